@@ -151,22 +151,26 @@ class MCPSocketServer:
             # Dispatch to appropriate handler
             handler = COMMAND_HANDLERS.get(command_type)
             if not handler:
-                return json.dumps({
-                    'status': 'error',
-                    'message': f"Unknown command type: {command_type}"
-                })
-
-            # Execute command directly
-            # Note: Most Blender API operations are thread-safe for reading
-            # For commands that modify the scene, Blender handles thread safety internally
-            try:
-                result = handler(params)
-            except Exception as e:
-                logger.error(f"Command execution error: {e}", exc_info=True)
                 result = {
                     'status': 'error',
-                    'message': str(e)
+                    'message': f"Unknown command type: {command_type}"
                 }
+            else:
+                # Execute command directly
+                # Note: Most Blender API operations are thread-safe for reading
+                # For commands that modify the scene, Blender handles thread safety internally
+                try:
+                    result = handler(params)
+                except Exception as e:
+                    logger.error(f"Command execution error: {e}", exc_info=True)
+                    result = {
+                        'status': 'error',
+                        'message': str(e)
+                    }
+
+            # Echo the request id so pipelining clients can match responses
+            if 'id' in command:
+                result = dict(result, id=command['id'])
 
             return json.dumps(result)
 
@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, Header, Query
 from .schemas import InventarioCreate, InventarioUpdate, InventarioResponse, PaginatedResponse
 from .dependencies import get_inventario_service, get_database_connection
 from ..database.connection import DatabaseConnection
+from ..database.pagination import DEFAULT_COUNT_MAX_AGE
 from ..services.inventario_service import InventarioService
 from ..utils.exceptions import ValidationError, RecordNotFoundError
 
@@ -17,11 +18,12 @@ router = APIRouter()
 async def get_inventario_list(
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
     sito: Optional[str] = Query(None, description="Filter by site"),
     tipo_reperto: Optional[str] = Query(None, description="Filter by find type"),
     inventario_service: InventarioService = Depends(get_inventario_service)
 ):
-    """Get paginated list of inventory items"""
+    """Get paginated list of inventory items (keyset pagination with ``cursor``)"""
     try:
         filters = {}
         if sito:
@@ -29,16 +31,26 @@ async def get_inventario_list(
         if tipo_reperto:
             filters['tipo_reperto'] = tipo_reperto
         
-        items = inventario_service.get_all_inventario(page=page, size=size, filters=filters)
-        total = inventario_service.count_inventario(filters=filters)
+        next_cursor, estimated = None, False
+        if cursor or page == 1:
+            result = inventario_service.get_inventario_page(cursor=cursor, size=size, filters=filters)
+            items, total = result.items, result.total
+            next_cursor, estimated = result.next_cursor, result.total_estimated
+        else:
+            items = inventario_service.get_all_inventario(page=page, size=size, filters=filters)
+            total = inventario_service.count_inventario(filters=filters, max_age=DEFAULT_COUNT_MAX_AGE)
         
         return PaginatedResponse(
             items=[InventarioResponse.from_orm(item) for item in items],
             total=total,
             page=page,
             size=size,
-            pages=(total + size - 1) // size
+            pages=(total + size - 1) // size,
+            next_cursor=next_cursor,
+            total_estimated=estimated
         )
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
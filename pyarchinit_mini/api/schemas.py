@@ -514,6 +514,8 @@ class PaginatedResponse(BaseModel):
     page: int = Field(..., description="Current page")
     size: int = Field(..., description="Page size")
     pages: int = Field(..., description="Total number of pages")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page (keyset pagination)")
+    total_estimated: bool = Field(False, description="Whether total is an estimate")
 
     class Config:
         from_attributes = True
@@ -9,6 +9,7 @@ from fastapi.responses import JSONResponse
 from .schemas import SiteCreate, SiteUpdate, SiteResponse, PaginatedResponse
 from .dependencies import get_site_service, get_database_connection
 from ..database.connection import DatabaseConnection
+from ..database.pagination import DEFAULT_COUNT_MAX_AGE
 from ..services.site_service import SiteService
 from ..utils.exceptions import ValidationError, RecordNotFoundError, DuplicateRecordError
 
@@ -18,6 +19,7 @@ router = APIRouter()
 async def get_sites(
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
     search: Optional[str] = Query(None, description="Search term"),
     nazione: Optional[str] = Query(None, description="Filter by country"),
     regione: Optional[str] = Query(None, description="Filter by region"),
@@ -37,23 +39,31 @@ async def get_sites(
         if comune:
             filters['comune'] = comune
         
-        # Get sites
+        # Get sites (keyset pagination unless searching or jumping to a page)
+        next_cursor, estimated = None, False
         if search:
             sites = site_service.search_sites(search, page=page, size=size, filters=filters)
+            total = site_service.count_sites(filters=filters, max_age=DEFAULT_COUNT_MAX_AGE)
+        elif cursor or page == 1:
+            result = site_service.get_sites_page(cursor=cursor, size=size, filters=filters)
+            sites, total = result.items, result.total
+            next_cursor, estimated = result.next_cursor, result.total_estimated
         else:
             sites = site_service.get_all_sites(page=page, size=size, filters=filters)
-        
-        # Get total count for pagination
-        total = site_service.count_sites(filters=filters)
+            total = site_service.count_sites(filters=filters, max_age=DEFAULT_COUNT_MAX_AGE)
         
         return PaginatedResponse(
             items=[SiteResponse.from_orm(site) for site in sites],
             total=total,
             page=page,
             size=size,
-            pages=(total + size - 1) // size
+            pages=(total + size - 1) // size,
+            next_cursor=next_cursor,
+            total_estimated=estimated
         )
     
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
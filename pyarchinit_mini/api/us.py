@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, Header, Query
 from .schemas import USCreate, USUpdate, USResponse, PaginatedResponse
 from .dependencies import get_us_service, get_database_connection
 from ..database.connection import DatabaseConnection
+from ..database.pagination import DEFAULT_COUNT_MAX_AGE
 from ..services.us_service import USService
 from ..utils.exceptions import ValidationError, RecordNotFoundError
 
@@ -17,11 +18,18 @@ router = APIRouter()
 async def get_us_list(
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
     sito: Optional[str] = Query(None, description="Filter by site"),
     area: Optional[str] = Query(None, description="Filter by area"),
     us_service: USService = Depends(get_us_service)
 ):
-    """Get paginated list of stratigraphic units"""
+    """
+    Get paginated list of stratigraphic units
+
+    The first page and pages requested with ``cursor`` use keyset
+    pagination (constant cost per page); ``page`` > 1 without a cursor
+    falls back to OFFSET.
+    """
     try:
         filters = {}
         if sito:
@@ -29,16 +37,26 @@ async def get_us_list(
         if area:
             filters['area'] = area
         
-        us_list = us_service.get_all_us(page=page, size=size, filters=filters)
-        total = us_service.count_us(filters=filters)
+        next_cursor, estimated = None, False
+        if cursor or page == 1:
+            result = us_service.get_us_page(cursor=cursor, size=size, filters=filters)
+            us_list, total = result.items, result.total
+            next_cursor, estimated = result.next_cursor, result.total_estimated
+        else:
+            us_list = us_service.get_all_us(page=page, size=size, filters=filters)
+            total = us_service.count_us(filters=filters, max_age=DEFAULT_COUNT_MAX_AGE)
         
         return PaginatedResponse(
             items=[USResponse.from_orm(us) for us in us_list],
             total=total,
             page=page,
             size=size,
-            pages=(total + size - 1) // size
+            pages=(total + size - 1) // size,
+            next_cursor=next_cursor,
+            total_estimated=estimated
         )
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -42,6 +42,7 @@ from pyarchinit_mini.models.site import Site
 from pyarchinit_mini.models.us import US
 from pyarchinit_mini.models.harris_matrix import USRelationships, Periodizzazione
 from pyarchinit_mini.harris_matrix.matrix_generator import HarrisMatrixGenerator
+from pyarchinit_mini.harris_matrix.matrix_cache import invalidate_matrix_cache
 from pyarchinit_mini.services.us_service import USService
 
 
@@ -423,6 +424,7 @@ class HarrisMatrixImporter:
         # Commit to database
         try:
             self.session.commit()
+            invalidate_matrix_cache(self.db_manager, site_name)
             click.echo(f"\n✅ Successfully imported Harris Matrix to database")
         except Exception as e:
             self.session.rollback()
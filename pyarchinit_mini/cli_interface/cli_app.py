@@ -46,7 +46,7 @@ class PyArchInitCLI:
         self.site_service = SiteService(self.db_manager)
         self.us_service = USService(self.db_manager)
         self.inventario_service = InventarioService(self.db_manager)
-        self.matrix_generator = HarrisMatrixGenerator(self.db_manager)
+        self.matrix_generator = HarrisMatrixGenerator(self.db_manager, self.us_service)
         self.matrix_visualizer = MatrixVisualizer()
         self.pdf_generator = PDFGenerator()
     
@@ -12,13 +12,93 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# PRAGMAs applied to every new SQLite connection, by profile name.
+# 'performance' switches the file to WAL so readers no longer block the
+# writer (web app, backup scheduler and MCP server sharing one .db file);
+# the journal mode is persistent, so it stays on for later connections.
+SQLITE_PROFILES = {
+    'legacy': {},
+    'default': {
+        'busy_timeout': 20000,
+        'cache_size': -65536,       # 64 MB (negative = KiB)
+        'temp_store': 'MEMORY',
+        'mmap_size': 268435456,     # 256 MB
+    },
+    'performance': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 20000,
+        'cache_size': -65536,
+        'temp_store': 'MEMORY',
+        'mmap_size': 268435456,
+    },
+}
+
+DEFAULT_SQLITE_PROFILE = 'default'
+
+
+def get_sqlite_profile(name: Optional[str] = None) -> dict:
+    """
+    Resolve a SQLite profile name (or PYARCHINIT_SQLITE_PROFILE) to its PRAGMAs
+
+    Unknown names fall back to the default profile with a warning.
+    """
+    if name is None:
+        name = os.getenv('PYARCHINIT_SQLITE_PROFILE', DEFAULT_SQLITE_PROFILE)
+    name = name.strip().lower()
+    if name not in SQLITE_PROFILES:
+        logger.warning(f"Unknown SQLite profile '{name}', using '{DEFAULT_SQLITE_PROFILE}'")
+        name = DEFAULT_SQLITE_PROFILE
+    return SQLITE_PROFILES[name]
+
+
+def copy_sqlite_database(src_path: str, dst_path: str) -> None:
+    """
+    Copy a SQLite database with the online backup API
+
+    Unlike a file copy, the result includes transactions still in the WAL
+    file and is consistent while other connections are writing. Files that
+    SQLite cannot open are copied byte for byte.
+
+    Raises:
+        FileNotFoundError: If src_path does not exist (sqlite3.connect would
+            otherwise create an empty database there)
+    """
+    import shutil
+    import sqlite3
+
+    if not os.path.isfile(src_path):
+        raise FileNotFoundError(f"SQLite database not found: {src_path}")
+
+    try:
+        src = sqlite3.connect(src_path)
+        try:
+            dst = sqlite3.connect(dst_path)
+            try:
+                src.backup(dst)
+            finally:
+                dst.close()
+        finally:
+            src.close()
+    except sqlite3.DatabaseError as e:
+        logger.warning(f"SQLite backup API failed for {src_path} ({e}); copying the file")
+        shutil.copy2(src_path, dst_path)
+
+
 class DatabaseConnection:
     """
     Manages database connections for both PostgreSQL and SQLite
     """
     
-    def __init__(self, connection_string: str):
+    def __init__(self, connection_string: str, sqlite_profile: Optional[str] = None):
+        """
+        Args:
+            connection_string: SQLAlchemy database URL
+            sqlite_profile: Name of a SQLITE_PROFILES entry; defaults to
+                PYARCHINIT_SQLITE_PROFILE or 'default'. Ignored for PostgreSQL.
+        """
         self.connection_string = connection_string
+        self.sqlite_pragmas = get_sqlite_profile(sqlite_profile)
         self.engine = None
         self.SessionLocal = None
         self._setup_connection()
@@ -38,12 +118,24 @@ class DatabaseConnection:
                     }
                 )
                 
-                # Enable foreign key constraints for SQLite
+                # Enable foreign key constraints and the performance
+                # profile PRAGMAs for SQLite
                 from sqlalchemy import event
+                pragmas = self.sqlite_pragmas
+                if ':memory:' in self.connection_string or self.connection_string.rstrip('/') == 'sqlite:':
+                    # WAL needs a file; in-memory databases keep their journal
+                    pragmas = {k: v for k, v in pragmas.items() if k != 'journal_mode'}
+
                 @event.listens_for(self.engine, "connect")
                 def set_sqlite_pragma(dbapi_connection, connection_record):
                     cursor = dbapi_connection.cursor()
                     cursor.execute("PRAGMA foreign_keys=ON")
+                    for pragma, value in pragmas.items():
+                        try:
+                            cursor.execute(f"PRAGMA {pragma}={value}")
+                        except Exception as e:
+                            # e.g. WAL on a read-only directory: keep going
+                            logger.warning(f"Could not set PRAGMA {pragma}={value}: {e}")
                     cursor.close()
             else:
                 # PostgreSQL specific settings
@@ -145,20 +237,30 @@ class DatabaseConnection:
             self.engine.dispose()
             logger.info("Database connection closed")
 
+    def sqlite_settings(self) -> dict:
+        """Current values of the profile PRAGMAs (empty for PostgreSQL)"""
+        if not self.connection_string.startswith('sqlite'):
+            return {}
+        settings = {}
+        with self.engine.connect() as conn:
+            for pragma in ['foreign_keys'] + list(self.sqlite_pragmas):
+                settings[pragma] = conn.exec_driver_sql(f"PRAGMA {pragma}").scalar()
+        return settings
+
     @classmethod
-    def from_url(cls, database_url: str) -> 'DatabaseConnection':
+    def from_url(cls, database_url: str, sqlite_profile: Optional[str] = None) -> 'DatabaseConnection':
         """Create connection from database URL"""
-        return cls(database_url)
+        return cls(database_url, sqlite_profile=sqlite_profile)
     
     @classmethod
-    def sqlite(cls, db_path: str) -> 'DatabaseConnection':
+    def sqlite(cls, db_path: str, sqlite_profile: Optional[str] = None) -> 'DatabaseConnection':
         """Create SQLite connection"""
         # Ensure directory exists if path contains directory
         dir_path = os.path.dirname(db_path)
         if dir_path:
             os.makedirs(dir_path, exist_ok=True)
         connection_string = f"sqlite:///{db_path}"
-        return cls(connection_string)
+        return cls(connection_string, sqlite_profile=sqlite_profile)
     
     @classmethod
     def postgresql(cls, host: str, port: int, database: str, 
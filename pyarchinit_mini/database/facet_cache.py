@@ -0,0 +1,223 @@
+"""
+Materialized filter facets (distinct values and counts per column)
+
+``pyarchinit_facet_values`` holds, per source table and facet column,
+every distinct non-empty value with its row count.
+``pyarchinit_facet_state`` has one row per source table with a ``dirty``
+flag and a write ``version``. Triggers on the source tables set the flag
+and bump the version on any insert, delete or update of a facet column,
+whoever makes the write (this process, another web worker, the desktop
+GUI or raw SQL). Readers recompute a table's facets only when its flag
+is set.
+
+SQLite uses row triggers; PostgreSQL uses one statement-level trigger
+per table.
+"""
+
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import inspect, text
+
+logger = logging.getLogger(__name__)
+
+VALUES_TABLE = 'pyarchinit_facet_values'
+STATE_TABLE = 'pyarchinit_facet_state'
+
+# Source table -> facet columns
+FACET_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    'site_table': ('sito', 'nazione', 'regione', 'comune'),
+    'us_table': ('sito', 'area', 'unita_tipo', 'anno_scavo', 'periodo_iniziale', 'fase_iniziale'),
+    'inventario_materiali_table': ('sito', 'tipo_reperto', 'area'),
+}
+
+_PG_FUNCTION = 'pyarchinit_facet_mark_dirty'
+
+
+def _trigger_name(table: str, event: str) -> str:
+    return f"{table}_facet_dirty_{event}"
+
+
+def _create_tables(conn):
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {VALUES_TABLE} ("
+        f"source_table VARCHAR(100) NOT NULL, facet VARCHAR(100) NOT NULL, "
+        f"value TEXT NOT NULL, count INTEGER NOT NULL, "
+        f"PRIMARY KEY (source_table, facet, value))"
+    ))
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {STATE_TABLE} ("
+        f"source_table VARCHAR(100) PRIMARY KEY, dirty INTEGER NOT NULL DEFAULT 1, "
+        f"version INTEGER NOT NULL DEFAULT 0, computed_at TIMESTAMP)"
+    ))
+    # State tables created before the version column
+    if 'version' not in {c['name'] for c in inspect(conn).get_columns(STATE_TABLE)}:
+        conn.execute(text(f"ALTER TABLE {STATE_TABLE} ADD COLUMN version INTEGER NOT NULL DEFAULT 0"))
+
+
+def _create_sqlite_triggers(conn, table: str, columns: Tuple[str, ...]):
+    mark = (f"UPDATE {STATE_TABLE} SET dirty = 1, version = version + 1 "
+            f"WHERE source_table = '{table}';")
+    timing = {
+        'ai': 'AFTER INSERT',
+        'ad': 'AFTER DELETE',
+        'au': f"AFTER UPDATE OF {', '.join(columns)}",
+    }
+    for event, when in timing.items():
+        # Recreated so triggers from before the version column are replaced
+        conn.execute(text(f"DROP TRIGGER IF EXISTS {_trigger_name(table, event)}"))
+        conn.execute(text(
+            f"CREATE TRIGGER {_trigger_name(table, event)} "
+            f"{when} ON {table} BEGIN {mark} END"
+        ))
+
+
+def _create_postgresql_triggers(conn, table: str, columns: Tuple[str, ...]):
+    name = _trigger_name(table, 'stmt')
+    exists = conn.execute(
+        text("SELECT 1 FROM pg_trigger WHERE tgname = :name"), {'name': name}
+    ).first()
+    if exists:
+        return
+    conn.execute(text(
+        f"CREATE TRIGGER {name} AFTER INSERT OR DELETE OR UPDATE OF {', '.join(columns)} "
+        f"ON {table} FOR EACH STATEMENT EXECUTE FUNCTION {_PG_FUNCTION}()"
+    ))
+
+
+def ensure_facet_cache(engine) -> int:
+    """
+    Create the facet tables, state rows and dirty-marking triggers
+
+    Source tables that do not exist yet, or lack a facet column, are
+    skipped (their facets are computed on every request).
+
+    Returns:
+        Number of source tables newly materialized
+    """
+    dialect = engine.dialect.name
+    if dialect not in ('sqlite', 'postgresql'):
+        return 0
+    inspector = inspect(engine)
+    installed = 0
+    with engine.begin() as conn:
+        _create_tables(conn)
+        if dialect == 'postgresql':
+            conn.execute(text(
+                f"CREATE OR REPLACE FUNCTION {_PG_FUNCTION}() RETURNS trigger AS $$ BEGIN "
+                f"UPDATE {STATE_TABLE} SET dirty = 1, version = version + 1 WHERE source_table = TG_TABLE_NAME; "
+                f"RETURN NULL; END $$ LANGUAGE plpgsql"
+            ))
+        for table, columns in FACET_COLUMNS.items():
+            if not inspector.has_table(table):
+                continue
+            existing = {c['name'] for c in inspector.get_columns(table)}
+            missing = [c for c in columns if c not in existing]
+            if missing:
+                logger.warning(f"Facet cache for {table} skipped, missing columns: {', '.join(missing)}")
+                continue
+            if dialect == 'sqlite':
+                _create_sqlite_triggers(conn, table, columns)
+            else:
+                _create_postgresql_triggers(conn, table, columns)
+            if conn.execute(text(f"SELECT 1 FROM {STATE_TABLE} WHERE source_table = :t"),
+                            {'t': table}).first() is None:
+                conn.execute(text(f"INSERT INTO {STATE_TABLE} (source_table, dirty) VALUES (:t, 1)"),
+                             {'t': table})
+                installed += 1
+    return installed
+
+
+def facet_cache_installed(engine) -> Dict[str, bool]:
+    """Source table -> whether its facets are materialized"""
+    status = {table: False for table in FACET_COLUMNS}
+    if not inspect(engine).has_table(STATE_TABLE):
+        return status
+    with engine.connect() as conn:
+        for (table,) in conn.execute(text(f"SELECT source_table FROM {STATE_TABLE}")):
+            if table in status:
+                status[table] = True
+    return status
+
+
+def compute_facets(conn, table: str, columns: Optional[Tuple[str, ...]] = None) -> Dict[str, List[Tuple]]:
+    """
+    Distinct non-empty values and counts straight from the source table
+
+    Returns:
+        {column: [(value, count), ...]} with values as stored
+    """
+    facets = {}
+    for column in columns or FACET_COLUMNS[table]:
+        rows = conn.execute(text(
+            f"SELECT {column}, COUNT(*) FROM {table} "
+            f"WHERE {column} IS NOT NULL AND CAST({column} AS TEXT) != '' GROUP BY {column}"
+        ))
+        facets[column] = [(row[0], row[1]) for row in rows]
+    return facets
+
+
+def refresh_facets(engine, table: str) -> Dict[str, List[Tuple]]:
+    """
+    Recompute and store the facets of one source table
+
+    Returns:
+        {column: [(value as text, count), ...]}
+
+    The facets are read without holding any lock. They are then stored,
+    and the state row cleaned, in a short transaction that only applies
+    if the state version is still the one read before the scan: a write
+    committed meanwhile leaves the row dirty for the next reader.
+    """
+    with engine.connect() as conn:
+        version = conn.execute(
+            text(f"SELECT version FROM {STATE_TABLE} WHERE source_table = :t"), {'t': table}
+        ).scalar()
+        facets = compute_facets(conn, table)
+    stored = {}
+    rows = []
+    for column, values in facets.items():
+        # SQLite can store 1 and '1' in the same column: merge them
+        merged: Dict[str, int] = {}
+        for value, count in values:
+            merged[str(value)] = merged.get(str(value), 0) + count
+        stored[column] = list(merged.items())
+        rows.extend({'t': table, 'f': column, 'v': v, 'c': c} for v, c in merged.items())
+    with engine.begin() as conn:
+        cleaned = conn.execute(text(
+            f"UPDATE {STATE_TABLE} SET dirty = 0, computed_at = CURRENT_TIMESTAMP "
+            f"WHERE source_table = :t AND version = :v"
+        ), {'t': table, 'v': version}).rowcount
+        if cleaned:
+            conn.execute(text(f"DELETE FROM {VALUES_TABLE} WHERE source_table = :t"), {'t': table})
+            if rows:
+                conn.execute(text(
+                    f"INSERT INTO {VALUES_TABLE} (source_table, facet, value, count) "
+                    f"VALUES (:t, :f, :v, :c)"
+                ), rows)
+    return stored
+
+
+def load_facets(engine, table: str) -> Optional[Dict[str, List[Tuple]]]:
+    """
+    Materialized facets of a source table, refreshed first if dirty
+
+    Returns:
+        {column: [(value as text, count), ...]}, or None if the table's
+        facets are not materialized
+    """
+    with engine.connect() as conn:
+        state = conn.execute(
+            text(f"SELECT dirty FROM {STATE_TABLE} WHERE source_table = :t"), {'t': table}
+        ).first()
+        if state is None:
+            return None
+        if not state[0]:
+            facets: Dict[str, List[Tuple]] = {column: [] for column in FACET_COLUMNS[table]}
+            for column, value, count in conn.execute(
+                text(f"SELECT facet, value, count FROM {VALUES_TABLE} WHERE source_table = :t"),
+                {'t': table}
+            ):
+                facets.setdefault(column, []).append((value, count))
+            return facets
+    return refresh_facets(engine, table)
@@ -2,13 +2,14 @@
 Main database manager for PyArchInit-Mini
 """
 
-from typing import List, Optional, Dict, Any, Type, TypeVar
+from typing import Callable, List, Optional, Dict, Any, Type, TypeVar
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import and_, or_, asc, desc, func, text
 
 from .connection import DatabaseConnection
 from .migrations import DatabaseMigrations
+from .pagination import Page, cached_count, decode_cursor, keyset_page, order_columns
 from ..models.base import BaseModel
 from ..exceptions import DatabaseError, ValidationError
 
@@ -28,10 +29,10 @@ class DatabaseManager:
         self.connection = connection
         self.migrations = DatabaseMigrations(self)
         
-    def run_migrations(self):
-        """Run all necessary database migrations"""
+    def run_migrations(self, force: bool = False):
+        """Run all necessary database migrations (skipped if the schema is unchanged, unless forced)"""
         try:
-            return self.migrations.migrate_all_tables()
+            return self.migrations.migrate_all_tables(force=force)
         except Exception as e:
             raise DatabaseError(f"Migration failed: {e}")
     
@@ -100,6 +101,53 @@ class DatabaseManager:
         except SQLAlchemyError as e:
             raise DatabaseError(f"Failed to get {model_class.__name__} records: {e}")
     
+    def get_page(self, model_class: Type[T],
+                 cursor: Optional[str] = None, limit: int = 100,
+                 order_by: Optional[str] = None,
+                 filters: Optional[Dict[str, Any]] = None,
+                 convert: Optional[Callable[[T], Any]] = None,
+                 with_total: bool = True) -> Page:
+        """
+        Get one page of records with keyset (cursor) pagination
+
+        Unlike ``get_all``'s OFFSET, the cost of a page does not grow with
+        its position. Pass the returned ``next_cursor`` to get the next
+        page; a cursor is only valid for the ``order_by`` it was issued for.
+
+        Args:
+            model_class: Model to list
+            cursor: Cursor of the previous page, None for the first page
+            limit: Page size
+            order_by: Non-nullable column ("-column" for descending);
+                the primary key breaks ties
+            filters: Equality filters, as in ``get_all``
+            convert: Applied to each record inside the session (e.g. DTO)
+            with_total: Include the (cached) total of matching records
+
+        Returns:
+            Page with items, next_cursor and total
+        """
+        # Reject bad cursors and orderings before opening a session
+        order_columns(model_class, order_by)
+        if cursor:
+            decode_cursor(cursor, order_by or '')
+        try:
+            with self.connection.get_session() as session:
+                query = session.query(model_class)
+
+                if filters:
+                    for field, value in filters.items():
+                        if hasattr(model_class, field):
+                            query = query.filter(getattr(model_class, field) == value)
+
+                page = keyset_page(query, model_class, order_by, cursor, limit, convert)
+                if with_total:
+                    page.total, page.total_estimated = cached_count(session, model_class, query, filters)
+                return page
+
+        except SQLAlchemyError as e:
+            raise DatabaseError(f"Failed to get {model_class.__name__} page: {e}")
+
     def update(self, model_class: Type[T], record_id: int, data: Dict[str, Any]) -> T:
         """Update existing record"""
         try:
@@ -134,8 +182,15 @@ class DatabaseManager:
         except SQLAlchemyError as e:
             raise DatabaseError(f"Failed to delete {model_class.__name__}: {e}")
     
-    def count(self, model_class: Type[T], filters: Optional[Dict[str, Any]] = None) -> int:
-        """Count records with optional filters"""
+    def count(self, model_class: Type[T], filters: Optional[Dict[str, Any]] = None,
+              max_age: Optional[float] = None) -> int:
+        """
+        Count records with optional filters
+
+        With ``max_age`` the count may come from the count cache (see
+        ``database.pagination``) and, for large unfiltered PostgreSQL
+        tables, be the planner estimate.
+        """
         try:
             with self.connection.get_session() as session:
                 # Use count() on the model class directly
@@ -146,7 +201,9 @@ class DatabaseManager:
                     for field, value in filters.items():
                         if hasattr(model_class, field):
                             query = query.filter(getattr(model_class, field) == value)
-                
+
+                if max_age is not None:
+                    return cached_count(session, model_class, query, filters, max_age)[0]
                 return query.count()
                 
         except SQLAlchemyError as e:
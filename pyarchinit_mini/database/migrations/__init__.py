@@ -4,14 +4,32 @@ Database migrations for PyArchInit-Mini
 
 import logging
 from sqlalchemy import text, inspect
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set
 
+from ... import __version__
 # Ensure Pottery model is registered in Base.metadata so create_all picks it up
 # even when migrations runs before any service imports it.
 from ...models.pottery import Pottery  # noqa: F401
 
 logger = logging.getLogger(__name__)
 
+# Bump when a migration is added or changed, so databases whose schema
+# fingerprint is unchanged still get the new checks
+MIGRATIONS_REVISION = 1
+
+_SCRIPTS_PACKAGE = "pyarchinit_mini.database.migrations"
+# Spec 1 scripts that change the schema, and those that repair rows other
+# clients may write at any time (run on every startup)
+SPEC1_SCHEMA_SCRIPTS = (
+    f"{_SCRIPTS_PACKAGE}._2026_05_node_uuid_schema",
+    f"{_SCRIPTS_PACKAGE}._2026_05_period_table_schema",
+)
+SPEC1_REPAIR_SCRIPTS = (
+    f"{_SCRIPTS_PACKAGE}._2026_05_node_uuid_backfill",
+    f"{_SCRIPTS_PACKAGE}._2026_05_vocab_alignment",
+)
+
+
 class DatabaseMigrations:
     """
     Handle database schema migrations
@@ -20,13 +38,51 @@ class DatabaseMigrations:
     def __init__(self, db_manager):
         self.db_manager = db_manager
         self.connection = db_manager.connection
+        # Table name -> column names (None if the table is missing),
+        # reflected once and kept up to date by add_column_if_not_exists
+        self._columns: Optional[Dict[str, Optional[Set[str]]]] = None
+        # Steps of the current run that failed and were only logged
+        self._failed_steps: List[str] = []
+
+    @property
+    def revision(self) -> str:
+        return f"{__version__}+{MIGRATIONS_REVISION}"
+
+    def _table_columns(self, table_name: str) -> Optional[Set[str]]:
+        """Column names of a table, or None if it does not exist"""
+        if self._columns is None:
+            # All tables in one pass (a single catalog query on PostgreSQL)
+            multi = inspect(self.connection.engine).get_multi_columns()
+            self._columns = {name: {col['name'] for col in cols} for (_, name), cols in multi.items()}
+        if table_name not in self._columns:
+            # Created after the first reflection
+            inspector = inspect(self.connection.engine)
+            self._columns[table_name] = (
+                {col['name'] for col in inspector.get_columns(table_name)}
+                if inspector.has_table(table_name) else None
+            )
+        return self._columns[table_name]
+
+    def _step_failed(self, step: str, error: Any):
+        """Log a failed step without aborting the run; the schema version is then not recorded"""
+        logger.warning(f"{step}: {error}")
+        self._failed_steps.append(step)
+
+    def _forget_columns(self, table_name: Optional[str] = None):
+        """Drop cached columns of a table (all tables if None)"""
+        if table_name is None:
+            self._columns = None
+        elif self._columns is not None:
+            self._columns.pop(table_name, None)
 
     def check_column_exists(self, table_name: str, column_name: str) -> bool:
         """Check if a column exists in a table"""
         try:
-            inspector = inspect(self.connection.engine)
-            columns = inspector.get_columns(table_name)
-            return any(col['name'] == column_name for col in columns)
+            columns = self._table_columns(table_name)
+            if columns is None:
+                logger.error(f"Error checking column {column_name}: table {table_name} does not exist")
+                return False
+            return column_name in columns
         except Exception as e:
             logger.error(f"Error checking column {column_name} in table {table_name}: {e}")
             return False
@@ -43,6 +99,7 @@ class DatabaseMigrations:
 
                     session.execute(text(alter_sql))
                     session.commit()
+                    self._table_columns(table_name).add(column_name)
                     logger.info(f"Added column {column_name} to table {table_name}")
                     return True
             else:
@@ -169,23 +226,24 @@ class DatabaseMigrations:
             logger.error(f"Error during tipo_documento migration: {e}")
             raise
 
+    CONCURRENCY_TABLES = [
+        'site_table', 'us_table', 'us_relationships_table',
+        'harris_matrix_table', 'period_table', 'datazioni_table',
+        'extended_matrix_table',
+        'inventario_materiali_table',
+        'periodizzazione_table', 'media_table', 'media_thumb_table',
+        'documentation_table',
+        'pyarchinit_thesaurus_sigle', 'thesaurus_field', 'thesaurus_category',
+        'users',
+    ]
+
     def migrate_concurrency_columns(self):
         """Add concurrency tracking columns to all main tables."""
-        import uuid as uuid_mod
         try:
             logger.info("Starting concurrency columns migration...")
             migrations_applied = 0
 
-            tables = [
-                'site_table', 'us_table', 'us_relationships_table',
-                'harris_matrix_table', 'period_table', 'datazioni_table',
-                'extended_matrix_table',
-                'inventario_materiali_table',
-                'periodizzazione_table', 'media_table', 'media_thumb_table',
-                'documentation_table',
-                'pyarchinit_thesaurus_sigle', 'thesaurus_field', 'thesaurus_category',
-                'users',
-            ]
+            tables = self.CONCURRENCY_TABLES
 
             concurrency_columns = [
                 ('entity_uuid', 'VARCHAR(36)'),
@@ -205,31 +263,75 @@ class DatabaseMigrations:
                     if self.add_column_if_not_exists(table, col_name, col_type, default):
                         migrations_applied += 1
 
-            # Back-fill entity_uuid for existing rows that have NULL.
-            # SQLite exposes `rowid`; PostgreSQL uses `ctid` (stable within a transaction).
-            row_id_col = 'ctid' if self.connection.engine.dialect.name == 'postgresql' else 'rowid'
-            for table in tables:
-                try:
-                    with self.connection.get_session() as session:
-                        rows = session.execute(
-                            text(f"SELECT {row_id_col} FROM {table} WHERE entity_uuid IS NULL")
-                        ).fetchall()
-                        for row in rows:
-                            new_uuid = str(uuid_mod.uuid4())
-                            session.execute(
-                                text(f"UPDATE {table} SET entity_uuid = :uuid WHERE {row_id_col} = :rid"),
-                                {"uuid": new_uuid, "rid": row[0]}
-                            )
-                        session.commit()
-                except Exception as e:
-                    logger.warning(f"UUID backfill for {table}: {e}")
-
             logger.info(f"Concurrency migration done. {migrations_applied} columns added")
             return migrations_applied
         except Exception as e:
             logger.error(f"Error during concurrency migration: {e}")
             raise
 
+    def backfill_entity_uuids(self, tables: Optional[List[str]] = None):
+        """Give rows inserted without an entity_uuid (e.g. by other clients) a new one"""
+        import uuid as uuid_mod
+        # SQLite exposes `rowid`; PostgreSQL uses `ctid` (stable within a transaction).
+        row_id_col = 'ctid' if self.connection.engine.dialect.name == 'postgresql' else 'rowid'
+        for table in tables or self.CONCURRENCY_TABLES:
+            try:
+                with self.connection.get_session() as session:
+                    rows = session.execute(
+                        text(f"SELECT {row_id_col} FROM {table} WHERE entity_uuid IS NULL")
+                    ).fetchall()
+                    for row in rows:
+                        new_uuid = str(uuid_mod.uuid4())
+                        session.execute(
+                            text(f"UPDATE {table} SET entity_uuid = :uuid WHERE {row_id_col} = :rid"),
+                            {"uuid": new_uuid, "rid": row[0]}
+                        )
+                    session.commit()
+            except Exception as e:
+                logger.warning(f"UUID backfill for {table}: {e}")
+
+    def sync_postgres_sequences(self):
+        """Move PostgreSQL id sequences past MAX(id) (rows written by other clients)"""
+        if self.connection.engine.dialect.name != 'postgresql':
+            return
+        try:
+            with self.connection.get_session() as session:
+                for table, pk, seq in [
+                    ('site_table', 'id_sito', 'site_table_id_sito_seq'),
+                    ('us_table', 'id_us', 'us_table_id_us_seq'),
+                    ('inventario_materiali_table', 'id_invmat', 'inventario_materiali_table_id_invmat_seq'),
+                    ('users', 'id', 'users_id_seq'),
+                    # Spec-3-bis & QGIS pyarchinit interop
+                    ('periodizzazione_table', 'id_perfas', 'periodizzazione_table_id_perfas_seq'),
+                    ('period_table', 'id_period', 'period_table_id_period_seq'),
+                    ('us_relationships_table', 'id_relationship', 'us_relationships_table_id_relationship_seq'),
+                    ('harris_matrix_table', 'id_matrix', 'harris_matrix_table_id_matrix_seq'),
+                ]:
+                    try:
+                        max_id = session.execute(text(f'SELECT MAX({pk}) FROM {table}')).scalar() or 0
+                        session.execute(text(f"SELECT setval('{seq}', {max_id + 1}, false)"))
+                    except Exception:
+                        pass
+                session.commit()
+                logger.info("PostgreSQL sequences synchronized")
+        except Exception as e:
+            logger.warning(f"Could not fix sequences: {e}")
+
+    def repair_data(self) -> int:
+        """
+        Data repairs run on every startup, even when the schema is unchanged
+
+        Rows written by other clients may lack an entity_uuid or node_uuid,
+        carry legacy unita_tipo values, or leave id sequences behind.
+
+        Returns:
+            Number of Spec 1 repair scripts that changed rows
+        """
+        self.backfill_entity_uuids()
+        repaired = self._run_migration_scripts(SPEC1_REPAIR_SCRIPTS)
+        self.sync_postgres_sequences()
+        return repaired
+
     def migrate_inventario_extra_columns(self):
         """Add missing columns to inventario_materiali_table."""
         try:
@@ -325,7 +427,83 @@ class DatabaseMigrations:
                     return 1
             return 0
         except Exception as e:
-            logger.warning(f"migrate_us_column_to_text: {e}")
+            self._step_failed("migrate_us_column_to_text", e)
+            return 0
+
+    def migrate_relationship_indexes(self):
+        """Create composite indexes used by Harris Matrix relationship loading.
+
+        ``HarrisMatrixGenerator._get_relationships`` filters both
+        ``us_relationships_table`` and ``us_table`` by ``sito`` and then
+        matches US numbers; these indexes turn both lookups into index
+        range scans on SQLite and PostgreSQL alike.
+        """
+        return self._create_indexes('migrate_relationship_indexes', [
+            ('idx_us_relationships_sito_us_from', 'us_relationships_table', 'sito, us_from'),
+            ('idx_us_relationships_sito_us_to', 'us_relationships_table', 'sito, us_to'),
+            ('idx_us_table_sito_us', 'us_table', 'sito, us'),
+        ])
+
+    def migrate_pagination_indexes(self):
+        """Create the (ordering column, primary key) indexes behind keyset pagination.
+
+        ``DatabaseManager.get_page`` reads pages with a row-value range on
+        (ordering column, primary key); with these indexes each page is an
+        index range scan whatever its position.
+        """
+        return self._create_indexes('migrate_pagination_indexes', [
+            ('idx_us_table_us_id', 'us_table', 'us, id_us'),
+            ('idx_inventario_numero_id', 'inventario_materiali_table', 'numero_inventario, id_invmat'),
+            ('idx_inventario_sito_numero_id', 'inventario_materiali_table', 'sito, numero_inventario, id_invmat'),
+        ])
+
+    def _create_indexes(self, migration_name, indexes):
+        """Create missing (index name, table, columns) indexes; returns how many"""
+        applied = 0
+        try:
+            inspector = inspect(self.connection.engine)
+            for index_name, table_name, columns in indexes:
+                if self._table_columns(table_name) is None:
+                    continue
+                existing = {ix['name'] for ix in inspector.get_indexes(table_name)}
+                if index_name in existing:
+                    continue
+                with self.connection.get_session() as session:
+                    session.execute(text(
+                        f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({columns})"
+                    ))
+                    session.commit()
+                logger.info(f"Created index {index_name} on {table_name} ({columns})")
+                applied += 1
+            return applied
+        except Exception as e:
+            self._step_failed(migration_name, e)
+            return applied
+
+    def migrate_search_index(self):
+        """Create the full-text index used by UniversalSearchService.
+
+        FTS5 tables with sync triggers on SQLite, tsvector/pg_trgm GIN
+        expression indexes on PostgreSQL (see ``database.search_index``).
+        """
+        try:
+            from ..search_index import ensure_search_index
+            return ensure_search_index(self.connection.engine)
+        except Exception as e:
+            self._step_failed("migrate_search_index", e)
+            return 0
+
+    def migrate_facet_cache(self):
+        """Create the materialized filter facets used by the list views.
+
+        Facet tables plus triggers marking a source table's facets dirty on
+        writes (see ``database.facet_cache``).
+        """
+        try:
+            from ..facet_cache import ensure_facet_cache
+            return ensure_facet_cache(self.connection.engine)
+        except Exception as e:
+            self._step_failed("migrate_facet_cache", e)
             return 0
 
     def migrate_user_sync_trigger(self):
@@ -520,7 +698,7 @@ class DatabaseMigrations:
                 return 1
 
         except Exception as e:
-            logger.warning(f"migrate_user_sync_trigger: {e}")
+            self._step_failed("migrate_user_sync_trigger", e)
             return 0
 
     def migrate_tma_thesaurus_sync_trigger(self):
@@ -613,7 +791,7 @@ class DatabaseMigrations:
                 logger.info("TMA thesaurus sync trigger function created/updated")
                 return 1
         except Exception as e:
-            logger.warning(f"migrate_tma_thesaurus_sync_trigger: {e}")
+            self._step_failed("migrate_tma_thesaurus_sync_trigger", e)
             return 0
 
     def migrate_tma_tables(self):
@@ -663,11 +841,12 @@ class DatabaseMigrations:
                 session.commit()
 
                 # If tables existed already with old schema, add missing columns
-                inspector = inspect(engine)
+                self._forget_columns('tma_materiali_archeologici')
+                self._forget_columns('tma_materiali_ripetibili')
 
                 # Master table: ensure sync_status (BaseModel concurrency col)
-                if inspector.has_table('tma_materiali_archeologici'):
-                    existing_master = {c['name'] for c in inspector.get_columns('tma_materiali_archeologici')}
+                existing_master = self._table_columns('tma_materiali_archeologici')
+                if existing_master is not None:
                     master_needed = [
                         ('sync_status', 'TEXT'),
                         ('entity_uuid', 'TEXT'),
@@ -683,14 +862,15 @@ class DatabaseMigrations:
                                 with self.connection.get_session() as s2:
                                     s2.execute(text(f"ALTER TABLE tma_materiali_archeologici ADD COLUMN {col} {typ}"))
                                     s2.commit()
+                                    existing_master.add(col)
                                     logger.info(f"Added column {col} to tma_materiali_archeologici")
                                     applied += 1
                             except Exception as e:
-                                logger.warning(f"Could not add {col} to master: {e}")
+                                self._step_failed(f"Could not add {col} to master", e)
 
                 # Detail table: detail-specific columns + concurrency cols
-                if inspector.has_table('tma_materiali_ripetibili'):
-                    existing = {c['name'] for c in inspector.get_columns('tma_materiali_ripetibili')}
+                existing = self._table_columns('tma_materiali_ripetibili')
+                if existing is not None:
                     needed = [
                         ('id_tma', 'INTEGER'),
                         ('madi', 'VARCHAR(50)'),
@@ -715,22 +895,49 @@ class DatabaseMigrations:
                                 with self.connection.get_session() as s2:
                                     s2.execute(text(f"ALTER TABLE tma_materiali_ripetibili ADD COLUMN {col} {typ}"))
                                     s2.commit()
+                                    existing.add(col)
                                     logger.info(f"Added column {col} to tma_materiali_ripetibili")
                                     applied += 1
                             except Exception as e:
-                                logger.warning(f"Could not add {col}: {e}")
+                                self._step_failed(f"Could not add {col}", e)
 
                 logger.info(f"TMA tables migration completed ({applied} columns added)")
                 return applied
         except Exception as e:
-            logger.warning(f"migrate_tma_tables: {e}")
+            self._step_failed("migrate_tma_tables", e)
             return applied
 
-    def migrate_all_tables(self):
-        """Run all necessary migrations"""
+    def schema_unchanged(self) -> bool:
+        """Whether the schema matches the one recorded by the last run of this revision"""
         try:
+            from ..schema_version import schema_unchanged
+            return schema_unchanged(self.connection.engine, self.revision)
+        except Exception as e:
+            logger.warning(f"Could not check schema version: {e}")
+            return False
+
+    def migrate_all_tables(self, force: bool = False):
+        """
+        Run all necessary migrations
+
+        The schema steps are skipped (one query) when the schema fingerprint
+        and migrations revision match the last recorded run, unless ``force``
+        is set; the data repairs (see repair_data) always run. The run is
+        recorded only when no step failed, so failed steps are retried on
+        the next startup.
+        """
+        try:
+            if not force and self.schema_unchanged():
+                logger.info("Database schema unchanged since the last migration run")
+                # Rows written by other clients still need repairs
+                self.repair_data()
+                return 0
+
             logger.info("Starting database migrations...")
+            self._failed_steps = []
 
+            # Reflect the schema afresh, once for the whole run
+            self._forget_columns()
             total_migrations = 0
 
             # Migrate inventario_materiali_table
@@ -756,6 +963,18 @@ class DatabaseMigrations:
             # Convert us_table.us from VARCHAR(100) to TEXT
             total_migrations += self.migrate_us_column_to_text()
 
+            # Composite indexes for Harris Matrix relationship loading
+            total_migrations += self.migrate_relationship_indexes()
+
+            # Indexes for keyset pagination of US and inventory lists
+            total_migrations += self.migrate_pagination_indexes()
+
+            # Full-text search index for sites, US and materials
+            total_migrations += self.migrate_search_index()
+
+            # Materialized filter facets for the list views
+            total_migrations += self.migrate_facet_cache()
+
             # Add contact fields to users table (BEFORE trigger so schema is ready)
             try:
                 for col, typ in [('telegram_username', 'VARCHAR(100)'), ('phone', 'VARCHAR(30)')]:
@@ -763,35 +982,11 @@ class DatabaseMigrations:
                         with self.connection.get_session() as session:
                             session.execute(text(f"ALTER TABLE users ADD COLUMN {col} {typ}"))
                             session.commit()
+                            self._table_columns('users').add(col)
                             logger.info(f"Added column {col} to users table")
                             total_migrations += 1
             except Exception as e:
-                logger.warning(f"Could not add contact columns to users: {e}")
-
-            # Fix PostgreSQL sequences (auto-increment out of sync)
-            if self.connection.engine.dialect.name == 'postgresql':
-                try:
-                    with self.connection.get_session() as session:
-                        for table, pk, seq in [
-                            ('site_table', 'id_sito', 'site_table_id_sito_seq'),
-                            ('us_table', 'id_us', 'us_table_id_us_seq'),
-                            ('inventario_materiali_table', 'id_invmat', 'inventario_materiali_table_id_invmat_seq'),
-                            ('users', 'id', 'users_id_seq'),
-                            # Spec-3-bis & QGIS pyarchinit interop
-                            ('periodizzazione_table', 'id_perfas', 'periodizzazione_table_id_perfas_seq'),
-                            ('period_table', 'id_period', 'period_table_id_period_seq'),
-                            ('us_relationships_table', 'id_relationship', 'us_relationships_table_id_relationship_seq'),
-                            ('harris_matrix_table', 'id_matrix', 'harris_matrix_table_id_matrix_seq'),
-                        ]:
-                            try:
-                                max_id = session.execute(text(f'SELECT MAX({pk}) FROM {table}')).scalar() or 0
-                                session.execute(text(f"SELECT setval('{seq}', {max_id + 1}, false)"))
-                            except Exception:
-                                pass
-                        session.commit()
-                        logger.info("PostgreSQL sequences synchronized")
-                except Exception as e:
-                    logger.warning(f"Could not fix sequences: {e}")
+                self._step_failed("Could not add contact columns to users", e)
 
             # Bidirectional user sync trigger (PostgreSQL only)
             total_migrations += self.migrate_user_sync_trigger()
@@ -800,43 +995,52 @@ class DatabaseMigrations:
             try:
                 total_migrations += self.migrate_tma_tables()
             except Exception as e:
-                logger.warning(f"TMA migration failed: {e}")
+                self._step_failed("TMA migration failed", e)
 
             # TMA thesaurus sync trigger (PostgreSQL only)
             try:
                 total_migrations += self.migrate_tma_thesaurus_sync_trigger()
             except Exception as e:
-                logger.warning(f"TMA thesaurus trigger failed: {e}")
+                self._step_failed("TMA thesaurus trigger failed", e)
 
             # Spec 1 (node_uuid + vocab alignment) — auto-applied so fresh
             # installs and upgraded existing DBs both get the swimlane editor
             # working without a manual `pyarchinit-mini-migrate-vocab` step.
+            # The back-fill and vocab alignment are part of repair_data.
             try:
-                total_migrations += self._migrate_spec1_node_uuid_and_vocab()
+                total_migrations += self._run_migration_scripts(SPEC1_SCHEMA_SCRIPTS)
             except Exception as e:
-                logger.warning(f"Spec 1 node_uuid/vocab migration failed: {e}")
+                self._step_failed("Spec 1 node_uuid/period schema migration failed", e)
+
+            # Data repairs (UUID back-fills, vocab alignment, PostgreSQL sequences)
+            total_migrations += self.repair_data()
 
             logger.info(f"All migrations completed. Total migrations applied: {total_migrations}")
+
+            if self._failed_steps:
+                # Leave the version unrecorded so the next startup retries
+                logger.warning(
+                    f"Schema version not recorded, failed steps: {', '.join(self._failed_steps)}"
+                )
+                return total_migrations
+            try:
+                from ..schema_version import record_schema_version
+                record_schema_version(self.connection.engine, self.revision, total_migrations)
+            except Exception as e:
+                logger.warning(f"Could not record schema version: {e}")
             return total_migrations
 
         except Exception as e:
             logger.error(f"Error during database migrations: {e}")
             raise
 
-    def _migrate_spec1_node_uuid_and_vocab(self) -> int:
-        """Apply Spec 1 migrations idempotently: node_uuid schema, backfill,
-        vocab alignment (USVA/USVB→USVs, USVC→USVn). Each underlying script
-        is a no-op when nothing needs changing, so this is safe to call on
-        every startup."""
+    def _run_migration_scripts(self, scripts) -> int:
+        """Apply Spec 1 migration scripts idempotently (node_uuid schema and
+        backfill, vocab alignment USVA/USVB→USVs, USVC→USVn, period table).
+        Each underlying script is a no-op when nothing needs changing, so
+        this is safe to call on every startup."""
         import importlib
 
-        pkg = "pyarchinit_mini.database.migrations"
-        scripts = [
-            f"{pkg}._2026_05_node_uuid_schema",
-            f"{pkg}._2026_05_node_uuid_backfill",
-            f"{pkg}._2026_05_vocab_alignment",
-            f"{pkg}._2026_05_period_table_schema",
-        ]
         # SQLAlchemy 2.x str(URL) redacts the password as '***', which would
         # cause the migration scripts to fail authentication when they call
         # create_engine(url) — silently, because the loop below swallows
@@ -849,7 +1053,9 @@ class DatabaseMigrations:
                 mod = importlib.import_module(mod_path)
                 report = mod.run(url, dry_run=False)
                 status = getattr(report, "status", "ok")
-                if status == "ok":
+                if status.startswith("error"):
+                    self._step_failed(mod_path, status)
+                elif status == "ok":
                     rows = getattr(report, "rows_updated", None)
                     tables = getattr(report, "tables_changed", None)
                     mappings = getattr(report, "mappings", None)
@@ -857,7 +1063,7 @@ class DatabaseMigrations:
                         applied += 1
                         logger.info(f"{mod_path}: {tables or rows or mappings}")
             except Exception as e:
-                logger.warning(f"{mod_path} failed: {e}")
+                self._step_failed(f"{mod_path} failed", e)
         return applied
 
     def get_table_info(self, table_name: str) -> Dict[str, Any]:
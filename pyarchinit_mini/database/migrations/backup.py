@@ -1,18 +1,19 @@
 """Database backup utilities for pre-migration safety.
 
-- SQLite: file copy via shutil.copy2 (preserves mtime)
+- SQLite: online backup API (consistent with WAL and concurrent writers)
 - PostgreSQL: pg_dump -Fc (custom format, restorable via pg_restore)
 - All backups catalogued in `<backups_dir>/_index.json` as a JSON array.
 """
 import hashlib
 import json
-import shutil
 import subprocess
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
 
+from ..connection import copy_sqlite_database
+
 
 @dataclass
 class BackupRecord:
@@ -56,7 +57,7 @@ def backup_database(url: str, *, backups_dir: Path) -> BackupRecord:
     if url.startswith("sqlite"):
         src = Path(url.replace("sqlite:///", "", 1))
         dst = backups_dir / f"{src.name}.pre_vocab_alignment_{suffix}.db"
-        shutil.copy2(src, dst)
+        copy_sqlite_database(str(src), str(dst))
     elif url.startswith("postgresql") or url.startswith("postgres"):
         parsed = urlparse(url)
         dbname = parsed.path.lstrip("/") or "db"
@@ -0,0 +1,257 @@
+"""
+Keyset (cursor) pagination and cached row counts
+
+A page is read with ``WHERE (order_col, pk) > (:last_value, :last_pk)
+ORDER BY order_col, pk LIMIT n``, so reading page 1000 costs the same
+index range scan as page 1, unlike OFFSET which re-reads every skipped
+row. The position is handed to clients as an opaque cursor.
+
+Totals shown next to a page come from a small per-process cache: ORM
+inserts and deletes committed in this process invalidate the counts of
+their table, other writes age out after ``max_age`` seconds. Unfiltered
+counts of large PostgreSQL tables use the planner estimate
+(``pg_class.reltuples``) instead of a full COUNT.
+"""
+
+import base64
+import binascii
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, inspect as sa_inspect, text, tuple_
+from sqlalchemy.orm import Session
+
+from ..utils.exceptions import ValidationError
+from .per_database import database_key
+
+# Seconds a cached count stays valid without an invalidating ORM write
+DEFAULT_COUNT_MAX_AGE = 30.0
+
+# Unfiltered PostgreSQL tables above this many rows report an estimate
+ESTIMATE_THRESHOLD = 100000
+
+
+@dataclass
+class Page:
+    """One page of a keyset-paginated listing"""
+    items: List[Any]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    total_estimated: bool = False
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def _json_value(value):
+    # Dates and decimals travel as strings and are compared as such
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def encode_cursor(order_by: str, values: Tuple) -> str:
+    """Opaque cursor for the position after a row with these ordering values"""
+    payload = json.dumps({'o': order_by, 'v': [_json_value(v) for v in values]},
+                         separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, order_by: str) -> List[Any]:
+    """
+    Ordering values stored in a cursor
+
+    Raises:
+        ValidationError: If the cursor is malformed or was issued for a
+            different ordering
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        values = payload['v']
+        issued_for = payload['o']
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError):
+        raise ValidationError("Invalid pagination cursor", field='cursor', value=cursor)
+    if issued_for != order_by or not isinstance(values, list) or len(values) != 2:
+        raise ValidationError("Pagination cursor does not match the requested ordering",
+                              field='cursor', value=cursor)
+    return values
+
+
+def order_columns(model_class, order_by: Optional[str]):
+    """
+    Resolve an ``order_by`` spec ("field" or "-field") to
+    (order column, primary key column, descending)
+
+    The primary key breaks ties so that the ordering is total. Without
+    ``order_by`` the primary key alone is used.
+    """
+    pk = sa_inspect(model_class).primary_key[0]
+    if not order_by:
+        return None, pk, False
+    descending = order_by.startswith('-')
+    name = order_by.lstrip('-')
+    column = getattr(model_class, name, None)
+    if column is None or not hasattr(column, 'property') or not hasattr(column.property, 'columns'):
+        raise ValidationError(f"Cannot order {model_class.__name__} by '{name}'", field='order_by', value=order_by)
+    if column.property.columns[0].nullable and column.property.columns[0] is not pk:
+        # NULLs sort differently per backend and cannot be compared
+        raise ValidationError(f"Cannot paginate {model_class.__name__} by nullable column '{name}'",
+                              field='order_by', value=order_by)
+    if column.property.columns[0] is pk:
+        return None, pk, descending
+    return column, pk, descending
+
+
+def keyset_page(query, model_class, order_by: Optional[str], cursor: Optional[str],
+                limit: int, convert: Optional[Callable[[Any], Any]] = None) -> Page:
+    """
+    Read one page of ``query`` (already filtered) after ``cursor``
+
+    Args:
+        query: ORM query over ``model_class``
+        model_class: Mapped class being listed
+        order_by: Column name, "-name" for descending, or None for the primary key
+        cursor: ``next_cursor`` of the previous page, None for the first page
+        limit: Page size
+        convert: Applied to each row (e.g. DTO conversion) inside the session
+
+    Returns:
+        Page without total
+    """
+    column, pk, descending = order_columns(model_class, order_by)
+    key_columns = [pk] if column is None else [column, pk]
+
+    if cursor:
+        values = decode_cursor(cursor, order_by or '')
+        if column is None:
+            bound = pk < values[1] if descending else pk > values[1]
+        else:
+            # Row-value comparison: a single index range scan on SQLite and PostgreSQL
+            bound = (tuple_(column, pk) < tuple_(*values) if descending
+                     else tuple_(column, pk) > tuple_(*values))
+        query = query.filter(bound)
+
+    query = query.order_by(*[c.desc() if descending else c.asc() for c in key_columns])
+    rows = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        last_pk = getattr(last, pk.key)
+        last_value = getattr(last, column.key) if column is not None else last_pk
+        next_cursor = encode_cursor(order_by or '', (last_value, last_pk))
+
+    items = [convert(row) for row in rows] if convert else rows
+    return Page(items=items, next_cursor=next_cursor)
+
+
+# --- cached counts -------------------------------------------------------
+
+_counts: Dict[Tuple[str, str, str], Tuple[int, bool, float]] = {}
+_counts_lock = threading.Lock()
+
+
+def _filters_key(filters: Optional[Dict[str, Any]]) -> str:
+    return json.dumps(sorted((k, _json_value(v)) for k, v in (filters or {}).items()))
+
+
+def _estimate_rows(session, table_name: str) -> Optional[int]:
+    """Planner row estimate of a PostgreSQL table, None elsewhere"""
+    if session.get_bind().dialect.name != 'postgresql':
+        return None
+    estimate = session.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+        {'table': table_name}
+    ).scalar()
+    # -1 / 0: never analysed
+    return estimate if estimate and estimate > 0 else None
+
+
+def cached_count(session, model_class, query, filters: Optional[Dict[str, Any]] = None,
+                 max_age: float = DEFAULT_COUNT_MAX_AGE) -> Tuple[int, bool]:
+    """
+    Row count of ``query`` through the count cache
+
+    Args:
+        session: Session the query belongs to
+        model_class: Mapped class counted (its table is the invalidation key)
+        query: Filtered ORM query to count on a cache miss
+        filters: The filters applied to ``query`` (part of the cache key)
+        max_age: Seconds a cached value may be reused
+
+    Returns:
+        (count, estimated)
+    """
+    table_name = model_class.__table__.name
+    key = (database_key(session.get_bind()), table_name, _filters_key(filters))
+    now = time.monotonic()
+    with _counts_lock:
+        hit = _counts.get(key)
+    if hit is not None and now - hit[2] <= max_age:
+        return hit[0], hit[1]
+
+    estimated = False
+    total = None
+    if not filters:
+        estimate = _estimate_rows(session, table_name)
+        if estimate is not None and estimate >= ESTIMATE_THRESHOLD:
+            total, estimated = estimate, True
+    if total is None:
+        total = query.count()
+
+    with _counts_lock:
+        _counts[key] = (total, estimated, now)
+    return total, estimated
+
+
+def invalidate_counts(bind, table_names=None) -> None:
+    """
+    Drop cached counts of a database (all tables, or only ``table_names``)
+
+    Args:
+        bind: Engine, connection or session bind of the database
+        table_names: Iterable of table names, or None for every table
+    """
+    database = database_key(bind)
+    tables = set(table_names) if table_names is not None else None
+    with _counts_lock:
+        for key in [k for k in _counts if k[0] == database and (tables is None or k[1] in tables)]:
+            del _counts[key]
+
+
+@event.listens_for(Session, 'after_flush')
+def _collect_counted_tables(session, flush_context):
+    tables = {sa_inspect(obj).mapper.local_table.name for obj in list(session.new) + list(session.deleted)}
+    if tables:
+        session.info.setdefault('count_tables', set()).update(tables)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _collect_dml_tables(orm_execute_state):
+    # Core-style inserts/deletes run through the session (bulk imports)
+    if orm_execute_state.is_insert or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, 'table', None)
+        if table is not None and getattr(table, 'name', None):
+            orm_execute_state.session.info.setdefault('count_tables', set()).add(table.name)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_committed(session):
+    tables = session.info.pop('count_tables', None)
+    if not tables:
+        return
+    try:
+        invalidate_counts(session.get_bind(), tables)
+    except Exception:
+        pass
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_counted_tables(session):
+    session.info.pop('count_tables', None)
@@ -0,0 +1,118 @@
+"""
+Process-wide state kept once per database
+
+Caches and in-memory indexes shared by requests are keyed by the
+normalised database URL rather than by engine: the web app can switch
+the active database, and import services reach the same database
+through their own engines or connection strings.
+"""
+
+import logging
+import threading
+from typing import Callable, Dict, Generic, Optional, TypeVar
+
+from sqlalchemy.engine import make_url
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+def database_key(database) -> Optional[str]:
+    """
+    Normalised URL of a database
+
+    Args:
+        database: Connection string, Engine, Connection (or session
+            bind), DatabaseConnection or DatabaseManager
+
+    Returns:
+        The URL including its password, or None if it cannot be told
+    """
+    if database is None:
+        return None
+    if isinstance(database, str):
+        return make_url(database).render_as_string(hide_password=False)
+    url = getattr(database, 'url', None)
+    if url is None:
+        # Connection / DatabaseConnection, then DatabaseManager
+        engine = getattr(database, 'engine', None)
+        if engine is None:
+            engine = getattr(getattr(database, 'connection', None), 'engine', None)
+        url = getattr(engine, 'url', None)
+    if url is None:
+        return None
+    return url.render_as_string(hide_password=False)
+
+
+class PerDatabase(Generic[T]):
+    """
+    Thread-safe map of database -> state object
+    """
+
+    def __init__(self):
+        self._items: Dict[str, T] = {}
+        self._lock = threading.Lock()
+
+    def get(self, database, factory: Optional[Callable[[], T]] = None) -> Optional[T]:
+        """
+        State object of a database
+
+        Args:
+            database: Anything ``database_key`` accepts
+            factory: Creates the object when the database has none yet;
+                without it a missing object is returned as None
+        """
+        key = database_key(database)
+        if key is None:
+            return None
+        with self._lock:
+            item = self._items.get(key)
+            if item is None and factory is not None:
+                item = factory()
+                self._items[key] = item
+            return item
+
+    def pop(self, database) -> Optional[T]:
+        """Forget a database's state object, returning it if there was one"""
+        key = database_key(database)
+        with self._lock:
+            return self._items.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+class BackgroundRefresh:
+    """
+    Mixin for state rebuilt off the request thread, one rebuild at a time
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._refreshing = False
+
+    def refresh_in_background(self, refresh: Callable[[], None], name: str) -> bool:
+        """
+        Run ``refresh`` in a daemon thread unless one is already running
+
+        Returns:
+            True if a refresh was started
+        """
+        with self._lock:
+            if self._refreshing:
+                return False
+            self._refreshing = True
+
+        def run():
+            try:
+                refresh()
+            except Exception as e:
+                logger.warning(f"{name} failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        threading.Thread(target=run, name=name, daemon=True).start()
+        return True
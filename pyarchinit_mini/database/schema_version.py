@@ -0,0 +1,109 @@
+"""
+Applied-migrations record and schema fingerprint
+
+``pyarchinit_schema_version`` gets one row per full migration run: the
+migrations revision, a fingerprint of the schema the run left behind and
+the number of migrations applied. On startup the latest row and the
+current fingerprint are read in a single query; when both the revision
+and the fingerprint match, nothing changed since the last run and the
+column-by-column checks are skipped.
+
+The fingerprint covers tables, columns, indexes and triggers: on SQLite
+the ``sqlite_master`` definitions, on PostgreSQL the catalog entries of
+the current schema. Other dialects have no fingerprint and always run
+the full checks.
+"""
+
+import hashlib
+import logging
+from typing import Optional
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+VERSION_TABLE = 'pyarchinit_schema_version'
+
+_SQLITE_FINGERPRINT = (
+    "SELECT group_concat(entry, char(10)) FROM ("
+    "SELECT type || ':' || name || ':' || coalesce(sql, '') AS entry FROM sqlite_master "
+    "WHERE name NOT LIKE 'sqlite_%' ORDER BY type, name)"
+)
+
+_POSTGRESQL_FINGERPRINT = (
+    "SELECT md5("
+    "coalesce((SELECT string_agg(table_name || '.' || column_name || ':' || data_type, ',' "
+    "ORDER BY table_name, column_name) FROM information_schema.columns "
+    "WHERE table_schema = current_schema()), '') || '|' || "
+    "coalesce((SELECT string_agg(indexname, ',' ORDER BY indexname) FROM pg_indexes "
+    "WHERE schemaname = current_schema()), '') || '|' || "
+    "coalesce((SELECT string_agg(tgname, ',' ORDER BY tgname) FROM pg_trigger "
+    "WHERE NOT tgisinternal), ''))"
+)
+
+
+def _fingerprint_sql(dialect: str) -> Optional[str]:
+    if dialect == 'sqlite':
+        return _SQLITE_FINGERPRINT
+    if dialect == 'postgresql':
+        return _POSTGRESQL_FINGERPRINT
+    return None
+
+
+def _digest(raw) -> str:
+    return hashlib.sha256((raw or '').encode('utf-8')).hexdigest()
+
+
+def _create_table(conn):
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {VERSION_TABLE} ("
+        f"id INTEGER PRIMARY KEY, revision VARCHAR(100) NOT NULL, "
+        f"fingerprint VARCHAR(64) NOT NULL, migrations_applied INTEGER NOT NULL DEFAULT 0, "
+        f"applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+    ))
+
+
+def schema_unchanged(engine, revision: str) -> bool:
+    """
+    Whether the schema is the one recorded by the last run of ``revision``
+
+    One query: the current fingerprint and the latest recorded run.
+    """
+    fingerprint_sql = _fingerprint_sql(engine.dialect.name)
+    if fingerprint_sql is None:
+        return False
+    try:
+        with engine.connect() as conn:
+            row = conn.execute(text(
+                f"SELECT ({fingerprint_sql}), "
+                f"(SELECT revision || ':' || fingerprint FROM {VERSION_TABLE} ORDER BY id DESC LIMIT 1)"
+            )).first()
+    except Exception as e:
+        # No version table yet (first run) or unreadable catalog
+        logger.debug(f"Schema version not available: {e}")
+        return False
+    if row is None or row[1] is None:
+        return False
+    return row[1] == f"{revision}:{_digest(row[0])}"
+
+
+def record_schema_version(engine, revision: str, migrations_applied: int) -> Optional[str]:
+    """
+    Record a completed migration run and the schema it left behind
+
+    Returns:
+        The recorded fingerprint, or None if the dialect has none
+    """
+    fingerprint_sql = _fingerprint_sql(engine.dialect.name)
+    if fingerprint_sql is None:
+        return None
+    with engine.begin() as conn:
+        _create_table(conn)
+        fingerprint = _digest(conn.execute(text(fingerprint_sql)).scalar())
+        next_id = conn.execute(text(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {VERSION_TABLE}")).scalar()
+        conn.execute(text(
+            f"INSERT INTO {VERSION_TABLE} (id, revision, fingerprint, migrations_applied) "
+            f"VALUES (:id, :revision, :fingerprint, :applied)"
+        ), {'id': next_id, 'revision': revision, 'fingerprint': fingerprint,
+            'applied': migrations_applied})
+    return fingerprint
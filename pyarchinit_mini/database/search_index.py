@@ -0,0 +1,267 @@
+"""
+Full-text search index for sites, stratigraphic units and materials
+
+SQLite: one external-content FTS5 table per entity (``<table>_fts``), kept
+in sync with its base table by AFTER INSERT/UPDATE/DELETE triggers.
+
+PostgreSQL: a GIN index on a ``to_tsvector('simple', ...)`` expression
+over the searchable columns and, when the pg_trgm extension is available,
+a trigram GIN index on the same document for substring matches. Both are
+expression indexes, so PostgreSQL maintains them on every write.
+
+UniversalSearchService uses the index when present and falls back to
+ILIKE scans otherwise.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import inspect, text
+
+from .per_database import PerDatabase
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SearchTable:
+    """A base table and the columns indexed for full-text search"""
+    table: str
+    pk: str
+    columns: Tuple[str, ...]
+
+    @property
+    def fts_table(self) -> str:
+        """Name of the SQLite FTS5 table"""
+        return f"{self.table}_fts"
+
+    @property
+    def tsvector_index(self) -> str:
+        return f"idx_{self.table}_search_tsv"
+
+    @property
+    def trigram_index(self) -> str:
+        return f"idx_{self.table}_search_trgm"
+
+    def document_sql(self) -> str:
+        """PostgreSQL expression concatenating the searchable columns"""
+        return " || ' ' || ".join(
+            f"coalesce(CAST({col} AS TEXT), '')" for col in self.columns
+        )
+
+    def tsvector_sql(self) -> str:
+        return f"to_tsvector('simple'::regconfig, {self.document_sql()})"
+
+
+# Result key used by UniversalSearchService -> indexed table
+SEARCH_TABLES: Dict[str, SearchTable] = {
+    'sites': SearchTable('site_table', 'id_sito', (
+        'sito', 'nazione', 'regione', 'comune', 'provincia',
+        'definizione_sito', 'descrizione',
+    )),
+    'us': SearchTable('us_table', 'id_us', (
+        'sito', 'area', 'us', 'd_stratigrafica', 'd_interpretativa', 'descrizione',
+        'interpretazione', 'schedatore', 'datazione', 'osservazioni',
+    )),
+    'materials': SearchTable('inventario_materiali_table', 'id_invmat', (
+        'sito', 'tipo_reperto', 'definizione', 'descrizione',
+        'criterio_schedatura', 'datazione_reperto',
+    )),
+}
+
+_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+def query_tokens(query: str):
+    """Split a free-text query into the word tokens the index matches"""
+    return _TOKEN_PATTERN.findall(query or '')
+
+
+def fts5_match_expression(query: str) -> Optional[str]:
+    """
+    FTS5 MATCH expression: every token must match as a prefix
+
+    Returns:
+        Expression, or None if the query has no word characters
+    """
+    tokens = query_tokens(query)
+    if not tokens:
+        return None
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+def tsquery_expression(query: str) -> Optional[str]:
+    """PostgreSQL to_tsquery() input: prefix match of every token"""
+    tokens = query_tokens(query)
+    if not tokens:
+        return None
+    return ' & '.join(f"{token}:*" for token in tokens)
+
+
+def _sqlite_triggers(spec: SearchTable) -> Dict[str, str]:
+    """Trigger name -> CREATE statement of the triggers syncing the FTS5 table"""
+    columns = ', '.join(spec.columns)
+    new_values = ', '.join(f'new.{col}' for col in spec.columns)
+    old_values = ', '.join(f'old.{col}' for col in spec.columns)
+    fts = spec.fts_table
+    return {
+        f"{fts}_ai": (
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {spec.table} BEGIN "
+            f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.{spec.pk}, {new_values}); END"
+        ),
+        f"{fts}_ad": (
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {spec.table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.{spec.pk}, {old_values}); END"
+        ),
+        # Only updates of indexed columns touch the index (not e.g. sync columns)
+        f"{fts}_au": (
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {spec.pk}, {columns} "
+            f"ON {spec.table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.{spec.pk}, {old_values}); "
+            f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.{spec.pk}, {new_values}); END"
+        ),
+    }
+
+
+def _sqlite_schema_names(conn):
+    return {row[0] for row in conn.execute(
+        text("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')")
+    )}
+
+
+def _create_sqlite_index(conn, spec: SearchTable) -> bool:
+    """
+    Create the FTS5 table and triggers of one base table; True if created
+
+    An FTS5 table that lost any of its triggers may have missed writes:
+    the triggers are recreated and the table rebuilt.
+    """
+    names = _sqlite_schema_names(conn)
+    triggers = _sqlite_triggers(spec)
+    missing = [name for name in triggers if name not in names]
+    fts = spec.fts_table
+    if fts in names and not missing:
+        return False
+
+    if fts not in names:
+        conn.execute(text(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5({', '.join(spec.columns)}, "
+            f"content='{spec.table}', content_rowid='{spec.pk}', "
+            f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        ))
+    else:
+        logger.warning(f"Full-text index {fts} is missing triggers {', '.join(missing)}, rebuilding it")
+    for name in missing:
+        conn.execute(text(triggers[name]))
+    conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+    return True
+
+
+def _create_postgresql_index(conn, spec: SearchTable, trigram: bool) -> int:
+    """Create the tsvector (and trigram) GIN indexes of one base table"""
+    conn.execute(text(
+        f"CREATE INDEX IF NOT EXISTS {spec.tsvector_index} "
+        f"ON {spec.table} USING gin (({spec.tsvector_sql()}))"
+    ))
+    created = 1
+    if trigram:
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS {spec.trigram_index} "
+            f"ON {spec.table} USING gin (({spec.document_sql()}) gin_trgm_ops)"
+        ))
+        created += 1
+    return created
+
+
+def ensure_search_index(engine) -> int:
+    """
+    Create the search index objects that are missing
+
+    Base tables that do not exist yet, or that lack an indexed column, are
+    skipped (searches on them use ILIKE). A SQLite index missing any of
+    its triggers is repaired and rebuilt.
+
+    Returns:
+        Number of tables whose index was created or rebuilt
+    """
+    try:
+        return _ensure_search_index(engine)
+    finally:
+        _status_cache.pop(engine)
+
+
+def _ensure_search_index(engine) -> int:
+    inspector = inspect(engine)
+    dialect = engine.dialect.name
+    trigram = False
+    if dialect == 'postgresql':
+        try:
+            with engine.begin() as conn:
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            trigram = True
+        except Exception as e:
+            logger.info(f"pg_trgm not available, substring search will not be indexed: {e}")
+    elif dialect != 'sqlite':
+        return 0
+
+    created = 0
+    for spec in SEARCH_TABLES.values():
+        if not inspector.has_table(spec.table):
+            continue
+        table_columns = {c['name'] for c in inspector.get_columns(spec.table)}
+        missing = [col for col in (spec.pk,) + spec.columns if col not in table_columns]
+        if missing:
+            logger.warning(f"Search index for {spec.table} skipped, missing columns: {', '.join(missing)}")
+            continue
+        try:
+            with engine.begin() as conn:
+                if dialect == 'sqlite':
+                    if _create_sqlite_index(conn, spec):
+                        created += 1
+                        logger.info(f"Created full-text index {spec.fts_table}")
+                else:
+                    _create_postgresql_index(conn, spec, trigram)
+                    created += 1
+        except Exception as e:
+            logger.warning(f"Could not create search index for {spec.table}: {e}")
+    return created
+
+
+def search_index_status(engine) -> Dict[str, Dict[str, bool]]:
+    """
+    Which search index objects exist, per result key
+
+    A SQLite full-text index counts only with all of its triggers, as
+    without them it no longer follows the base table.
+
+    Returns:
+        {'sites': {'fulltext': bool, 'trigram': bool}, ...}
+    """
+    status = {key: {'fulltext': False, 'trigram': False} for key in SEARCH_TABLES}
+    dialect = engine.dialect.name
+    with engine.connect() as conn:
+        if dialect == 'sqlite':
+            names = _sqlite_schema_names(conn)
+            for key, spec in SEARCH_TABLES.items():
+                status[key]['fulltext'] = (
+                    spec.fts_table in names and all(name in names for name in _sqlite_triggers(spec))
+                )
+        elif dialect == 'postgresql':
+            names = {row[0] for row in conn.execute(
+                text("SELECT indexname FROM pg_indexes WHERE schemaname = current_schema()")
+            )}
+            for key, spec in SEARCH_TABLES.items():
+                status[key]['fulltext'] = spec.tsvector_index in names
+                status[key]['trigram'] = spec.trigram_index in names
+    return status
+
+
+# Status per database, read once and dropped whenever ensure_search_index runs
+_status_cache: PerDatabase[Dict[str, Dict[str, bool]]] = PerDatabase()
+
+
+def cached_search_index_status(engine) -> Dict[str, Dict[str, bool]]:
+    """``search_index_status`` of a database, read once per process"""
+    return _status_cache.get(engine, lambda: search_index_status(engine))
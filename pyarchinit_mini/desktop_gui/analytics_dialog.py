@@ -99,7 +99,7 @@ class AnalyticsDialog:
             data = self.analytics_service.get_complete_dashboard_data()
 
             # Display overview stats
-            self.display_overview_stats(data['overview'])
+            self.display_overview_stats(data['overview'], data.get('freshness'))
 
             # Create charts
             self.create_charts(data)
@@ -107,7 +107,7 @@ class AnalyticsDialog:
         except Exception as e:
             messagebox.showerror("Errore", f"Errore caricamento analytics: {str(e)}")
 
-    def display_overview_stats(self, overview):
+    def display_overview_stats(self, overview, freshness=None):
         """Display overview statistics"""
         stats_text = f"""
         Siti Totali: {overview['total_sites']}
@@ -116,6 +116,8 @@ class AnalyticsDialog:
         Regioni: {overview['total_regions']}
         Province: {overview['total_provinces']}
         """
+        if freshness and freshness.get('reconciled_at'):
+            stats_text += f"Dati aggiornati al: {freshness['reconciled_at']}\n"
 
         label = ttk.Label(self.stats_frame, text=stats_text, font=("Arial", 12))
         label.pack()
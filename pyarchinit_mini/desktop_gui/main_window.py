@@ -21,10 +21,13 @@ from pyarchinit_mini.services.periodizzazione_service import PeriodizzazioneServ
 from pyarchinit_mini.services.media_service import MediaService
 from pyarchinit_mini.services.thesaurus_service import ThesaurusService
 from pyarchinit_mini.database.postgres_installer import PostgreSQLInstaller
-from pyarchinit_mini.harris_matrix.matrix_generator import HarrisMatrixGenerator
-from pyarchinit_mini.harris_matrix.pyarchinit_visualizer import PyArchInitMatrixVisualizer
-from pyarchinit_mini.pdf_export.pdf_generator import PDFGenerator
 from pyarchinit_mini.media_manager.media_handler import MediaHandler
+from pyarchinit_mini.utils.lazy import lazy_instance
+
+# Built on first use: networkx, graphviz and reportlab are slow to import
+MATRIX_GENERATOR = 'pyarchinit_mini.harris_matrix.matrix_generator:HarrisMatrixGenerator'
+MATRIX_VISUALIZER = 'pyarchinit_mini.harris_matrix.pyarchinit_visualizer:PyArchInitMatrixVisualizer'
+PDF_GENERATOR = 'pyarchinit_mini.pdf_export.pdf_generator:PDFGenerator'
 
 # Import i18n
 from .i18n import _
@@ -44,7 +47,6 @@ from .inventario_dialog_extended import ExtendedInventarioDialog
 from .thesaurus_dialog import ThesaurusDialog
 from .postgres_installer_dialog import PostgreSQLInstallerDialog
 from .export_import_dialog import show_export_import_dialog
-from .analytics_dialog import show_analytics_dialog
 from .graphml_export_dialog import show_graphml_export_dialog
 from .pyarchinit_import_export_dialog import PyArchInitImportExportDialog
 from .excel_import_dialog import ExcelImportDialog
@@ -113,9 +115,9 @@ class PyArchInitGUI:
             self.media_service = MediaService(self.db_manager)
             self.thesaurus_service = ThesaurusService(self.db_manager)
             self.postgres_installer = PostgreSQLInstaller()
-            self.matrix_generator = HarrisMatrixGenerator(self.db_manager, self.us_service)
-            self.matrix_visualizer = PyArchInitMatrixVisualizer()
-            self.pdf_generator = PDFGenerator()
+            self.matrix_generator = lazy_instance(MATRIX_GENERATOR, self.db_manager, self.us_service)
+            self.matrix_visualizer = lazy_instance(MATRIX_VISUALIZER)
+            self.pdf_generator = lazy_instance(PDF_GENERATOR)
             self.media_handler = MediaHandler()
             
             print("Database and services initialized successfully")
@@ -1299,7 +1301,7 @@ class PyArchInitGUI:
             self.inventario_service = InventarioService(self.db_manager)
             self.periodizzazione_service = PeriodizzazioneService(self.db_manager)
             self.media_service = MediaService(self.db_manager)
-            self.matrix_generator = HarrisMatrixGenerator(self.db_manager, self.us_service)
+            self.matrix_generator = lazy_instance(MATRIX_GENERATOR, self.db_manager, self.us_service)
             
             # Refresh data
             self.refresh_data()
@@ -1741,7 +1743,7 @@ SCORCIATOIE:
                         self.periodizzazione_service = PeriodizzazioneService(self.db_manager)
                         self.media_service = MediaService(self.db_manager)
                         self.thesaurus_service = ThesaurusService(self.db_manager)
-                        self.matrix_generator = HarrisMatrixGenerator(self.db_manager, self.us_service)
+                        self.matrix_generator = lazy_instance(MATRIX_GENERATOR, self.db_manager, self.us_service)
                         
                         # Initialize default thesaurus
                         self.thesaurus_service.initialize_default_vocabularies()
@@ -1788,6 +1790,8 @@ SCORCIATOIE:
     def show_analytics_dashboard(self):
         """Show analytics dashboard dialog"""
         try:
+            # matplotlib is imported with the dialog, on first opening
+            from .analytics_dialog import show_analytics_dialog
             show_analytics_dialog(self.root, self.db_manager)
         except Exception as e:
             messagebox.showerror("Errore", f"Errore apertura analytics: {str(e)}")
@@ -192,7 +192,11 @@ class PureNetworkXExporter:
 
     def _apply_transitive_reduction(self, graph: nx.DiGraph) -> nx.DiGraph:
         """
-        Apply transitive reduction to remove redundant edges
+        Apply selective transitive reduction to remove redundant edges
+
+        Only stratigraphic ordering edges (copre, taglia, riempie, ...) are
+        reduced; Extended Matrix symbolic edges and "si appoggia" are kept.
+        The graph (already a copy of the input) is reduced in place.
 
         Args:
             graph: Input graph
@@ -200,57 +204,37 @@ class PureNetworkXExporter:
         Returns:
             Reduced graph
         """
+        from ..harris_matrix.transitive_reduction import TransitiveReductionEngine
+
         print(f"ℹ️  Applying transitive reduction...")
 
         edges_before = len(graph.edges())
 
-        # Check if graph is a DAG
         try:
-            is_dag = nx.is_directed_acyclic_graph(graph)
-        except Exception as e:
-            print(f"⚠️  Could not check if graph is acyclic: {e}")
-            is_dag = False
-
-        if not is_dag:
+            edges_removed = TransitiveReductionEngine().reduce(graph)
+        except nx.NetworkXUnfeasible:
             print(f"⚠️  Graph contains cycles - transitive reduction requires a DAG")
             print(f"   Skipping transitive reduction (keeping all edges)")
             print(f"   Note: Cycles may indicate data quality issues")
             print(f"")
             return graph
-
-        # Apply transitive reduction
-        try:
-            reduced_graph = nx.transitive_reduction(graph)
-
-            # Copy node attributes
-            for node_id, node_data in graph.nodes(data=True):
-                for attr_key, attr_value in node_data.items():
-                    reduced_graph.nodes[node_id][attr_key] = attr_value
-
-            # Copy edge attributes
-            for source, target, edge_data in graph.edges(data=True):
-                if reduced_graph.has_edge(source, target):
-                    for attr_key, attr_value in edge_data.items():
-                        reduced_graph[source][target][attr_key] = attr_value
-
-            edges_after = len(reduced_graph.edges())
-            edges_removed = edges_before - edges_after
-            reduction_pct = (edges_removed / edges_before * 100) if edges_before > 0 else 0
-
-            print(f"✅ Transitive reduction complete:")
-            print(f"   - Edges before: {edges_before}")
-            print(f"   - Edges after: {edges_after}")
-            print(f"   - Removed: {edges_removed} ({reduction_pct:.1f}%)")
-            print(f"")
-
-            return reduced_graph
-
         except Exception as e:
             print(f"⚠️  Transitive reduction failed: {e}")
             print(f"   Keeping original graph")
             print(f"")
             return graph
 
+        edges_after = len(graph.edges())
+        reduction_pct = (edges_removed / edges_before * 100) if edges_before > 0 else 0
+
+        print(f"✅ Transitive reduction complete:")
+        print(f"   - Edges before: {edges_before}")
+        print(f"   - Edges after: {edges_after}")
+        print(f"   - Removed: {edges_removed} ({reduction_pct:.1f}%)")
+        print(f"")
+
+        return graph
+
     def _group_nodes_by_period(
         self,
         graph: nx.DiGraph,
@@ -22,8 +22,6 @@ from contextlib import contextmanager
 from typing import Any, Iterator
 
 from .filesystem import paradata_dir, paradata_flock
-from .projector import GraphProjector
-from pyarchinit_mini.graphml_io.writer import write_graphml
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +29,14 @@ _local = threading.local()
 STRATIGRAPHY_FILENAME = "stratigraphy.graphml"
 
 
+def __getattr__(name: str) -> Any:
+    # GraphProjector stays reachable as auto_regen.GraphProjector
+    if name == "GraphProjector":
+        from .projector import GraphProjector
+        return GraphProjector
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _is_regen_disabled() -> bool:
     return getattr(_local, "disabled", False)
 
@@ -75,6 +81,11 @@ def _trigger_graph_regen(site: str, *, session: Any) -> None:
         _record_touched_site(site)
         return
     try:
+        # Imported here: the projector pulls in s3dgraphy (and pandas), which
+        # importers of this hook (the web app, save routes) should not pay for
+        from .projector import GraphProjector
+        from pyarchinit_mini.graphml_io.writer import write_graphml
+
         graph = GraphProjector.populate_graph(session, site)
         out_path = paradata_dir(site) / STRATIGRAPHY_FILENAME
         # Serialize under per-site flock so concurrent regens don't interleave.
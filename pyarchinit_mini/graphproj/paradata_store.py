@@ -16,9 +16,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Optional
-
-import s3dgraphy
+from typing import TYPE_CHECKING, Any, Optional
 
 from .filesystem import paradata_dir, paradata_flock, slugify
 from .exceptions import ParadataConflict, ParadataNotFound, ParadataStorageError
@@ -26,6 +24,10 @@ from pyarchinit_mini.graphml_io.reader import read_graphml
 from pyarchinit_mini.graphml_io.writer import write_graphml
 
 
+if TYPE_CHECKING:
+    import s3dgraphy
+
+
 PARADATA_FILENAME = "paradata.graphml"
 PARADATA_JSON = "paradata.json"
 
@@ -45,6 +47,8 @@ class ParadataStore:
     def load(self) -> "s3dgraphy.Graph":
         """Returns paradata Graph. Empty Graph if file missing."""
         if not self._path.exists():
+            import s3dgraphy  # slow to import; only needed here
+
             return s3dgraphy.Graph(
                 graph_id=f"paradata:{slugify(self.site)}",
                 name=f"{self.site} paradata",
@@ -1,11 +1,26 @@
 """
 Harris Matrix generation and visualization module
+
+Exports are imported on first use: the visualizer pulls in matplotlib,
+which most importers (web routes, services) never need.
 """
 
-from .matrix_generator import HarrisMatrixGenerator
-from .matrix_visualizer import MatrixVisualizer
+import importlib
+
+_EXPORTS = {
+    "HarrisMatrixGenerator": ".matrix_generator",
+    "MatrixVisualizer": ".matrix_visualizer",
+}
 
 __all__ = [
     "HarrisMatrixGenerator",
     "MatrixVisualizer"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
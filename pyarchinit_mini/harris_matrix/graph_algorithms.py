@@ -0,0 +1,267 @@
+"""
+Scalable graph algorithms for Harris Matrix layout and validation
+
+Layering and cycle detection run in O(V + E) over the whole graph, so
+they can be applied to matrices of any size (no node-count thresholds).
+Feedback arc suggestions only work inside the cyclic components.
+"""
+
+import heapq
+from collections import deque
+from typing import Any, Dict, List, Set, Tuple
+
+import networkx as nx
+
+
+def condense(graph: nx.DiGraph) -> Tuple[nx.DiGraph, Dict[Any, int]]:
+    """
+    Condense strongly connected components into single nodes
+
+    Args:
+        graph: Harris Matrix graph (may contain cycles)
+
+    Returns:
+        Tuple (condensed DAG, mapping node -> component id). Each node of
+        the condensed DAG has a 'members' attribute with the original nodes.
+    """
+    condensed = nx.condensation(graph)
+    return condensed, condensed.graph['mapping']
+
+
+def cyclic_components(graph: nx.DiGraph) -> List[List[Any]]:
+    """
+    Return the strongly connected components that contain a cycle
+
+    A component is cyclic when it has more than one node, or a single node
+    with a self-loop.
+    """
+    components = []
+    for component in nx.strongly_connected_components(graph):
+        if len(component) > 1:
+            components.append(sorted(component, key=str))
+        else:
+            node = next(iter(component))
+            if graph.has_edge(node, node):
+                components.append([node])
+    return components
+
+
+def longest_path_levels(graph: nx.DiGraph) -> Dict[Any, int]:
+    """
+    Assign each node the length of the longest path from a top node
+
+    Kahn-style topological traversal over the SCC condensation: nodes that
+    form a cycle share the level of their component, so the layering is
+    always defined even for graphs with stratigraphic paradoxes.
+
+    Returns:
+        Mapping node -> level (0 = top of the matrix)
+    """
+    if graph.number_of_nodes() == 0:
+        return {}
+
+    condensed, mapping = condense(graph)
+
+    in_degree = dict(condensed.in_degree())
+    component_level = {c: 0 for c, degree in in_degree.items() if degree == 0}
+    queue = deque(component_level)
+
+    while queue:
+        component = queue.popleft()
+        next_level = component_level[component] + 1
+        for successor in condensed.successors(component):
+            if component_level.get(successor, 0) < next_level:
+                component_level[successor] = next_level
+            in_degree[successor] -= 1
+            if in_degree[successor] == 0:
+                queue.append(successor)
+
+    return {node: component_level[mapping[node]] for node in graph.nodes()}
+
+
+# Edge certainty ranking used to choose which relationships to suggest for
+# removal when breaking a cycle: the least certain edges are dropped first.
+CERTAINTY_RANK = {
+    'certain': 3, 'certa': 3, 'certo': 3,
+    'probable': 2, 'probabile': 2,
+    'doubtful': 1, 'dubbia': 1, 'dubbio': 1,
+    'hypothetical': 1, 'ipotetica': 1,
+    'inferred': 0,
+}
+
+
+def certainty_rank(certainty: Any) -> int:
+    """Rank an edge certainty value (higher = more reliable)"""
+    if certainty is None:
+        return CERTAINTY_RANK['certain']
+    return CERTAINTY_RANK.get(str(certainty).strip().lower(), CERTAINTY_RANK['certain'])
+
+
+def _greedy_feedback_order(graph: nx.DiGraph, nodes: Set[Any]) -> Dict[Any, int]:
+    """
+    Eades-Lin-Smyth ordering of a strongly connected component
+
+    Edges are weighted by certainty rank + 1, so the edges pointing
+    backwards in the returned order (the feedback arcs) are preferentially
+    the least certain ones. Runs in O(E log V) with a lazy heap.
+    """
+    weight = {}
+    out_w = {n: 0 for n in nodes}
+    in_w = {n: 0 for n in nodes}
+    for u in nodes:
+        for v, data in graph.succ[u].items():
+            if v in nodes and v != u:
+                w = certainty_rank(data.get('certainty')) + 1
+                weight[(u, v)] = w
+                out_w[u] += w
+                in_w[v] += w
+
+    active = set(nodes)
+    head, tail = [], []
+    heap = [(in_w[n] - out_w[n], str(n), n) for n in nodes]
+    heapq.heapify(heap)
+    sinks = deque(n for n in nodes if out_w[n] == 0)
+    sources = deque(n for n in nodes if in_w[n] == 0 and out_w[n] > 0)
+
+    def remove(node):
+        active.discard(node)
+        for v in graph.succ[node]:
+            if v in active and (node, v) in weight:
+                in_w[v] -= weight[(node, v)]
+                if in_w[v] == 0:
+                    sources.append(v)
+                heapq.heappush(heap, (in_w[v] - out_w[v], str(v), v))
+        for u in graph.pred[node]:
+            if u in active and (u, node) in weight:
+                out_w[u] -= weight[(u, node)]
+                if out_w[u] == 0:
+                    sinks.append(u)
+                heapq.heappush(heap, (in_w[u] - out_w[u], str(u), u))
+
+    while active:
+        if sinks:
+            node = sinks.popleft()
+            if node in active:
+                tail.append(node)
+                remove(node)
+            continue
+        if sources:
+            node = sources.popleft()
+            if node in active:
+                head.append(node)
+                remove(node)
+            continue
+        delta, _, node = heapq.heappop(heap)
+        if node not in active or delta != in_w[node] - out_w[node]:
+            continue  # Stale heap entry
+        head.append(node)
+        remove(node)
+
+    order = head + tail[::-1]
+    return {node: position for position, node in enumerate(order)}
+
+
+# Nodes the re-insertion pass of feedback_arc_set may visit, as a multiple
+# of the component size (V + E); keeps the suggestion linear-time overall
+MINIMIZE_WORK_FACTOR = 4
+
+
+def _creates_cycle(adjacency: Dict[Any, Set[Any]], u: Any, v: Any, limit: int) -> Tuple[bool, int]:
+    """
+    Whether adding u -> v to the acyclic adjacency would close a cycle
+
+    Returns (closes, visited). The search stops after `limit` nodes and then
+    reports a cycle, so an arc that was not fully checked is never re-inserted.
+    """
+    if u == v:
+        return True, 0
+    seen = {v}
+    stack = [v]
+    while stack:
+        node = stack.pop()
+        for nxt in adjacency[node]:
+            if nxt == u:
+                return True, len(seen)
+            if nxt not in seen:
+                if len(seen) >= limit:
+                    return True, len(seen)
+                seen.add(nxt)
+                stack.append(nxt)
+    return False, len(seen)
+
+
+def feedback_arc_set(graph: nx.DiGraph, component: List[Any]) -> List[Tuple[Any, Any]]:
+    """
+    Suggest a minimal set of edges whose removal makes a component acyclic
+
+    The greedy Eades-Lin-Smyth ordering gives a small feedback arc set; it
+    is then made inclusion-minimal by re-inserting, most certain first,
+    every arc that does not close a cycle again. The re-insertion searches
+    share a budget of MINIMIZE_WORK_FACTOR * (V + E) visited nodes; arcs
+    left once it runs out stay in the set, so large components are still
+    handled in linear time (the set is then small, not always minimal).
+    The result is sorted by ascending certainty (the first arcs are the
+    best removal candidates).
+    """
+    nodes = set(component)
+    if len(nodes) == 1:
+        node = component[0]
+        return [(node, node)] if graph.has_edge(node, node) else []
+
+    order = _greedy_feedback_order(graph, nodes)
+
+    adjacency = {n: set() for n in nodes}
+    backward = []
+    budget = MINIMIZE_WORK_FACTOR * len(nodes)
+    for u in nodes:
+        budget += MINIMIZE_WORK_FACTOR * len(graph.succ[u])
+        for v in graph.succ[u]:
+            if v not in nodes:
+                continue
+            if u != v and order[u] < order[v]:
+                adjacency[u].add(v)
+            else:
+                backward.append((u, v))
+
+    def rank(edge):
+        return certainty_rank(graph.edges[edge].get('certainty'))
+
+    feedback = []
+    for u, v in sorted(backward, key=lambda e: (-rank(e), str(e[0]), str(e[1]))):
+        closes, visited = _creates_cycle(adjacency, u, v, budget) if budget > 0 else (True, 0)
+        budget -= visited
+        if closes:
+            feedback.append((u, v))
+        else:
+            adjacency[u].add(v)
+
+    return sorted(feedback, key=lambda e: (rank(e), str(e[0]), str(e[1])))
+
+
+def analyze_cycles(graph: nx.DiGraph) -> List[Dict[str, Any]]:
+    """
+    Report every cyclic strongly connected component of the graph
+
+    Each entry contains the component nodes, one example cycle and the
+    feedback arcs suggested for removal (ranked by edge certainty).
+    SCC detection is linear; the arc suggestion only touches the edges
+    inside each cyclic component.
+
+    Returns:
+        List of dicts with 'nodes', 'cycle' and 'feedback_arcs' keys
+    """
+    report = []
+    for component in cyclic_components(graph):
+        subgraph = graph.subgraph(component)
+        cycle = [u for u, _ in nx.find_cycle(subgraph, source=component[0])]
+        arcs = []
+        for u, v in feedback_arc_set(graph, component):
+            data = graph.edges[u, v]
+            arcs.append({
+                'from': u,
+                'to': v,
+                'relationship': data.get('relationship', ''),
+                'certainty': data.get('certainty', 'certain'),
+            })
+        report.append({'nodes': component, 'cycle': cycle, 'feedback_arcs': arcs})
+    return report
@@ -0,0 +1,174 @@
+"""
+Shared cache of generated Harris Matrix graphs
+
+Entries are keyed by (database, site, area) and hold the built graph
+together with its levels and statistics. Write paths that touch US or
+relationships call ``invalidate_matrix_cache`` so the next request
+rebuilds the matrix; least recently used entries are evicted when the
+cache is full.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from ..database.per_database import database_key
+
+if TYPE_CHECKING:
+    # Write paths import this module only to invalidate; keep networkx out
+    import networkx as nx
+
+
+@dataclass
+class MatrixCacheEntry:
+    """A cached Harris Matrix with its derived data"""
+    graph: "nx.DiGraph"
+    levels: Dict[int, list]
+    statistics: Dict[str, Any]
+    created_at: float = field(default_factory=time.time)
+
+
+class MatrixCache:
+    """
+    Thread-safe LRU cache of Harris Matrix graphs
+
+    Each database and each (database, site) pair has a generation counter
+    that is bumped on invalidation, so a matrix built while a write was in
+    progress is not stored over the invalidation.
+    """
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[Tuple[str, str, Optional[str]], MatrixCacheEntry]" = OrderedDict()
+        self._generations: Dict[Tuple[str, str], int] = {}
+        self._database_generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(database: str, site: str, area: Optional[str]) -> Tuple[str, str, Optional[str]]:
+        return (str(database), str(site), area or None)
+
+    def get(self, database: str, site: str, area: Optional[str] = None) -> Optional[MatrixCacheEntry]:
+        """Return the cached entry (and mark it recently used), or None"""
+        key = self._key(database, site, area)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def generation(self, database: str, site: str) -> Tuple[int, int]:
+        """Current invalidation generation of a site (database-wide, per-site)"""
+        with self._lock:
+            return self._generation((str(database), str(site)))
+
+    def _generation(self, site_key: Tuple[str, str]) -> Tuple[int, int]:
+        return (self._database_generations.get(site_key[0], 0),
+                self._generations.get(site_key, 0))
+
+    def put(self, database: str, site: str, area: Optional[str], entry: MatrixCacheEntry,
+            generation: Optional[Tuple[int, int]] = None) -> bool:
+        """
+        Store an entry, evicting the least recently used one if full
+
+        Args:
+            generation: Site generation read before building the entry; if
+                the site was invalidated since, the entry is not stored
+
+        Returns:
+            True if the entry was stored
+        """
+        key = self._key(database, site, area)
+        with self._lock:
+            if generation is not None and generation != self._generation(key[:2]):
+                return False
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def get_or_build(self, database: str, site: str, area: Optional[str],
+                     builder: Callable[[], MatrixCacheEntry]) -> MatrixCacheEntry:
+        """Return the cached entry, building and storing it on a miss"""
+        entry = self.get(database, site, area)
+        if entry is not None:
+            return entry
+        generation = self.generation(database, site)
+        entry = builder()
+        self.put(database, site, area, entry, generation)
+        return entry
+
+    def invalidate(self, database: str, site: Optional[str] = None) -> int:
+        """
+        Drop the cached matrices of a site (all areas), or of every site of
+        the database when ``site`` is None
+
+        Returns:
+            Number of entries removed
+        """
+        database = str(database)
+        with self._lock:
+            if site is None:
+                keys = [k for k in self._entries if k[0] == database]
+                self._database_generations[database] = self._database_generations.get(database, 0) + 1
+            else:
+                site_key = (database, str(site))
+                keys = [k for k in self._entries if k[:2] == site_key]
+                self._generations[site_key] = self._generations.get(site_key, 0) + 1
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += 1
+            return len(keys)
+
+    def clear(self):
+        """Remove every entry (counters are kept)"""
+        with self._lock:
+            for database in {k[0] for k in self._entries}:
+                self._database_generations[database] = self._database_generations.get(database, 0) + 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and occupancy, for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': (self.hits / lookups) if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
+
+
+# Process-wide cache shared by the web interface, API and MCP tools
+matrix_cache = MatrixCache()
+
+
+def invalidate_matrix_cache(database, site: Optional[str] = None) -> int:
+    """
+    Invalidate the shared matrix cache after a US/relationship write
+
+    Args:
+        database: Connection string, engine or DatabaseManager
+        site: Site whose matrices changed (None = every site)
+
+    Returns:
+        Number of entries removed
+    """
+    database = database_key(database)
+    if database is None:
+        return 0
+    return matrix_cache.invalidate(database, site)
@@ -2,17 +2,25 @@
 Harris Matrix generation from stratigraphic relationships
 """
 
+import copy
 import networkx as nx
 from typing import List, Dict, Any, Tuple, Optional
 from ..database.manager import DatabaseManager
 from ..models.harris_matrix import HarrisMatrix, USRelationships
 from ..models.us import US
+from .graph_algorithms import analyze_cycles, cyclic_components, longest_path_levels
+from ..database.per_database import database_key
+from .matrix_cache import MatrixCacheEntry, invalidate_matrix_cache, matrix_cache
+from .transitive_reduction import TransitiveReductionEngine
 
 class HarrisMatrixGenerator:
     """
     Generates Harris Matrix from stratigraphic relationships
     """
     
+    # Rows fetched per round trip when streaming US / relationship records
+    stream_batch_size = 1000
+
     def __init__(self, db_manager: DatabaseManager, us_service=None):
         self.db_manager = db_manager
         self.us_service = us_service
@@ -28,79 +36,19 @@ class HarrisMatrixGenerator:
         Returns:
             NetworkX directed graph representing the Harris Matrix
         """
-        # Get all US for the site using service if available
-        if self.us_service:
-            filters = {'sito': site_name}
-            if area:
-                filters['area'] = area
-            us_list = self.us_service.get_all_us(size=1000, filters=filters)
-        else:
-            # If no service available, use empty list to avoid session errors
-            print("Warning: No US service available for matrix generation")
-            us_list = []
-        
-        # Get relationships
-        relationships = self._get_relationships(site_name, area)
-        
         # Create directed graph
         graph = nx.DiGraph()
-        
-        # Add US nodes
-        for us in us_list:
-            # Handle both DTO and SQLAlchemy objects
-            us_num = getattr(us, 'us', None)
-            if us_num is None:
-                continue
-
-            # Ensure us_num is always a string for consistent node keys
-            us_num = str(us_num)
-
-            # Get periodization data
-            periodo_iniziale = getattr(us, 'periodo_iniziale', None) or ""
-            fase_iniziale = getattr(us, 'fase_iniziale', None) or ""
-            periodo_finale = getattr(us, 'periodo_finale', None) or ""
-            fase_finale = getattr(us, 'fase_finale', None) or ""
 
-            # Generate periodo code (periodo-fase format as per PyArchInit)
-            periodo_code = self._get_periodo_code(periodo_iniziale, fase_iniziale)
-
-            # Generate extended label (PyArchInit EM palette format)
-            # Format: unita_tipo + us (WITHOUT d_interpretativa, WITHOUT periodo-fase)
-            unita_tipo = getattr(us, 'unita_tipo', None) or "US"
-            d_interpretativa = getattr(us, 'd_interpretativa', None) or ""
-
-            # Build extended label: only tipo + numero
-            extended_label = f"{unita_tipo}{us_num}"
+        # Add US nodes, streamed from the database in batches (no row cap)
+        if not self.us_service:
+            # If no service available, add no nodes to avoid session errors
+            print("Warning: No US service available for matrix generation")
+        for us in self._iter_site_us(site_name, area):
+            self._add_us_node(graph, us)
 
-            # Build description and URL:
-            # - For DOC units: d_interpretativa goes to URL (file path), description is empty
-            # - For other units: d_interpretativa goes to description, URL is empty
-            file_path = getattr(us, 'file_path', None) or ""
+        # Get relationships
+        relationships = self._get_relationships(site_name, area)
 
-            if unita_tipo == "DOC":
-                node_url = d_interpretativa  # For DOC, file path is stored in d_interpretativa
-                description = ""  # DOC nodes should have empty description
-            else:
-                node_url = ""
-                description = d_interpretativa
-
-            graph.add_node(
-                us_num,
-                label=f"US {us_num}",  # Simple label for basic display
-                extended_label=extended_label,  # Extended label for EM export
-                area=getattr(us, 'area', None) or "",
-                description=description,
-                url=node_url,
-                interpretation=d_interpretativa,
-                period_initial=periodo_iniziale,
-                phase_initial=fase_iniziale,
-                period_final=periodo_finale,
-                phase_final=fase_finale,
-                periodo_code=periodo_code,
-                formation=getattr(us, 'formazione', None) or "",
-                unita_tipo=unita_tipo
-            )
-        
         # Add relationship edges - include all stratigraphic relationships
         # Valid relationship types (all in lowercase for comparison)
         valid_relationships = [
@@ -229,22 +177,90 @@ class HarrisMatrixGenerator:
         # Validate and fix matrix
         graph = self._validate_matrix(graph)
 
-        # TRANSITIVE REDUCTION DISABLED FOR NOW
-        # The standard transitive reduction removes too many edges for Harris Matrix
-        # because it doesn't distinguish between:
-        # 1. Normal stratigraphic relationships (which can be reduced)
-        # 2. Extended Matrix metadata relationships (<, >, >>, <<) which should NOT be reduced
-        #
-        # TODO: Implement selective transitive reduction that:
-        # - Reduces only stratigraphic relationships (copre, taglia, riempie)
-        # - Preserves all EM relationships (<, >, >>, <<)
-        # - Preserves all "si appoggia" relationships (structural, not transitive)
-        #
-        # For now, keep ALL edges to ensure correctness
-        print(f"ℹ️  Transitive reduction disabled - keeping all {len(graph.edges())} edges")
+        # Selective transitive reduction: only stratigraphic ordering edges
+        # (copre, taglia, riempie) are reduced; EM symbolic relationships
+        # (<, >, >>, <<) and "si appoggia" are always preserved
+        try:
+            removed = TransitiveReductionEngine().reduce(graph)
+            print(f"✂️  Transitive reduction removed {removed} redundant edges "
+                  f"({len(graph.edges())} kept)")
+        except nx.NetworkXUnfeasible:
+            print(f"⚠️  Stratigraphic edges contain cycles - keeping all {len(graph.edges())} edges")
 
         return graph
 
+    def _iter_site_us(self, site_name: str, area: Optional[str] = None):
+        """
+        Iterate over every US of a site/area, streamed in batches
+
+        Uses ``us_service.iter_us`` (server-side cursor, ``yield_per``) so
+        that large excavations are read completely with bounded memory.
+        """
+        if not self.us_service:
+            return
+
+        filters = {'sito': site_name}
+        if area:
+            filters['area'] = area
+
+        yield from self.us_service.iter_us(filters=filters, batch_size=self.stream_batch_size)
+
+    def _add_us_node(self, graph: nx.DiGraph, us) -> None:
+        """Add a single US (DTO or SQLAlchemy object) as a node of the graph"""
+        # Handle both DTO and SQLAlchemy objects
+        us_num = getattr(us, 'us', None)
+        if us_num is None:
+            return
+
+        # Ensure us_num is always a string for consistent node keys
+        us_num = str(us_num)
+
+        # Get periodization data
+        periodo_iniziale = getattr(us, 'periodo_iniziale', None) or ""
+        fase_iniziale = getattr(us, 'fase_iniziale', None) or ""
+        periodo_finale = getattr(us, 'periodo_finale', None) or ""
+        fase_finale = getattr(us, 'fase_finale', None) or ""
+
+        # Generate periodo code (periodo-fase format as per PyArchInit)
+        periodo_code = self._get_periodo_code(periodo_iniziale, fase_iniziale)
+
+        # Generate extended label (PyArchInit EM palette format)
+        # Format: unita_tipo + us (WITHOUT d_interpretativa, WITHOUT periodo-fase)
+        unita_tipo = getattr(us, 'unita_tipo', None) or "US"
+        d_interpretativa = getattr(us, 'd_interpretativa', None) or ""
+
+        # Build extended label: only tipo + numero
+        extended_label = f"{unita_tipo}{us_num}"
+
+        # Build description and URL:
+        # - For DOC units: d_interpretativa goes to URL (file path), description is empty
+        # - For other units: d_interpretativa goes to description, URL is empty
+        file_path = getattr(us, 'file_path', None) or ""
+
+        if unita_tipo == "DOC":
+            node_url = d_interpretativa  # For DOC, file path is stored in d_interpretativa
+            description = ""  # DOC nodes should have empty description
+        else:
+            node_url = ""
+            description = d_interpretativa
+
+        graph.add_node(
+            us_num,
+            label=f"US {us_num}",  # Simple label for basic display
+            extended_label=extended_label,  # Extended label for EM export
+            area=getattr(us, 'area', None) or "",
+            description=description,
+            url=node_url,
+            interpretation=d_interpretativa,
+            period_initial=periodo_iniziale,
+            phase_initial=fase_iniziale,
+            period_final=periodo_finale,
+            phase_final=fase_finale,
+            periodo_code=periodo_code,
+            formation=getattr(us, 'formazione', None) or "",
+            unita_tipo=unita_tipo
+        )
+
     def _get_periodo_code(self, periodo: str, fase: str) -> str:
         """
         Generate periodo code in PyArchInit format: periodo-fase
@@ -284,75 +300,8 @@ class HarrisMatrixGenerator:
 
         # Method 1: Read from us_relationships_table (PyArchInit-Mini format)
         try:
-            from sqlalchemy import text
-            from sqlalchemy.orm import sessionmaker
-
-            Session = sessionmaker(bind=self.db_manager.connection.engine)
-            session = Session()
-
-            try:
-                # Query relationships from dedicated table
-                # Include extended data for rapporti2 format (unita_tipo, d_interpretativa, periodo-fase)
-                query = text("""
-                    SELECT DISTINCT
-                        r.us_from, r.us_to, r.relationship_type,
-                        u_to.unita_tipo as target_unita_tipo,
-                        u_to.d_interpretativa as target_d_interpretativa,
-                        u_to.periodo_iniziale as target_periodo_iniziale,
-                        u_to.fase_iniziale as target_fase_iniziale
-                    FROM us_relationships_table r
-                    INNER JOIN us_table u_from ON r.sito = u_from.sito AND CAST(r.us_from AS TEXT) = CAST(u_from.us AS TEXT)
-                    INNER JOIN us_table u_to ON r.sito = u_to.sito AND CAST(r.us_to AS TEXT) = CAST(u_to.us AS TEXT)
-                    WHERE r.sito = :site
-                """)
-
-                params = {'site': site_name}
-
-                # Add area filter if specified
-                if area:
-                    query = text("""
-                        SELECT DISTINCT
-                            r.us_from, r.us_to, r.relationship_type,
-                            u_to.unita_tipo as target_unita_tipo,
-                            u_to.d_interpretativa as target_d_interpretativa,
-                            u_to.periodo_iniziale as target_periodo_iniziale,
-                            u_to.fase_iniziale as target_fase_iniziale
-                        FROM us_relationships_table r
-                        INNER JOIN us_table u_from ON r.sito = u_from.sito AND CAST(r.us_from AS TEXT) = CAST(u_from.us AS TEXT)
-                        INNER JOIN us_table u_to ON r.sito = u_to.sito AND CAST(r.us_to AS TEXT) = CAST(u_to.us AS TEXT)
-                        WHERE r.sito = :site AND (u_from.area = :area OR u_to.area = :area)
-                    """)
-                    params['area'] = area
-
-                result = session.execute(query, params)
-                rels_from_table = result.fetchall()
-
-                for rel_row in rels_from_table:
-                    # Get target US data
-                    target_unita_tipo = rel_row.target_unita_tipo or "US"
-                    target_d_interpretativa = rel_row.target_d_interpretativa or ""
-                    target_periodo = rel_row.target_periodo_iniziale or ""
-                    target_fase = rel_row.target_fase_iniziale or ""
-
-                    # Generate periodo code for target
-                    target_periodo_code = self._get_periodo_code(target_periodo, target_fase)
-
-                    relationships.append({
-                        'us_from': str(rel_row.us_from),
-                        'us_to': str(rel_row.us_to),
-                        'type': rel_row.relationship_type.lower(),  # Normalize to lowercase
-                        'certainty': 'certain',
-                        # Extended rapporti2 format data
-                        'target_unita_tipo': target_unita_tipo,
-                        'target_d_interpretativa': target_d_interpretativa,
-                        'target_periodo_code': target_periodo_code
-                    })
-
-                print(f"Found {len(relationships)} relationships in us_relationships_table for {site_name}")
-
-            finally:
-                session.close()
-
+            relationships = self._load_table_relationships(site_name, area)
+            print(f"Found {len(relationships)} relationships in us_relationships_table for {site_name}")
         except Exception as e:
             print(f"Warning: Failed to read from us_relationships_table: {e}")
             # Fallback to rapporti field method below
@@ -361,14 +310,12 @@ class HarrisMatrixGenerator:
         if len(relationships) == 0:
             print("Falling back to rapporti field method...")
 
-            # Get US records to extract relationships from rapporti field
-            if self.us_service:
-                us_list = self.us_service.get_all_us(size=1000, filters=filters)
-            else:
+            # Stream US records to extract relationships from rapporti field
+            if not self.us_service:
                 print("Warning: No US service available for relationship extraction")
                 return []
 
-            for us_record in us_list:
+            for us_record in self._iter_site_us(site_name, area):
                 us_num = getattr(us_record, 'us', None)
                 area_us = getattr(us_record, 'area', '')
                 rapporti = getattr(us_record, 'rapporti', None)
@@ -465,8 +412,7 @@ class HarrisMatrixGenerator:
                     if 'area' in filters:
                         query = query.filter(USRelationships.area == filters['area'])
                     
-                    rel_records = query.limit(1000).all()
-                    for rel in rel_records:
+                    for rel in query.yield_per(self.stream_batch_size):
                         if rel.us_from is not None and rel.us_to is not None:
                             relationships.append({
                                 'us_from': rel.us_from,
@@ -486,8 +432,7 @@ class HarrisMatrixGenerator:
                     if 'area' in filters:
                         query = query.filter(HarrisMatrix.area == filters['area'])
                     
-                    matrix_records = query.limit(1000).all()
-                    for matrix in matrix_records:
+                    for matrix in query.yield_per(self.stream_batch_size):
                         if matrix.us_sopra is not None and matrix.us_sotto is not None:
                             relationships.append({
                                 'us_from': matrix.us_sopra,
@@ -513,6 +458,105 @@ class HarrisMatrixGenerator:
         
         return relationships
     
+    @staticmethod
+    def _us_key(value: Any) -> str:
+        """
+        Normalize a US number to the string key used for graph nodes.
+
+        us_table.us is TEXT while us_relationships_table.us_from/us_to are
+        INTEGER, so both sides are converted here instead of CASTing inside
+        the SQL join (which prevents the database from using any index).
+        """
+        if value is None:
+            return ""
+        return str(value).strip()
+
+    def _load_table_relationships(self, site_name: str, area: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Load relationships from us_relationships_table joined to us_table
+
+        Both tables are read with a plain ``sito = :site`` predicate so the
+        (sito, us_from) / (sito, us) indexes created by DatabaseMigrations
+        are used, then joined in memory on normalized US keys.
+
+        Args:
+            site_name: Site name
+            area: Optional area filter (matches either endpoint)
+
+        Returns:
+            List of relationship dictionaries in rapporti2-extended format
+        """
+        from sqlalchemy import text
+
+        us_query = text("""
+            SELECT us, area, unita_tipo, d_interpretativa,
+                   periodo_iniziale, fase_iniziale
+            FROM us_table
+            WHERE sito = :site
+        """)
+        rel_query = text("""
+            SELECT us_from, us_to, relationship_type
+            FROM us_relationships_table
+            WHERE sito = :site
+        """)
+
+        with self.db_manager.connection.get_session() as session:
+            # US key -> list of rows (the same US number may exist in more than one area)
+            us_rows: Dict[str, List[Any]] = {}
+            for row in session.execute(us_query, {'site': site_name}):
+                us_rows.setdefault(self._us_key(row.us), []).append(row)
+
+            rel_rows = session.execute(rel_query, {'site': site_name}).fetchall()
+
+        relationships = []
+        seen = set()
+
+        for rel_row in rel_rows:
+            us_from = self._us_key(rel_row.us_from)
+            us_to = self._us_key(rel_row.us_to)
+
+            from_rows = us_rows.get(us_from)
+            to_rows = us_rows.get(us_to)
+            if not from_rows or not to_rows:
+                # Same semantics as the INNER JOIN: both endpoints must exist
+                continue
+
+            if area:
+                # (from, to) pairs qualify when either endpoint is in the area
+                if not any(r.area == area for r in from_rows):
+                    to_rows = [r for r in to_rows if r.area == area]
+                    if not to_rows:
+                        continue
+
+            rel_type = (rel_row.relationship_type or '').lower()  # Normalize to lowercase
+
+            for target in to_rows:
+                target_unita_tipo = target.unita_tipo or "US"
+                target_d_interpretativa = target.d_interpretativa or ""
+                target_periodo_code = self._get_periodo_code(
+                    target.periodo_iniziale or "",
+                    target.fase_iniziale or ""
+                )
+
+                key = (us_from, us_to, rel_type, target_unita_tipo,
+                       target_d_interpretativa, target_periodo_code)
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                relationships.append({
+                    'us_from': us_from,
+                    'us_to': us_to,
+                    'type': rel_type,
+                    'certainty': 'certain',
+                    # Extended rapporti2 format data
+                    'target_unita_tipo': target_unita_tipo,
+                    'target_d_interpretativa': target_d_interpretativa,
+                    'target_periodo_code': target_periodo_code
+                })
+
+        return relationships
+
     def _map_relationship_type(self, pyarchinit_rel: str) -> Optional[str]:
         """Map PyArchInit relationship types to our standardized types"""
         mapping = {
@@ -570,14 +614,8 @@ class HarrisMatrixGenerator:
     def _infer_relationships(self, site_name: str, area: Optional[str] = None) -> List[Dict[str, Any]]:
         """Infer relationships from US order numbers"""
         
-        filters = {'sito': site_name}
-        if area:
-            filters['area'] = area
-        
         # Always use service if available to avoid session issues
-        if self.us_service:
-            us_list = self.us_service.get_all_us(size=1000, filters=filters)
-        else:
+        if not self.us_service:
             # If no service available, return empty relationships to avoid session errors
             print("Warning: No US service available for relationship inference")
             return []
@@ -586,7 +624,7 @@ class HarrisMatrixGenerator:
         
         # Simple inference: lower US numbers are typically above higher ones
         us_numbers = []
-        for us in us_list:
+        for us in self._iter_site_us(site_name, area):
             us_num = getattr(us, 'us', None)
             if us_num is not None:
                 us_numbers.append(us_num)
@@ -610,132 +648,113 @@ class HarrisMatrixGenerator:
         return relationships
     
     def _validate_matrix(self, graph: nx.DiGraph) -> nx.DiGraph:
-        """Validate and fix Harris Matrix for cycles and inconsistencies"""
+        """
+        Validate and fix Harris Matrix for cycles and inconsistencies
 
-        edges_before = len(graph.edges())
-        num_nodes = len(graph.nodes())
+        Cycles are found as strongly connected components (linear time, any
+        graph size). For each one a minimal feedback arc set, ranked by
+        edge certainty, is removed so the returned graph is acyclic. The
+        report is kept in ``graph.graph['cycle_report']``.
+        """
 
-        # For very large graphs (>500 nodes), skip cycle checking to avoid slowdowns
-        # Archaeological Harris Matrices should be acyclic by nature, and any cycles
-        # would indicate data quality issues that should be fixed at the source
-        if num_nodes > 500:
-            print(f"ℹ️  Large graph ({num_nodes} nodes) - skipping cycle validation for performance")
-            print(f"   Ensure your stratigraphic relationships are acyclic at data entry")
-            return graph
+        edges_before = len(graph.edges())
 
-        # Check for cycles (only for smaller graphs)
         try:
-            if not nx.is_directed_acyclic_graph(graph):
-                # Remove edges that create cycles
-                cycles = list(nx.simple_cycles(graph))
-                print(f"⚠️  Found {len(cycles)} cycles in graph")
-                for cycle in cycles[:10]:  # Limit to first 10 cycles to avoid infinite loops
-                    # Remove the edge with lowest certainty
-                    edges_to_remove = []
-                    for i in range(len(cycle)):
-                        from_node = cycle[i]
-                        to_node = cycle[(i + 1) % len(cycle)]
-                        if graph.has_edge(from_node, to_node):
-                            edge_data = graph.get_edge_data(from_node, to_node)
-                            certainty = edge_data.get('certainty', 'certain')
-                            edges_to_remove.append((from_node, to_node, certainty))
-
-                    # Sort by certainty and remove least certain
-                    edges_to_remove.sort(key=lambda x: x[2])
-                    if edges_to_remove:
-                        graph.remove_edge(edges_to_remove[0][0], edges_to_remove[0][1])
-
-                edges_after = len(graph.edges())
-                edges_removed = edges_before - edges_after
-                if edges_removed > 0:
-                    print(f"⚠️  Validation removed {edges_removed} edges ({edges_removed/edges_before*100:.1f}%)")
+            cycle_report = analyze_cycles(graph)
         except Exception as e:
             print(f"⚠️  Cycle validation failed: {e}")
             print(f"   Continuing with unvalidated graph")
+            return graph
+
+        graph.graph['cycle_report'] = cycle_report
+        if not cycle_report:
+            return graph
+
+        print(f"⚠️  Found {len(cycle_report)} cyclic components in graph")
+        for component in cycle_report:
+            for arc in component['feedback_arcs']:
+                print(f"   Removing US {arc['from']} → US {arc['to']} "
+                      f"({arc['relationship']}, {arc['certainty']})")
+                graph.remove_edge(arc['from'], arc['to'])
+
+        edges_removed = edges_before - len(graph.edges())
+        if edges_removed > 0:
+            print(f"⚠️  Validation removed {edges_removed} edges ({edges_removed/edges_before*100:.1f}%)")
 
         return graph
     
     def get_matrix_levels(self, graph: nx.DiGraph) -> Dict[int, List[int]]:
         """
         Get topological levels for matrix layout
-        
+
+        Longest-path layering computed in O(V+E); US involved in a cycle
+        share the level of their strongly connected component.
+
         Returns:
             Dictionary mapping level number to list of US numbers
         """
-        if not graph.nodes():
-            return {}
-            
-        # Calculate topological levels
         levels = {}
-        
-        # Get nodes with no incoming edges (top level)
-        top_nodes = [n for n in graph.nodes() if graph.in_degree(n) == 0]
-        if not top_nodes:
-            # If no top nodes (cycle), start with any node
-            top_nodes = [list(graph.nodes())[0]]
-        
-        current_level = 0
-        remaining_nodes = set(graph.nodes())
-        
-        while remaining_nodes:
-            # Find nodes that have no predecessors in remaining nodes
-            level_nodes = []
-            for node in remaining_nodes.copy():
-                predecessors = set(graph.predecessors(node))
-                if not predecessors or not predecessors.intersection(remaining_nodes):
-                    level_nodes.append(node)
-                    remaining_nodes.remove(node)
-            
-            if not level_nodes and remaining_nodes:
-                # Break cycles by taking any remaining node
-                level_nodes = [remaining_nodes.pop()]
-            
-            if level_nodes:
-                levels[current_level] = sorted(level_nodes)
-                current_level += 1
-        
-        return levels
+        for node, level in longest_path_levels(graph).items():
+            levels.setdefault(level, []).append(node)
+
+        return {level: sorted(levels[level], key=str) for level in sorted(levels)}
     
     def get_matrix_statistics(self, graph: nx.DiGraph) -> Dict[str, Any]:
         """Get statistics about the Harris Matrix"""
 
-        num_nodes = len(graph.nodes())
-        num_edges = len(graph.edges())
-
-        # For large graphs (> 500 nodes), skip expensive operations
-        if num_nodes > 500:
-            print(f"ℹ️  Large graph ({num_nodes} nodes) - using fast statistics (skipping cycle detection)")
-            stats = {
-                'total_us': num_nodes,
-                'total_relationships': num_edges,
-                'levels': 0,  # Skip levels calculation for performance
-                'is_valid': True,  # Assume valid (cycles already checked during generation)
-                'has_cycles': False,  # Skip cycle detection for performance
-                'isolated_us': len(list(nx.isolates(graph))),
-                'top_level_us': len([n for n in graph.nodes() if graph.in_degree(n) == 0]),
-                'bottom_level_us': len([n for n in graph.nodes() if graph.out_degree(n) == 0])
-            }
-        else:
-            # For small graphs, compute full statistics
-            is_dag = nx.is_directed_acyclic_graph(graph)  # Call only once
-
-            stats = {
-                'total_us': num_nodes,
-                'total_relationships': num_edges,
-                'levels': len(self.get_matrix_levels(graph)),
-                'is_valid': is_dag,
-                'has_cycles': not is_dag,
-                'isolated_us': len(list(nx.isolates(graph))),
-                'top_level_us': len([n for n in graph.nodes() if graph.in_degree(n) == 0]),
-                'bottom_level_us': len([n for n in graph.nodes() if graph.out_degree(n) == 0])
-            }
+        node_levels = longest_path_levels(graph)
+        cycles = cyclic_components(graph)
+
+        stats = {
+            'total_us': graph.number_of_nodes(),
+            'total_relationships': graph.number_of_edges(),
+            'levels': (max(node_levels.values()) + 1) if node_levels else 0,
+            'is_valid': not cycles,
+            'has_cycles': bool(cycles),
+            'isolated_us': sum(1 for _ in nx.isolates(graph)),
+            'top_level_us': sum(1 for _, degree in graph.in_degree() if degree == 0),
+            'bottom_level_us': sum(1 for _, degree in graph.out_degree() if degree == 0)
+        }
 
-            # Add cycle information if present (only for small graphs)
-            if stats['has_cycles']:
-                stats['cycles'] = list(nx.simple_cycles(graph))
+        # Add cycle information if present (one entry per cyclic component)
+        if cycles:
+            stats['cycles'] = cycles
 
         return stats
     
+    def get_cached_matrix(self, site_name: str,
+                          area: Optional[str] = None) -> Tuple[nx.DiGraph, Dict[int, List[int]], Dict[str, Any]]:
+        """
+        Get the Harris Matrix graph, levels and statistics from the shared cache
+
+        The matrix is generated on a cache miss; US and relationship write
+        paths invalidate the site's entries. A generator without a US
+        service cannot read the site's US, so it bypasses the cache. The
+        returned graph, levels and statistics are copies, so callers may
+        modify them freely.
+
+        Args:
+            site_name: Site name
+            area: Optional area filter
+
+        Returns:
+            Tuple (graph, levels, statistics)
+        """
+        def build():
+            graph = self.generate_matrix(site_name, area)
+            return MatrixCacheEntry(
+                graph=graph,
+                levels=self.get_matrix_levels(graph),
+                statistics=self.get_matrix_statistics(graph)
+            )
+
+        database = database_key(self.db_manager)
+        if database is None or self.us_service is None:
+            entry = build()
+        else:
+            entry = matrix_cache.get_or_build(database, site_name, area, build)
+        return entry.graph.copy(), copy.deepcopy(entry.levels), copy.deepcopy(entry.statistics)
+
     def add_relationship(self, site_name: str, us_from: int, us_to: int, 
                         relationship_type: str = 'sopra', certainty: str = 'certain',
                         description: str = "") -> bool:
@@ -764,6 +783,7 @@ class HarrisMatrixGenerator:
             }
             
             self.db_manager.create(USRelationships, relationship_data)
+            invalidate_matrix_cache(self.db_manager, site_name)
             return True
             
         except Exception as e:
@@ -46,6 +46,62 @@ class MatrixVisualizer:
         Returns:
             Base64 encoded image string
         """
+        self._draw_matplotlib(graph, levels, style)
+
+        # Save or return as base64
+        if output_path:
+            plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        
+        # Convert to base64
+        buffer = io.BytesIO()
+        plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
+        buffer.seek(0)
+        image_base64 = base64.b64encode(buffer.read()).decode()
+        buffer.close()
+        plt.close()
+        
+        return image_base64
+
+    def render_matplotlib_cached(self, graph: nx.DiGraph, levels: Dict[int, List[int]],
+                                 style: Optional[Dict] = None, cache=None) -> str:
+        """
+        Render Harris Matrix with matplotlib through the on-disk render cache
+
+        The cache key covers the level layout, edges, node descriptions and
+        style, so repeat views of an unchanged matrix are a file read.
+
+        Args:
+            graph: NetworkX graph
+            levels: Matrix levels from generator
+            style: Optional style overrides
+            cache: RenderCache to use (defaults to the shared one)
+
+        Returns:
+            Render cache key of the PNG image
+        """
+        from .render_cache import get_render_cache
+
+        cache = cache or get_render_cache()
+        layout = {
+            'levels': [(level, [str(us) for us in levels[level]]) for level in sorted(levels)],
+            'edges': sorted((str(u), str(v)) for u, v in graph.edges()),
+            'descriptions': sorted((str(n), str(d.get('description') or ''))
+                                   for n, d in graph.nodes(data=True)),
+            'style': sorted({**self.default_style, **(style or {})}.items(), key=lambda item: item[0]),
+        }
+        key = cache.make_key('matplotlib', layout, 'png')
+
+        def render(path):
+            self._draw_matplotlib(graph, levels, style)
+            plt.savefig(path, format='png', dpi=150, bbox_inches='tight')
+            plt.close()
+
+        cache.get_or_render(key, render)
+        return key
+
+    def _draw_matplotlib(self, graph: nx.DiGraph, levels: Dict[int, List[int]],
+                         style: Optional[Dict] = None):
+        """Draw the matrix on the current matplotlib figure"""
         if style:
             current_style = {**self.default_style, **style}
         else:
@@ -117,20 +173,6 @@ class MatrixVisualizer:
                ha='center', va='center', fontsize=16, fontweight='bold')
         
         plt.tight_layout()
-        
-        # Save or return as base64
-        if output_path:
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        
-        # Convert to base64
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.read()).decode()
-        buffer.close()
-        plt.close()
-        
-        return image_base64
     
     def render_graphviz(self, graph: nx.DiGraph, output_path: Optional[str] = None) -> str:
         """
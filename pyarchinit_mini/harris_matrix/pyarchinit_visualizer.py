@@ -138,6 +138,47 @@ class PyArchInitMatrixVisualizer:
             print(f"Saved DOT file instead: {dot_path}")
             return dot_path
 
+    def render_cached(self, graph: nx.DiGraph, grouping: str = 'period_area',
+                      settings: Optional[Dict] = None, cache=None) -> Optional[str]:
+        """
+        Render Harris Matrix to PNG through the on-disk render cache
+
+        The cache key is the hash of the DOT source plus grouping and
+        language, so Graphviz only runs when the matrix or its settings
+        change.
+
+        Args:
+            graph: NetworkX directed graph with US nodes and relationships
+            grouping: 'period_area', 'period', 'area', 'none'
+            settings: Optional style settings override
+            cache: RenderCache to use (defaults to the shared one)
+
+        Returns:
+            Render cache key of the PNG image, or None if rendering failed
+        """
+        from .render_cache import get_render_cache
+
+        # Merge settings
+        current_settings = {**self.default_settings}
+        if settings:
+            current_settings.update(settings)
+
+        G = self._create_digraph(graph, grouping, current_settings)
+
+        cache = cache or get_render_cache()
+        key = cache.make_key('graphviz', G.source, grouping, current_settings.get('lang', 'it'), 'png')
+
+        def render(path):
+            with open(path, 'wb') as f:
+                f.write(G.pipe(format='png'))
+
+        try:
+            cache.get_or_render(key, render)
+        except Exception as e:
+            print(f"Error rendering matrix to PNG: {e}")
+            return None
+        return key
+
     def _create_digraph(self, graph: nx.DiGraph, grouping: str, settings: Dict) -> Digraph:
         """
         Create Graphviz Digraph from NetworkX graph
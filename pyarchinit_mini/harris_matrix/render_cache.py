@@ -0,0 +1,166 @@
+"""
+Content-addressed on-disk cache for rendered Harris Matrix images
+
+Images are stored under a key derived from everything that determines
+the output (DOT source or layout, grouping, language, format), so an
+unchanged matrix is served with a file read instead of a new Graphviz or
+matplotlib run. The directory is bounded in size: least recently used
+files are evicted first.
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+# Default size limit of the render directory (bytes)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_KEY_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+
+class RenderCache:
+    """
+    Size-bounded directory of rendered images keyed by content hash
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        if cache_dir is None:
+            cache_dir = os.getenv(
+                "PYARCHINIT_RENDER_CACHE_DIR",
+                str(Path.home() / '.pyarchinit_mini' / 'cache' / 'renders')
+            )
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Hash the inputs that determine a rendering into a cache key"""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(str(part).encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    @staticmethod
+    def is_valid_key(key: str) -> bool:
+        """True if ``key`` looks like a key produced by make_key()"""
+        return bool(_KEY_PATTERN.match(key or ''))
+
+    def path_for(self, key: str, fmt: str = 'png') -> Path:
+        """File path of a cache entry (it may not exist)"""
+        if not self.is_valid_key(key):
+            raise ValueError(f"Invalid render cache key: {key!r}")
+        return self.cache_dir / f"{key}.{fmt}"
+
+    def get(self, key: str, fmt: str = 'png') -> Optional[Path]:
+        """Return the cached file (marking it recently used), or None"""
+        path = self.path_for(key, fmt)
+        try:
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def get_or_render(self, key: str, render: Callable[[str], None], fmt: str = 'png') -> Path:
+        """
+        Return the cached file, rendering it on a miss
+
+        Args:
+            key: Cache key from make_key()
+            render: Callable writing the image to the path it receives
+            fmt: File extension
+
+        Returns:
+            Path of the cached image
+        """
+        path = self.get(key, fmt)
+        if path is not None:
+            return path
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=f'.{fmt}', dir=self.cache_dir)
+        os.close(fd)
+        try:
+            render(tmp_path)
+            path = self.path_for(key, fmt)
+            # Atomic publish: concurrent readers never see a partial file
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self.evict()
+        return path
+
+    def evict(self) -> int:
+        """
+        Delete least recently used files until the directory fits max_bytes
+
+        Returns:
+            Number of files removed
+        """
+        with self._lock:
+            entries = []
+            total = 0
+            try:
+                for entry in os.scandir(self.cache_dir):
+                    if entry.is_file() and self.is_valid_key(entry.name.split('.', 1)[0]):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                        total += stat.st_size
+            except FileNotFoundError:
+                return 0
+
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            self.evictions += removed
+            return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and disk usage, for monitoring"""
+        files = 0
+        size = 0
+        if self.cache_dir.exists():
+            for entry in os.scandir(self.cache_dir):
+                if entry.is_file():
+                    files += 1
+                    size += entry.stat().st_size
+        return {
+            'cache_dir': str(self.cache_dir),
+            'files': files,
+            'bytes': size,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+_render_cache: Optional[RenderCache] = None
+
+
+def get_render_cache() -> RenderCache:
+    """Process-wide render cache (created on first use)"""
+    global _render_cache
+    if _render_cache is None:
+        _render_cache = RenderCache()
+    return _render_cache
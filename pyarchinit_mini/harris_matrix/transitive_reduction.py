@@ -0,0 +1,124 @@
+"""
+Selective transitive reduction for Harris Matrix graphs
+
+Only stratigraphic ordering edges (copre, taglia, riempie, ...) are
+reduced: an edge A → C of a reducible class is dropped when C is also
+reachable from A through other reducible edges. Extended Matrix symbolic
+edges (>, <, >>, <<), "si appoggia" and contemporaneity edges are never
+removed and never used to justify a removal.
+
+Reachability is computed on an integer-indexed adjacency in topological
+order, with Python ints as bitsets. Targets are processed in chunks of
+``chunk_size`` topological positions so that memory stays bounded at
+O(V * chunk_size) bits.
+"""
+
+from typing import Iterable, List, Optional, Tuple
+
+import networkx as nx
+
+# Edge classes reduced by default (canonical forms produced by
+# HarrisMatrixGenerator plus their English/generic equivalents)
+DEFAULT_REDUCIBLE_RELATIONSHIPS = frozenset([
+    'copre', 'covers',
+    'taglia', 'cuts',
+    'riempie', 'fills',
+    'sopra', 'above', 'over',
+])
+
+
+class TransitiveReductionEngine:
+    """
+    Removes redundant edges of configurable relationship classes
+    """
+
+    def __init__(self, reducible: Optional[Iterable[str]] = None, chunk_size: int = 4096):
+        """
+        Args:
+            reducible: Relationship types (case-insensitive) that may be
+                reduced; defaults to DEFAULT_REDUCIBLE_RELATIONSHIPS
+            chunk_size: Number of topological positions per bitset chunk
+        """
+        if reducible is None:
+            reducible = DEFAULT_REDUCIBLE_RELATIONSHIPS
+        self.reducible = frozenset(r.lower() for r in reducible)
+        self.chunk_size = max(1, chunk_size)
+
+    def _is_reducible(self, edge_data: dict) -> bool:
+        return str(edge_data.get('relationship', 'sopra')).lower() in self.reducible
+
+    def redundant_edges(self, graph: nx.DiGraph) -> List[Tuple]:
+        """
+        Find reducible edges implied by other reducible edges
+
+        Args:
+            graph: Harris Matrix graph
+
+        Returns:
+            List of (source, target) edges that can be removed
+
+        Raises:
+            nx.NetworkXUnfeasible: if the reducible edges contain a cycle
+        """
+        reducible_edges = [
+            (u, v) for u, v, data in graph.edges(data=True)
+            if u != v and self._is_reducible(data)
+        ]
+        if not reducible_edges:
+            return []
+
+        subgraph = nx.DiGraph(reducible_edges)
+        order = list(nx.topological_sort(subgraph))
+        position = {node: i for i, node in enumerate(order)}
+
+        # Integer adjacency: successors[i] = positions of direct successors
+        successors = [[] for _ in order]
+        for u, v in reducible_edges:
+            successors[position[u]].append(position[v])
+
+        redundant = []
+        num_nodes = len(order)
+
+        for lo in range(0, num_nodes, self.chunk_size):
+            hi = min(lo + self.chunk_size, num_nodes)
+
+            # reach[i] = descendants of node i whose position is in [lo, hi),
+            # as bits shifted by lo. Nodes at position >= hi only have
+            # descendants after hi, so they are never needed.
+            reach = [0] * hi
+            for i in range(hi - 1, -1, -1):
+                bits = 0
+                for j in successors[i]:
+                    if j < hi:
+                        bits |= reach[j]
+                        if j >= lo:
+                            bits |= 1 << (j - lo)
+                reach[i] = bits
+
+            for i in range(hi):
+                succ = successors[i]
+                if len(succ) < 2:
+                    continue
+                # Descendants reachable through some successor (paths of length >= 2)
+                implied = 0
+                for j in succ:
+                    if j < hi:
+                        implied |= reach[j]
+                if not implied:
+                    continue
+                for j in succ:
+                    if lo <= j < hi and implied >> (j - lo) & 1:
+                        redundant.append((order[i], order[j]))
+
+        return redundant
+
+    def reduce(self, graph: nx.DiGraph) -> int:
+        """
+        Remove redundant reducible edges from the graph in place
+
+        Returns:
+            Number of edges removed
+        """
+        redundant = self.redundant_edges(graph)
+        graph.remove_edges_from(redundant)
+        return len(redundant)
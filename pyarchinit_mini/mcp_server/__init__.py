@@ -14,9 +14,26 @@ Integration:
 - Claude AI ↔ PyArchInit MCP Server ↔ Blender MCP Addon
 """
 
+import importlib
+
 __version__ = "1.0.0"
 
-from .server import PyArchInitMCPServer, MCPConfig, main
-from .blender_client import BlenderClient, test_blender_connection
+# Exports are imported on first use, so that importing a submodule
+# (e.g. graphml_parser from the web routes) does not load the MCP SDK
+_EXPORTS = {
+    "PyArchInitMCPServer": ".server",
+    "MCPConfig": ".server",
+    "main": ".server",
+    "BlenderClient": ".blender_client",
+    "test_blender_connection": ".blender_client",
+}
 
 __all__ = ["PyArchInitMCPServer", "MCPConfig", "BlenderClient", "test_blender_connection", "main"]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
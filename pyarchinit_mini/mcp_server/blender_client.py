@@ -3,13 +3,22 @@ Blender Client
 
 TCP socket client for communicating with Blender MCP addon.
 Sends JSON commands to Blender and receives responses.
+
+Commands are newline-delimited JSON carrying a request ``id``; a reader
+thread matches each response to its request (by the echoed ``id``, or in
+order for addons that do not echo it), so many commands can be streamed
+without waiting for each round trip (see ``send_async`` and
+``send_many``).
 """
 
 import socket
 import json
 import logging
+import threading
 import time
-from typing import Dict, Any, Optional, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Optional, List, Tuple, Iterable
 from dataclasses import dataclass
 
 
@@ -31,6 +40,7 @@ class BlenderResponse:
     status: str  # "success" or "error"
     result: Optional[Dict[str, Any]] = None
     message: str = ""
+    request_id: Optional[int] = None
 
 
 class BlenderConnectionError(Exception):
@@ -52,9 +62,9 @@ class BlenderClient:
     Communicates with Blender addon socket server (default port 9876)
     using JSON-encoded messages.
 
-    Protocol:
-        Request:  {"type": "command_type", "params": {...}}
-        Response: {"status": "success|error", "result": {...}, "message": "..."}
+    Protocol (one JSON object per line):
+        Request:  {"type": "command_type", "params": {...}, "id": 1}
+        Response: {"status": "success|error", "result": {...}, "message": "...", "id": 1}
     """
 
     def __init__(
@@ -63,6 +73,7 @@ class BlenderClient:
         port: int = 9876,
         timeout: int = 30,
         max_retries: int = 3,
+        max_in_flight: int = 512,
     ):
         """
         Initialize Blender client
@@ -72,14 +83,24 @@ class BlenderClient:
             port: Blender socket port
             timeout: Socket timeout in seconds
             max_retries: Maximum connection retry attempts
+            max_in_flight: Maximum commands sent but not yet answered
         """
         self.host = host
         self.port = port
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_in_flight = max_in_flight
         self.socket: Optional[socket.socket] = None
         self.connected = False
 
+        # Pipelining state, reset on every connect
+        self._send_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending: "OrderedDict[int, Future]" = OrderedDict()
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._next_id = 0
+        self._reader: Optional[threading.Thread] = None
+
     def connect(self) -> bool:
         """
         Connect to Blender socket server
@@ -100,8 +121,17 @@ class BlenderClient:
                 self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 self.socket.settimeout(self.timeout)
                 self.socket.connect((self.host, self.port))
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
                 self.connected = True
+                self._in_flight = threading.BoundedSemaphore(self.max_in_flight)
+                self._reader = threading.Thread(
+                    target=self._read_responses,
+                    args=(self.socket,),
+                    name="blender-client-reader",
+                    daemon=True,
+                )
+                self._reader.start()
                 logger.info(f"Connected to Blender successfully")
                 return True
 
@@ -125,6 +155,11 @@ class BlenderClient:
     def disconnect(self):
         """Disconnect from Blender"""
         if self.socket:
+            try:
+                # Wakes the reader thread blocked in recv()
+                self.socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
             try:
                 self.socket.close()
                 logger.info("Disconnected from Blender")
@@ -133,12 +168,13 @@ class BlenderClient:
             finally:
                 self.socket = None
                 self.connected = False
+                self._fail_pending(BlenderConnectionError("Disconnected from Blender"))
 
     def send_command(
         self, command_type: str, params: Dict[str, Any]
     ) -> BlenderResponse:
         """
-        Send command to Blender
+        Send command to Blender and wait for its response
 
         Args:
             command_type: Type of command (e.g., "create_object", "apply_material")
@@ -151,66 +187,199 @@ class BlenderClient:
             BlenderConnectionError: If not connected
             BlenderCommandError: If command execution fails
         """
-        if not self.connected:
-            raise BlenderConnectionError("Not connected to Blender")
-
-        # Construct command
-        command = {"type": command_type, "params": params}
-
         try:
-            # Send command
-            message = json.dumps(command) + "\n"
-            self.socket.sendall(message.encode("utf-8"))
-            logger.debug(f"Sent command: {command_type}")
-
-            # Receive response
-            response_data = self._receive_response()
-            response = json.loads(response_data)
-
-            # Parse response
-            blender_response = BlenderResponse(
-                status=response.get("status", "error"),
-                result=response.get("result"),
-                message=response.get("message", ""),
+            response = self._wait(command_type, self.send_async(command_type, params))
+        except (BlenderConnectionError, BlenderCommandError):
+            raise
+        except Exception as e:
+            logger.error(f"Error sending command: {e}")
+            raise
+
+        if response.status == "error":
+            raise BlenderCommandError(
+                f"Blender command '{command_type}' failed: {response.message}"
             )
 
-            if blender_response.status == "error":
-                raise BlenderCommandError(
-                    f"Blender command '{command_type}' failed: {blender_response.message}"
-                )
+        logger.debug(f"Command '{command_type}' successful")
+        return response
 
-            logger.debug(f"Command '{command_type}' successful")
-            return blender_response
+    def send_async(self, command_type: str, params: Dict[str, Any]) -> Future:
+        """
+        Send command to Blender without waiting for its response
 
-        except socket.timeout:
-            raise BlenderConnectionError(f"Timeout waiting for response from Blender")
-        except json.JSONDecodeError as e:
-            raise BlenderCommandError(f"Invalid JSON response from Blender: {e}")
-        except Exception as e:
-            logger.error(f"Error sending command: {e}")
-            raise
+        Args:
+            command_type: Type of command
+            params: Command parameters
+
+        Returns:
+            Future resolved with the BlenderResponse (error responses
+            included) when Blender answers
+
+        Raises:
+            BlenderConnectionError: If not connected, or if Blender does not
+                accept more commands within the timeout
+        """
+        if not self.connected:
+            raise BlenderConnectionError("Not connected to Blender")
 
-    def _receive_response(self, buffer_size: int = 4096) -> str:
+        # Back-pressure: at most max_in_flight unanswered commands
+        if not self._in_flight.acquire(timeout=self.timeout):
+            raise BlenderConnectionError("Timeout waiting for Blender to accept more commands")
+
+        future = Future()
+        with self._send_lock:
+            self._next_id += 1
+            request_id = self._next_id
+            with self._pending_lock:
+                self._pending[request_id] = future
+
+            command = {"type": command_type, "params": params, "id": request_id}
+            try:
+                self.socket.sendall((json.dumps(command) + "\n").encode("utf-8"))
+            except OSError as e:
+                with self._pending_lock:
+                    unsent = self._pending.pop(request_id, None)
+                if unsent is not None:
+                    self._in_flight.release()
+                if isinstance(e, socket.timeout):
+                    raise BlenderConnectionError("Timeout sending command to Blender")
+                raise BlenderConnectionError(f"Error sending command to Blender: {e}")
+
+        logger.debug(f"Sent command: {command_type} (id {request_id})")
+        return future
+
+    def send_many(
+        self,
+        commands: Iterable[Tuple[str, Dict[str, Any]]],
+        raise_on_error: bool = True,
+    ) -> List[BlenderResponse]:
         """
-        Receive response from Blender
+        Stream commands to Blender and collect all responses
+
+        Every command is sent before any response is awaited, so the
+        whole batch costs about one round trip instead of one per command.
 
         Args:
-            buffer_size: Socket buffer size
+            commands: (command_type, params) pairs
+            raise_on_error: Raise if any command failed (after all ran)
 
         Returns:
-            Response string
+            BlenderResponse list, in command order
+
+        Raises:
+            BlenderConnectionError: On connection loss or timeout
+            BlenderCommandError: If raise_on_error and a command failed
+        """
+        futures = [
+            (command_type, self.send_async(command_type, params))
+            for command_type, params in commands
+        ]
+        responses = [self._wait(command_type, future) for command_type, future in futures]
+
+        failed = [
+            (command_type, response)
+            for (command_type, _), response in zip(futures, responses)
+            if response.status == "error"
+        ]
+        if failed and raise_on_error:
+            command_type, response = failed[0]
+            raise BlenderCommandError(
+                f"{len(failed)} of {len(responses)} Blender commands failed; "
+                f"first '{command_type}': {response.message}"
+            )
+        return responses
+
+    def _wait(self, command_type: str, future: Future) -> BlenderResponse:
+        """Response of a sent command (BlenderConnectionError on timeout)"""
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            raise BlenderConnectionError(
+                f"Timeout waiting for response from Blender ('{command_type}')"
+            )
+
+    def _read_responses(self, sock: socket.socket, buffer_size: int = 65536):
+        """
+        Reader thread: split the stream into lines and resolve the
+        matching pending futures until the connection closes
         """
-        response_parts = []
+        buffer = b""
         while True:
-            chunk = self.socket.recv(buffer_size).decode("utf-8")
-            if not chunk:
+            try:
+                chunk = sock.recv(buffer_size)
+            except socket.timeout:
+                if self.socket is not sock:
+                    break
+                continue
+            except OSError:
                 break
-            response_parts.append(chunk)
-            # Check if we received a complete message (ends with newline)
-            if chunk.endswith("\n"):
+            if not chunk or self.socket is not sock:
                 break
 
-        return "".join(response_parts).strip()
+            # A chunk may hold several responses or part of one
+            lines = (buffer + chunk).split(b"\n")
+            buffer = lines.pop()
+            for line in lines:
+                if line.strip():
+                    self._dispatch(line)
+
+        # After disconnect() or a reconnect the pending commands are no
+        # longer this connection's
+        if self.socket is sock:
+            self.connected = False
+            self._fail_pending(BlenderConnectionError("Connection to Blender closed"))
+
+    def _dispatch(self, line: bytes):
+        """Resolve the future of one response line"""
+        try:
+            response = json.loads(line)
+        except json.JSONDecodeError as e:
+            future = self._pop_pending(None)
+            if future is not None:
+                future.set_exception(
+                    BlenderCommandError(f"Invalid JSON response from Blender: {e}")
+                )
+            return
+
+        request_id = response.get("id")
+        future = self._pop_pending(request_id)
+        if future is None:
+            logger.warning(
+                f"Unexpected response from Blender (id {request_id}): {response.get('message', '')}"
+            )
+            return
+        future.set_result(BlenderResponse(
+            status=response.get("status", "error"),
+            result=response.get("result"),
+            message=response.get("message", ""),
+            request_id=request_id,
+        ))
+
+    def _pop_pending(self, request_id: Optional[int]) -> Optional[Future]:
+        """
+        Remove the future of ``request_id``, or the oldest one when the
+        response carries no id (the addon does not echo request ids and
+        answers in order). An id with no pending command gives None.
+        """
+        with self._pending_lock:
+            if request_id is not None:
+                future = self._pending.pop(request_id, None)
+                if future is None:
+                    return None
+            elif self._pending:
+                _, future = self._pending.popitem(last=False)
+            else:
+                return None
+        self._in_flight.release()
+        return future
+
+    def _fail_pending(self, error: Exception):
+        """Fail every command still waiting for a response"""
+        while True:
+            future = self._pop_pending(None)
+            if future is None:
+                break
+            future.set_exception(error)
 
     # ========================================================================
     # High-level Blender Commands
@@ -237,14 +406,7 @@ class BlenderClient:
         Returns:
             Result dict with proxy info
         """
-        params = {
-            "proxy_id": proxy_id,
-            "location": {"x": location[0], "y": location[1], "z": location[2]},
-            "scale": {"x": scale[0], "y": scale[1], "z": scale[2]},
-            "rotation": {"x": rotation[0], "y": rotation[1], "z": rotation[2]},
-            "geometry": geometry,
-        }
-
+        params = self._proxy_params(proxy_id, location, scale, rotation, geometry)
         response = self.send_command("create_proxy", params)
         return response.result or {}
 
@@ -269,22 +431,26 @@ class BlenderClient:
         Returns:
             Result dict
         """
-        params = {
-            "proxy_id": proxy_id,
-            "material_name": material_name,
-            "base_color": {
-                "r": base_color[0],
-                "g": base_color[1],
-                "b": base_color[2],
-                "a": base_color[3],
-            },
-            "roughness": roughness,
-            "metallic": metallic,
-        }
-
+        params = self._material_params(proxy_id, material_name, base_color, roughness, metallic)
         response = self.send_command("apply_material", params)
         return response.result or {}
 
+    def apply_materials(self, materials: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Apply materials to many proxies in one pipelined batch
+
+        Args:
+            materials: Dicts with the apply_material arguments
+                (proxy_id, material_name, base_color, roughness, metallic)
+
+        Returns:
+            Result dicts, in input order
+        """
+        responses = self.send_many(
+            ("apply_material", self._material_params(**material)) for material in materials
+        )
+        return [response.result or {} for response in responses]
+
     def set_visibility(self, proxy_id: str, visible: bool) -> Dict[str, Any]:
         """
         Set proxy visibility
@@ -300,6 +466,22 @@ class BlenderClient:
         response = self.send_command("set_visibility", params)
         return response.result or {}
 
+    def set_visibilities(self, visibility: Dict[str, bool]) -> List[Dict[str, Any]]:
+        """
+        Set visibility of many proxies in one pipelined batch
+
+        Args:
+            visibility: Proxy identifier → visibility state
+
+        Returns:
+            Result dicts, in input order
+        """
+        responses = self.send_many(
+            ("set_visibility", {"proxy_id": proxy_id, "visible": visible})
+            for proxy_id, visible in visibility.items()
+        )
+        return [response.result or {} for response in responses]
+
     def set_transparency(self, proxy_id: str, alpha: float) -> Dict[str, Any]:
         """
         Set proxy transparency
@@ -406,6 +588,48 @@ class BlenderClient:
         response = self.send_command("batch_create_proxies", params)
         return response.result or {}
 
+    def build_scene(self, proxies: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create proxies with their material, collection and visibility in
+        one pipelined batch
+
+        Args:
+            proxies: Proxy metadata dicts (ProxyMetadata.to_dict())
+
+        Returns:
+            Dict with proxy and command counts
+        """
+        commands = []
+        for proxy in proxies:
+            props = proxy["blender_properties"]
+            proxy_id = proxy["proxy_id"]
+            commands.append(("create_proxy", self._proxy_params(
+                proxy_id,
+                _xyz(props["location"]),
+                _xyz(props["scale"]),
+                _xyz(props["rotation"]),
+                props.get("geometry", "CUBE"),
+            )))
+            material = props.get("material")
+            if material:
+                commands.append(("apply_material", self._material_params(
+                    proxy_id,
+                    material["name"],
+                    tuple(material["base_color"]),
+                    material.get("roughness", 0.7),
+                    material.get("metallic", 0.0),
+                )))
+            if props.get("collection"):
+                commands.append(("assign_to_collection", {
+                    "proxy_id": proxy_id, "collection_name": props["collection"],
+                }))
+            visible = proxy.get("visualization", {}).get("visible", True)
+            if not visible:
+                commands.append(("set_visibility", {"proxy_id": proxy_id, "visible": False}))
+
+        self.send_many(commands)
+        return {"proxy_count": len(proxies), "command_count": len(commands)}
+
     def execute_python(self, code: str) -> Dict[str, Any]:
         """
         Execute arbitrary Python code in Blender context
@@ -425,6 +649,45 @@ class BlenderClient:
         response = self.send_command("execute_python", params)
         return response.result or {}
 
+    @staticmethod
+    def _proxy_params(
+        proxy_id: str,
+        location: Tuple[float, float, float],
+        scale: Tuple[float, float, float],
+        rotation: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+        geometry: str = "CUBE",
+    ) -> Dict[str, Any]:
+        """Parameters of a create_proxy command"""
+        return {
+            "proxy_id": proxy_id,
+            "location": {"x": location[0], "y": location[1], "z": location[2]},
+            "scale": {"x": scale[0], "y": scale[1], "z": scale[2]},
+            "rotation": {"x": rotation[0], "y": rotation[1], "z": rotation[2]},
+            "geometry": geometry,
+        }
+
+    @staticmethod
+    def _material_params(
+        proxy_id: str,
+        material_name: str,
+        base_color: Tuple[float, float, float, float],
+        roughness: float = 0.7,
+        metallic: float = 0.0,
+    ) -> Dict[str, Any]:
+        """Parameters of an apply_material command"""
+        return {
+            "proxy_id": proxy_id,
+            "material_name": material_name,
+            "base_color": {
+                "r": base_color[0],
+                "g": base_color[1],
+                "b": base_color[2],
+                "a": base_color[3],
+            },
+            "roughness": roughness,
+            "metallic": metallic,
+        }
+
     # ========================================================================
     # Context Manager Support
     # ========================================================================
@@ -444,6 +707,11 @@ class BlenderClient:
 # ============================================================================
 
 
+def _xyz(vector: Dict[str, float]) -> Tuple[float, float, float]:
+    """(x, y, z) tuple from a {"x", "y", "z"} dict"""
+    return (vector["x"], vector["y"], vector["z"])
+
+
 def test_blender_connection(
     host: str = "localhost", port: int = 9876
 ) -> Tuple[bool, str]:
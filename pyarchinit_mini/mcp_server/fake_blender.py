@@ -0,0 +1,273 @@
+"""
+Fake Blender server
+
+In-process stand-in for the Blender MCP addon socket server, used by the
+BlenderClient tests and benchmark. It speaks the same newline-delimited
+JSON protocol and keeps a minimal scene (proxies, materials,
+collections) in memory instead of driving bpy.
+"""
+
+import heapq
+import json
+import logging
+import socket
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class FakeBlenderServer:
+    """
+    Minimal Blender MCP addon server
+
+    Handles each connection like the addon: messages are processed in
+    order and answered one line each. ``latency`` delays every response
+    (without delaying the next command) to simulate a network hop;
+    ``echo_ids=False`` answers like an addon that does not echo request
+    ids.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        echo_ids: bool = True,
+    ):
+        """
+        Args:
+            host: Address to bind
+            port: Port to bind (0 = any free port)
+            latency: Seconds each response is held back
+            echo_ids: Whether responses carry the request id
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.echo_ids = echo_ids
+
+        self.proxies: Dict[str, Dict[str, Any]] = {}
+        self.collections: List[str] = []
+        self.commands: List[str] = []
+
+        self._server_socket: Optional[socket.socket] = None
+        self._running = False
+        self._lock = threading.Lock()
+
+    # ========================================================================
+    # Server lifecycle
+    # ========================================================================
+
+    def start(self) -> Tuple[str, int]:
+        """Start listening in a background thread; returns (host, port)"""
+        self._server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server_socket.bind((self.host, self.port))
+        self._server_socket.listen(5)
+        self.port = self._server_socket.getsockname()[1]
+        self._running = True
+        threading.Thread(target=self._accept_loop, name="fake-blender", daemon=True).start()
+        return self.host, self.port
+
+    def stop(self):
+        """Stop accepting connections"""
+        self._running = False
+        if self._server_socket:
+            try:
+                self._server_socket.close()
+            except OSError:
+                pass
+            self._server_socket = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _accept_loop(self):
+        while self._running:
+            try:
+                client_socket, _ = self._server_socket.accept()
+            except OSError:
+                break
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(
+                target=self._handle_client, args=(client_socket,), daemon=True
+            ).start()
+
+    def _handle_client(self, client_socket: socket.socket):
+        writer = _DelayedWriter(client_socket, self.latency)
+        buffer = b""
+        try:
+            while True:
+                data = client_socket.recv(65536)
+                if not data:
+                    break
+                lines = (buffer + data).split(b"\n")
+                buffer = lines.pop()
+                responses = [self.process(line) for line in lines if line.strip()]
+                if responses:
+                    writer.send("".join(response + "\n" for response in responses).encode("utf-8"))
+        except OSError:
+            pass
+        finally:
+            writer.close()
+            client_socket.close()
+
+    # ========================================================================
+    # Commands
+    # ========================================================================
+
+    def process(self, message: bytes) -> str:
+        """Execute one JSON command and return the JSON response line"""
+        try:
+            command = json.loads(message)
+        except json.JSONDecodeError as e:
+            return json.dumps({"status": "error", "message": f"Invalid JSON: {e}"})
+
+        command_type = command.get("type")
+        handler = getattr(self, f"_handle_{command_type}", None)
+        with self._lock:
+            self.commands.append(command_type)
+            if handler is None:
+                response = {"status": "error", "message": f"Unknown command type: {command_type}"}
+            else:
+                try:
+                    response = handler(command.get("params", {}))
+                except KeyError as e:
+                    response = {"status": "error", "message": f"Missing parameter {e}"}
+
+        if self.echo_ids and "id" in command:
+            response["id"] = command["id"]
+        return json.dumps(response)
+
+    def _proxy(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return self.proxies.get(params["proxy_id"])
+
+    def _not_found(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"status": "error", "message": f"Proxy {params['proxy_id']} not found"}
+
+    def _handle_create_proxy(self, params):
+        proxy_id = params["proxy_id"]
+        self.proxies[proxy_id] = {
+            "location": params["location"],
+            "scale": params["scale"],
+            "rotation": params.get("rotation", {"x": 0, "y": 0, "z": 0}),
+            "geometry": params.get("geometry", "CUBE"),
+            "visible": True,
+        }
+        return {
+            "status": "success",
+            "result": {"proxy_id": proxy_id, "object_name": f"Proxy_{proxy_id}"},
+            "message": f"Created proxy {proxy_id}",
+        }
+
+    def _handle_batch_create_proxies(self, params):
+        created = [self._handle_create_proxy(proxy)["result"]["proxy_id"] for proxy in params["proxies"]]
+        return {
+            "status": "success",
+            "result": {"created_count": len(created), "proxy_ids": created},
+            "message": f"Created {len(created)}/{len(params['proxies'])} proxies",
+        }
+
+    def _handle_apply_material(self, params):
+        proxy = self._proxy(params)
+        if proxy is None:
+            return self._not_found(params)
+        proxy["material"] = params["material_name"]
+        proxy["base_color"] = params["base_color"]
+        return {"status": "success", "result": {"material_name": params["material_name"]}}
+
+    def _handle_set_visibility(self, params):
+        proxy = self._proxy(params)
+        if proxy is None:
+            return self._not_found(params)
+        proxy["visible"] = params["visible"]
+        return {"status": "success", "result": {"visible": params["visible"]}}
+
+    def _handle_set_transparency(self, params):
+        proxy = self._proxy(params)
+        if proxy is None:
+            return self._not_found(params)
+        proxy["alpha"] = params["alpha"]
+        return {"status": "success", "result": {"alpha": params["alpha"]}}
+
+    def _handle_create_collection(self, params):
+        self.collections.append(params["collection_name"])
+        return {"status": "success", "result": {"collection_name": params["collection_name"]}}
+
+    def _handle_assign_to_collection(self, params):
+        proxy = self._proxy(params)
+        if proxy is None:
+            return self._not_found(params)
+        if params["collection_name"] not in self.collections:
+            self.collections.append(params["collection_name"])
+        proxy["collection"] = params["collection_name"]
+        return {"status": "success", "result": {"collection": params["collection_name"]}}
+
+    def _handle_clear_scene(self, params):
+        deleted_count = len(self.proxies)
+        self.proxies.clear()
+        return {"status": "success", "result": {"deleted_count": deleted_count}}
+
+    def _handle_get_scene_info(self, params):
+        return {
+            "status": "success",
+            "result": {
+                "name": "Scene",
+                "object_count": len(self.proxies),
+                "proxy_count": len(self.proxies),
+                "collections": list(self.collections),
+            },
+        }
+
+
+class _DelayedWriter:
+    """Sends data on a socket after a fixed delay, keeping send order"""
+
+    def __init__(self, sock: socket.socket, delay: float):
+        self.sock = sock
+        self.delay = delay
+        self._queue: List[Tuple[float, int, bytes]] = []
+        self._counter = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        if delay > 0:
+            threading.Thread(target=self._run, daemon=True).start()
+
+    def send(self, data: bytes):
+        if self.delay <= 0:
+            self.sock.sendall(data)
+            return
+        with self._condition:
+            self._counter += 1
+            heapq.heappush(self._queue, (time.monotonic() + self.delay, self._counter, data))
+            self._condition.notify()
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                due, _, data = self._queue[0]
+                wait = due - time.monotonic()
+                if wait > 0:
+                    self._condition.wait(wait)
+                    continue
+                heapq.heappop(self._queue)
+            try:
+                self.sock.sendall(data)
+            except OSError:
+                return
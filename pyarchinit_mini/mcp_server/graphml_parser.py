@@ -5,6 +5,7 @@ Parses GraphML files and extracts stratigraphic metadata,
 combining GraphML data with database US records.
 """
 
+import hashlib
 import logging
 import networkx as nx
 from typing import Dict, Any, List, Optional, Tuple
@@ -17,6 +18,17 @@ from ..models.datazione import Datazione
 
 logger = logging.getLogger(__name__)
 
+RELATIONSHIP_TYPES = (
+    "covers",
+    "covered_by",
+    "fills",
+    "filled_by",
+    "cuts",
+    "cut_by",
+    "equals",
+    "contemporaneous_with",
+)
+
 
 class GraphMLParser:
     """
@@ -36,6 +48,13 @@ class GraphMLParser:
         self.db_session = db_session
         self.graph: Optional[nx.DiGraph] = None
         self.graphml_path: Optional[str] = None
+        # sha256 of the loaded file, for caches of derived data
+        self.graphml_hash: Optional[str] = None
+
+        # Built once per loaded graph by _build_index()
+        self._node_by_us: Dict[int, str] = {}
+        self._us_by_node: Dict[str, int] = {}
+        self._relationships: Dict[str, Dict[str, List[int]]] = {}
 
     def load_graphml(self, filepath: str) -> bool:
         """
@@ -52,10 +71,13 @@ class GraphMLParser:
                 logger.error(f"GraphML file not found: {filepath}")
                 return False
 
+            self.graphml_hash = hashlib.sha256(Path(filepath).read_bytes()).hexdigest()
+
             # Try loading with NetworkX first
             try:
                 self.graph = nx.read_graphml(filepath)
                 self.graphml_path = filepath
+                self._build_index()
                 logger.info(
                     f"Loaded GraphML (standard): {len(self.graph.nodes())} nodes, "
                     f"{len(self.graph.edges())} edges"
@@ -181,6 +203,7 @@ class GraphMLParser:
                         self.graph.add_edge(source, target, **edge_attrs)
 
             self.graphml_path = filepath
+            self._build_index()
             logger.info(
                 f"Loaded GraphML (yFiles): {len(self.graph.nodes())} nodes, "
                 f"{len(self.graph.edges())} edges"
@@ -290,48 +313,12 @@ class GraphMLParser:
         if not self.graph:
             raise ValueError("No GraphML loaded")
 
-        relationships = {
-            "covers": [],
-            "covered_by": [],
-            "fills": [],
-            "filled_by": [],
-            "cuts": [],
-            "cut_by": [],
-            "equals": [],
-            "contemporaneous_with": [],
-        }
-
-        # Find node for this US
-        us_node = self._find_node_by_us_id(us_id)
-        if not us_node:
-            return relationships
-
-        # Parse outgoing edges (this US → other US)
-        for _, target in self.graph.out_edges(us_node):
-            edge_data = self.graph.edges[us_node, target]
-            relationship = edge_data.get("relationship", "").lower()
+        buckets = self._relationships.get(self._find_node_by_us_id(us_id))
+        if buckets is None:
+            return {rel: [] for rel in RELATIONSHIP_TYPES}
 
-            target_label = self.graph.nodes[target].get("label", "")
-            target_us_id = self._extract_us_id(target_label)
-
-            if target_us_id and relationship in relationships:
-                relationships[relationship].append(target_us_id)
-
-        # Parse incoming edges (other US → this US)
-        for source, _ in self.graph.in_edges(us_node):
-            edge_data = self.graph.edges[source, us_node]
-            relationship = edge_data.get("relationship", "").lower()
-
-            source_label = self.graph.nodes[source].get("label", "")
-            source_us_id = self._extract_us_id(source_label)
-
-            # Infer inverse relationship
-            inverse_rel = self._get_inverse_relationship(relationship)
-
-            if source_us_id and inverse_rel in relationships:
-                relationships[inverse_rel].append(source_us_id)
-
-        return relationships
+        # Copies, so callers cannot alter the index
+        return {rel: list(us_ids) for rel, us_ids in buckets.items()}
 
     def get_us_data_with_graphml(self, us_id: int) -> Dict[str, Any]:
         """
@@ -351,6 +338,12 @@ class GraphMLParser:
             logger.warning(f"US {us_id} not found in database")
             return {"error": f"US {us_id} not found"}
 
+        return self._combine_us_data(us_id, us_record, self._get_period_data(us_record))
+
+    def _combine_us_data(
+        self, us_id: int, us_record: US, period_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Combine a US record, its chronology and its GraphML node"""
         # Get GraphML node data
         us_node = self._find_node_by_us_id(us_id)
         graphml_data = {}
@@ -360,9 +353,6 @@ class GraphMLParser:
         # Get relationships
         relationships = self.get_relationships_for_us(us_id)
 
-        # Get periodization data
-        period_data = self._get_period_data(us_record)
-
         # Combine all data
         complete_data = {
             "us_id": us_id,
@@ -395,13 +385,66 @@ class GraphMLParser:
 
         us_records = query.all()
 
-        # Get complete data for each US
-        complete_data = []
-        for us_record in us_records:
-            data = self.get_us_data_with_graphml(us_record.id_us)
-            if "error" not in data:
-                complete_data.append(data)
+        # Keyed by US number, not id_us
+        return [
+            data for _, data in self._combine_records(
+                [(self._us_number(us_record), us_record) for us_record in us_records]
+            )
+        ]
 
+    def get_us_data_for_ids(self, us_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Get complete US data for several US at once
+
+        Same result per US as get_us_data_with_graphml, but the US and
+        periodization rows are read in one query each.
+
+        Args:
+            us_ids: US IDs (US numbers)
+
+        Returns:
+            Dict mapping US ID → complete US data dict (error dict if missing)
+        """
+        numbers = {str(us_id): us_id for us_id in us_ids}
+        us_records = {}
+        if numbers:
+            query = self.db_session.query(US).filter(US.us.in_(list(numbers))).order_by(US.id_us)
+            for us_record in query:
+                us_records.setdefault(us_record.us, us_record)
+
+        complete_data = dict(self._combine_records(
+            [(numbers[number], us_record) for number, us_record in us_records.items()]
+        ))
+        for us_id in us_ids:
+            if us_id not in complete_data:
+                logger.warning(f"US {us_id} not found in database")
+                complete_data[us_id] = {"error": f"US {us_id} not found"}
+        return complete_data
+
+    def _combine_records(self, us_records: List[Tuple[Any, US]]) -> List[Tuple[Any, Dict[str, Any]]]:
+        """
+        Complete data for (US ID, record) pairs
+
+        Periodization rows are read in one query instead of one per US,
+        and Datazione lookups are shared between US of the same period.
+        """
+        numbers = {us_id for us_id, _ in us_records if isinstance(us_id, int)}
+        periods = {}
+        if numbers:
+            query = self.db_session.query(Periodizzazione).filter(Periodizzazione.us.in_(numbers))
+            for period_record in query:
+                periods.setdefault(
+                    (period_record.sito, period_record.area, period_record.us), period_record
+                )
+        datazioni = {}
+
+        complete_data = []
+        for us_id, us_record in us_records:
+            period_record = periods.get(
+                (us_record.sito, us_record.area, us_id if isinstance(us_id, int) else -1)
+            )
+            period_data = self._get_period_data(us_record, period_record, datazioni)
+            complete_data.append((us_id, self._combine_us_data(us_id, us_record, period_data)))
         return complete_data
 
     def get_topological_order(self) -> List[int]:
@@ -468,17 +511,60 @@ class GraphMLParser:
             pass
         return None
 
+    @staticmethod
+    def _us_number(us_record: US):
+        """US number of a record as int (kept as text if not numeric)"""
+        us_number = str(us_record.us)
+        return int(us_number) if us_number.lstrip('-').isdigit() else us_number
+
     def _find_node_by_us_id(self, us_id: int) -> Optional[str]:
         """Find GraphML node ID for given US ID"""
         if not self.graph:
             return None
 
+        return self._node_by_us.get(us_id)
+
+    def _build_index(self):
+        """
+        Index the loaded graph: US ID <-> node ID and, per node, its
+        relationships grouped by type (incoming edges as the inverse
+        relationship of the source US)
+
+        Labels are parsed once here, so per-US lookups are O(1) and
+        whole-site queries stay linear in the size of the graph.
+        """
+        self._node_by_us = {}
+        self._us_by_node = {}
+        self._relationships = {}
+        if not self.graph:
+            return
+
+        for node_id, node_data in self.graph.nodes(data=True):
+            us_id = self._extract_us_id(node_data.get("label", ""))
+            if us_id is not None:
+                self._us_by_node[node_id] = us_id
+                # The first node labelled with a US wins
+                self._node_by_us.setdefault(us_id, node_id)
+
         for node_id in self.graph.nodes():
-            label = self.graph.nodes[node_id].get("label", "")
-            if self._extract_us_id(label) == us_id:
-                return node_id
+            buckets = {rel: [] for rel in RELATIONSHIP_TYPES}
 
-        return None
+            # Outgoing edges (this US → other US)
+            for _, target, edge_data in self.graph.out_edges(node_id, data=True):
+                relationship = edge_data.get("relationship", "").lower()
+                target_us_id = self._us_by_node.get(target)
+                if target_us_id and relationship in buckets:
+                    buckets[relationship].append(target_us_id)
+
+            # Incoming edges (other US → this US), as the inverse relationship
+            for source, _, edge_data in self.graph.in_edges(node_id, data=True):
+                relationship = edge_data.get("relationship", "").lower()
+                inverse_rel = self._get_inverse_relationship(relationship)
+                source_us_id = self._us_by_node.get(source)
+                if source_us_id and inverse_rel in buckets:
+                    buckets[inverse_rel].append(source_us_id)
+
+            self._relationships[node_id] = buckets
 
     def _get_inverse_relationship(self, relationship: str) -> str:
         """Get inverse stratigraphic relationship"""
@@ -535,18 +621,33 @@ class GraphMLParser:
             ),
         }
 
-    def _get_period_data(self, us_record: US) -> Dict[str, Any]:
-        """Get periodization data for US"""
+    def _get_period_data(
+        self,
+        us_record: US,
+        period_record: Optional[Periodizzazione] = None,
+        datazioni: Optional[Dict[Tuple[str, str], Optional[Datazione]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get periodization data for US
+
+        Args:
+            us_record: US database record
+            period_record: Periodizzazione row already read by the caller;
+                queried here only when no ``datazioni`` memo is given
+            datazioni: Memo of Datazione lookups by (sito, periodo), shared
+                across calls for a whole site
+        """
         # Query periodizzazione table
-        period_record = (
-            self.db_session.query(Periodizzazione)
-            .filter(
-                Periodizzazione.sito == us_record.sito,
-                Periodizzazione.area == us_record.area,
-                Periodizzazione.us == (int(us_record.us) if str(us_record.us).lstrip('-').isdigit() else -1),
+        if period_record is None and datazioni is None:
+            period_record = (
+                self.db_session.query(Periodizzazione)
+                .filter(
+                    Periodizzazione.sito == us_record.sito,
+                    Periodizzazione.area == us_record.area,
+                    Periodizzazione.us == (int(us_record.us) if str(us_record.us).lstrip('-').isdigit() else -1),
+                )
+                .first()
             )
-            .first()
-        )
 
         if not period_record:
             return {
@@ -559,12 +660,18 @@ class GraphMLParser:
         # Query datazioni table for period details
         period_detail = None
         if period_record.periodo:
-            period_detail = (
-                self.db_session.query(Datazione)
-                .filter(Datazione.sito == us_record.sito)
-                .filter(Datazione.periodo.ilike(f"%{period_record.periodo}%"))
-                .first()
-            )
+            key = (us_record.sito, period_record.periodo)
+            if datazioni is not None and key in datazioni:
+                period_detail = datazioni[key]
+            else:
+                period_detail = (
+                    self.db_session.query(Datazione)
+                    .filter(Datazione.sito == us_record.sito)
+                    .filter(Datazione.periodo.ilike(f"%{period_record.periodo}%"))
+                    .first()
+                )
+                if datazioni is not None:
+                    datazioni[key] = period_detail
 
         period_data = {
             "period_id": period_record.id if period_record else None,
@@ -7,8 +7,10 @@ Combines GraphML, US data, and periodization to create complete proxy definition
 
 import logging
 import math
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 import json
 
 from .graphml_parser import GraphMLParser
@@ -83,6 +85,34 @@ class ProxyMetadata:
         return json.dumps(self.to_dict(), indent=2)
 
 
+@dataclass
+class SiteLayout:
+    """Topology and 2D layout of a GraphML, shared by all proxies of a build"""
+
+    # US ID → index in topological order (first occurrence)
+    topo_index: Dict[int, int]
+    num_items: int
+
+    # US ID → depth level (0 = oldest/bottom)
+    depth_levels: Dict[int, int]
+    max_depth: int
+
+    # Node ID → spring layout position (force_directed positioning only)
+    positions: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+
+
+# Layouts by (GraphML sha256, with spring layout), most recently used last
+_LAYOUT_CACHE_SIZE = 16
+_layout_cache: "OrderedDict[Tuple[str, bool], SiteLayout]" = OrderedDict()
+_layout_lock = threading.Lock()
+
+
+def clear_layout_cache():
+    """Drop all cached site layouts"""
+    with _layout_lock:
+        _layout_cache.clear()
+
+
 class ProxyGenerator:
     """
     Generates proxy metadata for Blender 3D visualization
@@ -133,7 +163,16 @@ class ProxyGenerator:
         """
         # Get complete US data from parser
         us_data = self.parser.get_us_data_with_graphml(us_id)
+        return self._build_proxy(us_id, us_data, self.site_layout(), build_session_id)
 
+    def _build_proxy(
+        self,
+        us_id: int,
+        us_data: Dict[str, Any],
+        layout: SiteLayout,
+        build_session_id: str,
+    ) -> Optional[ProxyMetadata]:
+        """Proxy metadata from complete US data and the site layout"""
         if "error" in us_data:
             logger.warning(f"Cannot generate proxy for US {us_id}: {us_data['error']}")
             return None
@@ -145,7 +184,7 @@ class ProxyGenerator:
         chronology = us_data["chronology"]
 
         # Calculate 3D properties
-        location = self._calculate_location(us_id, graphml_data)
+        location = self._calculate_location(us_id, graphml_data, layout)
         scale = self._calculate_scale(stratigraphic_data)
         rotation = (0.0, 0.0, 0.0)
 
@@ -212,10 +251,15 @@ class ProxyGenerator:
         Returns:
             List of ProxyMetadata
         """
+        # Topology, depth levels and layout once per build (cached by
+        # GraphML hash), US and periodization rows in a few queries
+        layout = self.site_layout()
+        us_data = self.parser.get_us_data_for_ids(us_ids)
+
         proxies = []
 
         for us_id in us_ids:
-            proxy = self.generate_proxy(us_id, build_session_id)
+            proxy = self._build_proxy(us_id, us_data[us_id], layout, build_session_id)
             if proxy:
                 proxies.append(proxy)
 
@@ -226,8 +270,67 @@ class ProxyGenerator:
     # Positioning Algorithms
     # ========================================================================
 
+    def site_layout(self) -> SiteLayout:
+        """
+        Topology, depth levels and (for force_directed) spring layout of
+        the loaded GraphML
+
+        Cached by GraphML hash, so a build computes them once instead of
+        once per US, and later builds of the same file reuse them.
+        """
+        with_positions = self.positioning == "force_directed"
+        key = (self.parser.graphml_hash, with_positions)
+        if key[0] is not None:
+            with _layout_lock:
+                layout = _layout_cache.get(key)
+                if layout is not None:
+                    _layout_cache.move_to_end(key)
+                    return layout
+
+        layout = self._compute_layout(with_positions)
+
+        if key[0] is not None:
+            with _layout_lock:
+                _layout_cache[key] = layout
+                while len(_layout_cache) > _LAYOUT_CACHE_SIZE:
+                    _layout_cache.popitem(last=False)
+        return layout
+
+    def _compute_layout(self, with_positions: bool) -> SiteLayout:
+        """Compute a SiteLayout from the parser's graph"""
+        topo_order = self.parser.get_topological_order()
+
+        topo_index = {}
+        for index, us_id in enumerate(topo_order):
+            topo_index.setdefault(us_id, index)
+        depth_levels = {us_id: index for index, us_id in enumerate(topo_order)}
+
+        positions = {}
+        if with_positions and self.parser.graph:
+            import networkx as nx
+
+            # Seeded, so a cache miss reproduces the same layout
+            try:
+                positions = {
+                    node: (float(x), float(y))
+                    for node, (x, y) in nx.spring_layout(
+                        self.parser.graph, k=2.0, iterations=50, seed=42
+                    ).items()
+                }
+            except ImportError as e:
+                # Large graphs need scipy, which is not a dependency
+                logger.warning(f"Spring layout unavailable ({e}), using grid positions")
+
+        return SiteLayout(
+            topo_index=topo_index,
+            num_items=len(topo_order),
+            depth_levels=depth_levels,
+            max_depth=max(depth_levels.values()) if depth_levels else 0,
+            positions=positions,
+        )
+
     def _calculate_location(
-        self, us_id: int, graphml_data: Dict[str, Any]
+        self, us_id: int, graphml_data: Dict[str, Any], layout: SiteLayout
     ) -> Tuple[float, float, float]:
         """
         Calculate 3D location for proxy
@@ -236,30 +339,28 @@ class ProxyGenerator:
             (x, y, z) tuple
         """
         # Z-axis: Based on stratigraphic depth
-        z = self._calculate_z_position(us_id)
+        z = self._calculate_z_position(us_id, layout)
 
         # X-Y: Based on positioning algorithm
         if self.positioning == "graphml" and "position" in graphml_data:
             x, y = self._position_from_graphml(graphml_data["position"])
         elif self.positioning == "force_directed":
-            x, y = self._position_force_directed(us_id)
+            x, y = self._position_force_directed(us_id, layout)
         else:  # grid (default fallback)
-            x, y = self._position_grid(us_id)
+            x, y = self._position_grid(us_id, layout)
 
         return (x, y, z)
 
-    def _calculate_z_position(self, us_id: int) -> float:
+    def _calculate_z_position(self, us_id: int, layout: SiteLayout) -> float:
         """
         Calculate Z position based on stratigraphic depth
 
         Bottom (oldest) = 0, top (newest) = higher Z
         """
-        depth_levels = self.parser.get_depth_levels()
-        us_depth = depth_levels.get(us_id, 0)
-        max_depth = max(depth_levels.values()) if depth_levels else 0
+        us_depth = layout.depth_levels.get(us_id, 0)
 
         # Invert: oldest at Z=0, newest at top
-        z_position = (max_depth - us_depth) * self.layer_spacing
+        z_position = (layout.max_depth - us_depth) * self.layer_spacing
 
         return z_position
 
@@ -273,17 +374,12 @@ class ProxyGenerator:
         y = graphml_position.get("y", 0) * 0.001
         return (x, y)
 
-    def _position_grid(self, us_id: int) -> Tuple[float, float]:
+    def _position_grid(self, us_id: int, layout: SiteLayout) -> Tuple[float, float]:
         """Position on regular grid"""
-        topo_order = self.parser.get_topological_order()
-
-        try:
-            index = topo_order.index(us_id)
-        except ValueError:
-            index = us_id  # Fallback
+        index = layout.topo_index.get(us_id, us_id)  # Fallback: US ID
 
         # Ensure we have at least 1 column to avoid division by zero
-        num_items = max(len(topo_order), 1)
+        num_items = max(layout.num_items, 1)
         cols = max(math.ceil(math.sqrt(num_items)), 1)
 
         x = (index % cols) * self.grid_spacing
@@ -291,20 +387,13 @@ class ProxyGenerator:
 
         return (x, y)
 
-    def _position_force_directed(self, us_id: int) -> Tuple[float, float]:
-        """Position using NetworkX spring layout"""
-        import networkx as nx
-
-        if not self.parser.graph:
-            return self._position_grid(us_id)
-
-        # Calculate spring layout
-        pos = nx.spring_layout(self.parser.graph, k=2.0, iterations=50)
-
+    def _position_force_directed(self, us_id: int, layout: SiteLayout) -> Tuple[float, float]:
+        """Position using the NetworkX spring layout of the site"""
         # Find node for this US
         us_node = self.parser._find_node_by_us_id(us_id)
+        pos = layout.positions
         if not us_node or us_node not in pos:
-            return self._position_grid(us_id)
+            return self._position_grid(us_id, layout)
 
         # Scale to Blender units
         x, y = pos[us_node]
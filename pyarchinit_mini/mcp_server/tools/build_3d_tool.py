@@ -104,7 +104,7 @@ class Build3DTool(BaseTool):
             matrix_generator = HarrisMatrixGenerator(db_manager, us_service=us_service)
 
             # Generate Harris Matrix graph
-            graph = matrix_generator.generate_matrix(site_name)
+            graph, _, _ = matrix_generator.get_cached_matrix(site_name)
             has_relationships = graph and graph.number_of_edges() > 0
 
             if not graph or graph.number_of_nodes() == 0:
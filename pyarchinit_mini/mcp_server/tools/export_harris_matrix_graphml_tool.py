@@ -136,7 +136,7 @@ class ExportHarrisMatrixGraphMLTool(BaseTool):
             matrix_generator = HarrisMatrixGenerator(self.db_manager, self.us_service)
 
             # Generate Harris Matrix graph from database
-            graph = matrix_generator.generate_matrix(site_name)
+            graph, _, _ = matrix_generator.get_cached_matrix(site_name)
 
             if not graph or graph.number_of_nodes() == 0:
                 logger.error(f"No stratigraphic units found for site {site_name}")
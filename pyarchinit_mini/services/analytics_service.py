@@ -2,8 +2,14 @@
 Analytics Service for PyArchInit-Mini
 
 Provides data aggregation and statistics for dashboard charts and analytics.
+
+The ``get_*`` methods query the database directly. The dashboard
+(``get_complete_dashboard_data``, ``get_dashboard_totals``) is served from
+precomputed aggregates, see ``dashboard_aggregates``.
 """
 
+import logging
+import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from collections import Counter
@@ -14,19 +20,55 @@ from ..models.site import Site
 from ..models.us import US
 from ..models.inventario_materiali import InventarioMateriali
 from ..models.pottery import Pottery
+from .dashboard_aggregates import DEFAULT_MAX_AGE, DashboardAggregates, aggregates_for
 
+logger = logging.getLogger(__name__)
 
 class AnalyticsService:
     """Service for generating analytics and statistics"""
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, max_age: float = DEFAULT_MAX_AGE):
         """
         Initialize analytics service
 
         Args:
             db_manager: Database manager instance
+            max_age: Seconds after which the dashboard aggregates are
+                reconciled with the database in the background
         """
         self.db_manager = db_manager
+        self.max_age = max_age
+
+    def _aggregates(self) -> DashboardAggregates:
+        snapshot = aggregates_for(self.db_manager.connection.engine)
+        if not snapshot.reconciled_at:
+            # First use: compute synchronously
+            self.reconcile(snapshot)
+        elif snapshot.stale or time.time() - snapshot.reconciled_at > self.max_age:
+            self._reconcile_in_background(snapshot)
+        return snapshot
+
+    def reconcile(self, snapshot: Optional[DashboardAggregates] = None):
+        """Recompute the dashboard aggregates from the database"""
+        if snapshot is None:
+            snapshot = aggregates_for(self.db_manager.connection.engine)
+        with self.db_manager.connection.get_session() as session:
+            snapshot.reconcile(session)
+
+    def _reconcile_in_background(self, snapshot: DashboardAggregates):
+        snapshot.refresh_in_background(lambda: self.reconcile(snapshot), 'dashboard-aggregates-reconcile')
+
+    def get_dashboard_totals(self) -> Dict[str, Any]:
+        """
+        Record totals for the dashboard, from the precomputed aggregates
+
+        Returns:
+            Overview totals (including 'total_media') plus 'freshness'
+        """
+        snapshot = self._aggregates()
+        totals = snapshot.dashboard_data()['overview']
+        totals['freshness'] = snapshot.freshness()
+        return totals
 
     def get_overview_stats(self) -> Dict[str, Any]:
         """
@@ -298,20 +340,14 @@ class AnalyticsService:
         """
         Get all analytics data for dashboard in a single call
 
+        Served from the precomputed aggregates: the same keys and values as
+        the ``get_*`` queries (top 10 where those take a limit), plus
+        'freshness' with the time of the last full reconcile.
+
         Returns:
             Dictionary with all dashboard data
         """
-        return {
-            'overview': self.get_overview_stats(),
-            'sites_by_region': self.get_sites_by_region(),
-            'sites_by_province': self.get_sites_by_province(limit=10),
-            'us_by_period': self.get_us_by_period(),
-            'us_by_type': self.get_us_by_type(),
-            'us_by_site': self.get_us_by_site(limit=10),
-            'inventario_by_type': self.get_inventario_by_type(limit=10),
-            'inventario_by_conservation': self.get_inventario_by_conservation(),
-            'inventario_by_site': self.get_inventario_by_site(limit=10),
-            'pottery_by_site': self.get_pottery_by_site(limit=10),
-            'pottery_by_form': self.get_pottery_by_form(limit=10),
-            'pottery_by_fabric': self.get_pottery_by_fabric(limit=10),
-        }
+        snapshot = self._aggregates()
+        data = snapshot.dashboard_data()
+        data['freshness'] = snapshot.freshness()
+        return data
@@ -4,11 +4,11 @@ from __future__ import annotations
 import json
 import logging
 import os
-import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ..database.connection import copy_sqlite_database
 from ..database.manager import DatabaseManager
 
 logger = logging.getLogger(__name__)
@@ -38,7 +38,7 @@ class BackupService:
         if db_url.startswith("sqlite:///"):
             src = db_url.replace("sqlite:///", "", 1)
             path = backups / f"pyarchinit_backup_{ts}.sqlite"
-            shutil.copy(src, path)
+            copy_sqlite_database(src, str(path))
             fmt = "sqlite"
         elif db_url.startswith("postgresql"):
             # Try pg_dump first via ImportExportService._create_backup.
@@ -0,0 +1,307 @@
+"""
+Precomputed dashboard aggregates (record totals and per-value counts)
+
+One snapshot per database holds the totals and grouped counts shown by
+the dashboard and /analytics, so those pages read counters instead of
+running a dozen GROUP BY queries.
+
+ORM inserts, updates and deletes committed in this process adjust the
+counters incrementally through SQLAlchemy session events. Writes the
+events cannot see in detail (bulk DML through a session, raw SQL, other
+processes) are picked up by a full reconcile, which runs in the
+background when the snapshot is marked stale or is older than
+``max_age`` seconds. ``reconciled_at`` tells users how fresh the data is.
+"""
+
+import heapq
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import event, func, inspect as sa_inspect
+from sqlalchemy.orm import Session
+
+from ..database.per_database import BackgroundRefresh, PerDatabase
+from ..models.inventario_materiali import InventarioMateriali
+from ..models.media import Media
+from ..models.pottery import Pottery
+from ..models.site import Site
+from ..models.us import US
+
+logger = logging.getLogger(__name__)
+
+# Seconds between full reconciles
+DEFAULT_MAX_AGE = 300.0
+
+
+@dataclass(frozen=True)
+class Dimension:
+    """A grouped count shown on the dashboard"""
+    model: Any
+    column: str
+    limit: Optional[int] = None     # top-N by count, None for all values
+
+
+# Dashboard key -> counted model
+TOTALS: Dict[str, Any] = {
+    'total_sites': Site,
+    'total_us': US,
+    'total_inventario': InventarioMateriali,
+    'total_pottery': Pottery,
+    'total_media': Media,
+}
+
+# Dashboard key -> grouped count (same keys as get_complete_dashboard_data)
+DIMENSIONS: Dict[str, Dimension] = {
+    'sites_by_region': Dimension(Site, 'regione'),
+    'sites_by_province': Dimension(Site, 'provincia', limit=10),
+    'us_by_period': Dimension(US, 'periodo_iniziale'),
+    'us_by_type': Dimension(US, 'unita_tipo'),
+    'us_by_site': Dimension(US, 'sito', limit=10),
+    'inventario_by_type': Dimension(InventarioMateriali, 'tipo_reperto', limit=10),
+    'inventario_by_conservation': Dimension(InventarioMateriali, 'stato_conservazione'),
+    'inventario_by_site': Dimension(InventarioMateriali, 'sito', limit=10),
+    'pottery_by_site': Dimension(Pottery, 'sito', limit=10),
+    'pottery_by_form': Dimension(Pottery, 'form', limit=10),
+    'pottery_by_fabric': Dimension(Pottery, 'fabric', limit=10),
+}
+
+_TRACKED = {model: [key for key, dim in DIMENSIONS.items() if dim.model is model]
+            for model in TOTALS.values()}
+_TRACKED_TABLES = {model.__table__.name for model in _TRACKED}
+
+
+def _counted(value) -> bool:
+    return value is not None and value != ''
+
+
+def _present_columns(session: Session) -> Dict[str, Set[str]]:
+    """Columns of the tracked tables the database has (missing tables left out)"""
+    inspector = sa_inspect(session.get_bind())
+    return {table: {column['name'] for column in inspector.get_columns(table)}
+            for table in _TRACKED_TABLES if inspector.has_table(table)}
+
+
+class DashboardAggregates(BackgroundRefresh):
+    """
+    Counters of one database
+
+    A change is (model, total delta, old values, new values): the model's
+    total moves by the delta, every dimension loses its old value and
+    gains its new one.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.totals: Dict[Any, int] = {model: 0 for model in _TRACKED}
+        self.counters: Dict[str, Counter] = {key: Counter() for key in DIMENSIONS}
+        self.reconciled_at = 0.0
+        self.updated_at = 0.0
+        self.stale = True
+        # Set when changes are committed while a reconcile reads the
+        # database: whether the reconcile saw them is unknown, so the
+        # result is marked stale and reconciled again
+        self._reconciling = False
+        self._changed_while_reconciling = False
+
+    def reconcile(self, session: Session):
+        """
+        Recompute every counter from the database
+
+        Tables or columns the database lacks (e.g. no pottery_table) count
+        as empty.
+        """
+        with self._lock:
+            self._reconciling = True
+            self._changed_while_reconciling = False
+        try:
+            present = _present_columns(session)
+            totals = {}
+            for model in _TRACKED:
+                if model.__table__.name not in present:
+                    totals[model] = 0
+                    continue
+                pk = sa_inspect(model).primary_key[0]
+                totals[model] = session.query(func.count(pk)).scalar() or 0
+            counters = {}
+            for key, dim in DIMENSIONS.items():
+                if dim.column not in present.get(dim.model.__table__.name, ()):
+                    counters[key] = Counter()
+                    continue
+                column = getattr(dim.model, dim.column)
+                rows = session.query(column, func.count()).filter(
+                    column.isnot(None), column != ''
+                ).group_by(column).all()
+                counters[key] = Counter({value: count for value, count in rows if _counted(value)})
+        except Exception:
+            with self._lock:
+                self._reconciling = False
+            raise
+        with self._lock:
+            self._reconciling = False
+            self.totals = totals
+            self.counters = counters
+            self.reconciled_at = self.updated_at = time.time()
+            self.stale = self._changed_while_reconciling
+
+    def _apply(self, model, delta: int, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]):
+        self.totals[model] = max(0, self.totals[model] + delta)
+        for key in _TRACKED[model]:
+            column = DIMENSIONS[key].column
+            counter = self.counters[key]
+            if old is not None and column in old and _counted(old[column]):
+                counter[old[column]] -= 1
+                if counter[old[column]] <= 0:
+                    del counter[old[column]]
+            if new is not None and column in new and _counted(new[column]):
+                counter[new[column]] += 1
+
+    def apply_changes(self, changes):
+        """Apply committed changes (see class docstring)"""
+        with self._lock:
+            if self._reconciling:
+                self._changed_while_reconciling = True
+            if not self.reconciled_at:
+                return
+            for change in changes:
+                self._apply(*change)
+            self.updated_at = time.time()
+
+    def mark_stale(self):
+        """Reconcile on next use (writes the events could not apply)"""
+        with self._lock:
+            self.stale = True
+            if self._reconciling:
+                self._changed_while_reconciling = True
+
+    def dashboard_data(self) -> Dict[str, Any]:
+        """Overview totals and grouped counts, shaped like the live queries"""
+        with self._lock:
+            totals = {key: self.totals[model] for key, model in TOTALS.items()}
+            overview = dict(totals,
+                            total_regions=len(self.counters['sites_by_region']),
+                            total_provinces=len(self.counters['sites_by_province']))
+            data: Dict[str, Any] = {'overview': overview}
+            for key, dim in DIMENSIONS.items():
+                counter = self.counters[key]
+                if dim.limit is None:
+                    data[key] = dict(counter)
+                else:
+                    data[key] = dict(heapq.nlargest(dim.limit, counter.items(), key=lambda item: item[1]))
+            return data
+
+    def freshness(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'reconciled_at': _iso(self.reconciled_at),
+                'updated_at': _iso(self.updated_at),
+                'age_seconds': round(time.time() - self.reconciled_at, 1) if self.reconciled_at else None,
+                'stale': self.stale,
+            }
+
+
+def _iso(timestamp: float) -> Optional[str]:
+    if not timestamp:
+        return None
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+
+
+_snapshots: PerDatabase[DashboardAggregates] = PerDatabase()
+
+
+def aggregates_for(database, create: bool = True) -> Optional[DashboardAggregates]:
+    return _snapshots.get(database, DashboardAggregates if create else None)
+
+
+def invalidate_dashboard_aggregates(database) -> None:
+    """
+    Mark a database's aggregates stale after bulk or raw SQL writes; they
+    are reconciled in the background on next use
+
+    Args:
+        database: Engine or connection URL
+    """
+    snapshot = aggregates_for(database, create=False)
+    if snapshot is not None:
+        snapshot.mark_stale()
+
+
+def _old_and_new(instance, columns: List[str]) -> Tuple[Optional[Dict], Optional[Dict], bool]:
+    """Pre- and post-flush values of the changed tracked columns; False if unknown"""
+    state = sa_inspect(instance)
+    old, new = {}, {}
+    for column in columns:
+        history = state.attrs[column].history
+        if not history.added and not history.deleted:
+            continue
+        if not history.deleted and not history.unchanged:
+            # Previous value was never loaded
+            return None, None, False
+        old[column] = history.deleted[0] if history.deleted else history.unchanged[0]
+        new[column] = history.added[0] if history.added else None
+    return old, new, True
+
+
+@event.listens_for(Session, 'after_flush')
+def _collect_aggregate_changes(session, flush_context):
+    """Record counter changes of this flush until the transaction commits"""
+    changes = []
+    unknown = False
+    for instance in session.new:
+        model = type(instance)
+        if model in _TRACKED:
+            columns = [DIMENSIONS[key].column for key in _TRACKED[model]]
+            changes.append((model, 1, None, {c: getattr(instance, c, None) for c in columns}))
+    for instance in session.deleted:
+        model = type(instance)
+        if model in _TRACKED:
+            columns = [DIMENSIONS[key].column for key in _TRACKED[model]]
+            changes.append((model, -1, {c: getattr(instance, c, None) for c in columns}, None))
+    for instance in session.dirty:
+        model = type(instance)
+        if model in _TRACKED and session.is_modified(instance):
+            columns = [DIMENSIONS[key].column for key in _TRACKED[model]]
+            old, new, known = _old_and_new(instance, columns)
+            if not known:
+                unknown = True
+            elif old:
+                changes.append((model, 0, old, new))
+    if changes:
+        session.info.setdefault('aggregate_changes', []).extend(changes)
+    if unknown:
+        session.info['aggregate_stale'] = True
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _collect_aggregate_dml(orm_execute_state):
+    # Bulk DML run through a session cannot be applied row by row
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, 'table', None)
+        if getattr(table, 'name', None) in _TRACKED_TABLES:
+            orm_execute_state.session.info['aggregate_stale'] = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _apply_aggregate_changes(session):
+    changes = session.info.pop('aggregate_changes', None)
+    stale = session.info.pop('aggregate_stale', False)
+    if not changes and not stale:
+        return
+    try:
+        snapshot = aggregates_for(session.get_bind(), create=False)
+    except Exception:
+        return
+    if snapshot is None:
+        return
+    if changes:
+        snapshot.apply_changes(changes)
+    if stale:
+        snapshot.mark_stale()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_aggregate_changes(session):
+    session.info.pop('aggregate_changes', None)
+    session.info.pop('aggregate_stale', None)
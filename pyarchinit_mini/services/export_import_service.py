@@ -371,6 +371,11 @@ class ExportImportService:
 
             session.commit()
 
+        if imported:
+            from ..harris_matrix.matrix_cache import invalidate_matrix_cache
+            for site in {row.get('sito') for row in data}:
+                invalidate_matrix_cache(self.db_manager, site)
+
         logger.info(f"Batch import US completed: {imported} imported, {skipped} skipped, {len(errors)} errors")
 
         return {
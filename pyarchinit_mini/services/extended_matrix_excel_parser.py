@@ -671,6 +671,9 @@ class ExtendedMatrixExcelParser:
                     # Step 5: Update rapporti field in US records
                     self.update_rapporti_field()
 
+                    from pyarchinit_mini.harris_matrix.matrix_cache import invalidate_matrix_cache
+                    invalidate_matrix_cache(self.db_connection.connection_string, self.site_name)
+
                     # Step 6: Generate GraphML (optional)
                     graphml_path = None
                     if generate_graphml:
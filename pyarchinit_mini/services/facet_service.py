@@ -0,0 +1,97 @@
+"""
+Filter facets for the site, US and inventory list views
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Tuple
+
+from ..database.facet_cache import (
+    FACET_COLUMNS, compute_facets, facet_cache_installed, load_facets
+)
+from ..database.per_database import database_key
+from ..models.base import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class FacetService:
+    """
+    Distinct values and counts of the list filter columns
+
+    Values come from the materialized facet cache (see
+    ``database.facet_cache``), which database triggers mark dirty on
+    writes, so every request and worker shares one computation per
+    change. Databases without the cache tables are queried directly.
+    """
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self._installed: Dict[str, Dict[str, bool]] = {}
+        self._lock = threading.Lock()
+
+    def _cache_installed(self, table: str) -> bool:
+        connection = self.db_manager.connection
+        key = database_key(connection)
+        with self._lock:
+            status = self._installed.get(key)
+        if status is None:
+            try:
+                status = facet_cache_installed(connection.engine)
+            except Exception as e:
+                logger.warning(f"Could not read facet cache status: {e}")
+                status = {}
+            with self._lock:
+                self._installed[key] = status
+        return status.get(table, False)
+
+    @staticmethod
+    def _typed(table: str, column: str, value: Any) -> Any:
+        """Convert a cached (text) value back to the column's Python type"""
+        try:
+            python_type = BaseModel.metadata.tables[table].c[column].type.python_type
+        except (KeyError, NotImplementedError):
+            return value
+        if python_type is int and not isinstance(value, int):
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return value
+        return value
+
+    def get_facets(self, table: str) -> Dict[str, List[Tuple[Any, int]]]:
+        """
+        All facets of a source table
+
+        Args:
+            table: Source table name (a key of ``FACET_COLUMNS``)
+
+        Returns:
+            {column: [(value, count), ...]} sorted by value
+        """
+        if table not in FACET_COLUMNS:
+            raise ValueError(f"No facets defined for table '{table}'")
+        facets = None
+        if self._cache_installed(table):
+            try:
+                facets = load_facets(self.db_manager.connection.engine, table)
+            except Exception as e:
+                logger.warning(f"Facet cache unavailable for {table}, querying directly: {e}")
+        if facets is None:
+            with self.db_manager.connection.engine.connect() as conn:
+                facets = compute_facets(conn, table)
+
+        result = {}
+        for column, values in facets.items():
+            typed = [(self._typed(table, column, value), count) for value, count in values]
+            result[column] = sorted(typed, key=lambda item: (str(type(item[0])), item[0]))
+        return result
+
+    def values(self, table: str, column: str, descending: bool = False) -> List[Any]:
+        """Sorted distinct non-empty values of one facet column"""
+        values = [value for value, _ in self.get_facets(table).get(column, [])]
+        return values[::-1] if descending else values
+
+    def counts(self, table: str, column: str) -> Dict[Any, int]:
+        """Row count per value of one facet column"""
+        return dict(self.get_facets(table).get(column, []))
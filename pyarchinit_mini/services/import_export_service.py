@@ -22,10 +22,12 @@ import uuid
 from datetime import datetime, date
 from typing import Dict, List, Optional, Tuple, Any
 import logging
-from sqlalchemy import create_engine, text, inspect
+from sqlalchemy import bindparam, create_engine, text, inspect
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 
+from ..database.connection import copy_sqlite_database
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -42,6 +44,7 @@ class ImportExportService:
             mini_db_connection: Connection string for PyArchInit-Mini database
             source_db_connection: Connection string for source PyArchInit database (for import)
         """
+        self.mini_db_connection = mini_db_connection
         self.mini_engine = create_engine(mini_db_connection)
         self.mini_session_maker = sessionmaker(bind=self.mini_engine)
 
@@ -94,7 +97,7 @@ class ImportExportService:
             backup_path = f"{db_path}.backup_{timestamp}"
 
             try:
-                shutil.copy2(db_path, backup_path)
+                copy_sqlite_database(db_path, backup_path)
                 file_size = os.path.getsize(backup_path) / (1024 * 1024)  # MB
                 logger.info(f"✓ Database backup created: {backup_path} ({file_size:.2f} MB)")
                 return backup_path
@@ -430,6 +433,11 @@ class ImportExportService:
                     stats['errors'].append(error_msg)
                     stats['skipped'] += 1
 
+            from .dashboard_aggregates import invalidate_dashboard_aggregates
+            from .suggest_service import invalidate_suggestions
+            invalidate_suggestions(self.mini_db_connection)
+            invalidate_dashboard_aggregates(self.mini_db_connection)
+
             return stats
 
         except Exception as e:
@@ -765,18 +773,26 @@ class ImportExportService:
     def import_us(self, sito_filter: Optional[List[str]] = None,
                   import_relationships: bool = True,
                   auto_migrate: bool = True,
-                  auto_backup: bool = True) -> Dict[str, Any]:
+                  auto_backup: bool = True,
+                  batch_size: int = 1000) -> Dict[str, Any]:
         """
         Import US (Stratigraphic Units) from PyArchInit to PyArchInit-Mini
 
+        Source rows are streamed in chunks of ``batch_size``. Existing US keys
+        and relationship keys are preloaded into sets, so each chunk is
+        written with a few executemany statements in a single transaction.
+        If a chunk fails, it is replayed row by row to isolate the bad rows.
+
         Args:
             sito_filter: List of site names to import (None = import all)
             import_relationships: If True, parse rapporti field and create relationships
             auto_migrate: If True, automatically add missing i18n columns to source database
             auto_backup: If True, create backup before database migration
+            batch_size: Number of source rows written per transaction
 
         Returns:
-            Dictionary with import statistics including backup_path
+            Dictionary with import statistics including backup_path and
+            throughput (rows_per_second)
         """
         if not self.source_engine:
             raise ValueError("Source database not configured")
@@ -795,103 +811,124 @@ class ImportExportService:
             'updated': 0,
             'skipped': 0,
             'relationships_created': 0,
-            'errors': []
+            'errors': [],
+            'batches': 0,
+            'duration_seconds': 0.0,
+            'rows_per_second': 0.0
         }
 
+        import time
+        start_time = time.perf_counter()
+        batch_size = max(1, batch_size)
+
         source_session = self.source_session_maker()
         mini_session = self.mini_session_maker()
 
         try:
-            # Query US from PyArchInit
-            query = "SELECT * FROM us_table"
+            site_params = {}
+            site_clause = ""
             if sito_filter:
-                placeholders = ','.join([f"'{s}'" for s in sito_filter])
-                query += f" WHERE sito IN ({placeholders})"
+                site_clause = " WHERE sito IN :sites"
+                site_params = {'sites': list(sito_filter)}
+
+            def site_query(sql):
+                query = text(sql + site_clause)
+                if sito_filter:
+                    query = query.bindparams(bindparam('sites', expanding=True))
+                return query
+
+            # Preload existing keys of the target database
+            existing_us = {
+                (row[0], str(row[1]))
+                for row in mini_session.execute(site_query("SELECT sito, us FROM us_table"), site_params)
+            }
+            existing_rels = set()
+            if import_relationships:
+                existing_rels = {
+                    tuple(row) for row in mini_session.execute(
+                        site_query("SELECT sito, us_from, us_to, relationship_type FROM us_relationships_table"),
+                        site_params
+                    )
+                }
+            max_id = mini_session.execute(text("SELECT MAX(CAST(id_us AS INTEGER)) FROM us_table")).scalar()
+            next_id = (max_id or 0) + 1
+            mini_session.commit()
+
+            # Stream source rows (server-side cursor where supported)
+            result = source_session.execute(
+                site_query("SELECT * FROM us_table"),
+                site_params,
+                execution_options={'stream_results': True}
+            )
 
-            result = source_session.execute(text(query))
-            source_us_list = result.fetchall()
+            imported_sites = set()
 
-            for us_row in source_us_list:
-                try:
+            for chunk in result.partitions(batch_size):
+                operations = []
+                for us_row in chunk:
                     us_data = dict(us_row._mapping)
+                    try:
+                        operation, next_id = self._plan_us_import(
+                            us_data, existing_us, existing_rels, next_id, import_relationships
+                        )
+                    except Exception as e:
+                        error_msg = f"Error importing US {us_data.get('sito')}/{us_data.get('us')}: {str(e)}"
+                        logger.error(error_msg)
+                        stats['errors'].append(error_msg)
+                        stats['skipped'] += 1
+                        continue
+                    operations.append(operation)
 
-                    # Check if US already exists using raw SQL (avoids ORM metadata issues)
-                    # Cast us to str: source db may have INTEGER us, but mini uses VARCHAR(100)
-                    existing = mini_session.execute(
-                        text("SELECT id_us FROM us_table WHERE sito = :sito AND us = :us LIMIT 1"),
-                        {'sito': us_data['sito'], 'us': str(us_data['us'])}
-                    ).fetchone()
-
-                    # Map fields from PyArchInit to PyArchInit-Mini
-                    mapped_data = self._map_us_fields_import(us_data)
-
-                    if existing:
-                        # Update existing US
-                        self._update_us_mini(mini_session, mapped_data)
-                        stats['updated'] += 1
-                    else:
-                        # Insert new US
-                        self._insert_us_mini(mini_session, mapped_data)
-                        stats['imported'] += 1
-
-                    # Handle relationships
-                    if import_relationships:
-                        rapporti_field = us_data.get('rapporti')
-                        if rapporti_field:
-                            logger.info(f"Processing relationships for US {us_data['sito']}/{us_data['us']}: {rapporti_field}")
-                            relationships = self._parse_pyarchinit_rapporti(rapporti_field)
-                            logger.info(f"Parsed {len(relationships)} relationships: {relationships}")
-
-                            for rel_type, us_to in relationships:
-                                try:
-                                    # Check if relationship already exists
-                                    existing_rel = mini_session.execute(
-                                        text("""SELECT id_relationship FROM us_relationships_table
-                                                WHERE sito = :sito AND us_from = :us_from AND us_to = :us_to
-                                                AND relationship_type = :rel_type"""),
-                                        {
-                                            'sito': us_data['sito'],
-                                            'us_from': int(us_data['us']),
-                                            'us_to': int(us_to),
-                                            'rel_type': rel_type
-                                        }
-                                    ).fetchone()
-
-                                    if existing_rel:
-                                        logger.debug(f"Relationship already exists: {us_data['sito']} US {us_data['us']} -{rel_type}-> {us_to}")
-                                        continue
-
-                                    # Insert relationship
-                                    rel_query = text("""
-                                        INSERT INTO us_relationships_table
-                                        (sito, us_from, us_to, relationship_type, created_at, updated_at)
-                                        VALUES (:sito, :us_from, :us_to, :rel_type, :created_at, :updated_at)
-                                    """)
-
-                                    mini_session.execute(rel_query, {
-                                        'sito': us_data['sito'],
-                                        'us_from': int(us_data['us']),
-                                        'us_to': int(us_to),
-                                        'rel_type': rel_type,
-                                        'created_at': datetime.now(),
-                                        'updated_at': datetime.now()
-                                    })
-                                    stats['relationships_created'] += 1
-                                    logger.info(f"Created relationship: {us_data['sito']} US {us_data['us']} -{rel_type}-> {us_to}")
-
-                                except Exception as e:
-                                    logger.warning(f"Failed to create relationship {us_data['sito']} US {us_data['us']} -{rel_type}-> {us_to}: {str(e)}")
-                        else:
-                            logger.debug(f"No rapporti field for US {us_data['sito']}/{us_data['us']}")
+                if not operations:
+                    continue
 
+                try:
+                    self._write_us_batch(mini_session, operations)
                     mini_session.commit()
-
+                    written = operations
                 except Exception as e:
                     mini_session.rollback()
-                    error_msg = f"Error importing US {us_data.get('sito')}/{us_data.get('us')}: {str(e)}"
-                    logger.error(error_msg)
-                    stats['errors'].append(error_msg)
-                    stats['skipped'] += 1
+                    logger.warning(f"Batch of {len(operations)} US failed ({e}), retrying row by row")
+                    written = []
+                    for operation in operations:
+                        try:
+                            self._write_us_batch(mini_session, [operation])
+                            mini_session.commit()
+                            written.append(operation)
+                        except Exception as row_error:
+                            mini_session.rollback()
+                            # Forget the keys planned for the failed row
+                            if operation['insert']:
+                                existing_us.discard(operation['key'])
+                            existing_rels.difference_update(r['key'] for r in operation['relationships'])
+                            us_data = operation['data']
+                            error_msg = f"Error importing US {us_data.get('sito')}/{us_data.get('us')}: {str(row_error)}"
+                            logger.error(error_msg)
+                            stats['errors'].append(error_msg)
+                            stats['skipped'] += 1
+
+                for operation in written:
+                    stats['imported' if operation['insert'] else 'updated'] += 1
+                    stats['relationships_created'] += len(operation['relationships'])
+                    imported_sites.add(operation['key'][0])
+                stats['batches'] += 1
+
+                elapsed = time.perf_counter() - start_time
+                processed = stats['imported'] + stats['updated'] + stats['skipped']
+                logger.info(f"Imported {processed} US ({processed / elapsed if elapsed else 0:.0f} rows/s)")
+
+            from ..harris_matrix.matrix_cache import invalidate_matrix_cache
+            from .dashboard_aggregates import invalidate_dashboard_aggregates
+            from .suggest_service import invalidate_suggestions
+            for site in imported_sites:
+                invalidate_matrix_cache(self.mini_db_connection, site)
+            invalidate_suggestions(self.mini_db_connection)
+            invalidate_dashboard_aggregates(self.mini_db_connection)
+
+            elapsed = time.perf_counter() - start_time
+            processed = stats['imported'] + stats['updated'] + stats['skipped']
+            stats['duration_seconds'] = elapsed
+            stats['rows_per_second'] = processed / elapsed if elapsed else 0.0
 
             return stats
 
@@ -902,6 +939,97 @@ class ImportExportService:
             source_session.close()
             mini_session.close()
 
+    def _plan_us_import(self, us_data: Dict[str, Any], existing_us: set, existing_rels: set,
+                        next_id: int, import_relationships: bool) -> Tuple[Dict[str, Any], int]:
+        """
+        Map one source US row to the writes it needs
+
+        Updates ``existing_us``/``existing_rels`` so later rows in the same
+        import see the planned rows, like the row-by-row import did.
+
+        Returns:
+            Tuple (operation dict, next free id_us)
+        """
+        mapped_data = self._map_us_fields_import(us_data)
+        key = (us_data['sito'], str(us_data['us']))
+        insert = key not in existing_us
+
+        if insert:
+            mapped_data['id_us'] = next_id  # Keep as int — id_us is INTEGER in PostgreSQL
+            next_id += 1
+            existing_us.add(key)
+
+        relationships = []
+        if import_relationships:
+            rapporti_field = us_data.get('rapporti')
+            if rapporti_field:
+                for rel_type, us_to in self._parse_pyarchinit_rapporti(rapporti_field):
+                    try:
+                        rel_key = (us_data['sito'], int(us_data['us']), int(us_to), rel_type)
+                    except (TypeError, ValueError) as e:
+                        logger.warning(f"Failed to create relationship {us_data['sito']} US {us_data['us']} -{rel_type}-> {us_to}: {str(e)}")
+                        continue
+                    if rel_key in existing_rels:
+                        logger.debug(f"Relationship already exists: {us_data['sito']} US {us_data['us']} -{rel_type}-> {us_to}")
+                        continue
+                    existing_rels.add(rel_key)
+                    now = datetime.now()
+                    relationships.append({
+                        'key': rel_key,
+                        'params': {
+                            'sito': rel_key[0],
+                            'us_from': rel_key[1],
+                            'us_to': rel_key[2],
+                            'rel_type': rel_type,
+                            # BaseModel required fields (NOT NULL, no server-side default)
+                            'version_number': 1,
+                            'sync_status': 'new',
+                            'entity_uuid': str(uuid.uuid4()),
+                            'created_at': now,
+                            'updated_at': now
+                        }
+                    })
+
+        operation = {
+            'key': key,
+            'insert': insert,
+            'data': mapped_data,
+            'relationships': relationships
+        }
+        return operation, next_id
+
+    def _write_us_batch(self, session: Session, operations: List[Dict[str, Any]]):
+        """Write planned US inserts, updates and relationships with executemany"""
+        inserts = [op['data'] for op in operations if op['insert']]
+        updates = [op['data'] for op in operations if not op['insert']]
+        relationships = [rel['params'] for op in operations for rel in op['relationships']]
+
+        if inserts:
+            fields = list(inserts[0].keys())
+            session.execute(text(f"""
+                INSERT INTO us_table ({', '.join(fields)})
+                VALUES ({', '.join(f':{k}' for k in fields)})
+            """), inserts)
+
+        if updates:
+            # Exclude identity fields (sito, us, id_us) from update
+            update_fields = [k for k in updates[0].keys() if k not in ['sito', 'us', 'id_us']]
+            set_clause = ', '.join([f"{k} = :{k}" for k in update_fields])
+            session.execute(text(f"""
+                UPDATE us_table
+                SET {set_clause}
+                WHERE sito = :sito AND us = :us
+            """), updates)
+
+        if relationships:
+            session.execute(text("""
+                INSERT INTO us_relationships_table
+                (sito, us_from, us_to, relationship_type, version_number, sync_status,
+                 entity_uuid, created_at, updated_at)
+                VALUES (:sito, :us_from, :us_to, :rel_type, :version_number, :sync_status,
+                        :entity_uuid, :created_at, :updated_at)
+            """), relationships)
+
     def _convert_rapporti_to_mini_format(self, rapporti_str: str) -> str:
         """
         Convert PyArchInit rapporti format to PyArchInit-Mini format
@@ -1026,42 +1154,6 @@ class ImportExportService:
 
         return mapped
 
-    def _insert_us_mini(self, session: Session, data: Dict[str, Any]):
-        """Insert US into PyArchInit-Mini database"""
-        # Generate next id_us (INTEGER primary key with autoincrement)
-        max_id_result = session.execute(text("SELECT MAX(CAST(id_us AS INTEGER)) FROM us_table")).fetchone()
-        next_id = (max_id_result[0] or 0) + 1 if max_id_result else 1
-        data['id_us'] = next_id  # Keep as int — id_us is INTEGER in PostgreSQL
-
-        # Build INSERT with all fields including id_us
-        fields = list(data.keys())
-        placeholders = [f':{k}' for k in fields]
-
-        query = text(f"""
-            INSERT INTO us_table ({', '.join(fields)})
-            VALUES ({', '.join(placeholders)})
-        """)
-
-        session.execute(query, data)
-
-    def _update_us_mini(self, session: Session, data: Dict[str, Any]):
-        """Update US in PyArchInit-Mini database using raw SQL"""
-        # Build UPDATE query dynamically based on provided fields
-        # Exclude identity fields (sito, us, id_us) from update
-        update_fields = {k: v for k, v in data.items() if k not in ['sito', 'us', 'id_us']}
-
-        if update_fields:
-            set_clause = ', '.join([f"{k} = :{k}" for k in update_fields.keys()])
-            query = text(f"""
-                UPDATE us_table
-                SET {set_clause}
-                WHERE sito = :sito AND us = :us
-            """)
-
-            # Combine update fields with identity fields for WHERE clause
-            params = {**update_fields, 'sito': data['sito'], 'us': data['us']}
-            session.execute(query, params)
-
     def export_us(self, target_db_connection: str, sito_filter: Optional[List[str]] = None,
                   export_relationships: bool = True) -> Dict[str, Any]:
         """
@@ -1354,6 +1446,11 @@ class ImportExportService:
                     stats['errors'].append(error_msg)
                     stats['skipped'] += 1
 
+            from .dashboard_aggregates import invalidate_dashboard_aggregates
+            from .suggest_service import invalidate_suggestions
+            invalidate_suggestions(self.mini_db_connection)
+            invalidate_dashboard_aggregates(self.mini_db_connection)
+
             return stats
 
         except Exception as e:
@@ -1865,7 +1962,9 @@ class ImportExportService:
                         overwrite_target: bool = False,
                         auto_backup: bool = True,
                         backup_dir: Optional[str] = None,
-                        merge_strategy: str = 'skip') -> Dict[str, Any]:
+                        merge_strategy: str = 'skip',
+                        chunk_size: int = 1000,
+                        progress_callback=None) -> Dict[str, Any]:
         """
         Migrate all data from source database to target database
 
@@ -1886,6 +1985,9 @@ class ImportExportService:
                 - 'skip': Skip records with conflicting IDs (default)
                 - 'overwrite': Update existing records with new data
                 - 'renumber': Generate new IDs for conflicting records
+            chunk_size: Rows streamed, written and committed per chunk; an
+                interrupted migration resumes after the last committed chunk
+            progress_callback: Optional callable(table_name, rows_read, total_rows)
 
         Returns:
             Dictionary with migration statistics including backup info
@@ -1998,7 +2100,9 @@ class ImportExportService:
                         table_name,
                         source_session_maker,
                         target_session_maker,
-                        merge_strategy=merge_strategy
+                        merge_strategy=merge_strategy,
+                        chunk_size=chunk_size,
+                        progress_callback=progress_callback
                     )
 
                     if rows_copied > 0:
@@ -2026,6 +2130,14 @@ class ImportExportService:
             stats['success'] = stats['tables_migrated'] > 0
             stats['duration_seconds'] = time.time() - start_time
 
+            # Every site of the target database may have changed
+            from ..harris_matrix.matrix_cache import invalidate_matrix_cache
+            from .dashboard_aggregates import invalidate_dashboard_aggregates
+            from .suggest_service import invalidate_suggestions
+            invalidate_matrix_cache(target_db_url)
+            invalidate_suggestions(target_db_url)
+            invalidate_dashboard_aggregates(target_db_url)
+
             logger.info(f"Migration complete: {stats['tables_migrated']} tables, {stats['total_rows_copied']} rows in {stats['duration_seconds']:.2f}s")
 
             return stats
@@ -2079,7 +2191,7 @@ class ImportExportService:
                 else:
                     backup_path = f"{db_path}.backup_{timestamp}"
 
-                shutil.copy2(db_path, backup_path)
+                copy_sqlite_database(db_path, backup_path)
                 file_size = os.path.getsize(backup_path) / (1024 * 1024)  # MB
 
                 result['success'] = True
@@ -2640,6 +2752,15 @@ class ImportExportService:
                 continue
         return value
 
+    # Integer 0/1 columns stored as BOOLEAN on PostgreSQL.
+    # NOTE: site_table.find_check is Integer in pyarchinit-mini (matches
+    # the PyArchInit PostgreSQL schema) — do NOT convert it to bool.
+    _POSTGRESQL_BOOLEAN_COLUMNS = {
+        'media_table': ['is_primary', 'is_public'],
+        'harris_matrix_table': ['is_final', 'is_public'],
+        'users': ['is_active', 'is_superuser'],
+    }
+
     @staticmethod
     def _convert_boolean_fields(table_name: str, row_data: Dict[str, Any],
                                  target_engine) -> Dict[str, Any]:
@@ -2658,17 +2779,8 @@ class ImportExportService:
         if not str(target_engine.url).startswith('postgresql'):
             return row_data
 
-        # Define boolean columns for each table.
-        # NOTE: site_table.find_check is Integer in pyarchinit-mini (matches
-        # the PyArchInit PostgreSQL schema) — do NOT convert it to bool.
-        boolean_columns = {
-            'media_table': ['is_primary', 'is_public'],
-            'harris_matrix_table': ['is_final', 'is_public'],
-            'users': ['is_active', 'is_superuser']
-        }
-
         # Get boolean columns for this table
-        bool_cols = boolean_columns.get(table_name, [])
+        bool_cols = ImportExportService._POSTGRESQL_BOOLEAN_COLUMNS.get(table_name, [])
 
         # Convert integer values to boolean
         converted_data = row_data.copy()
@@ -2680,28 +2792,313 @@ class ImportExportService:
 
         return converted_data
 
+    # Bookkeeping table written in the target database so an interrupted
+    # migration can resume after the last committed chunk of each table
+    _MIGRATION_CHECKPOINT_TABLE = 'pyarchinit_migration_checkpoints'
+
+    @staticmethod
+    def _target_column_profile(target_inspector, table_name: str,
+                               pk_column: Optional[str], target_engine) -> Dict[str, Any]:
+        """
+        Introspect target column metadata once per table
+
+        Handles:
+         - Date/DateTime: parse legacy "DD-MM-YYYY"
+         - String(n): truncate over-length values
+         - NOT NULL columns: fill missing values from the source
+           (legacy schemas don't carry created_at/updated_at/etc.)
+
+        Returns:
+            Dict with date_cols, varchar_max, non_text_cols, bool_cols and
+            notnull_fillers (col -> callable producing a default value)
+        """
+        import uuid as _uuid
+
+        profile = {
+            'date_cols': set(),
+            'varchar_max': {},
+            'non_text_cols': set(),  # numeric/date/bool — empty strings → None
+            'bool_cols': set(),      # target Boolean columns — coerce 0/1 → False/True
+            'notnull_fillers': {},
+        }
+        try:
+            for c in target_inspector.get_columns(table_name):
+                type_name = str(c.get('type', '')).upper()
+                is_datetime = 'DATETIME' in type_name or 'TIMESTAMP' in type_name
+                is_date = (not is_datetime) and 'DATE' in type_name
+                if is_datetime or is_date:
+                    profile['date_cols'].add(c['name'])
+                    profile['non_text_cols'].add(c['name'])
+                if any(t in type_name for t in ('INT', 'NUMERIC', 'FLOAT', 'DOUBLE', 'BOOL', 'DECIMAL')):
+                    profile['non_text_cols'].add(c['name'])
+                if 'BOOL' in type_name:
+                    profile['bool_cols'].add(c['name'])
+                if c.get('type') is not None and getattr(c['type'], 'length', None):
+                    profile['varchar_max'][c['name']] = c['type'].length
+                has_server_default = c.get('default') is not None or c.get('autoincrement') is True
+                if not c.get('nullable', True) and c['name'] != pk_column and not has_server_default:
+                    fillers = profile['notnull_fillers']
+                    if is_datetime:
+                        fillers[c['name']] = lambda: datetime.utcnow()
+                    elif is_date:
+                        fillers[c['name']] = lambda: datetime.utcnow().date()
+                    elif 'CHAR' in type_name or 'TEXT' in type_name:
+                        if c['name'] == 'entity_uuid':
+                            fillers[c['name']] = lambda: str(_uuid.uuid4())
+                        elif c['name'] == 'sync_status':
+                            fillers[c['name']] = lambda: 'new'
+                        else:
+                            fillers[c['name']] = lambda: ''
+                    elif 'INT' in type_name or 'NUMERIC' in type_name or 'FLOAT' in type_name:
+                        fillers[c['name']] = (
+                            lambda n=c['name']: 1 if n == 'version_number' else 0
+                        )
+                    elif 'BOOL' in type_name:
+                        fillers[c['name']] = lambda: False
+        except Exception:
+            pass
+
+        # Integer 0/1 booleans known to need conversion on PostgreSQL targets,
+        # even where introspection missed them
+        if target_engine.dialect.name == 'postgresql':
+            profile['bool_cols'].update(
+                ImportExportService._POSTGRESQL_BOOLEAN_COLUMNS.get(table_name, [])
+            )
+
+        return profile
+
+    @staticmethod
+    def _coerce_chunk(rows: List[Dict[str, Any]], profile: Dict[str, Any]) -> None:
+        """
+        Apply the target column coercions to a chunk of rows in place
+
+        Each coercion runs column by column over the whole chunk, so the
+        per-column checks are resolved once per chunk rather than per row.
+        """
+        if not rows:
+            return
+
+        present = set(rows[0])
+
+        # Normalise legacy Italian date strings (DD-MM-YYYY,
+        # DD/MM/YYYY) to ISO YYYY-MM-DD for Date/DateTime targets.
+        normalise = ImportExportService._normalise_date
+        for col in profile['date_cols'] & present:
+            for row in rows:
+                val = row[col]
+                if isinstance(val, str) and val.strip():
+                    row[col] = normalise(val.strip())
+
+        # Empty strings on numeric/date columns mean NULL on PG.
+        for col in profile['non_text_cols'] & present:
+            for row in rows:
+                val = row[col]
+                if isinstance(val, str) and not val.strip():
+                    row[col] = None
+
+        # Coerce 0/1 → False/True for any Boolean column on the target.
+        # Catches mismatches like Postgres `find_check BOOLEAN` vs source
+        # SQLite legacy storing 0/1 as Integer.
+        truthy = ('1', 'true', 't', 'yes', 'y', 'si', 'sì')
+        falsy = ('0', 'false', 'f', 'no', 'n')
+        for col in profile['bool_cols'] & present:
+            for row in rows:
+                val = row[col]
+                if isinstance(val, bool) or val is None:
+                    continue
+                try:
+                    if isinstance(val, (int, float)):
+                        row[col] = bool(int(val))
+                    elif isinstance(val, str):
+                        s = val.strip().lower()
+                        if s in truthy:
+                            row[col] = True
+                        elif s in falsy:
+                            row[col] = False
+                        elif s == '':
+                            row[col] = None
+                except (ValueError, TypeError):
+                    pass
+
+        # Truncate over-long strings to fit varchar(N) targets.
+        for col, max_len in profile['varchar_max'].items():
+            if col not in present:
+                continue
+            for row in rows:
+                val = row[col]
+                if isinstance(val, str) and len(val) > max_len:
+                    row[col] = val[:max_len]
+
+        # Fill NOT NULL columns when the source row is missing them
+        # or carries None (legacy schemas don't have created_at, etc.)
+        for col, filler in profile['notnull_fillers'].items():
+            for row in rows:
+                if row.get(col) is None:
+                    row[col] = filler()
+
+    @staticmethod
+    def _bulk_insert(session: Session, table_name: str, rows: List[Dict[str, Any]]):
+        """
+        Insert a chunk of rows: COPY on PostgreSQL (psycopg2), executemany elsewhere
+        """
+        if not rows:
+            return
+        columns = list(rows[0])
+
+        bind = session.get_bind()
+        if bind.dialect.name == 'postgresql' and bind.dialect.driver == 'psycopg2':
+            ImportExportService._copy_rows_postgresql(session, table_name, columns, rows)
+            return
+
+        insert_query = text(
+            f"INSERT INTO {table_name} ({', '.join(columns)}) "
+            f"VALUES ({', '.join(':' + col for col in columns)})"
+        )
+        session.execute(insert_query, rows)
+
+    @staticmethod
+    def _copy_rows_postgresql(session: Session, table_name: str, columns: List[str],
+                              rows: List[Dict[str, Any]]):
+        """Stream a chunk into PostgreSQL with COPY ... FROM STDIN (CSV)"""
+        import io
+
+        def encode(value):
+            if value is None:
+                return '\\N'
+            if isinstance(value, bool):
+                value = 't' if value else 'f'
+            elif isinstance(value, (datetime, date)):
+                value = value.isoformat()
+            elif isinstance(value, (bytes, bytearray, memoryview)):
+                value = '\\x' + bytes(value).hex()
+            elif isinstance(value, (dict, list)):
+                value = json.dumps(value)
+            # Quoted fields are never read as NULL, so '' and '\N' survive
+            return '"' + str(value).replace('"', '""') + '"'
+
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(','.join(encode(row[col]) for col in columns))
+            buffer.write('\n')
+        buffer.seek(0)
+
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table_name} ({', '.join(columns)}) "
+                f"FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer
+            )
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _checkpoint_source_key(source_engine) -> str:
+        """Identify the source database in checkpoints (password hidden)"""
+        return source_engine.url.render_as_string(hide_password=True)
+
+    @staticmethod
+    def _load_migration_checkpoint(target_session: Session, source_key: str,
+                                   table_name: str) -> Optional[Dict[str, Any]]:
+        """Return the last committed position of an interrupted table copy"""
+        table = ImportExportService._MIGRATION_CHECKPOINT_TABLE
+        try:
+            row = target_session.execute(
+                text(f"SELECT last_pk, rows_copied FROM {table} "
+                     f"WHERE source_key = :source_key AND table_name = :table_name"),
+                {'source_key': source_key, 'table_name': table_name}
+            ).first()
+        except SQLAlchemyError:
+            target_session.rollback()
+            return None
+        if row is None:
+            return None
+        return {'last_pk': json.loads(row[0]), 'rows_copied': row[1] or 0}
+
+    @staticmethod
+    def _save_migration_checkpoint(target_session: Session, source_key: str,
+                                   table_name: str, last_pk: Any, rows_copied: int):
+        """Record progress inside the chunk's transaction"""
+        table = ImportExportService._MIGRATION_CHECKPOINT_TABLE
+        params = {
+            'source_key': source_key,
+            'table_name': table_name,
+            'last_pk': json.dumps(last_pk, default=str),
+            'rows_copied': rows_copied,
+            'updated_at': datetime.utcnow(),
+        }
+        target_session.execute(text(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                source_key VARCHAR(500) NOT NULL,
+                table_name VARCHAR(100) NOT NULL,
+                last_pk TEXT,
+                rows_copied INTEGER,
+                updated_at TIMESTAMP,
+                PRIMARY KEY (source_key, table_name)
+            )
+        """))
+        updated = target_session.execute(text(
+            f"UPDATE {table} SET last_pk = :last_pk, rows_copied = :rows_copied, "
+            f"updated_at = :updated_at "
+            f"WHERE source_key = :source_key AND table_name = :table_name"
+        ), params)
+        if updated.rowcount == 0:
+            target_session.execute(text(
+                f"INSERT INTO {table} (source_key, table_name, last_pk, rows_copied, updated_at) "
+                f"VALUES (:source_key, :table_name, :last_pk, :rows_copied, :updated_at)"
+            ), params)
+
+    @staticmethod
+    def _clear_migration_checkpoint(target_session: Session, source_key: str, table_name: str):
+        """Forget the checkpoint of a table copy that completed"""
+        table = ImportExportService._MIGRATION_CHECKPOINT_TABLE
+        try:
+            target_session.execute(
+                text(f"DELETE FROM {table} "
+                     f"WHERE source_key = :source_key AND table_name = :table_name"),
+                {'source_key': source_key, 'table_name': table_name}
+            )
+            target_session.commit()
+        except SQLAlchemyError:
+            target_session.rollback()
+
     @staticmethod
     def _migrate_table(table_name: str, source_session_maker, target_session_maker,
-                      merge_strategy: str = 'skip') -> int:
+                      merge_strategy: str = 'skip', chunk_size: int = 1000,
+                      progress_callback=None, resume: bool = True) -> int:
         """
         Migrate data from one table to another with conflict resolution
 
+        The source is streamed in primary key order with a server-side
+        cursor, ``chunk_size`` rows at a time. Each chunk is coerced to the
+        target schema, checked for ID conflicts with a single lookup,
+        bulk-written and committed together with a checkpoint, so an
+        interrupted migration resumes after the last committed chunk.
+
         Args:
             table_name: Name of the table to migrate
             source_session_maker: Source database session maker
             target_session_maker: Target database session maker
             merge_strategy: How to handle ID conflicts: 'skip', 'overwrite', or 'renumber'
+            chunk_size: Number of rows read, written and committed at a time
+            progress_callback: Optional callable(table_name, rows_read, total_rows)
+                called after each chunk
+            resume: If True, continue from the checkpoint of an interrupted run
 
         Returns:
             Number of rows copied/updated
         """
+        import time
+
         source_session = source_session_maker()
         target_session = target_session_maker()
+        chunk_size = max(1, chunk_size)
 
         rows_processed = 0
         rows_skipped = 0
         rows_updated = 0
         rows_renumbered = 0
+        rows_failed = 0
 
         try:
             # Check if table exists in source
@@ -2712,10 +3109,10 @@ class ImportExportService:
                 return 0
 
             # Get primary key column for this table
-            from sqlalchemy import inspect
             source_engine = source_session.get_bind()
             inspector = inspect(source_engine)
             pk_columns = inspector.get_pk_constraint(table_name).get('constrained_columns', [])
+            source_columns = [c['name'] for c in inspector.get_columns(table_name)]
 
             if not pk_columns:
                 logger.warning(f"No primary key found for {table_name}, using simple INSERT strategy")
@@ -2724,16 +3121,6 @@ class ImportExportService:
                 pk_column = pk_columns[0]  # Use first PK column
                 logger.debug(f"Using primary key column '{pk_column}' for {table_name}")
 
-            # Get all rows from source table
-            result = source_session.execute(text(f"SELECT * FROM {table_name}"))
-            rows = result.fetchall()
-
-            if not rows:
-                return 0
-
-            # Get column names from source
-            source_columns = list(rows[0]._mapping.keys())
-
             # Get target engine for boolean conversion + schema introspection
             target_engine = target_session.get_bind()
 
@@ -2741,6 +3128,7 @@ class ImportExportService:
             # carry fields that don't exist in pyarchinit-mini (e.g.
             # site_table.toponimo, us_table.quantificazioni). Keep only
             # columns that exist on both sides.
+            target_inspector = None
             try:
                 target_inspector = inspect(target_engine)
                 target_columns = {c['name'] for c in target_inspector.get_columns(table_name)}
@@ -2755,226 +3143,187 @@ class ImportExportService:
                 logger.warning(f"{table_name}: could not introspect target columns ({e}); using source columns")
                 column_names = source_columns
 
-            # Get existing IDs in target (for conflict detection)
-            existing_ids = set()
-            if pk_column:
-                try:
-                    existing_result = target_session.execute(
-                        text(f"SELECT {pk_column} FROM {table_name}")
-                    )
-                    existing_ids = {row[0] for row in existing_result.fetchall()}
-                    logger.debug(f"Found {len(existing_ids)} existing records in target {table_name}")
-                except Exception:
-                    # Target table might be empty or not exist
-                    existing_ids = set()
+            profile = ImportExportService._target_column_profile(
+                target_inspector, table_name, pk_column, target_engine
+            ) if target_inspector is not None else {
+                'date_cols': set(), 'varchar_max': {}, 'non_text_cols': set(),
+                'bool_cols': set(), 'notnull_fillers': {},
+            }
 
-            # Find max ID in target (for renumber strategy)
+            total_rows = source_session.execute(
+                text(f"SELECT COUNT(*) FROM {table_name}")
+            ).scalar() or 0
+            if not total_rows:
+                return 0
+
+            # Resume after the last committed chunk of an interrupted run
+            source_key = ImportExportService._checkpoint_source_key(source_engine)
+            last_pk = None
+            rows_read = 0
+            if pk_column and resume:
+                checkpoint = ImportExportService._load_migration_checkpoint(
+                    target_session, source_key, table_name
+                )
+                if checkpoint is not None:
+                    last_pk = checkpoint['last_pk']
+                    rows_processed = checkpoint['rows_copied']
+                    rows_read = source_session.execute(
+                        text(f"SELECT COUNT(*) FROM {table_name} WHERE {pk_column} <= :last_pk"),
+                        {'last_pk': last_pk}
+                    ).scalar() or 0
+                    logger.info(f"{table_name}: resuming after {pk_column} = {last_pk} "
+                                f"({rows_processed} rows already copied)")
+
+            # New IDs for the renumber strategy start above both sides so
+            # they never collide with source rows not yet copied
             max_id = 0
             if pk_column and merge_strategy == 'renumber':
                 try:
-                    max_result = target_session.execute(
-                        text(f"SELECT MAX({pk_column}) FROM {table_name}")
+                    max_id = max(
+                        target_session.execute(text(f"SELECT MAX({pk_column}) FROM {table_name}")).scalar() or 0,
+                        source_session.execute(text(f"SELECT MAX({pk_column}) FROM {table_name}")).scalar() or 0,
                     )
-                    max_id = max_result.scalar() or 0
-                    logger.debug(f"Max ID in target {table_name}: {max_id}")
+                    logger.debug(f"Max ID for renumbering {table_name}: {max_id}")
                 except Exception:
                     max_id = 0
 
-            # Introspect target column metadata to handle:
-            #  - Date/DateTime: parse legacy "DD-MM-YYYY"
-            #  - String(n): truncate over-length values
-            #  - NOT NULL columns: fill missing values from the source
-            #    (legacy schemas don't carry created_at/updated_at/etc.)
-            date_cols = set()
-            varchar_max = {}
-            non_text_cols = set()  # numeric/date/bool — empty strings → None
-            bool_cols = set()      # target Boolean columns — coerce 0/1 → False/True
-            notnull_fillers = {}  # col -> callable producing a default value
-            try:
-                from datetime import datetime
-                import uuid as _uuid
-                for c in target_inspector.get_columns(table_name):
-                    type_name = str(c.get('type', '')).upper()
-                    is_datetime = 'DATETIME' in type_name or 'TIMESTAMP' in type_name
-                    is_date = (not is_datetime) and 'DATE' in type_name
-                    if is_datetime or is_date:
-                        date_cols.add(c['name'])
-                        non_text_cols.add(c['name'])
-                    if any(t in type_name for t in ('INT', 'NUMERIC', 'FLOAT', 'DOUBLE', 'BOOL', 'DECIMAL')):
-                        non_text_cols.add(c['name'])
-                    if 'BOOL' in type_name:
-                        bool_cols.add(c['name'])
-                    if c.get('type') is not None and getattr(c['type'], 'length', None):
-                        varchar_max[c['name']] = c['type'].length
-                    has_server_default = c.get('default') is not None or c.get('autoincrement') is True
-                    if not c.get('nullable', True) and c['name'] != pk_column and not has_server_default:
-                        if is_datetime:
-                            notnull_fillers[c['name']] = lambda: datetime.utcnow()
-                        elif is_date:
-                            notnull_fillers[c['name']] = lambda: datetime.utcnow().date()
-                        elif 'CHAR' in type_name or 'TEXT' in type_name:
-                            if c['name'] == 'entity_uuid':
-                                notnull_fillers[c['name']] = lambda: str(_uuid.uuid4())
-                            elif c['name'] == 'sync_status':
-                                notnull_fillers[c['name']] = lambda: 'new'
-                            else:
-                                notnull_fillers[c['name']] = lambda: ''
-                        elif 'INT' in type_name or 'NUMERIC' in type_name or 'FLOAT' in type_name:
-                            notnull_fillers[c['name']] = (
-                                lambda n=c['name']: 1 if n == 'version_number' else 0
-                            )
-                        elif 'BOOL' in type_name:
-                            notnull_fillers[c['name']] = lambda: False
-            except Exception:
-                pass
-
-            # Process each row
-            for row in rows:
-                row_data = dict(row._mapping)
+            select_sql = f"SELECT {', '.join(column_names)} FROM {table_name}"
+            params = {}
+            if pk_column:
+                if last_pk is not None:
+                    select_sql += f" WHERE {pk_column} > :last_pk"
+                    params['last_pk'] = last_pk
+                select_sql += f" ORDER BY {pk_column}"
 
-                # Drop source-only columns (kept aligned with column_names).
-                row_data = {k: v for k, v in row_data.items() if k in column_names}
+            existing_query = None
+            if pk_column:
+                existing_query = text(
+                    f"SELECT {pk_column} FROM {table_name} WHERE {pk_column} IN :ids"
+                ).bindparams(bindparam('ids', expanding=True))
 
-                # Convert boolean fields if needed (SQLite -> PostgreSQL)
-                row_data = ImportExportService._convert_boolean_fields(
-                    table_name, row_data, target_engine
-                )
+            start_time = time.time()
+            result = source_session.execute(
+                text(select_sql), params, execution_options={'stream_results': True}
+            )
 
-                # Normalise legacy Italian date strings (DD-MM-YYYY,
-                # DD/MM/YYYY) to ISO YYYY-MM-DD for Date/DateTime targets.
-                for col in date_cols:
-                    val = row_data.get(col)
-                    if isinstance(val, str) and val.strip():
-                        row_data[col] = ImportExportService._normalise_date(val.strip())
-
-                # Empty strings on numeric/date columns mean NULL on PG.
-                for col in non_text_cols:
-                    if row_data.get(col) == '' or (isinstance(row_data.get(col), str) and not row_data[col].strip()):
-                        row_data[col] = None
-
-                # Coerce 0/1 → False/True for any Boolean column on the target.
-                # Catches mismatches like Postgres `find_check BOOLEAN` vs source
-                # SQLite legacy storing 0/1 as Integer (the explicit
-                # _convert_boolean_fields hard-coded list misses tables/columns).
-                for col in bool_cols:
-                    if col not in row_data:
-                        continue
-                    val = row_data[col]
-                    if isinstance(val, bool) or val is None:
-                        continue
-                    try:
-                        if isinstance(val, (int, float)):
-                            row_data[col] = bool(int(val))
-                        elif isinstance(val, str):
-                            s = val.strip().lower()
-                            if s in ('1', 'true', 't', 'yes', 'y', 'si', 'sì'):
-                                row_data[col] = True
-                            elif s in ('0', 'false', 'f', 'no', 'n', ''):
-                                row_data[col] = False if s != '' else None
-                    except (ValueError, TypeError):
-                        pass
-
-                # Truncate over-long strings to fit varchar(N) targets.
-                for col, max_len in varchar_max.items():
-                    val = row_data.get(col)
-                    if isinstance(val, str) and len(val) > max_len:
-                        row_data[col] = val[:max_len]
-
-                # Fill NOT NULL columns when the source row is missing them
-                # or carries None (legacy schemas don't have created_at, etc.)
-                for col, filler in notnull_fillers.items():
-                    if row_data.get(col) is None:
-                        row_data[col] = filler()
-
-                # The set of columns to write may differ per row (some are
-                # dropped to let DB defaults fire). Recompute each iteration.
-                row_columns = list(row_data.keys())
-
-                # Check for conflict
-                record_id = row_data.get(pk_column) if pk_column else None
-                has_conflict = pk_column and record_id in existing_ids
+            for partition in result.partitions(chunk_size):
+                rows = [dict(row._mapping) for row in partition]
+                rows_read += len(rows)
+                ImportExportService._coerce_chunk(rows, profile)
+
+                # Columns filled by the NOT NULL fillers may be missing
+                # from some rows only; keep one column set per chunk.
+                all_columns = list(dict.fromkeys(col for row in rows for col in row))
+                for row in rows:
+                    for col in all_columns:
+                        row.setdefault(col, None)
+
+                # One lookup per chunk instead of loading every target ID
+                existing_ids = set()
+                if existing_query is not None:
+                    chunk_ids = [row[pk_column] for row in rows if row[pk_column] is not None]
+                    for i in range(0, len(chunk_ids), 500):
+                        existing_ids.update(
+                            r[0] for r in target_session.execute(
+                                existing_query, {'ids': chunk_ids[i:i + 500]}
+                            )
+                        )
 
-                try:
-                    if has_conflict:
+                inserts = []
+                updates = []
+                renumbered = []
+                for row in rows:
+                    record_id = row.get(pk_column) if pk_column else None
+                    if pk_column and record_id in existing_ids:
                         # Handle conflict based on strategy
                         if merge_strategy == 'skip':
-                            # Skip this record
                             rows_skipped += 1
                             logger.debug(f"Skipping {table_name} ID {record_id} (already exists)")
-                            continue
-
                         elif merge_strategy == 'overwrite':
-                            # Update existing record
-                            set_clause = ', '.join([f"{col} = :{col}" for col in row_columns if col != pk_column])
-                            update_query = text(f"""
-                                UPDATE {table_name}
-                                SET {set_clause}
-                                WHERE {pk_column} = :_pk_value
-                            """)
-
-                            # Add PK value for WHERE clause
-                            update_params = row_data.copy()
+                            update_params = dict(row)
                             update_params['_pk_value'] = record_id
-
-                            target_session.execute(update_query, update_params)
-                            rows_updated += 1
-                            rows_processed += 1
-                            logger.debug(f"Updated {table_name} ID {record_id}")
-
+                            updates.append(update_params)
                         elif merge_strategy == 'renumber':
-                            # Generate new ID and insert
                             max_id += 1
-                            row_data[pk_column] = max_id
-                            existing_ids.add(max_id)  # Track new ID
-                            if pk_column not in row_columns:
-                                row_columns.append(pk_column)
-
-                            # Build INSERT query
-                            columns = ', '.join(row_columns)
-                            placeholders = ', '.join([f':{col}' for col in row_columns])
-                            insert_query = text(f"""
-                                INSERT INTO {table_name} ({columns})
-                                VALUES ({placeholders})
-                            """)
-
-                            target_session.execute(insert_query, row_data)
-                            rows_renumbered += 1
-                            rows_processed += 1
                             logger.debug(f"Renumbered {table_name} ID {record_id} -> {max_id}")
-
+                            renumbered.append(dict(row, **{pk_column: max_id}))
                     else:
-                        # No conflict, insert normally
-                        columns = ', '.join(row_columns)
-                        placeholders = ', '.join([f':{col}' for col in row_columns])
-                        insert_query = text(f"""
-                            INSERT INTO {table_name} ({columns})
-                            VALUES ({placeholders})
-                        """)
+                        inserts.append(row)
 
-                        target_session.execute(insert_query, row_data)
-                        rows_processed += 1
+                update_query = None
+                if updates:
+                    set_clause = ', '.join(f"{col} = :{col}" for col in all_columns if col != pk_column)
+                    update_query = text(
+                        f"UPDATE {table_name} SET {set_clause} WHERE {pk_column} = :_pk_value"
+                    )
 
-                        # Track new ID if applicable
-                        if pk_column and record_id:
-                            existing_ids.add(record_id)
+                chunk_last_pk = rows[-1].get(pk_column) if pk_column else None
 
+                try:
+                    ImportExportService._bulk_insert(target_session, table_name, inserts + renumbered)
+                    if updates:
+                        target_session.execute(update_query, updates)
+                    written = len(inserts) + len(renumbered) + len(updates)
+                    if pk_column:
+                        ImportExportService._save_migration_checkpoint(
+                            target_session, source_key, table_name,
+                            chunk_last_pk, rows_processed + written
+                        )
+                    target_session.commit()
+                    rows_processed += written
+                    rows_updated += len(updates)
+                    rows_renumbered += len(renumbered)
                 except Exception as e:
-                    # Log error but continue with other rows
-                    logger.warning(f"Failed to process row in {table_name}: {str(e)}")
+                    # Replay the chunk row by row so one bad row does not
+                    # cost the rest of the chunk
                     target_session.rollback()
-                    continue
+                    logger.warning(f"Bulk write failed for a {table_name} chunk, retrying row by row: "
+                                   f"{str(e).splitlines()[0]}")
+                    for batch in (inserts, renumbered, updates):
+                        for row in batch:
+                            try:
+                                if batch is not updates:
+                                    ImportExportService._bulk_insert(target_session, table_name, [row])
+                                else:
+                                    target_session.execute(update_query, row)
+                                target_session.commit()
+                            except Exception as row_error:
+                                # Log error but continue with other rows
+                                target_session.rollback()
+                                rows_failed += 1
+                                logger.warning(f"Failed to process row in {table_name}: {str(row_error)}")
+                                continue
+                            rows_processed += 1
+                            if batch is updates:
+                                rows_updated += 1
+                            elif batch is renumbered:
+                                rows_renumbered += 1
+                    if pk_column:
+                        ImportExportService._save_migration_checkpoint(
+                            target_session, source_key, table_name, chunk_last_pk, rows_processed
+                        )
+                        target_session.commit()
 
-            # Commit all changes for this table
-            target_session.commit()
+                elapsed = time.time() - start_time
+                logger.info(
+                    f"{table_name}: {rows_read}/{total_rows} rows read, "
+                    f"{rows_processed} written ({rows_read / elapsed if elapsed > 0 else 0:.0f} rows/s)"
+                )
+                if progress_callback is not None:
+                    progress_callback(table_name, rows_read, total_rows)
+
+            if pk_column:
+                ImportExportService._clear_migration_checkpoint(target_session, source_key, table_name)
 
             # Log summary
-            if rows_skipped > 0 or rows_updated > 0 or rows_renumbered > 0:
+            if rows_skipped > 0 or rows_updated > 0 or rows_renumbered > 0 or rows_failed > 0:
                 logger.info(
                     f"{table_name} merge summary: "
                     f"{rows_processed} processed, "
                     f"{rows_skipped} skipped, "
                     f"{rows_updated} updated, "
-                    f"{rows_renumbered} renumbered"
+                    f"{rows_renumbered} renumbered, "
+                    f"{rows_failed} failed"
                 )
 
             return rows_processed
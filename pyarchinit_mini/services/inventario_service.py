@@ -5,6 +5,7 @@ Inventario Materiali service - Business logic for inventory management
 from typing import List, Dict, Any, Optional
 from sqlalchemy import text
 from ..database.manager import DatabaseManager
+from ..database.pagination import Page
 from ..models.inventario_materiali import InventarioMateriali
 from ..models.site import Site
 from ..models.us import US
@@ -151,6 +152,19 @@ class InventarioService:
             from ..utils.exceptions import DatabaseError
             raise DatabaseError(f"Failed to get InventarioMateriali records: {e}")
     
+    def get_inventario_page(self, cursor: Optional[str] = None, size: int = 10,
+                            filters: Optional[Dict[str, Any]] = None) -> Page:
+        """
+        Get one page of inventory items ordered by inventory number, with
+        keyset pagination
+
+        Returns:
+            Page of InventarioDTO with next_cursor and a cached total
+        """
+        return self.db_manager.get_page(InventarioMateriali, cursor=cursor, limit=size,
+                                        order_by='numero_inventario', filters=filters,
+                                        convert=InventarioDTO.from_model)
+
     def update_inventario(self, inv_id: int, update_data: Dict[str, Any]) -> InventarioMateriali:
         """Update existing inventory item"""
         # For updates, we don't need full validation (only check specific business rules)
@@ -191,9 +205,10 @@ class InventarioService:
         """Delete inventory item"""
         return self.db_manager.delete(InventarioMateriali, inv_id)
     
-    def count_inventario(self, filters: Optional[Dict[str, Any]] = None) -> int:
-        """Count inventory items with optional filters"""
-        return self.db_manager.count(InventarioMateriali, filters)
+    def count_inventario(self, filters: Optional[Dict[str, Any]] = None,
+                         max_age: Optional[float] = None) -> int:
+        """Count inventory items with optional filters (cached for ``max_age`` seconds if given)"""
+        return self.db_manager.count(InventarioMateriali, filters, max_age=max_age)
     
     def search_inventario(self, search_term: str, page: int = 1, size: int = 10) -> List[InventarioDTO]:
         """Search inventory items by term - returns DTOs"""
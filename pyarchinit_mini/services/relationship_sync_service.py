@@ -12,7 +12,7 @@ This ensures consistency across all interfaces (Web UI, Desktop GUI, Harris Matr
 
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.orm import Session
 
 from ..database.manager import DatabaseManager
@@ -60,6 +60,24 @@ class RelationshipSyncService:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
 
+    def _invalidate_matrix_cache(self, session: Session, sito: str):
+        """
+        Drop the cached Harris matrices of a site once `session` commits
+
+        Invalidating earlier would let a matrix rebuilt before the commit
+        cache the old relationships again; a rolled-back write needs no
+        invalidation.
+        """
+        pending = session.info.setdefault('matrix_cache_sites', set())
+        if not pending:
+            event.listen(session, 'after_commit', self._on_commit, once=True)
+        pending.add(sito)
+
+    def _on_commit(self, session: Session):
+        from ..harris_matrix.matrix_cache import invalidate_matrix_cache
+        for sito in session.info.pop('matrix_cache_sites', ()):
+            invalidate_matrix_cache(self.db_manager, sito)
+
     def parse_rapporti_field(self, rapporti_text: str) -> List[Tuple[str, int]]:
         """
         Parse rapporti field into list of (relationship_type, target_us) tuples.
@@ -186,6 +204,7 @@ class RelationshipSyncService:
                 created += 1
 
             session.flush()
+            self._invalidate_matrix_cache(session, sito)
 
             return {
                 'deleted': deleted,
@@ -329,6 +348,7 @@ class RelationshipSyncService:
                 us_processed += 1
 
             session.flush()
+            self._invalidate_matrix_cache(session, sito)
 
             return {
                 'sito': sito,
@@ -393,6 +413,7 @@ class RelationshipSyncService:
                 session.add(reciprocal_rel)
 
             session.flush()
+            self._invalidate_matrix_cache(session, sito)
             return True
 
         finally:
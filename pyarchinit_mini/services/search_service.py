@@ -1,13 +1,22 @@
 """
 Universal search service for cross-table full-text search
+
+Sites, US and materials are searched through the full-text index of
+``pyarchinit_mini.database.search_index`` (FTS5 on SQLite, tsvector on
+PostgreSQL) when it exists: every query token is matched as a prefix and
+results are ranked by relevance. Without the index, and for users, the
+service falls back to case-insensitive substring (ILIKE) scans.
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
-from sqlalchemy import or_, func, cast, String
+from sqlalchemy import or_, func, cast, String, text
 from sqlalchemy.exc import SQLAlchemyError
 
+from pyarchinit_mini.database.search_index import (
+    SEARCH_TABLES, cached_search_index_status, fts5_match_expression, tsquery_expression
+)
 from pyarchinit_mini.models.site import Site
 from pyarchinit_mini.models.us import US
 from pyarchinit_mini.models.inventario_materiali import InventarioMateriali
@@ -22,6 +31,10 @@ class UniversalSearchService:
     materials inventory, and users using a single database session.
     """
 
+    # Above this many matches results are returned unranked: scoring every
+    # match of a very broad prefix costs far more than it tells apart
+    RANKED_MATCH_LIMIT = 10000
+
     def __init__(self, db_manager):
         """
         Args:
@@ -38,7 +51,9 @@ class UniversalSearchService:
         Search all major tables for *query* and return consolidated results.
 
         Args:
-            query: Free-text search string (case-insensitive substring match).
+            query: Free-text search string. With the full-text index every
+                word is matched as a prefix and results are ranked; without
+                it, a case-insensitive substring match is used.
             limit_per_table: Maximum number of rows returned per table.
 
         Returns:
@@ -48,16 +63,17 @@ class UniversalSearchService:
 
         try:
             with self.db_manager.connection.get_session() as session:
-                # --- counts ------------------------------------------------
-                site_count = self._count(session, Site, self._site_filters(pattern))
-                us_count = self._count(session, US, self._us_filters(pattern))
-                mat_count = self._count(session, InventarioMateriali, self._material_filters(pattern))
-                user_count = self._count(session, User, self._user_filters(pattern))
+                status = self._search_index_status()
 
-                # --- limited result sets -----------------------------------
-                sites = self._search_table(session, Site, self._site_filters(pattern), limit_per_table)
-                us_list = self._search_table(session, US, self._us_filters(pattern), limit_per_table)
-                materials = self._search_table(session, InventarioMateriali, self._material_filters(pattern), limit_per_table)
+                # --- counts and limited result sets ------------------------
+                site_count, sites = self._search(
+                    session, 'sites', Site, query, self._site_filters(pattern), limit_per_table, status)
+                us_count, us_list = self._search(
+                    session, 'us', US, query, self._us_filters(pattern), limit_per_table, status)
+                mat_count, materials = self._search(
+                    session, 'materials', InventarioMateriali, query,
+                    self._material_filters(pattern), limit_per_table, status)
+                user_count = self._count(session, User, self._user_filters(pattern))
                 users = self._search_table(session, User, self._user_filters(pattern), limit_per_table)
 
                 total = site_count + us_count + mat_count + user_count
@@ -151,6 +167,78 @@ class UniversalSearchService:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _search_index_status(self) -> Dict[str, Dict[str, bool]]:
+        """Index status of the active database (checked once per database)"""
+        try:
+            return cached_search_index_status(self.db_manager.connection.engine)
+        except SQLAlchemyError as exc:
+            logger.warning("Could not inspect the search index: %s", exc)
+            return {}
+
+    def _search(self, session, key: str, model, query: str, filters, limit: int,
+                status: Dict[str, Dict[str, bool]]) -> Tuple[int, List[Dict[str, Any]]]:
+        """Count and fetch matches of one table, through the index when possible"""
+        if status.get(key, {}).get('fulltext'):
+            try:
+                indexed = self._indexed_search(session, key, model, query, limit, status[key])
+                if indexed is not None:
+                    return indexed
+            except SQLAlchemyError as exc:
+                # Read-only session: rolling back only clears the failed statement
+                session.rollback()
+                logger.warning("Indexed search on %s failed, using ILIKE: %s", key, exc)
+        return (self._count(session, model, filters),
+                self._search_table(session, model, filters, limit))
+
+    def _indexed_search(self, session, key: str, model, query: str, limit: int,
+                        status: Dict[str, bool]) -> Optional[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Ranked prefix search through the full-text index
+
+        Returns:
+            (count, rows), or None if the query has no indexable token
+        """
+        spec = SEARCH_TABLES[key]
+        dialect = session.get_bind().dialect.name
+
+        if dialect == 'sqlite':
+            match = fts5_match_expression(query)
+            if match is None:
+                return None
+            params = {'match': match, 'limit': limit}
+            count = session.execute(text(
+                f"SELECT count(*) FROM {spec.fts_table} WHERE {spec.fts_table} MATCH :match"
+            ), params).scalar() or 0
+            order = "ORDER BY rank " if count <= self.RANKED_MATCH_LIMIT else ""
+            ids = [row[0] for row in session.execute(text(
+                f"SELECT rowid FROM {spec.fts_table} WHERE {spec.fts_table} MATCH :match "
+                f"{order}LIMIT :limit"
+            ), params)]
+        else:
+            tsquery = tsquery_expression(query)
+            if tsquery is None:
+                return None
+            params = {'tsquery': tsquery, 'pattern': f"%{query}%", 'limit': limit}
+            condition = f"{spec.tsvector_sql()} @@ to_tsquery('simple'::regconfig, :tsquery)"
+            if status.get('trigram'):
+                # Substring matches inside words, served by the trigram index
+                condition = f"({condition} OR ({spec.document_sql()}) ILIKE :pattern)"
+            count = session.execute(text(
+                f"SELECT count(*) FROM {spec.table} WHERE {condition}"
+            ), params).scalar() or 0
+            order = ""
+            if count <= self.RANKED_MATCH_LIMIT:
+                order = (f"ORDER BY ts_rank({spec.tsvector_sql()}, "
+                         f"to_tsquery('simple'::regconfig, :tsquery)) DESC ")
+            ids = [row[0] for row in session.execute(text(
+                f"SELECT {spec.pk} FROM {spec.table} WHERE {condition} {order}LIMIT :limit"
+            ), params)]
+
+        pk = getattr(model, spec.pk)
+        by_id = {getattr(row, spec.pk): row for row in session.query(model).filter(pk.in_(ids)).all()} if ids else {}
+        rows = [by_id[i].to_dict() for i in ids if i in by_id]
+        return count, rows
+
     @staticmethod
     def _count(session, model, filters) -> int:
         """Return the number of rows matching *filters* using func.count()."""
@@ -4,6 +4,7 @@ Site service - Business logic for site management
 
 from typing import List, Dict, Any, Optional
 from ..database.manager import DatabaseManager
+from ..database.pagination import Page
 from ..models.site import Site
 from ..dto.site_dto import SiteDTO
 from ..utils.validators import validate_data
@@ -101,6 +102,17 @@ class SiteService:
             from ..utils.exceptions import DatabaseError
             raise DatabaseError(f"Failed to get Site records: {e}")
     
+    def get_sites_page(self, cursor: Optional[str] = None, size: int = 10,
+                       filters: Optional[Dict[str, Any]] = None) -> Page:
+        """
+        Get one page of sites ordered by name, with keyset pagination
+
+        Returns:
+            Page of SiteDTO with next_cursor and a cached total
+        """
+        return self.db_manager.get_page(Site, cursor=cursor, limit=size, order_by='sito',
+                                        filters=filters, convert=SiteDTO.from_model)
+
     def update_site(self, site_id: int, update_data: Dict[str, Any]) -> Site:
         """Update existing site"""
         # For updates, we don't need full validation (only check specific business rules)
@@ -319,10 +331,11 @@ class SiteService:
             from ..exceptions import DatabaseError
             raise DatabaseError(f"Failed to get sites as DTOs: {e}")
     
-    def count_sites(self) -> int:
-        """Count total number of sites"""
+    def count_sites(self, filters: Optional[Dict[str, Any]] = None,
+                    max_age: Optional[float] = None) -> int:
+        """Count sites (cached for ``max_age`` seconds if given)"""
         try:
-            return self.db_manager.count(Site)
+            return self.db_manager.count(Site, filters, max_age=max_age)
         except Exception as e:
             from ..exceptions import DatabaseError
             raise DatabaseError(f"Failed to count sites: {e}")
\ No newline at end of file
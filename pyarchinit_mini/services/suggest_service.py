@@ -0,0 +1,444 @@
+"""
+Typeahead suggestions served from an in-memory prefix index
+
+Site names, US identifiers, inventory numbers and users are kept in
+sorted arrays of (normalised key, id) pairs, so a suggestion is a bisect
+plus a short scan and never touches the database.
+
+The index is built on first use. ORM writes committed in this process
+update it incrementally through SQLAlchemy session events. Bulk imports
+call ``invalidate_suggestions``, and the index is rebuilt in the
+background once it is older than ``max_age`` seconds, which also picks
+up raw SQL writes and writes from other processes. When the index
+would exceed its memory ceiling it is marked incomplete and callers fall
+back to the database search.
+"""
+
+import bisect
+import logging
+import os
+import sys
+import time
+import unicodedata
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..database.per_database import BackgroundRefresh, PerDatabase
+from ..models.inventario_materiali import InventarioMateriali
+from ..models.site import Site
+from ..models.us import US
+from ..models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Default memory ceiling of one database's index (bytes, estimated);
+# about 100 MB holds 300k US and inventory records
+DEFAULT_MAX_BYTES = int(os.getenv('PYARCHINIT_SUGGEST_MAX_MB', '128')) * 1024 * 1024
+
+
+def normalize(value: Any) -> str:
+    """Lowercase, strip accents and collapse whitespace"""
+    if value is None:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', str(value))
+    folded = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return ' '.join(folded.lower().split())
+
+
+def _words(value: Any) -> List[str]:
+    """The value and each of its later words, so inner words also match"""
+    text = normalize(value)
+    if not text:
+        return []
+    words = text.split(' ')
+    return [text] + [' '.join(words[i:]) for i in range(1, len(words))]
+
+
+@dataclass(frozen=True)
+class SuggestionType:
+    """How one model is loaded, keyed and presented"""
+    model: Any
+    pk: str
+    columns: Tuple[str, ...]
+    # column values -> normalised index keys / suggestion fields
+    keys: Callable[[Dict[str, Any]], List[str]]
+    entry: Callable[[Dict[str, Any]], Dict[str, Any]]
+    # Words typed before an identifier ("us 12", "inv. 40") that are not
+    # part of the indexed key
+    query_prefixes: Tuple[str, ...] = ()
+
+    def fields(self, values: Tuple) -> Dict[str, Any]:
+        return dict(zip(self.columns, values))
+
+
+def _role(value) -> str:
+    return getattr(value, 'value', value) or ''
+
+
+SUGGESTION_TYPES: Dict[str, SuggestionType] = {
+    'site': SuggestionType(
+        Site, 'id_sito', ('sito', 'comune'),
+        keys=lambda f: _words(f['sito']) + _words(f['comune']),
+        entry=lambda f: {'label': f['sito'] or '', 'sub': f['comune'] or '', 'sito': f['sito'] or ''},
+    ),
+    'us': SuggestionType(
+        US, 'id_us', ('sito', 'us', 'd_stratigrafica'),
+        keys=lambda f: [normalize(f['us'])],
+        entry=lambda f: {'label': f"US {f['us']} - {f['sito']}", 'sub': f['d_stratigrafica'] or '',
+                         'sito': f['sito'] or '', 'us': str(f['us'])},
+        query_prefixes=('us ',),
+    ),
+    'material': SuggestionType(
+        InventarioMateriali, 'id_invmat', ('sito', 'numero_inventario', 'tipo_reperto'),
+        keys=lambda f: [normalize(f['numero_inventario'])],
+        entry=lambda f: {'label': f"Inv. {f['numero_inventario']} - {f['sito']}",
+                         'sub': f['tipo_reperto'] or ''},
+        query_prefixes=('inv. ', 'inv '),
+    ),
+    'user': SuggestionType(
+        User, 'id', ('username', 'full_name', 'email', 'role'),
+        keys=lambda f: [normalize(f['username']), normalize(f['email'])] + _words(f['full_name']),
+        entry=lambda f: {'label': f['full_name'] or f['username'] or '', 'sub': _role(f['role'])},
+    ),
+}
+
+_MODEL_TYPES = {spec.model: name for name, spec in SUGGESTION_TYPES.items()}
+
+# Rough CPython sizes used for the memory ceiling
+_PAIR_OVERHEAD = 56 + 8          # 2-tuple + list slot
+_ENTITY_OVERHEAD = 100 + 28      # dict slot + integer id
+
+
+class PrefixIndex:
+    """
+    Sorted array of (key, id) pairs answering prefix lookups with bisect
+
+    Only the column values of each entity are stored; keys are recomputed
+    from them when an entity is replaced or removed.
+    """
+
+    def __init__(self, spec: SuggestionType):
+        self.spec = spec
+        self._pairs: List[Tuple[str, Any]] = []
+        self._values: Dict[Any, Tuple] = {}
+        self.bytes = 0
+
+    def __len__(self):
+        return len(self._values)
+
+    def _keys(self, values: Tuple) -> List[str]:
+        return [k for k in dict.fromkeys(self.spec.keys(self.spec.fields(values))) if k]
+
+    @staticmethod
+    def _size(keys: List[str], values: Tuple) -> int:
+        # Value strings are shared (interned) and accounted by SuggestionIndex
+        return (_ENTITY_OVERHEAD + sys.getsizeof(values)
+                + sum(sys.getsizeof(k) + _PAIR_OVERHEAD for k in keys))
+
+    def load(self, items: List[Tuple[Any, Tuple]]):
+        """Replace the content with (id, values) items, sorting once"""
+        pairs = []
+        self._values = {}
+        self.bytes = 0
+        for entity_id, values in items:
+            keys = self._keys(values)
+            self._values[entity_id] = values
+            pairs.extend((k, entity_id) for k in keys)
+            self.bytes += self._size(keys, values)
+        pairs.sort()
+        self._pairs = pairs
+
+    def upsert(self, entity_id, values: Tuple):
+        """Add or replace one entity"""
+        self.remove(entity_id)
+        keys = self._keys(values)
+        for key in keys:
+            bisect.insort(self._pairs, (key, entity_id))
+        self._values[entity_id] = values
+        self.bytes += self._size(keys, values)
+
+    def remove(self, entity_id):
+        """Drop one entity (no-op if absent)"""
+        values = self._values.pop(entity_id, None)
+        if values is None:
+            return
+        keys = self._keys(values)
+        for key in keys:
+            i = bisect.bisect_left(self._pairs, (key, entity_id))
+            if i < len(self._pairs) and self._pairs[i] == (key, entity_id):
+                del self._pairs[i]
+        self.bytes -= self._size(keys, values)
+
+    def search(self, prefix: str, limit: int) -> List[Tuple]:
+        """Values of entities with a key starting with ``prefix``, in key order"""
+        results = []
+        seen = set()
+        pairs = self._pairs
+        i = bisect.bisect_left(pairs, (prefix,))
+        while i < len(pairs) and len(results) < limit:
+            key, entity_id = pairs[i]
+            if not key.startswith(prefix):
+                break
+            if entity_id not in seen:
+                seen.add(entity_id)
+                results.append(self._values[entity_id])
+            i += 1
+        return results
+
+
+class SuggestionIndex(BackgroundRefresh):
+    """
+    Prefix indexes of one database, one per suggestion type
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.indexes = self._empty()
+        self.complete = False
+        self.built_at = 0.0
+        self.stale = True
+        # Repeated values (site names, descriptions) are stored once
+        self._strings: Dict[str, str] = {}
+        self._string_bytes = 0
+        # Changes committed while a rebuild reads the database
+        self._replay: Optional[List[Tuple[str, str, Any, Optional[Tuple]]]] = None
+
+    @staticmethod
+    def _empty() -> Dict[str, PrefixIndex]:
+        return {name: PrefixIndex(spec) for name, spec in SUGGESTION_TYPES.items()}
+
+    @property
+    def bytes(self) -> int:
+        return sum(index.bytes for index in self.indexes.values()) + self._string_bytes
+
+    @staticmethod
+    def _intern(values, strings: Dict[str, str]) -> Tuple[Tuple, int]:
+        """Share equal strings; returns (values, bytes of newly seen strings)"""
+        added = 0
+        shared = []
+        for value in values:
+            if isinstance(value, str):
+                existing = strings.get(value)
+                if existing is None:
+                    strings[value] = existing = value
+                    added += sys.getsizeof(value) + 100
+                value = existing
+            shared.append(value)
+        return tuple(shared), added
+
+    def build(self, session: Session):
+        """Load every suggestion type from the database"""
+        with self._lock:
+            self._replay = []
+        fresh = self._empty()
+        strings: Dict[str, str] = {}
+        string_bytes = 0
+        total = 0
+        complete = True
+        try:
+            for name, spec in SUGGESTION_TYPES.items():
+                columns = [getattr(spec.model, spec.pk)] + [getattr(spec.model, c) for c in spec.columns]
+                index = fresh[name]
+                items = []
+                for row in session.query(*columns).yield_per(5000):
+                    values, added = self._intern(row[1:], strings)
+                    string_bytes += added
+                    total += added + index._size(index._keys(values), values)
+                    if total > self.max_bytes:
+                        complete = False
+                        break
+                    items.append((row[0], values))
+                if not complete:
+                    logger.warning(f"Suggestion index exceeds {self.max_bytes} bytes; "
+                                   f"suggestions will use the database")
+                    break
+                index.load(items)
+        finally:
+            with self._lock:
+                replay, self._replay = self._replay, None
+                if complete:
+                    self.indexes = fresh
+                    self._strings = strings
+                    self._string_bytes = string_bytes
+                    for change in replay:
+                        self._apply(*change)
+                else:
+                    self.indexes = self._empty()
+                    self._strings = {}
+                    self._string_bytes = 0
+                self.complete = complete
+                self.built_at = time.time()
+                self.stale = False
+
+    def _apply(self, op: str, name: str, entity_id, values: Optional[Tuple]):
+        index = self.indexes[name]
+        if op == 'delete':
+            index.remove(entity_id)
+            return
+        values, added = self._intern(values, self._strings)
+        self._string_bytes += added
+        index.upsert(entity_id, values)
+        if self.bytes > self.max_bytes:
+            logger.warning("Suggestion index exceeded its memory ceiling; falling back to the database")
+            self.complete = False
+            self.indexes = self._empty()
+            self._strings = {}
+            self._string_bytes = 0
+
+    def apply_changes(self, changes):
+        """Apply committed (op, type, id, values) changes"""
+        with self._lock:
+            if not self.complete and self._replay is None:
+                return
+            for change in changes:
+                if self._replay is not None:
+                    self._replay.append(change)
+                if self.complete:
+                    self._apply(*change)
+
+    def search(self, name: str, prefix: str, limit: int) -> List[Dict[str, Any]]:
+        spec = SUGGESTION_TYPES[name]
+        for query_prefix in spec.query_prefixes:
+            if prefix.startswith(query_prefix) and len(prefix) > len(query_prefix):
+                prefix = prefix[len(query_prefix):]
+                break
+        with self._lock:
+            matches = self.indexes[name].search(prefix, limit)
+        return [dict(spec.entry(spec.fields(values)), type=name) for values in matches]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'complete': self.complete,
+                'stale': self.stale,
+                'age_seconds': round(time.time() - self.built_at, 1) if self.built_at else None,
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+                'entries': {name: len(index) for name, index in self.indexes.items()},
+            }
+
+
+# One index per database URL (the web app can switch the active database,
+# and import services reach the same database through their own engines)
+_indexes: PerDatabase[SuggestionIndex] = PerDatabase()
+
+
+def _index_for(database, max_bytes: int = DEFAULT_MAX_BYTES, create: bool = True) -> Optional[SuggestionIndex]:
+    return _indexes.get(database, (lambda: SuggestionIndex(max_bytes)) if create else None)
+
+
+def invalidate_suggestions(database) -> None:
+    """
+    Mark a database's index stale after bulk or raw SQL writes; it is
+    rebuilt in the background on next use
+
+    Args:
+        database: Engine or connection URL
+    """
+    index = _index_for(database, create=False)
+    if index is not None:
+        index.stale = True
+
+
+def _values(instance, spec: SuggestionType) -> Tuple:
+    return tuple(getattr(instance, name, None) for name in spec.columns)
+
+
+@event.listens_for(Session, 'after_flush')
+def _collect_changes(session, flush_context):
+    """Record suggestion changes of this flush until the transaction commits"""
+    changes = []
+    for op, instances in (('upsert', session.new), ('upsert', session.dirty), ('delete', session.deleted)):
+        for instance in instances:
+            name = _MODEL_TYPES.get(type(instance))
+            if name is None:
+                continue
+            spec = SUGGESTION_TYPES[name]
+            values = _values(instance, spec) if op == 'upsert' else None
+            changes.append((op, name, getattr(instance, spec.pk), values))
+    if changes:
+        session.info.setdefault('suggestion_changes', []).extend(changes)
+
+
+@event.listens_for(Session, 'after_commit')
+def _apply_changes(session):
+    changes = session.info.pop('suggestion_changes', None)
+    if not changes:
+        return
+    try:
+        index = _index_for(session.get_bind(), create=False)
+    except Exception:
+        return
+    if index is not None:
+        index.apply_changes(changes)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_changes(session):
+    session.info.pop('suggestion_changes', None)
+
+
+class SuggestionService:
+    """
+    Answers /api/search/suggest from the in-memory prefix index
+    """
+
+    def __init__(self, db_manager, max_bytes: int = DEFAULT_MAX_BYTES, max_age: float = 300.0):
+        """
+        Args:
+            db_manager: DatabaseManager of the active database
+            max_bytes: Memory ceiling of the index (estimated)
+            max_age: Seconds after which the index is rebuilt in the background
+        """
+        self.db_manager = db_manager
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+    def _index(self) -> SuggestionIndex:
+        connection = self.db_manager.connection
+        index = _index_for(connection.engine, self.max_bytes)
+        if not index.built_at:
+            # First use: build synchronously
+            self.refresh(index)
+        elif index.stale or time.time() - index.built_at > self.max_age:
+            self._refresh_in_background(index)
+        return index
+
+    def refresh(self, index: Optional[SuggestionIndex] = None):
+        """Rebuild the index of the active database from the database"""
+        if index is None:
+            index = _index_for(self.db_manager.connection.engine, self.max_bytes)
+        with self.db_manager.connection.get_session() as session:
+            index.build(session)
+
+    def _refresh_in_background(self, index: SuggestionIndex):
+        index.refresh_in_background(lambda: self.refresh(index), 'suggestion-index-refresh')
+
+    def suggest(self, query: str, limit_per_type: int = 5, limit: int = 15) -> Optional[List[Dict[str, Any]]]:
+        """
+        Suggestions for a typeahead query, grouped by type
+
+        Returns:
+            List of dicts with 'type', 'label', 'sub' (and 'sito'/'us' for
+            sites and US), or None when the index cannot answer (over its
+            memory ceiling) and the caller should query the database
+        """
+        prefix = normalize(query)
+        if not prefix:
+            return []
+        index = self._index()
+        if not index.complete:
+            return None
+        results = []
+        for name in SUGGESTION_TYPES:
+            results.extend(index.search(name, prefix, limit_per_type))
+        return results[:limit]
+
+    def stats(self) -> Dict[str, Any]:
+        """Index occupancy, for monitoring"""
+        index = _index_for(self.db_manager.connection.engine, self.max_bytes, create=False)
+        return index.stats() if index is not None else {'complete': False, 'built': False}
@@ -2,9 +2,10 @@
 US (Stratigraphic Unit) service - Business logic for US management
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from sqlalchemy import text
 from ..database.manager import DatabaseManager
+from ..database.pagination import Page
 from ..models.us import US
 from ..models.site import Site
 from ..dto.us_dto import USDTO
@@ -42,7 +43,9 @@ class USService:
             )
         
         # Create US
-        return self.db_manager.create(US, us_data)
+        us = self.db_manager.create(US, us_data)
+        self._invalidate_matrix_cache(us_data['sito'])
+        return us
     
     def create_us_dto(self, us_data: Dict[str, Any]) -> USDTO:
         """Create a new US and return as DTO"""
@@ -77,8 +80,11 @@ class USService:
                 session.refresh(us)  # Refresh to get all data
                 
                 # Convert to DTO while still in session
-                return USDTO.from_model(us)
-                
+                dto = USDTO.from_model(us)
+
+            self._invalidate_matrix_cache(dto.sito)
+            return dto
+
         except Exception as e:
             from ..utils.exceptions import DatabaseError
             raise DatabaseError(f"Failed to create US: {e}")
@@ -127,6 +133,51 @@ class USService:
             from ..utils.exceptions import DatabaseError
             raise DatabaseError(f"Failed to get US records: {e}")
     
+    def get_us_page(self, cursor: Optional[str] = None, size: int = 10,
+                    filters: Optional[Dict[str, Any]] = None) -> Page:
+        """
+        Get one page of US ordered by US number, with keyset pagination
+
+        Args:
+            cursor: ``next_cursor`` of the previous page, None for the first page
+            size: Page size
+            filters: Equality filters, as in ``get_all_us``
+
+        Returns:
+            Page of USDTO with next_cursor and a cached total
+        """
+        return self.db_manager.get_page(US, cursor=cursor, limit=size, order_by='us',
+                                        filters=filters, convert=USDTO.from_model)
+
+    def iter_us(self, filters: Optional[Dict[str, Any]] = None,
+                batch_size: int = 500) -> Iterator[USDTO]:
+        """
+        Stream all US matching filters as DTOs, without any row cap
+
+        Rows are fetched in batches of ``batch_size`` (``yield_per``), which
+        uses a server-side cursor on PostgreSQL, so memory stays bounded
+        regardless of how many US the site has. The session is held open
+        until the iterator is exhausted or closed.
+        """
+        try:
+            from sqlalchemy import asc
+            with self.db_manager.connection.get_session() as session:
+                query = session.query(US)
+
+                if filters:
+                    for key, value in filters.items():
+                        if hasattr(US, key):
+                            query = query.filter(getattr(US, key) == value)
+
+                query = query.order_by(asc(US.us)).yield_per(batch_size)
+
+                for us in query:
+                    yield USDTO.from_model(us)
+
+        except Exception as e:
+            from ..utils.exceptions import DatabaseError
+            raise DatabaseError(f"Failed to stream US records: {e}")
+
     def update_us(self, us_id: int, update_data: Dict[str, Any]) -> US:
         """Update existing US"""
         # For updates, we don't need full validation (only check specific business rules)
@@ -139,6 +190,7 @@ class USService:
                 raise ValidationError(f"Site '{update_data['sito']}' does not exist")
         
         # If US number, site, or area is being changed, check for duplicates
+        current_us = None
         if any(field in update_data for field in ['us', 'sito', 'area']):
             current_us = self.get_us_by_id(us_id)
             if not current_us:
@@ -155,7 +207,11 @@ class USService:
                 )
         
         # Update US
-        return self.db_manager.update(US, us_id, update_data)
+        us = self.db_manager.update(US, us_id, update_data)
+        self._invalidate_matrix_cache(us.sito)
+        if current_us and current_us.sito != us.sito:
+            self._invalidate_matrix_cache(current_us.sito)
+        return us
     
     def update_us_dto(self, us_id: int, update_data: Dict[str, Any]) -> Optional[USDTO]:
         """Update existing US and return DTO"""
@@ -166,6 +222,7 @@ class USService:
                 if not us_record:
                     from ..utils.exceptions import RecordNotFoundError
                     raise RecordNotFoundError(f"US with ID {us_id} not found")
+                old_sito = us_record.sito
 
                 # Update fields
                 for key, value in update_data.items():
@@ -179,6 +236,10 @@ class USService:
                 # Convert to DTO while still in session
                 dto = USDTO.from_model(us_record)
 
+            self._invalidate_matrix_cache(old_sito)
+            if dto.sito != old_sito:
+                self._invalidate_matrix_cache(dto.sito)
+
             # Return DTO (session is now closed, but DTO is safe)
             return dto
 
@@ -189,11 +250,23 @@ class USService:
     def delete_us(self, us_id: int) -> bool:
         """Delete US"""
         # TODO: Check for related records (Inventario) before deletion
-        return self.db_manager.delete(US, us_id)
+        us = self.get_us_by_id(us_id)
+        deleted = self.db_manager.delete(US, us_id)
+        if deleted and us:
+            self._invalidate_matrix_cache(us.sito)
+        return deleted
+
+    def _invalidate_matrix_cache(self, sito: Optional[str]):
+        """Drop the cached Harris matrices of a site after a US write"""
+        if not sito:
+            return
+        from ..harris_matrix.matrix_cache import invalidate_matrix_cache
+        invalidate_matrix_cache(self.db_manager, sito)
     
-    def count_us(self, filters: Optional[Dict[str, Any]] = None) -> int:
-        """Count US with optional filters"""
-        return self.db_manager.count(US, filters)
+    def count_us(self, filters: Optional[Dict[str, Any]] = None,
+                 max_age: Optional[float] = None) -> int:
+        """Count US with optional filters (cached for ``max_age`` seconds if given)"""
+        return self.db_manager.count(US, filters, max_age=max_age)
     
     def search_us(self, search_term: str, page: int = 1, size: int = 10) -> List[USDTO]:
         """Search US by term - returns DTOs"""
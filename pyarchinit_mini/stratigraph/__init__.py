@@ -5,6 +5,7 @@ StratiGraph integration module for PyArchInit-Mini.
 # Phase 1 — UUID & bundle
 from .uuid_manager import generate_uuid, validate_uuid, ensure_uuid, build_uri
 from .bundle_creator import BundleCreator
+from .chunk_store import ChunkStore
 from .bundle_validator import BundleValidator, validate_bundle
 
 # Phase 2 — Offline-first sync
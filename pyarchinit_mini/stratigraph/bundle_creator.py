@@ -9,17 +9,29 @@ Creates standardized StratiGraph bundle ZIP files containing:
 - Integrity hashes for all included files
 
 A bundle is a self-contained, validated package ready for
-synchronization with the StratiGraph Knowledge Graph.
+synchronization with the StratiGraph Knowledge Graph. With a ChunkStore,
+bundles are deltas: media and large files are listed as content-addressed
+chunks and only the chunks the server does not hold yet are included.
 """
 
+import hashlib
 import os
-import shutil
-import tempfile
 import zipfile
 from datetime import datetime, timezone
 
 from pyarchinit_mini.stratigraph.bundle_manifest import BundleManifest
 
+# Read size when streaming whole files into the archive
+COPY_BLOCK_SIZE = 1024 * 1024
+
+# Formats that are already compressed: DEFLATE costs CPU and saves nothing
+STORED_EXTENSIONS = frozenset({
+    ".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic", ".jp2",
+    ".mp4", ".mov", ".avi", ".mkv", ".webm", ".mp3", ".ogg", ".m4a",
+    ".zip", ".gz", ".bz2", ".xz", ".7z", ".glb", ".pdf",
+    ".docx", ".xlsx", ".pptx", ".odt", ".ods",
+})
+
 
 class BundleCreator:
     """Creates StratiGraph-compliant export bundles.
@@ -36,16 +48,19 @@ class BundleCreator:
         creator.add_media_file("/path/to/photo.jpg", "media/photo_001.jpg")
         result = creator.build()
         # result = {"success": True, "bundle_path": "/path/to/bundle.zip", ...}
+
+    Passing a ChunkStore builds a delta bundle (see ChunkStore).
     """
 
     # Standard directory structure inside the bundle
     DIR_DATA = "data"
     DIR_METADATA = "metadata"
     DIR_MEDIA = "media"
+    DIR_CHUNKS = "chunks"
 
     def __init__(self, output_dir, site_name=None, user=None,
                  organization=None, tool_version=None,
-                 ontology_references=None):
+                 ontology_references=None, chunk_store=None):
         """Initialize the bundle creator.
 
         Args:
@@ -55,6 +70,8 @@ class BundleCreator:
             organization: Organization name for provenance.
             tool_version: PyArchInit version. Auto-detected if None.
             ontology_references: List of ontology URIs for BMD.
+            chunk_store: Optional ChunkStore. When given, the bundle is a
+                delta that ships only chunks the server does not hold.
         """
         self.output_dir = output_dir
         self.site_name = site_name or "unknown_site"
@@ -62,6 +79,7 @@ class BundleCreator:
         self.organization = organization or ""
         self.tool_version = tool_version
         self.ontology_references = ontology_references
+        self.chunk_store = chunk_store
 
         # Files to include: list of (source_path, bundle_relative_path)
         self._files = []
@@ -145,8 +163,11 @@ class BundleCreator:
     def build(self):
         """Build the bundle ZIP file.
 
-        Creates a temporary directory, copies all registered files,
-        generates the manifest, and compresses everything into a ZIP.
+        Streams every registered file straight into the ZIP, hashing it
+        on the way, then writes the manifest. Already-compressed media is
+        stored without DEFLATE. In delta mode media and large files are
+        cut into chunks and only chunks unknown to the chunk store are
+        written (under chunks/).
 
         Returns:
             dict: Result with keys:
@@ -157,6 +178,7 @@ class BundleCreator:
                 - errors (list[str])
                 - warnings (list[str])
                 - timestamp (str): ISO 8601 export timestamp
+                - chunks_shipped, chunks_reused (int): Delta mode only
         """
         result = {
             "success": False,
@@ -186,13 +208,7 @@ class BundleCreator:
         bundle_filename = f"stratigraph_bundle_{safe_site}_{ts_str}.zip"
         bundle_path = os.path.join(self.output_dir, bundle_filename)
 
-        # Work in a temp directory
-        tmp_dir = tempfile.mkdtemp(prefix="stratigraph_bundle_")
         try:
-            # Create bundle directory structure
-            for subdir in [self.DIR_DATA, self.DIR_METADATA, self.DIR_MEDIA]:
-                os.makedirs(os.path.join(tmp_dir, subdir), exist_ok=True)
-
             # Initialize manifest
             manifest = BundleManifest(
                 tool_version=self.tool_version,
@@ -200,25 +216,37 @@ class BundleCreator:
                 organization=self.organization,
                 ontology_references=self.ontology_references,
             )
+            shipped = {}  # chunk hash -> None, in write order
+            reused = 0
 
-            # Copy files and register in manifest
-            for source_path, rel_path in self._files:
-                dest_path = os.path.join(tmp_dir, rel_path)
-                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                shutil.copy2(source_path, dest_path)
-                manifest.add_file(dest_path, rel_path)
-
-            # Write manifest
-            manifest_path = os.path.join(tmp_dir, self.DIR_METADATA, "manifest.json")
-            integrity_hash = manifest.write(manifest_path)
-
-            # Create ZIP
             with zipfile.ZipFile(bundle_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for root, _dirs, files in os.walk(tmp_dir):
-                    for filename in files:
-                        file_path = os.path.join(root, filename)
-                        arcname = os.path.relpath(file_path, tmp_dir)
-                        zf.write(file_path, arcname)
+                for source_path, rel_path in self._files:
+                    compress_type = self._compress_type(source_path)
+                    if not self._chunked(source_path, rel_path):
+                        file_hash, size = self._write_file(zf, source_path, rel_path, compress_type)
+                        manifest.add_entry(rel_path, file_hash, size)
+                    else:
+                        file_hash, size, chunks = self._write_chunks(
+                            zf, source_path, compress_type, shipped)
+                        manifest.add_entry(rel_path, file_hash, size, chunks=chunks)
+                        reused += len(chunks)
+
+                if self.chunk_store is not None:
+                    reused -= len(shipped)
+                    manifest.delta = {
+                        "chunk_size": self.chunk_store.chunk_size,
+                        "chunks_shipped": len(shipped),
+                        "chunks_reused": reused,
+                    }
+
+                # Write manifest
+                zf.writestr(f"{self.DIR_METADATA}/manifest.json", manifest.to_json())
+                integrity_hash = manifest.integrity_hash
+
+            if self.chunk_store is not None:
+                self.chunk_store.record_bundle(bundle_filename, shipped)
+                result["chunks_shipped"] = len(shipped)
+                result["chunks_reused"] = reused
 
             result["success"] = True
             result["bundle_path"] = bundle_path
@@ -228,8 +256,68 @@ class BundleCreator:
 
         except Exception as e:
             result["errors"].append(f"Bundle creation failed: {e}")
-        finally:
-            # Clean up temp directory
-            shutil.rmtree(tmp_dir, ignore_errors=True)
+            # Do not leave a truncated ZIP behind
+            if os.path.exists(bundle_path):
+                os.remove(bundle_path)
 
         return result
+
+    def _chunked(self, source_path, rel_path):
+        """Whether a file is shipped as chunks (delta mode only).
+
+        Small data and metadata files (the JSON-LD exports) are written
+        whole, so the bundle's UUIDs can be validated on their own.
+        """
+        if self.chunk_store is None:
+            return False
+        if rel_path.startswith(f"{self.DIR_MEDIA}/"):
+            return True
+        return os.path.getsize(source_path) > self.chunk_store.chunk_size
+
+    @staticmethod
+    def _compress_type(source_path):
+        """ZIP_STORED for already-compressed formats, ZIP_DEFLATED otherwise."""
+        ext = os.path.splitext(source_path)[1].lower()
+        return zipfile.ZIP_STORED if ext in STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+
+    @staticmethod
+    def _write_file(zf, source_path, arcname, compress_type):
+        """Stream a file into the archive, hashing it on the way.
+
+        Returns:
+            tuple: (sha256 hex digest, size in bytes)
+        """
+        info = zipfile.ZipInfo.from_file(source_path, arcname)
+        info.compress_type = compress_type
+        digest = hashlib.sha256()
+        size = 0
+        with open(source_path, 'rb') as src, zf.open(info, 'w') as dst:
+            for block in iter(lambda: src.read(COPY_BLOCK_SIZE), b''):
+                digest.update(block)
+                dst.write(block)
+                size += len(block)
+        return digest.hexdigest(), size
+
+    def _write_chunks(self, zf, source_path, compress_type, shipped):
+        """Cut a file into chunks and write those the server lacks.
+
+        Chunks already acknowledged, or already written to this bundle,
+        are only referenced. New chunk hashes are added to ``shipped``.
+
+        Returns:
+            tuple: (sha256 hex digest, size in bytes, ordered chunk hashes)
+        """
+        digest = hashlib.sha256()
+        size = 0
+        chunks = []
+        with open(source_path, 'rb') as src:
+            for block in iter(lambda: src.read(self.chunk_store.chunk_size), b''):
+                chunk_hash = hashlib.sha256(block).hexdigest()
+                digest.update(block)
+                size += len(block)
+                chunks.append(chunk_hash)
+                if chunk_hash in shipped or self.chunk_store.has(chunk_hash):
+                    continue
+                zf.writestr(f"{self.DIR_CHUNKS}/{chunk_hash}", block, compress_type=compress_type)
+                shipped[chunk_hash] = None
+        return digest.hexdigest(), size, chunks
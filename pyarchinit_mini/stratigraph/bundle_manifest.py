@@ -83,6 +83,7 @@ class BundleManifest:
         self.organization = organization or ""
         self.ontology_references = ontology_references or list(DEFAULT_ONTOLOGY_REFERENCES)
         self.files = []  # List of {path, hash, size_bytes}
+        self.delta = None  # Set for delta bundles (see BundleCreator)
         self.export_timestamp = None
         self.integrity_hash = None
 
@@ -128,6 +129,32 @@ class BundleManifest:
         self.files.append(entry)
         return entry
 
+    def add_entry(self, relative_path, sha256, size_bytes, chunks=None):
+        """Register a file whose hash and size are already known.
+
+        Used when files are hashed while being streamed into the bundle,
+        so they are not read a second time.
+
+        Args:
+            relative_path: Path relative to the bundle root.
+            sha256: Hex-encoded SHA-256 of the whole file.
+            size_bytes: File size in bytes.
+            chunks: For delta bundles, the ordered chunk hashes the file
+                is made of.
+
+        Returns:
+            dict: The file entry added to the manifest.
+        """
+        entry = {
+            "path": relative_path,
+            "sha256": sha256,
+            "size_bytes": size_bytes,
+        }
+        if chunks is not None:
+            entry["chunks"] = list(chunks)
+        self.files.append(entry)
+        return entry
+
     def generate(self):
         """Generate the complete manifest dict.
 
@@ -154,6 +181,8 @@ class BundleManifest:
             },
             "files": self.files,
         }
+        if self.delta is not None:
+            manifest["delta"] = self.delta
 
         # Compute integrity hash over files section
         files_json = json.dumps(self.files, sort_keys=True).encode('utf-8')
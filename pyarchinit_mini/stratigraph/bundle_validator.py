@@ -141,7 +141,7 @@ class BundleValidator:
         results.extend(self._validate_files(manifest, bundle_dir))
 
         # Validate UUIDs in data files
-        results.extend(self._validate_uuids(bundle_dir))
+        results.extend(self._validate_uuids(bundle_dir, manifest))
 
         return results
 
@@ -313,6 +313,12 @@ class BundleValidator:
                 ))
                 continue
 
+            # Delta bundles list files as content-addressed chunks
+            if "chunks" in entry:
+                results.extend(self._validate_chunked_file(
+                    entry, bundle_dir, "delta" in manifest))
+                continue
+
             full_path = os.path.join(bundle_dir, rel_path)
 
             # Check file exists
@@ -338,13 +344,75 @@ class BundleValidator:
 
         return results
 
-    def _validate_uuids(self, bundle_dir):
+    def _validate_chunked_file(self, entry, bundle_dir, is_delta):
+        """Validate a file stored as chunks under chunks/.
+
+        Each chunk present in the bundle must match its hash. In a delta
+        bundle, absent chunks were shipped in an earlier bundle; when all
+        chunks are present the reassembled file hash is checked as well.
+
+        Args:
+            entry: Manifest file entry with a "chunks" list.
+            bundle_dir: Path to the bundle directory.
+            is_delta: True if the manifest has a "delta" section.
+
+        Returns:
+            list[ValidationResult]: Chunk validation results.
+        """
+        results = []
+        rel_path = entry.get("path", "")
+        file_hash = hashlib.sha256()
+        missing = 0
+
+        for chunk_hash in entry["chunks"]:
+            chunk_path = os.path.join(bundle_dir, "chunks", chunk_hash)
+            if not os.path.isfile(chunk_path):
+                missing += 1
+                continue
+            with open(chunk_path, 'rb') as f:
+                data = f.read()
+            if hashlib.sha256(data).hexdigest() != chunk_hash:
+                results.append(ValidationResult(
+                    ValidationLevel.ERROR, "CHUNK_HASH_MISMATCH",
+                    f"Hash mismatch for chunk {chunk_hash[:12]} of {rel_path}",
+                    {"path": rel_path, "chunk": chunk_hash}
+                ))
+            file_hash.update(data)
+
+        if missing and not is_delta:
+            results.append(ValidationResult(
+                ValidationLevel.ERROR, "FILE_MISSING",
+                f"{missing} chunk(s) of {rel_path} not found in a full bundle",
+                {"path": rel_path, "missing_chunks": missing}
+            ))
+        elif missing:
+            results.append(ValidationResult(
+                ValidationLevel.INFO, "CHUNKS_FROM_BASE",
+                f"{missing} chunk(s) of {rel_path} come from earlier bundles",
+                {"path": rel_path, "missing_chunks": missing}
+            ))
+        elif entry.get("sha256") and file_hash.hexdigest() != entry["sha256"]:
+            results.append(ValidationResult(
+                ValidationLevel.ERROR, "FILE_HASH_MISMATCH",
+                f"Hash mismatch for {rel_path}",
+                {"path": rel_path,
+                 "expected": entry["sha256"],
+                 "actual": file_hash.hexdigest()}
+            ))
+
+        return results
+
+    def _validate_uuids(self, bundle_dir, manifest=None):
         """Validate UUID consistency in JSON-LD data files.
 
         Checks that entity_uuid fields are present, valid, and unique.
+        Data files a delta bundle stores as chunks are reassembled first;
+        when some of their chunks come from earlier bundles the check is
+        skipped with a warning.
 
         Args:
             bundle_dir: Path to the bundle directory.
+            manifest: Parsed manifest dict (for chunked data files).
 
         Returns:
             list[ValidationResult]: UUID validation results.
@@ -352,18 +420,9 @@ class BundleValidator:
         results = []
         seen_uuids = set()
 
-        data_dir = os.path.join(bundle_dir, "data")
-        if not os.path.isdir(data_dir):
-            return results
-
-        for filename in os.listdir(data_dir):
-            if not filename.endswith('.jsonld') and not filename.endswith('.json'):
-                continue
-
-            filepath = os.path.join(data_dir, filename)
+        for filename, raw in self._json_data_files(bundle_dir, manifest, results):
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = json.loads(raw.decode('utf-8'))
             except (json.JSONDecodeError, UnicodeDecodeError):
                 continue
 
@@ -388,6 +447,43 @@ class BundleValidator:
 
         return results
 
+    @staticmethod
+    def _json_data_files(bundle_dir, manifest, results):
+        """Yield (filename, bytes) of the JSON files under data/.
+
+        Chunked files missing chunks add a UUID_CHECK_SKIPPED warning to
+        ``results`` instead.
+        """
+        data_dir = os.path.join(bundle_dir, "data")
+        if os.path.isdir(data_dir):
+            for filename in os.listdir(data_dir):
+                if not filename.endswith(('.jsonld', '.json')):
+                    continue
+                with open(os.path.join(data_dir, filename), 'rb') as f:
+                    yield filename, f.read()
+
+        for entry in (manifest or {}).get("files", []):
+            rel_path = entry.get("path", "")
+            if ("chunks" not in entry or not rel_path.startswith("data/")
+                    or not rel_path.endswith(('.jsonld', '.json'))):
+                continue
+            parts = []
+            for chunk_hash in entry["chunks"]:
+                chunk_path = os.path.join(bundle_dir, "chunks", chunk_hash)
+                if not os.path.isfile(chunk_path):
+                    parts = None
+                    break
+                with open(chunk_path, 'rb') as f:
+                    parts.append(f.read())
+            if parts is None:
+                results.append(ValidationResult(
+                    ValidationLevel.WARNING, "UUID_CHECK_SKIPPED",
+                    f"UUIDs of {rel_path} not checked: some chunks come from earlier bundles",
+                    {"path": rel_path}
+                ))
+                continue
+            yield os.path.basename(rel_path), b"".join(parts)
+
     def _extract_uuids(self, data, path=""):
         """Recursively extract entity_uuid values from a JSON structure.
 
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Chunk Store for StratiGraph delta bundles.
+
+Files in a delta bundle are split into fixed-size chunks addressed by
+their SHA-256. The chunk store is the local record of which chunks the
+server already holds: chunks shipped in a bundle stay pending until the
+upload of that bundle is acknowledged, after which later bundles only
+reference them instead of shipping them again.
+
+Fixed-size chunking suits the SQLite databases that make up most of an
+export: pages are rewritten in place, so an edit changes only the chunks
+holding the touched pages. Unchanged media files map to unchanged chunks.
+"""
+
+import json
+import os
+import threading
+
+# 4 MiB: a whole number of SQLite pages for every page size
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+class ChunkStore:
+    """Content-addressed index of chunks shipped to the StratiGraph server.
+
+    Only chunk hashes are kept (not their bytes), so the store stays a few
+    kilobytes even for multi-GB exports. State is a JSON file:
+    acknowledged chunk hashes plus, per bundle awaiting acknowledgement,
+    the chunks it shipped.
+
+    Usage:
+        store = ChunkStore("/path/to/stratigraph_chunks.json")
+        creator = BundleCreator(output_dir, site_name="MySite", chunk_store=store)
+        result = creator.build()           # ships chunks the server lacks
+        ...                                # upload result["bundle_path"]
+        store.acknowledge(os.path.basename(result["bundle_path"]))
+    """
+
+    def __init__(self, path, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Initialize the chunk store.
+
+        Args:
+            path: Path of the JSON state file (created on first write).
+            chunk_size: Chunk size in bytes. Changing it invalidates the
+                acknowledged chunks, so the next bundle ships in full.
+        """
+        self.path = path
+        self.chunk_size = chunk_size
+        self._lock = threading.Lock()
+        self._acknowledged = set()
+        self._pending = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("chunk_size") != self.chunk_size:
+            return
+        self._acknowledged = set(data.get("acknowledged", []))
+        self._pending = {k: list(v) for k, v in data.get("pending", {}).items()}
+
+    def _save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "chunk_size": self.chunk_size,
+                "acknowledged": sorted(self._acknowledged),
+                "pending": self._pending,
+            }, f)
+        os.replace(tmp_path, self.path)
+
+    def has(self, chunk_hash):
+        """Return True if the server is known to hold the chunk."""
+        with self._lock:
+            return chunk_hash in self._acknowledged
+
+    def record_bundle(self, bundle_id, chunk_hashes):
+        """Remember the chunks shipped in a bundle until it is acknowledged.
+
+        Args:
+            bundle_id: Bundle identifier (the bundle ZIP filename).
+            chunk_hashes: Hashes of the chunks stored in the bundle.
+        """
+        with self._lock:
+            self._pending[bundle_id] = sorted(set(chunk_hashes))
+            self._save()
+
+    def acknowledge(self, bundle_id):
+        """Mark a bundle as received by the server.
+
+        Args:
+            bundle_id: Bundle identifier passed to record_bundle().
+
+        Returns:
+            bool: True if the bundle was pending.
+        """
+        with self._lock:
+            chunks = self._pending.pop(bundle_id, None)
+            if chunks is None:
+                return False
+            self._acknowledged.update(chunks)
+            self._save()
+            return True
+
+    def reset(self):
+        """Forget every chunk; the next bundle is shipped in full."""
+        with self._lock:
+            self._acknowledged.clear()
+            self._pending.clear()
+            self._save()
@@ -15,6 +15,7 @@ from pyarchinit_mini.stratigraph.sync_state_machine import SyncStateMachine, Syn
 from pyarchinit_mini.stratigraph.sync_queue import SyncQueue
 from pyarchinit_mini.stratigraph.connectivity_monitor import ConnectivityMonitor
 from pyarchinit_mini.stratigraph.bundle_creator import BundleCreator
+from pyarchinit_mini.stratigraph.chunk_store import ChunkStore
 from pyarchinit_mini.stratigraph.bundle_validator import validate_bundle
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,7 @@ class SyncOrchestrator:
 
         queue_dir = config_dir or os.path.expanduser("~/.pyarchinit")
         self.queue = SyncQueue(db_path=os.path.join(queue_dir, "stratigraph_sync_queue.sqlite"))
+        self.chunk_store = ChunkStore(os.path.join(queue_dir, "stratigraph_chunks.json"))
         self.connectivity = ConnectivityMonitor(settings_manager=self._settings)
 
         self._running = False
@@ -89,8 +91,14 @@ class SyncOrchestrator:
 
     # -- public API ----------------------------------------------------------
 
-    def export_bundle(self, site_name: str = None) -> dict:
-        """Run the full export -> validate -> enqueue pipeline."""
+    def export_bundle(self, site_name: str = None, delta: bool = None) -> dict:
+        """Run the full export -> validate -> enqueue pipeline.
+
+        With ``delta`` (default: the ``bundle_delta`` setting) the bundle
+        only ships chunks not acknowledged by the server yet.
+        """
+        if delta is None:
+            delta = bool(self._settings.get("bundle_delta", False))
         result = {"success": False, "bundle_path": None, "errors": []}
 
         if not self.state_machine.transition(SyncState.LOCAL_EXPORT, {"site": site_name}):
@@ -102,7 +110,8 @@ class SyncOrchestrator:
         output_dir = os.path.join(home, "stratigraph_bundles")
 
         try:
-            creator = BundleCreator(output_dir=output_dir, site_name=site_name)
+            creator = BundleCreator(output_dir=output_dir, site_name=site_name,
+                                    chunk_store=self.chunk_store if delta else None)
             db_folder = os.path.join(home, "pyarchinit_DB_folder")
             if os.path.isdir(db_folder):
                 creator.add_directory(db_folder, "data", extensions=[".sqlite", ".gpkg"])
@@ -192,6 +201,8 @@ class SyncOrchestrator:
                 success = self._upload_bundle(entry.bundle_path, self._upload_endpoint)
                 if success:
                     self.queue.mark_completed(entry.id)
+                    # The server now holds this bundle's chunks
+                    self.chunk_store.acknowledge(os.path.basename(entry.bundle_path))
                     for cb in self._on_sync_progress:
                         cb(entry.id, 100, "Upload complete")
                     for cb in self._on_sync_completed:
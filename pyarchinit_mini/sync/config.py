@@ -21,6 +21,10 @@ class Config:
     delete_enabled: bool = True
     delete_on_empty_source: bool = False
     collision_id_base: int = 1_000_000_000
+    apply_batch_size: int = 5_000           # rows fetched/staged/merged per round trip
+    workers: int = 4                        # tables synced concurrently, one connection pair each
+    diff_leaf_size: int = 256               # mismatching hash buckets this small are diffed row by row
+    change_tracking: bool = False           # install change-log triggers on the source, diff only the delta
 
 def load_config(path: str | None = None, env: Mapping[str, str] = os.environ) -> Config:
     raw = {}
@@ -42,4 +46,8 @@ def load_config(path: str | None = None, env: Mapping[str, str] = os.environ) ->
         delete_enabled=bool(raw.get("delete_enabled", True)),
         delete_on_empty_source=bool(raw.get("delete_on_empty_source", False)),
         collision_id_base=int(raw.get("collision_id_base", 1_000_000_000)),
+        apply_batch_size=int(raw.get("apply_batch_size", 5_000)),
+        workers=int(raw.get("workers", 4)),
+        diff_leaf_size=int(raw.get("diff_leaf_size", 256)),
+        change_tracking=bool(raw.get("change_tracking", False)),
     )
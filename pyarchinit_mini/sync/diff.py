@@ -17,3 +17,29 @@ def diff_by_keyset(source_keys: set[tuple], target_keys: set[tuple]) -> Diff:
     return Diff(inserts=sorted(source_keys - target_keys),
                 updates=[],
                 deletes=sorted(target_keys - source_keys))
+
+def diff_by_buckets(src_buckets, tgt_buckets, src_rows, tgt_rows,
+                    leaf_size: int = 256, max_depth: int = 6) -> Diff:
+    # Merkle-style descent over key-hash prefixes. *_buckets(depth, parents) returns
+    # {prefix: (count, digest)} for the `depth`-digit prefixes under `parents` (None =
+    # whole table); *_rows(prefixes) returns {key: hash} for those buckets only.
+    # Equal buckets are dropped, small mismatching ones are diffed row by row and
+    # the rest are split one digit further, so transfer tracks the changed rows.
+    inserts, updates, deletes = [], [], []
+    depth, parents = 1, None
+    while parents != []:
+        s, t = src_buckets(depth, parents), tgt_buckets(depth, parents)
+        leaves, parents = [], []
+        for p in sorted(set(s) | set(t)):
+            sb, tb = s.get(p, (0, None)), t.get(p, (0, None))
+            if sb == tb:
+                continue
+            if min(sb[0], tb[0]) <= leaf_size or depth >= max_depth:
+                leaves.append(p)
+            else:
+                parents.append(p)
+        if leaves:
+            d = diff_by_hash(src_rows(leaves), tgt_rows(leaves))
+            inserts += d.inserts; updates += d.updates; deletes += d.deletes
+        depth += 1
+    return Diff(inserts=sorted(inserts), updates=sorted(updates), deletes=sorted(deletes))
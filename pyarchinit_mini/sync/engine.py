@@ -1,37 +1,99 @@
 import re
 from dataclasses import dataclass
 from psycopg2.extensions import connection
-from . import introspect as I, transform as T, state as S, rowmap as M
-from .diff import diff_by_hash
+from psycopg2.extras import execute_values
+from . import introspect as I, transform as T, state as S, rowmap as M, tracking as W
+from .diff import diff_by_hash, diff_by_buckets
 from .policy import select_mode, is_gated, preserve_set_for_table, common_data_columns
 
 @dataclass
 class TableResult:
     table: str; mode: str; inserted: int; updated: int; deleted: int
     skipped: bool; error: str | None
+    seconds: float = 0.0                    # wall time, set by the runner
+
+    @property
+    def rows_per_s(self) -> float:
+        n = self.inserted + self.updated + self.deleted
+        return n / self.seconds if self.seconds > 0 else 0.0
 
 _FILL_DEFAULTS = {
     "created_at": "now()", "updated_at": "now()", "version_number": "1",
     "entity_uuid": "gen_random_uuid()::text", "node_uuid": "gen_random_uuid()::text",
 }
 
-def _source_hash(src_conn, table, pk, common, src_types, tgt_types, geom):
+def _keyed_source(table, pk, common, src_types, tgt_types, geom):
     hcols = [c for c in common if c != pk]      # pk excluded; identity is the map, not the hash
-    cur = src_conn.cursor()
-    cur.execute(T.build_pk_hash_select_coerced(table, [pk], hcols, src_types, tgt_types, geom))
-    return {str(r[0]): r[1] for r in cur.fetchall()}
+    return (f'select "{pk}"::text as k, {T.coerced_row_hash_sql(hcols, src_types, tgt_types, geom)} '
+            f'as h from public."{table}"', [])
 
-def _target_hash(tgt_conn, table, pk, common, tgt_types):
+def _keyed_target(table, pk, common, tgt_types):
+    # v1_pk -> hash of its mapped v2 row (null if that row is gone), bucketed by the v1 key
     hcols = [c for c in common if c != pk]
-    cur = tgt_conn.cursor()
-    cur.execute(f'select "{pk}"::text, {T.plain_row_hash_sql(hcols, tgt_types)} from public."{table}"')
-    return {r[0]: r[1] for r in cur.fetchall()}
+    return ('select m.v1_pk as k, t.h from public.sync_row_map m left join '
+            f'(select "{pk}"::text as v2, {T.plain_row_hash_sql(hcols, tgt_types)} as h '
+            f'from public."{table}") t on t.v2 = m.v2_pk where m.table_name = %s', [table])
+
+def _bucket_reader(conn, keyed):
+    # server-side aggregates for diff_by_buckets: a bucket is a prefix of md5(key), its
+    # digest the count plus the sum of 60-bit md5(key|hash) values (order independent)
+    sql, params = keyed
+
+    def buckets(depth, parents):
+        where, args = "", []
+        if parents:
+            where, args = "where substr(md5(k), 1, %s) = any(%s)", [depth - 1, parents]
+        cur = conn.cursor()
+        cur.execute("select substr(md5(k), 1, %s), count(*), "
+                    "sum(('x' || substr(md5(k || '|' || coalesce(h, '')), 1, 15))::bit(60)::bigint) "
+                    f"from ({sql}) x {where} group by 1", [depth, *params, *args])
+        return {r[0]: (r[1], r[2]) for r in cur.fetchall()}
+
+    def rows(prefixes):
+        cur = conn.cursor()
+        cur.execute(f"select k, h from ({sql}) x where substr(md5(k), 1, %s) = any(%s)",
+                    [*params, len(prefixes[0]), prefixes])
+        return {r[0]: r[1] for r in cur.fetchall()}
+    return buckets, rows
+
+_STAGE = "_sync_stage"
+_TYPED_KEYS = {"integer", "bigint", "smallint", "text", "character varying", "uuid"}
+
+def _chunks(seq, size):
+    for i in range(0, len(seq), size):
+        yield seq[i:i + size]
+
+def _pk_in(pk, pk_type):
+    # typed ANY() keeps the pk index usable; other key types compare as text
+    if pk_type in _TYPED_KEYS:
+        return f'"{pk}" = ANY(%s::{pk_type}[])'
+    return f'"{pk}"::text = ANY(%s)'
+
+def _delta_diff(src_conn, tgt_conn, table, pk, common, src_types, tgt_types, geom, keys, batch):
+    # diff restricted to the keys the change log reported, fetched by pk on both sides
+    hcols = [c for c in common if c != pk]
+    pk_type = tgt_types[pk][0]
+    v2_eq = f'"{pk}" = m.v2_pk::{pk_type}' if pk_type in _TYPED_KEYS else f'"{pk}"::text = m.v2_pk'
+    src, tgt = {}, {}
+    scur, tcur = src_conn.cursor(), tgt_conn.cursor()
+    for chunk in _chunks(sorted(keys), batch):
+        scur.execute(f'select "{pk}"::text, {T.coerced_row_hash_sql(hcols, src_types, tgt_types, geom)} '
+                     f'from public."{table}" where {_pk_in(pk, src_types[pk][0])}', (chunk,))
+        src.update(scur.fetchall())
+        tcur.execute('select m.v1_pk, t.h from public.sync_row_map m left join lateral '
+                     f'(select {T.plain_row_hash_sql(hcols, tgt_types)} as h from public."{table}" '
+                     f'where {v2_eq}) t on true where m.table_name = %s and m.v1_pk = any(%s)',
+                     (table, chunk))
+        tgt.update(tcur.fetchall())
+    return diff_by_hash(src, tgt)
 
-def _fetch_source_row(src_conn, table, common, pk, v1_pk):
+def _fetch_source_rows(src_conn, table, common, pk, src_types, v1_pks):
+    # {v1_pk: row aligned to `common`} for one batch of keys
     cur = src_conn.cursor()
     cols = ", ".join(f'"{c}"' for c in common)
-    cur.execute(f'select {cols} from public."{table}" where "{pk}"::text=%s', (v1_pk,))
-    return cur.fetchone()
+    cur.execute(f'select "{pk}"::text, {cols} from public."{table}" '
+                f'where {_pk_in(pk, src_types[pk][0])}', (list(v1_pks),))
+    return {r[0]: r[1:] for r in cur.fetchall()}
 
 def _value_exprs(common, src_types, tgt_types, geom):
     out = []
@@ -40,29 +102,45 @@ def _value_exprs(common, src_types, tgt_types, geom):
         out.append(T.cast_expr(src_types[c][0], tgt_t, tgt_types[c][1], ph=f"%({c})s"))
     return out
 
-def _insert_one(tgt_conn, table, common, pk, row, v2_pk, src_types, tgt_types, geom):
-    # row is aligned to `common`; force the pk column to the chosen v2_pk
+def _create_stage(tgt_conn, table, common):
+    # target-typed copy of the synced columns (no constraints), dropped at commit/rollback
+    cols = ", ".join(f'"{c}"' for c in common)
+    cur = tgt_conn.cursor()
+    cur.execute(f"DROP TABLE IF EXISTS pg_temp.{_STAGE}")
+    cur.execute(f'CREATE TEMP TABLE {_STAGE} ON COMMIT DROP AS '
+                f'SELECT {cols} FROM public."{table}" WITH NO DATA')
+    cur.execute(f"ALTER TABLE {_STAGE} ADD COLUMN __op char(1), ADD COLUMN __v2pk text")
+
+def _stage_rows(tgt_conn, common, pk, staged, src_types, tgt_types, geom):
+    # staged: [(op, v2_pk, row)]; op 'i' inserts, 'u' updates; pk forced to v2_pk
     exprs = _value_exprs(common, src_types, tgt_types, geom)
+    cols = ", ".join(f'"{c}"' for c in common)
+    params = []
+    for op, v2k, row in staged:
+        p = {c: row[i] for i, c in enumerate(common)}
+        p[pk] = v2k; p["__op"] = op; p["__v2pk"] = v2k
+        params.append(p)
+    execute_values(tgt_conn.cursor(), f"INSERT INTO {_STAGE} (__op, __v2pk, {cols}) VALUES %s",
+                   params, template=f"(%(__op)s, %(__v2pk)s, {', '.join(exprs)})",
+                   page_size=len(params))
+
+def _merge_stage(tgt_conn, table, common, pk, tgt_types):
+    cur = tgt_conn.cursor()
     fill = {c: v for c, v in _FILL_DEFAULTS.items() if c in tgt_types and c not in common}
-    cols = common + list(fill.keys())
-    col_sql = ", ".join(f'"{c}"' for c in cols)
-    val_sql = ", ".join(exprs + list(fill.values()))
-    params = {c: row[i] for i, c in enumerate(common)}
-    params[pk] = v2_pk                       # override pk value with the chosen v2_pk
-    tgt_conn.cursor().execute(
-        f'INSERT INTO public."{table}" ({col_sql}) VALUES ({val_sql})', params)
-
-def _update_one(tgt_conn, table, common, pk, row, v2_pk, src_types, tgt_types, geom):
+    col_sql = ", ".join(f'"{c}"' for c in common + list(fill))
+    sel_sql = ", ".join([f's."{c}"' for c in common] + list(fill.values()))
+    cur.execute(f'INSERT INTO public."{table}" ({col_sql}) '
+                f"SELECT {sel_sql} FROM {_STAGE} s WHERE s.__op = 'i'")
     set_cols = [c for c in common if c != pk]            # never update the pk
-    exprs = _value_exprs(set_cols, src_types, tgt_types, geom)
-    assigns = ", ".join(f'"{c}" = {e}' for c, e in zip(set_cols, exprs))
-    params = {c: row[common.index(c)] for c in set_cols}
-    params["__v2pk"] = v2_pk
-    tgt_conn.cursor().execute(
-        f'UPDATE public."{table}" SET {assigns} WHERE "{pk}"::text = %(__v2pk)s', params)
+    if set_cols:
+        assigns = ", ".join(f'"{c}" = s."{c}"' for c in set_cols)
+        cur.execute(f'UPDATE public."{table}" t SET {assigns} FROM {_STAGE} s '
+                    "WHERE s.__op = 'u' AND " f't."{pk}" = s."{pk}"')
+    cur.execute(f"TRUNCATE {_STAGE}")
 
-def _delete_one(tgt_conn, table, pk, v2_pk):
-    tgt_conn.cursor().execute(f'delete from public."{table}" where "{pk}"::text=%s', (v2_pk,))
+def _delete_many(tgt_conn, table, pk, tgt_types, v2_pks):
+    tgt_conn.cursor().execute(f'delete from public."{table}" where {_pk_in(pk, tgt_types[pk][0])}',
+                              (list(v2_pks),))
 
 def _alloc_v2_pk(v1_pk, v2pks, state):
     if v1_pk not in v2pks:
@@ -76,11 +154,10 @@ def _alloc_v2_pk(v1_pk, v2pks, state):
 def sync_table(src_conn, tgt_conn, table, cfg, dry_run=True) -> TableResult:
     mode = "unknown"; ins = upd = dele = 0
     try:
-        M.ensure_map_table(tgt_conn); S.ensure_state_table(tgt_conn)
+        M.ensure_map_table(tgt_conn); S.ensure_state_table(tgt_conn)   # no-ops once run() created them
         pk_cols = I.primary_key(src_conn, table)
         single_pk = pk_cols[0] if len(pk_cols) == 1 else None
         mode = select_mode(single_pk is not None)
-        rc = I.row_count(src_conn, table)
         src_types = I.column_types(src_conn, table)
         tgt_types = I.column_types(tgt_conn, table)
         geom = I.geometry_columns(tgt_conn, table)
@@ -99,17 +176,18 @@ def sync_table(src_conn, tgt_conn, table, cfg, dry_run=True) -> TableResult:
             seen = {r[0] for r in tcur.fetchall()}
             exprs = _value_exprs(common, src_types, tgt_types, geom)
             col_sql = ", ".join(f'"{c}"' for c in common)
-            sql = f'INSERT INTO public."{table}" ({col_sql}) VALUES ({", ".join(exprs)})'
-            icur = tgt_conn.cursor()
+            new_rows = []
             for r in srows:
                 h = r[0]
                 if h in seen:
                     continue
                 seen.add(h)
                 row = r[1:]
-                params = {c: row[i] for i, c in enumerate(common)}
-                icur.execute(sql, params)
-                ins += 1
+                new_rows.append({c: row[i] for i, c in enumerate(common)})
+            if new_rows:                             # multi-row VALUES, apply_batch_size per statement
+                execute_values(tgt_conn.cursor(), f'INSERT INTO public."{table}" ({col_sql}) VALUES %s',
+                               new_rows, template=f'({", ".join(exprs)})', page_size=cfg.apply_batch_size)
+            ins = len(new_rows)
             if dry_run:
                 tgt_conn.rollback()
             else:
@@ -117,48 +195,76 @@ def sync_table(src_conn, tgt_conn, table, cfg, dry_run=True) -> TableResult:
                                 mode, ins, 0, 0, None)
                 tgt_conn.commit()
             return TableResult(table, mode, ins, 0, 0, False, None)
-        if is_gated(rc, cfg.size_threshold_keyset):
-            if I.signature(src_conn, table, pk_cols) == S.get_signature(tgt_conn, table):
+        tracked = cfg.change_tracking and W.is_tracked(src_conn, table)
+        if cfg.change_tracking and not tracked and not dry_run:
+            W.ensure_tracking(src_conn, table, single_pk)     # logged from here; this run diffs in full
+            tracked = True
+        wm = W.watermark(src_conn) if tracked else None       # read before diffing; later changes wait
+        keys = None                                           # v1 keys changed since the last run
+        last = S.get_signature(tgt_conn, table) or ""
+        if tracked and last.startswith("txid:"):
+            keys = W.changed_keys(src_conn, table, int(last[5:]))
+            if keys == set():                                 # nothing logged: skip without scanning
+                tgt_conn.rollback()
+                return TableResult(table, mode, 0, 0, 0, True, None)
+        rc = I.row_count(src_conn, table) if keys is None else None
+        if not tracked and is_gated(rc, cfg.size_threshold_keyset):
+            if I.signature(src_conn, table, pk_cols) == last:
                 tgt_conn.rollback()
                 return TableResult(table, mode, 0, 0, 0, True, None)
         if M.map_count(tgt_conn, table) == 0:
             M.bootstrap_table(tgt_conn, src_conn, table, single_pk)
         mp = M.load_map(tgt_conn, table)                       # {v1_pk: v2_pk}
-        src = _source_hash(src_conn, table, single_pk, common, src_types, tgt_types, geom)
-        tgt_h = _target_hash(tgt_conn, table, single_pk, common, tgt_types)   # {v2_pk: hash}
-        target = {v1: tgt_h.get(v2) for v1, v2 in mp.items()}      # {v1_pk: hash-of-its-v2-row}
-        d = diff_by_hash(src, target)
+        if keys is None:
+            src_b, src_r = _bucket_reader(src_conn, _keyed_source(table, single_pk, common,
+                                                                  src_types, tgt_types, geom))
+            tgt_b, tgt_r = _bucket_reader(tgt_conn, _keyed_target(table, single_pk, common, tgt_types))
+            d = diff_by_buckets(src_b, tgt_b, src_r, tgt_r, leaf_size=cfg.diff_leaf_size)
+        else:
+            d = _delta_diff(src_conn, tgt_conn, table, single_pk, common, src_types, tgt_types,
+                            geom, keys, cfg.apply_batch_size)
         v2pks = M.v2_pk_set(tgt_conn, table, single_pk)
         nums = [int(x) for x in v2pks if re.fullmatch(r"-?\d+", x)]
         state = {"next_high": max([cfg.collision_id_base] + [n + 1 for n in nums])}
-        if cfg.delete_enabled and (rc > 0 or cfg.delete_on_empty_source):
-            for v1k in d.deletes:
-                _delete_one(tgt_conn, table, single_pk, mp[v1k]); M.delete_map(tgt_conn, table, v1k); dele += 1
-        for v1k in d.inserts:
-            row = _fetch_source_row(src_conn, table, common, single_pk, v1k)
-            if row is None:
-                continue
-            v2k = _alloc_v2_pk(v1k, v2pks, state)
-            _insert_one(tgt_conn, table, common, single_pk, row, v2k, src_types, tgt_types, geom)
-            M.upsert_map(tgt_conn, table, v1k, v2k); v2pks.add(v2k); ins += 1
-        for v1k in d.updates:
-            v2k = mp[v1k]
-            row = _fetch_source_row(src_conn, table, common, single_pk, v1k)
-            if row is None:
-                continue
-            if v2k in v2pks:
-                _update_one(tgt_conn, table, common, single_pk, row, v2k, src_types, tgt_types, geom)
-            else:                                   # mapped row deleted in v2 -> re-insert
-                v2k = _alloc_v2_pk(v1k, v2pks, state)
-                _insert_one(tgt_conn, table, common, single_pk, row, v2k, src_types, tgt_types, geom)
-                M.upsert_map(tgt_conn, table, v1k, v2k); v2pks.add(v2k)
-            upd += 1
+        batch = cfg.apply_batch_size
+        # logged deletes are explicit, so the empty-source guard only applies to full diffs
+        if cfg.delete_enabled and (keys is not None or rc > 0 or cfg.delete_on_empty_source):
+            for chunk in _chunks(d.deletes, batch):
+                _delete_many(tgt_conn, table, single_pk, tgt_types, [mp[k] for k in chunk])
+                M.delete_map_many(tgt_conn, table, chunk); dele += len(chunk)
+        # Changed rows are fetched, staged and merged one batch at a time
+        # (one SELECT, one multi-row INSERT and set-based merges per batch)
+        if d.inserts or d.updates:
+            _create_stage(tgt_conn, table, common)
+        for op, keys_all in (("i", d.inserts), ("u", d.updates)):
+            for chunk in _chunks(keys_all, batch):
+                rows = _fetch_source_rows(src_conn, table, common, single_pk, src_types, chunk)
+                staged, mapped = [], []
+                for v1k in chunk:
+                    row = rows.get(v1k)
+                    if row is None:
+                        continue
+                    if op == "u" and mp[v1k] in v2pks:
+                        staged.append(("u", mp[v1k], row))
+                    else:                           # new row, or mapped row deleted in v2 -> re-insert
+                        v2k = _alloc_v2_pk(v1k, v2pks, state)
+                        staged.append(("i", v2k, row)); mapped.append((v1k, v2k)); v2pks.add(v2k)
+                    if op == "i":
+                        ins += 1
+                    else:
+                        upd += 1
+                if staged:
+                    _stage_rows(tgt_conn, common, single_pk, staged, src_types, tgt_types, geom)
+                    _merge_stage(tgt_conn, table, common, single_pk, tgt_types)
+                    M.upsert_map_many(tgt_conn, table, mapped)
         if dry_run:
             tgt_conn.rollback()
         else:
-            S.record_result(tgt_conn, table, I.signature(src_conn, table, pk_cols),
-                            mode, ins, upd, dele, None)
+            sig = f"txid:{wm}" if tracked else I.signature(src_conn, table, pk_cols)
+            S.record_result(tgt_conn, table, sig, mode, ins, upd, dele, None)
             tgt_conn.commit()
+            if tracked:
+                W.prune(src_conn, table, wm)                  # entries below wm were consumed
         return TableResult(table, mode, ins, upd, dele, False, None)
     except Exception as e:
         tgt_conn.rollback()
@@ -31,6 +31,29 @@ def geometry_columns(conn: connection, table: str) -> set[str]:
                 "and udt_name in ('geometry','geography')", (table,))
     return {r[0] for r in cur.fetchall()}
 
+def foreign_keys(conn: connection) -> dict[str, set[str]]:
+    # {table: tables it references}, public schema, self-references dropped
+    cur = conn.cursor()
+    cur.execute("""select c.relname, p.relname from pg_constraint k
+                   join pg_class c on c.oid=k.conrelid
+                   join pg_class p on p.oid=k.confrelid
+                   join pg_namespace n on n.oid=c.relnamespace
+                   join pg_namespace pn on pn.oid=p.relnamespace
+                   where k.contype='f' and n.nspname='public' and pn.nspname='public'
+                   and c.oid<>p.oid""")
+    out: dict[str, set[str]] = {}
+    for child, parent in cur.fetchall():
+        out.setdefault(child, set()).add(parent)
+    return out
+
+def estimated_rows(conn: connection) -> dict[str, int]:
+    # planner estimate (pg_class.reltuples): free, unlike count(*); -1 if never analyzed
+    cur = conn.cursor()
+    cur.execute("""select c.relname, c.reltuples::bigint from pg_class c
+                   join pg_namespace n on n.oid=c.relnamespace
+                   where n.nspname='public' and c.relkind in ('r','p')""")
+    return {r[0]: r[1] for r in cur.fetchall()}
+
 def row_count(conn: connection, table: str) -> int:
     cur = conn.cursor()
     cur.execute(f'select count(*) from public."{table}"')
@@ -57,6 +57,21 @@ def upsert_map(conn: connection, table: str, v1_pk: str, v2_pk: str) -> None:
         (table, v1_pk, v2_pk))
 
 
+def upsert_map_many(conn: connection, table: str, pairs: list[tuple[str, str]]) -> None:
+    if not pairs:
+        return
+    execute_values(conn.cursor(),
+        "INSERT INTO public.sync_row_map (table_name, v1_pk, v2_pk) VALUES %s "
+        "ON CONFLICT (table_name, v1_pk) DO UPDATE SET v2_pk=EXCLUDED.v2_pk, last_run_at=now()",
+        [(table, v1, v2) for v1, v2 in pairs], page_size=len(pairs))
+
+
 def delete_map(conn: connection, table: str, v1_pk: str) -> None:
     conn.cursor().execute(
         "delete from public.sync_row_map where table_name=%s and v1_pk=%s", (table, v1_pk))
+
+
+def delete_map_many(conn: connection, table: str, v1_pks: list[str]) -> None:
+    conn.cursor().execute(
+        "delete from public.sync_row_map where table_name=%s and v1_pk = ANY(%s)",
+        (table, list(v1_pks)))
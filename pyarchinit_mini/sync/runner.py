@@ -1,6 +1,7 @@
-import logging, psycopg2
+import logging, queue, time, psycopg2
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from psycopg2.extensions import connection
-from . import introspect as I
+from . import introspect as I, rowmap as M, state as S
 from .config import Config
 from .engine import sync_table, TableResult
 
@@ -8,26 +9,91 @@ def discover_tables(src_conn: connection, tgt_conn: connection, cfg: Config) ->
     mirrored = I.base_tables(src_conn) & I.base_tables(tgt_conn)
     return sorted(mirrored - set(cfg.exclude_tables))
 
+def table_dependencies(tgt_conn: connection, names: list[str]) -> dict[str, set[str]]:
+    # FK DAG on the target (v2): a table waits for the synced tables it references
+    fks = I.foreign_keys(tgt_conn)
+    selected = set(names)
+    return {t: (fks.get(t, set()) & selected) - {t} for t in names}
+
+def run_ordered(names: list[str], deps: dict[str, set[str]], workers: int, work,
+                priority: dict[str, int] | None = None, logger=None) -> dict:
+    """Call work(name) for every table on up to `workers` threads; a table starts once
+    all its deps finished. Ready tables go biggest first (priority), so the long
+    tables start early and the small ones fill the other workers."""
+    logger = logger or logging.getLogger("sync")
+    priority = priority or {}
+    pending = {t: set(deps.get(t, ())) & set(names) - {t} for t in names}
+    running, results = {}, {}
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="sync") as pool:
+        while pending or running:
+            ready = sorted((t for t, ds in pending.items() if not ds),
+                           key=lambda t: (-priority.get(t, 0), t))
+            if not ready and not running:          # FK cycle: break it in name order
+                ready = [min(pending)]
+                logger.warning("FK cycle among %s; syncing %s first", sorted(pending), ready[0])
+            for t in ready[:max(1, workers) - len(running)]:
+                del pending[t]
+                running[pool.submit(work, t)] = t
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for f in done:
+                t = running.pop(f)
+                results[t] = f.result()
+                for ds in pending.values():
+                    ds.discard(t)
+    return results
+
 def run(cfg: Config, tables: list[str] | None = None, dry_run: bool = True, logger=None, _conns: tuple | None = None) -> list[TableResult]:
     logger = logger or logging.getLogger("sync")
+    tag = "DRY" if dry_run else "APPLY"
+    owns = _conns is None
     src, tgt = _conns or (psycopg2.connect(cfg.source_dsn), psycopg2.connect(cfg.target_dsn))
     src.autocommit = True              # source: read-only
-    owns = _conns is None
+    pairs = queue.Queue(); pairs.put((src, tgt))
+    opened = [(src, tgt)]
     try:
         names = tables if tables else discover_tables(src, tgt, cfg)
-        results = []
-        ti = tu = td = 0
-        for name in names:
-            r = sync_table(src, tgt, name, cfg, dry_run=dry_run)
-            results.append(r)
-            ti += r.inserted; tu += r.updated; td += r.deleted
-            tag = "DRY" if dry_run else "APPLY"
+        deps = table_dependencies(tgt, names)
+        size = I.estimated_rows(src)
+        # tracking tables are created once and committed here: workers creating them in
+        # their own open transactions block on each other and hit pg_type duplicates.
+        # A dry run commits nothing: while they are missing it stays on the single pair,
+        # which creates them inside each table's rolled-back transaction
+        if dry_run:
+            serial = not {"sync_row_map", "sync_state"} <= I.base_tables(tgt)
+            tgt.rollback()
+        else:
+            M.ensure_map_table(tgt); S.ensure_state_table(tgt)
+            tgt.commit()
+            serial = False
+        workers = 1 if not owns or serial else max(1, min(cfg.workers, len(names)))
+        for _ in range(workers - 1):   # one connection pair per worker
+            s, t = psycopg2.connect(cfg.source_dsn), psycopg2.connect(cfg.target_dsn)
+            s.autocommit = True
+            opened.append((s, t)); pairs.put((s, t))
+
+        def work(name):
+            s, t = pairs.get()
+            try:
+                start = time.perf_counter()
+                r = sync_table(s, t, name, cfg, dry_run=dry_run)
+                r.seconds = time.perf_counter() - start
+            finally:
+                pairs.put((s, t))
             state = "SKIP" if r.skipped else ("ERR:" + r.error if r.error else "ok")
-            logger.info("[%s] %-40s mode=%-7s +%d ~%d -%d %s",
-                        tag, name, r.mode, r.inserted, r.updated, r.deleted, state)
-        logger.info("[%s] TOTAL tables=%d +%d ~%d -%d",
-                    "DRY" if dry_run else "APPLY", len(results), ti, tu, td)
+            logger.info("[%s] %-40s mode=%-7s +%d ~%d -%d %s %.2fs %.0f rows/s",
+                        tag, name, r.mode, r.inserted, r.updated, r.deleted, state,
+                        r.seconds, r.rows_per_s)
+            return r
+
+        start = time.perf_counter()
+        done = run_ordered(names, deps, workers, work, priority=size, logger=logger)
+        results = [done[n] for n in names]
+        ti = sum(r.inserted for r in results); tu = sum(r.updated for r in results)
+        td = sum(r.deleted for r in results)
+        logger.info("[%s] TOTAL tables=%d +%d ~%d -%d %.2fs workers=%d",
+                    tag, len(results), ti, tu, td, time.perf_counter() - start, workers)
         return results
     finally:
         if owns:
-            src.close(); tgt.close()
+            for s, t in opened:
+                s.close(); t.close()
@@ -0,0 +1,82 @@
+"""Source-side change tracking — trigger-maintained log of changed primary keys."""
+import threading
+from psycopg2.extensions import connection
+
+_LOCK = threading.Lock()      # workers share one source DB; DDL is installed one table at a time
+
+
+def _ensure_log(conn: connection) -> None:
+    cur = conn.cursor()
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS public.sync_change_log (
+            table_name text NOT NULL,
+            pk text,                                    -- null: TRUNCATE, every row changed
+            txid bigint NOT NULL DEFAULT txid_current()
+        )""")
+    cur.execute("CREATE INDEX IF NOT EXISTS sync_change_log_table_txid "
+                "ON public.sync_change_log (table_name, txid)")
+    cur.execute("""
+        CREATE OR REPLACE FUNCTION public.sync_log_change() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            old_pk text; new_pk text;
+        BEGIN
+            IF TG_OP = 'TRUNCATE' THEN
+                INSERT INTO public.sync_change_log (table_name, pk) VALUES (TG_TABLE_NAME, NULL);
+                RETURN NULL;
+            END IF;
+            IF TG_OP <> 'INSERT' THEN
+                EXECUTE format('SELECT ($1).%I::text', TG_ARGV[0]) USING OLD INTO old_pk;
+            END IF;
+            IF TG_OP <> 'DELETE' THEN
+                EXECUTE format('SELECT ($1).%I::text', TG_ARGV[0]) USING NEW INTO new_pk;
+            END IF;
+            INSERT INTO public.sync_change_log (table_name, pk)
+            SELECT TG_TABLE_NAME, k FROM (SELECT DISTINCT unnest(ARRAY[old_pk, new_pk]) AS k) s
+            WHERE k IS NOT NULL;
+            RETURN NULL;
+        END $$""")
+
+
+def is_tracked(conn: connection, table: str) -> bool:
+    cur = conn.cursor()
+    cur.execute("""select 1 from pg_trigger t
+                   join pg_class c on c.oid=t.tgrelid
+                   join pg_namespace n on n.oid=c.relnamespace
+                   where n.nspname='public' and c.relname=%s and t.tgname='sync_track'""", (table,))
+    return cur.fetchone() is not None
+
+
+def ensure_tracking(conn: connection, table: str, pk: str) -> None:
+    # installs the log and the row/TRUNCATE triggers on `table`; conn must be autocommit
+    with _LOCK:
+        if is_tracked(conn, table):
+            return
+        _ensure_log(conn)
+        cur = conn.cursor()
+        cur.execute(f'CREATE TRIGGER sync_track AFTER INSERT OR UPDATE OR DELETE ON public."{table}" '
+                    "FOR EACH ROW EXECUTE PROCEDURE public.sync_log_change(%s)", (pk,))
+        cur.execute(f'CREATE TRIGGER sync_track_truncate AFTER TRUNCATE ON public."{table}" '
+                    "FOR EACH STATEMENT EXECUTE PROCEDURE public.sync_log_change()")
+
+
+def watermark(conn: connection) -> int:
+    # oldest transaction still in flight: every change logged below it is committed
+    # (or rolled back), so a run reading at this point has seen all of them
+    cur = conn.cursor()
+    cur.execute("select txid_snapshot_xmin(txid_current_snapshot())")
+    return cur.fetchone()[0]
+
+
+def changed_keys(conn: connection, table: str, since: int) -> set[str] | None:
+    # primary keys touched since the watermark; None after a TRUNCATE (diff everything)
+    cur = conn.cursor()
+    cur.execute("select distinct pk from public.sync_change_log "
+                "where table_name=%s and txid >= %s", (table, since))
+    keys = {r[0] for r in cur.fetchall()}
+    return None if None in keys else keys
+
+
+def prune(conn: connection, table: str, before: int) -> None:
+    conn.cursor().execute("delete from public.sync_change_log where table_name=%s and txid < %s",
+                          (table, before))
@@ -0,0 +1,76 @@
+"""
+Import-on-first-use helpers
+
+Used by the web app and desktop GUI for services and helpers whose
+modules pull in heavy libraries (reportlab, networkx, matplotlib,
+s3dgraphy/pandas) that most requests and sessions never need.
+"""
+
+import importlib
+import threading
+from typing import Any, Callable
+
+
+def import_string(target: str) -> Any:
+    """
+    Import an object from a ``'package.module:name'`` path
+
+    Args:
+        target: Module path and attribute name separated by a colon
+    """
+    module_name, _, name = target.partition(':')
+    module = importlib.import_module(module_name)
+    return getattr(module, name) if name else module
+
+
+class LazyObject:
+    """
+    Proxy that builds its target on first attribute access
+
+    The factory runs once (thread-safely); afterwards every attribute
+    read and write is forwarded to the built object.
+    """
+
+    def __init__(self, factory: Callable[[], Any], name: str = ''):
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_name', name)
+        object.__setattr__(self, '_target', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    def _resolve(self) -> Any:
+        target = object.__getattribute__(self, '_target')
+        if target is None:
+            with object.__getattribute__(self, '_lock'):
+                target = object.__getattribute__(self, '_target')
+                if target is None:
+                    target = object.__getattribute__(self, '_factory')()
+                    object.__setattr__(self, '_target', target)
+        return target
+
+    @property
+    def is_loaded(self) -> bool:
+        return object.__getattribute__(self, '_target') is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._resolve(), name, value)
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        if self.is_loaded:
+            return repr(self._resolve())
+        return f"<LazyObject {object.__getattribute__(self, '_name') or 'unloaded'}>"
+
+
+def lazy_instance(target: str, *args, **kwargs) -> LazyObject:
+    """
+    Proxy for ``Class(*args, **kwargs)``, importing ``target`` on first use
+
+    Args:
+        target: ``'package.module:Class'``
+    """
+    return LazyObject(lambda: import_string(target)(*args, **kwargs), name=target)
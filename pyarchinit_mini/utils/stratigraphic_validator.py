@@ -5,7 +5,6 @@ Validates stratigraphic relationships to detect logical paradoxes
 """
 
 from typing import Dict, List, Set, Tuple, Optional
-import networkx as nx
 from ..utils.exceptions import ValidationError
 
 class StratigraphicValidator:
@@ -196,10 +195,14 @@ class StratigraphicValidator:
     ]
     
     def __init__(self):
+        # networkx is imported on first use: this module is loaded with the
+        # US service at package import, long before any validation runs
+        import networkx as nx
         self.graph = nx.DiGraph()
         self.relationships = {}
         self.units = {}
         self.periodization = {}  # Map of (site, area, us) -> period data
+        self.cycle_report = []  # Cyclic components found by validate_sequence
         
     def add_unit(self, us_number: int, unit_data: Dict) -> None:
         """Add a stratigraphic unit"""
@@ -460,12 +463,15 @@ class StratigraphicValidator:
 
     def validate_sequence(self) -> List[str]:
         """Validate the entire stratigraphic sequence for cycles"""
+        import networkx as nx
         errors = []
 
-        # Check for cycles (temporal paradoxes)
+        # Check for cycles (temporal paradoxes): one entry per strongly
+        # connected component, found in linear time on any sequence size
         try:
-            cycles = list(nx.simple_cycles(self.graph))
-            for cycle in cycles:
+            self.cycle_report = self.get_cycle_report()
+            for component in self.cycle_report:
+                cycle = component['cycle']
                 cycle_str = " → ".join(str(us) for us in cycle + [cycle[0]])
                 errors.append(f"Temporal paradox (cycle): {cycle_str}")
         except nx.NetworkXError:
@@ -473,6 +479,17 @@ class StratigraphicValidator:
 
         return errors
         
+    def get_cycle_report(self) -> List[Dict]:
+        """
+        Get cyclic components of the sequence with suggested fixes
+
+        Returns:
+            List of dicts with 'nodes', 'cycle' and 'feedback_arcs' (the
+            relationships suggested for removal, least certain first)
+        """
+        from ..harris_matrix.graph_algorithms import analyze_cycles
+        return analyze_cycles(self.graph)
+
     def validate_all(self, us_list: List[Dict], periodization_list: Optional[List[Dict]] = None) -> List[str]:
         """
         Validate all stratigraphic relationships
@@ -15,13 +15,13 @@ from wtforms import StringField, TextAreaField, IntegerField, SelectField, FileF
 from wtforms.validators import DataRequired, Optional
 from werkzeug.utils import secure_filename
 import tempfile
-import base64
 from sqlalchemy import text
 
 # PyArchInit-Mini imports
 from pyarchinit_mini import __version__
 from pyarchinit_mini.database.connection import DatabaseConnection
 from pyarchinit_mini.database.manager import DatabaseManager
+from pyarchinit_mini.database.pagination import DEFAULT_COUNT_MAX_AGE
 from pyarchinit_mini.services.site_service import SiteService
 from pyarchinit_mini.services.us_service import USService
 from pyarchinit_mini.services.inventario_service import InventarioService
@@ -32,11 +32,12 @@ from pyarchinit_mini.services.relationship_sync_service import RelationshipSyncS
 from pyarchinit_mini.services.datazione_service import DatazioneService
 from pyarchinit_mini.services.media_service import MediaService
 from pyarchinit_mini.services.import_export_service import ImportExportService
-from pyarchinit_mini.harris_matrix.matrix_generator import HarrisMatrixGenerator
 # MatrixVisualizer and PyArchInitMatrixVisualizer are lazy-loaded on first use
-# (matplotlib import is very slow; defer until Harris Matrix is actually accessed)
+# (matplotlib import is very slow; defer until Harris Matrix is actually accessed).
+# HarrisMatrixGenerator (networkx) and PDFGenerator (reportlab) are built on
+# first use through lazy_instance proxies in create_app().
+from pyarchinit_mini.utils.lazy import lazy_instance
 from pyarchinit_mini.utils.stratigraphic_validator import StratigraphicValidator
-from pyarchinit_mini.pdf_export.pdf_generator import PDFGenerator
 from pyarchinit_mini.media_manager.media_handler import MediaHandler
 from pyarchinit_mini.graphml_converter import convert_dot_content_to_graphml
 from pyarchinit_mini.graphproj.auto_regen import _trigger_graph_regen
@@ -538,16 +539,21 @@ def create_app():
     analytics_service = AnalyticsService(db_manager)
     relationship_sync_service = RelationshipSyncService(db_manager)
     datazione_service = DatazioneService(db_manager)
-    matrix_generator = HarrisMatrixGenerator(db_manager, us_service)  # Pass us_service for proper matrix generation
+    matrix_generator = lazy_instance('pyarchinit_mini.harris_matrix.matrix_generator:HarrisMatrixGenerator',
+                                     db_manager, us_service)  # Pass us_service for proper matrix generation
     export_import_service = ImportExportService(db_manager.connection.connection_string)
     from pyarchinit_mini.services.export_import_service import ExportImportService
     csv_excel_service = ExportImportService(db_manager)
     from pyarchinit_mini.services.search_service import UniversalSearchService
     search_service = UniversalSearchService(db_manager)
+    from pyarchinit_mini.services.suggest_service import SuggestionService
+    suggestion_service = SuggestionService(db_manager)
+    from pyarchinit_mini.services.facet_service import FacetService
+    facet_service = FacetService(db_manager)
     from pyarchinit_mini.services.tma_service import TMAService
     tma_service = TMAService(db_manager)
     # matrix_visualizer and graphviz_visualizer are declared at module level
-    pdf_generator = PDFGenerator()
+    pdf_generator = lazy_instance('pyarchinit_mini.pdf_export.pdf_generator:PDFGenerator')
     media_handler = MediaHandler()
     media_service = MediaService(db_manager, media_handler)
 
@@ -652,6 +658,41 @@ def create_app():
         except Exception:
             # Return empty list if thesaurus not available
             return [('', '-- Seleziona --')]
+
+    def cursor_listing(endpoint, size, fetch_page, fetch_offset, count):
+        """
+        Keyset-paginated list view helper
+
+        The first page and ``?cursor=`` pages use ``fetch_page(cursor)``
+        (constant cost per page); an explicit ``?page=N`` without cursor
+        falls back to ``fetch_offset(page)`` and ``count()``.
+
+        Returns:
+            (items, template context with total, page, first_url, next_url)
+        """
+        from pyarchinit_mini.utils.exceptions import ValidationError as CursorError
+        args = request.args.to_dict()
+        page = request.args.get('page', 1, type=int)
+        cursor = args.pop('cursor', None)
+        args.pop('page', None)
+        context = {'page': page, 'first_url': url_for(endpoint, **args),
+                   'next_url': None, 'total_estimated': False}
+        if cursor or page <= 1:
+            try:
+                result = fetch_page(cursor)
+            except CursorError:
+                # Stale or tampered cursor: back to the first page
+                result = fetch_page(None)
+                context['page'] = page = 1
+            if result.next_cursor:
+                context['next_url'] = url_for(endpoint, cursor=result.next_cursor, page=page + 1, **args)
+            context.update(total=result.total, total_estimated=result.total_estimated)
+            return result.items, context
+        items = fetch_offset(page)
+        context['total'] = count()
+        if page * size < context['total']:
+            context['next_url'] = url_for(endpoint, page=page + 1, **args)
+        return items, context
     
     # Routes
     @app.route('/')
@@ -661,26 +702,17 @@ def create_app():
         try:
             # Get basic statistics
             sites = site_service.get_all_sites(size=5)
-            total_sites = site_service.count_sites()
-            total_us = us_service.count_us()
-            total_inventory = inventario_service.count_inventario()
-            try:
-                total_media = media_service.count_media()
-            except Exception:
-                total_media = 0
-            try:
-                from pyarchinit_mini.services.pottery_service import PotteryService
-                total_pottery = PotteryService(db_manager).count_pottery()
-            except Exception:
-                total_pottery = 0
+            # Precomputed totals (see AnalyticsService.get_dashboard_totals)
+            totals = analytics_service.get_dashboard_totals()
 
             stats = {
-                'total_sites': total_sites,
-                'total_us': total_us,
-                'total_inventory': total_inventory,
-                'total_media': total_media,
-                'total_pottery': total_pottery,
-                'recent_sites': sites
+                'total_sites': totals['total_sites'],
+                'total_us': totals['total_us'],
+                'total_inventory': totals['total_inventario'],
+                'total_media': totals['total_media'],
+                'total_pottery': totals['total_pottery'],
+                'recent_sites': sites,
+                'freshness': totals['freshness']
             }
 
             return render_template('dashboard.html', stats=stats)
@@ -708,17 +740,30 @@ def create_app():
         query = request.args.get('q', '').strip()
         if len(query) < 2:
             return jsonify([])
-        results = search_service.search_all(query, limit_per_table=5)
-        suggestions = []
-        for s in results.get('sites', []):
-            suggestions.append({'type': 'site', 'label': s.get('sito', ''), 'sub': s.get('comune', ''), 'url': url_for('sites_list') + f"?search={s.get('sito', '')}"})
-        for u in results.get('us', []):
-            suggestions.append({'type': 'us', 'label': f"US {u.get('us', '')} - {u.get('sito', '')}", 'sub': u.get('d_stratigrafica', ''), 'url': url_for('us_list') + f"?sito={u.get('sito', '')}&us_number={u.get('us', '')}"})
-        for m in results.get('materials', []):
-            suggestions.append({'type': 'material', 'label': f"Inv. {m.get('numero_inventario', '')} - {m.get('sito', '')}", 'sub': m.get('tipo_reperto', ''), 'url': url_for('inventario_list')})
-        for p in results.get('users', []):
-            suggestions.append({'type': 'user', 'label': p.get('full_name', p.get('username', '')), 'sub': p.get('role', ''), 'url': url_for('auth.users')})
-        return jsonify(suggestions[:15])
+        suggestions = suggestion_service.suggest(query)
+        if suggestions is None:
+            # Index over its memory ceiling: query the database instead
+            results = search_service.search_all(query, limit_per_table=5)
+            suggestions = []
+            for s in results.get('sites', []):
+                suggestions.append({'type': 'site', 'label': s.get('sito', ''), 'sub': s.get('comune', ''), 'sito': s.get('sito', '')})
+            for u in results.get('us', []):
+                suggestions.append({'type': 'us', 'label': f"US {u.get('us', '')} - {u.get('sito', '')}", 'sub': u.get('d_stratigrafica', ''), 'sito': u.get('sito', ''), 'us': u.get('us', '')})
+            for m in results.get('materials', []):
+                suggestions.append({'type': 'material', 'label': f"Inv. {m.get('numero_inventario', '')} - {m.get('sito', '')}", 'sub': m.get('tipo_reperto', '')})
+            for p in results.get('users', []):
+                suggestions.append({'type': 'user', 'label': p.get('full_name', p.get('username', '')), 'sub': p.get('role', '')})
+        urls = {
+            'site': lambda s: url_for('sites_list') + f"?search={s.get('sito', '')}",
+            'us': lambda s: url_for('us_list') + f"?sito={s.get('sito', '')}&us_number={s.get('us', '')}",
+            'material': lambda s: url_for('inventario_list'),
+            'user': lambda s: url_for('auth.users'),
+        }
+        suggestions = [
+            {'type': s['type'], 'label': s['label'], 'sub': s['sub'], 'url': urls[s['type']](s)}
+            for s in suggestions[:15]
+        ]
+        return jsonify(suggestions)
 
     @app.route('/analytics')
     @login_required
@@ -746,34 +791,16 @@ def create_app():
         else:
             sites = site_service.get_all_sites(page=page, size=per_page)
 
-        total = site_service.count_sites()
+        total = site_service.count_sites(max_age=DEFAULT_COUNT_MAX_AGE)
         import math
         total_pages = math.ceil(total / per_page) if per_page > 0 else 1
 
-        # Count US and Inventario per site using raw SQL for compatibility
+        # Count US and Inventario per site (materialized facets)
         site_counts = {}
         if sites:
             try:
-                from sqlalchemy import text as sa_text
-                with db_manager.connection.get_session() as session:
-                    # Get all US counts grouped by sito
-                    try:
-                        us_rows = session.execute(sa_text(
-                            "SELECT sito, COUNT(*) as cnt FROM us_table GROUP BY sito"
-                        )).fetchall()
-                        us_counts = {row[0]: row[1] for row in us_rows}
-                    except Exception:
-                        us_counts = {}
-
-                    # Get all Inventario counts grouped by sito
-                    try:
-                        inv_rows = session.execute(sa_text(
-                            "SELECT sito, COUNT(*) as cnt FROM inventario_materiali_table GROUP BY sito"
-                        )).fetchall()
-                        inv_counts = {row[0]: row[1] for row in inv_rows}
-                    except Exception:
-                        inv_counts = {}
-
+                us_counts = facet_service.counts('us_table', 'sito')
+                inv_counts = facet_service.counts('inventario_materiali_table', 'sito')
                 for s in sites:
                     site_counts[s.sito] = {
                         'us': us_counts.get(s.sito, 0),
@@ -948,8 +975,6 @@ def create_app():
     def us_list():
         from flask import session
 
-        page = request.args.get('page', 1, type=int)
-
         # Advanced filters
         sito_filter = request.args.get('sito', '')
         area_filter = request.args.get('area', '')
@@ -984,24 +1009,19 @@ def create_app():
         }
 
         per_page = request.args.get('per_page', 50, type=int)
-        us_list = us_service.get_all_us(page=page, size=per_page, filters=filters)
-        total = us_service.count_us(filters=filters)
-
-        # Get sites for filter dropdown (need all sites)
-        sites = site_service.get_all_sites(size=10000)
-
-        # Get distinct values for filters
-        with db_manager.connection.get_session() as db_session:
-            from pyarchinit_mini.models.us import US as USModel
-            from sqlalchemy import distinct
-
-            areas = db_session.query(distinct(USModel.area)).filter(USModel.area.isnot(None), USModel.area != '').all()
-            areas = sorted([a[0] for a in areas if a[0]])
-
-            unit_types = ['US', 'USM', 'VSF', 'SF', 'CON', 'USD', 'USVA', 'USVB', 'USVC', 'DOC', 'TU', 'property', 'Combiner', 'Extractor']
+        us_list, pager = cursor_listing(
+            'us_list', per_page,
+            lambda cursor: us_service.get_us_page(cursor=cursor, size=per_page, filters=filters),
+            lambda page: us_service.get_all_us(page=page, size=per_page, filters=filters),
+            lambda: us_service.count_us(filters=filters, max_age=DEFAULT_COUNT_MAX_AGE),
+        )
 
-            years = db_session.query(distinct(USModel.anno_scavo)).filter(USModel.anno_scavo.isnot(None)).all()
-            years = sorted([y[0] for y in years if y[0]], reverse=True)
+        # Filter dropdowns from the materialized facets
+        sites = facet_service.values('site_table', 'sito')
+        us_facets = facet_service.get_facets('us_table')
+        areas = [value for value, _ in us_facets['area']]
+        unit_types = ['US', 'USM', 'VSF', 'SF', 'CON', 'USD', 'USVA', 'USVB', 'USVC', 'DOC', 'TU', 'property', 'Combiner', 'Extractor']
+        years = [value for value, _ in reversed(us_facets['anno_scavo']) if value]
 
         return render_template('us/list.html',
                              us_list=us_list,
@@ -1009,15 +1029,14 @@ def create_app():
                              areas=areas,
                              unit_types=unit_types,
                              years=years,
-                             total=total,
-                             page=page,
                              sito_filter=sito_filter,
                              area_filter=area_filter,
                              unita_tipo_filter=unita_tipo_filter,
                              anno_scavo_filter=anno_scavo_filter,
                              periodo_filter=periodo_filter,
                              fase_filter=fase_filter,
-                             us_number_filter=us_number_filter)
+                             us_number_filter=us_number_filter,
+                             **pager)
     
     @app.route('/us/create', methods=['GET', 'POST'])
     @login_required
@@ -1535,7 +1554,6 @@ def create_app():
     @app.route('/inventario')
     @login_required
     def inventario_list():
-        page = request.args.get('page', 1, type=int)
         sito_filter = request.args.get('sito', '')
         tipo_filter = request.args.get('tipo', '')
         
@@ -1545,11 +1563,15 @@ def create_app():
         if tipo_filter:
             filters['tipo_reperto'] = tipo_filter
         
-        inventory_list = inventario_service.get_all_inventario(page=page, size=20, filters=filters)
-        total = inventario_service.count_inventario(filters=filters)
+        inventory_list, pager = cursor_listing(
+            'inventario_list', 20,
+            lambda cursor: inventario_service.get_inventario_page(cursor=cursor, size=20, filters=filters),
+            lambda page: inventario_service.get_all_inventario(page=page, size=20, filters=filters),
+            lambda: inventario_service.count_inventario(filters=filters, max_age=DEFAULT_COUNT_MAX_AGE),
+        )
 
         # Get options for filters
-        sites = site_service.get_all_sites(size=10000)
+        sites = facet_service.values('site_table', 'sito')
 
         # Build set of inventory IDs that have media attached (single query)
         media_ids = set()
@@ -1566,9 +1588,9 @@ def create_app():
                 media_ids = {r[0] for r in rows}
 
         return render_template('inventario/list.html', inventory_list=inventory_list,
-                             sites=sites, total=total, page=page,
+                             sites=sites,
                              sito_filter=sito_filter, tipo_filter=tipo_filter,
-                             media_ids=media_ids)
+                             media_ids=media_ids, **pager)
     
     @app.route('/inventario/create', methods=['GET', 'POST'])
     @login_required
@@ -1841,14 +1863,9 @@ def create_app():
         """Harris Matrix - auto-selects best visualizer based on graph size"""
         try:
             print(f"🔵 [DEBUG] Starting harris_matrix for site: {site_name}")
-            # Generate matrix
-            graph = matrix_generator.generate_matrix(site_name)
-            print(f"🔵 [DEBUG] Graph generated with {len(graph.nodes())} nodes")
-            print(f"🔵 [DEBUG] Getting matrix levels...")
-            levels = matrix_generator.get_matrix_levels(graph)
-            print(f"🔵 [DEBUG] Getting matrix statistics...")
-            stats = matrix_generator.get_matrix_statistics(graph)
-            print(f"🔵 [DEBUG] Stats retrieved, preparing to render...")
+            # Generate matrix (levels and statistics come from the shared matrix cache)
+            graph, levels, stats = matrix_generator.get_cached_matrix(site_name)
+            print(f"🔵 [DEBUG] Graph ready with {len(graph.nodes())} nodes, preparing to render...")
 
             num_nodes = len(graph.nodes())
             print(f"🔵 [DEBUG] Checking graph size: {num_nodes} nodes")
@@ -1874,11 +1891,11 @@ def create_app():
                 if matrix_visualizer is None:
                     from pyarchinit_mini.harris_matrix.matrix_visualizer import MatrixVisualizer
                     matrix_visualizer = MatrixVisualizer()
-                matrix_image = matrix_visualizer.render_matplotlib(graph, levels)
+                image_key = matrix_visualizer.render_matplotlib_cached(graph, levels)
 
                 return render_template('harris_matrix/view.html',
                                      site_name=site_name,
-                                     matrix_image=matrix_image,
+                                     matrix_image_url=url_for('harris_matrix_render', key=image_key),
                                      stats=stats,
                                      levels=levels,
                                      visualizer='matplotlib')
@@ -1895,9 +1912,7 @@ def create_app():
             grouping = request.args.get('grouping', 'period_area')
 
             # Generate matrix
-            graph = matrix_generator.generate_matrix(site_name)
-            levels = matrix_generator.get_matrix_levels(graph)
-            stats = matrix_generator.get_matrix_statistics(graph)
+            graph, levels, stats = matrix_generator.get_cached_matrix(site_name)
 
             # Generate visualization with Graphviz (lazy-load on first use)
             global graphviz_visualizer
@@ -1909,7 +1924,8 @@ def create_app():
                 current_lang = get_locale()
             except Exception:
                 current_lang = 'it'
-            output_path = graphviz_visualizer.create_matrix(
+            # Rendered PNGs are content-addressed: an unchanged matrix is served from disk
+            image_key = graphviz_visualizer.render_cached(
                 graph,
                 grouping=grouping,
                 settings={
@@ -1918,18 +1934,11 @@ def create_app():
                     'lang': current_lang
                 }
             )
-
-            # Read image and encode to base64
-            with open(output_path, 'rb') as f:
-                image_data = base64.b64encode(f.read()).decode('utf-8')
-
-            # Clean up temp file
-            if os.path.exists(output_path):
-                os.remove(output_path)
+            matrix_image_url = url_for('harris_matrix_render', key=image_key) if image_key else None
 
             return render_template('harris_matrix/view_graphviz.html',
                                  site_name=site_name,
-                                 matrix_image=image_data,
+                                 matrix_image_url=matrix_image_url,
                                  stats=stats,
                                  levels=levels,
                                  visualizer='graphviz',
@@ -1941,6 +1950,21 @@ def create_app():
             flash(f'Errore generazione Harris Matrix Graphviz: {str(e)}', 'error')
             return redirect(url_for('sites_list'))
 
+    @app.route('/harris_matrix/render/<key>.png')
+    def harris_matrix_render(key):
+        """Serve a rendered Harris Matrix image from the render cache"""
+        from pyarchinit_mini.harris_matrix.render_cache import get_render_cache
+        render_cache = get_render_cache()
+        if not render_cache.is_valid_key(key):
+            abort(404)
+        path = render_cache.get(key)
+        if path is None:
+            abort(404)
+        # Content-addressed: the same URL always returns the same image
+        response = send_file(str(path), mimetype='image/png', max_age=31536000)
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+        return response
+
     # GraphML Export routes
     @app.route('/harris_matrix/graphml_export', methods=['GET', 'POST'])
     @login_required
@@ -1966,7 +1990,7 @@ def create_app():
                 # 4. Converts to GraphML with proper TableNode Rows
 
                 # First generate the Harris Matrix graph
-                graph = matrix_generator.generate_matrix(site_name)
+                graph, _, _ = matrix_generator.get_cached_matrix(site_name)
 
                 import tempfile
                 with tempfile.NamedTemporaryFile(mode='w', suffix='.graphml', delete=False) as f:
@@ -2028,7 +2052,7 @@ def create_app():
                 return redirect(url_for('us_list'))
 
             # Generate matrix for the site
-            graph = matrix_generator.generate_matrix(site_name)
+            graph, _, _ = matrix_generator.get_cached_matrix(site_name)
 
             # If filters are active (beyond site), filter the graph nodes
             if any([filters.get('area'), filters.get('unita_tipo'), filters.get('anno_scavo'), filters.get('us_number')]):
@@ -2139,9 +2163,9 @@ def create_app():
     def validate_stratigraphic(site_name):
         """Validate stratigraphic relationships for a site"""
         try:
-            # Get all US for the site
+            # Get all US for the site (streamed, no row cap)
             filters = {'sito': site_name}
-            us_list = us_service.get_all_us(size=1000, filters=filters)
+            us_list = list(us_service.iter_us(filters=filters))
 
             # Initialize validator
             validator = StratigraphicValidator()
@@ -2228,19 +2252,14 @@ def create_app():
             # Get validation report with chronological validation
             report = validator.get_validation_report(us_list_dicts, periodization_list)
 
-            # Extract cycles from errors
-            cycles = []
-            non_cycle_errors = []
-            for error in report.get('errors', []):
-                if 'cycle' in error.lower() or 'ciclo' in error.lower():
-                    # Extract cycle from error message
-                    # Format: "Temporal paradox (cycle): 1 → 2 → 3 → 1"
-                    if '→' in error:
-                        cycle_part = error.split(':')[-1].strip()
-                        cycle_us = [us.strip() for us in cycle_part.split('→')]
-                        cycles.append(cycle_us[:-1])  # Remove duplicate last element
-                else:
-                    non_cycle_errors.append(error)
+            # Cycles come from the validator's SCC report (one per cyclic
+            # component, with the relationships suggested for removal)
+            cycles = [[str(us) for us in component['cycle']] for component in validator.cycle_report]
+            cycle_fixes = [component['feedback_arcs'] for component in validator.cycle_report]
+            non_cycle_errors = [
+                error for error in report.get('errors', [])
+                if 'cycle' not in error.lower() and 'ciclo' not in error.lower()
+            ]
 
             # Generate relationship fixes to find missing reciprocals
             fixes = validator.generate_relationship_fixes(us_list_dicts)
@@ -2290,6 +2309,7 @@ def create_app():
                                  stats=stats,
                                  errors=non_cycle_errors,
                                  cycles=cycles,
+                                 cycle_fixes=cycle_fixes,
                                  missing_reciprocals=missing_reciprocals)
 
         except Exception as e:
@@ -2447,8 +2467,7 @@ def create_app():
             matrix_img = None
             matrix_stats = None
             try:
-                graph = matrix_generator.generate_matrix(site_name)
-                matrix_stats = matrix_generator.get_matrix_statistics(graph)
+                graph, _, matrix_stats = matrix_generator.get_cached_matrix(site_name)
                 global graphviz_visualizer
                 if graphviz_visualizer is None:
                     from pyarchinit_mini.harris_matrix.pyarchinit_visualizer import PyArchInitMatrixVisualizer
@@ -2499,8 +2518,7 @@ def create_app():
         """Export site PDF with integrated Harris Matrix"""
         try:
             # Generate Harris Matrix image
-            graph = matrix_generator.generate_matrix(site_name)
-            stats = matrix_generator.get_matrix_statistics(graph)
+            graph, _, stats = matrix_generator.get_cached_matrix(site_name)
 
             # Create temporary file for matrix image (lazy-load graphviz_visualizer)
             global graphviz_visualizer
@@ -4026,7 +4044,8 @@ def create_app():
             analytics_service = AnalyticsService(db_manager)
             relationship_sync_service = RelationshipSyncService(db_manager)
             datazione_service = DatazioneService(db_manager)
-            matrix_generator = HarrisMatrixGenerator(db_manager, us_service)
+            matrix_generator = lazy_instance('pyarchinit_mini.harris_matrix.matrix_generator:HarrisMatrixGenerator',
+                                             db_manager, us_service)
             export_import_service = ImportExportService(db_manager.connection.connection_string)
             from pyarchinit_mini.services.export_import_service import ExportImportService
             csv_excel_service = ExportImportService(db_manager)
@@ -4096,6 +4115,16 @@ def create_app():
         sites = site_service.get_all_sites(size=10000)
         return jsonify([{'id': s.id_sito, 'name': s.sito} for s in sites])
 
+    @app.route('/api/harris_matrix/cache_stats')
+    @login_required
+    def api_harris_matrix_cache_stats():
+        """Hit/miss counters of the shared Harris Matrix caches (monitoring)"""
+        from pyarchinit_mini.harris_matrix.matrix_cache import matrix_cache
+        from pyarchinit_mini.harris_matrix.render_cache import get_render_cache
+        stats = matrix_cache.stats()
+        stats['render_cache'] = get_render_cache().stats()
+        return jsonify(stats)
+
     # ===== Sites Map =====
 
     @app.route('/sites/map')
@@ -6,7 +6,6 @@ from flask import Blueprint, abort, g, render_template, request, send_file, sess
 from pyarchinit_mini.graphproj.filesystem import paradata_dir, slugify
 from pyarchinit_mini.graphproj.exceptions import GraphMLReadError, IngestStaleError
 from pyarchinit_mini.graphml_io.reader import read_graphml
-from pyarchinit_mini.graphproj.ingestor import GraphIngestor
 
 graph_bp = Blueprint("graph", __name__, url_prefix="/sites")
 
@@ -59,6 +58,8 @@ def import_preview(site: str):
     db_session = getattr(g, "db_session", None)
     if db_session is None:
         return "No DB session bound", 500
+    # Imported on first use: the ingestor pulls in s3dgraphy (and pandas)
+    from pyarchinit_mini.graphproj.ingestor import GraphIngestor
     ingestor = GraphIngestor(db_session, site)
     plan = ingestor.preview(graph)
 
@@ -88,6 +89,7 @@ def import_apply(site: str):
         return ("Plan not found in session", 404)
 
     from pyarchinit_mini.graphproj.ingest_plan import IngestPlan, NodePlanEntry
+    from pyarchinit_mini.graphproj.ingestor import GraphIngestor
 
     def _r(entries):
         return tuple(NodePlanEntry(**e) for e in entries)
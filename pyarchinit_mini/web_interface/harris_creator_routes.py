@@ -26,8 +26,7 @@ logger = logging.getLogger(__name__)
 from pyarchinit_mini.services.relationship_sync_service import RelationshipSyncService
 from pyarchinit_mini.config.em_node_config_manager import get_config_manager
 from pyarchinit_mini.vocab.provider import VocabProvider
-from pyarchinit_mini.graphml_io.writer import write_graphml
-from pyarchinit_mini.graphproj.projector import GraphProjector
+from pyarchinit_mini.harris_matrix.matrix_cache import invalidate_matrix_cache
 
 # Create Blueprint
 harris_creator_bp = Blueprint('harris_creator', __name__, url_prefix='/harris-creator')
@@ -371,6 +370,7 @@ def save_matrix():
 
             # Explicitly commit all changes
             db.commit()
+            invalidate_matrix_cache(db_manager, site_name)
 
             # Spec 2: auto-regen stratigraphy.graphml after Harris Creator save.
             # Best-effort; _trigger_graph_regen already catches its own errors.
@@ -426,6 +426,9 @@ def export_matrix(format):
             if format == 'graphml':
                 # Build s3dgraphy.Graph via GraphProjector then write with
                 # graphml_io.writer (bypasses the GraphMLBuilder.to_string bug).
+                # Imported here: s3dgraphy is slow to import.
+                from pyarchinit_mini.graphml_io.writer import write_graphml
+                from pyarchinit_mini.graphproj.projector import GraphProjector
                 graph = GraphProjector.populate_graph(db, site_name)
 
                 if not graph.nodes:
@@ -453,7 +456,7 @@ def export_matrix(format):
                     us_service = USService(db_manager)
                     generator = HarrisMatrixGenerator(db_manager, us_service)
 
-                nx_graph = generator.generate_matrix(site_name)
+                nx_graph, _, _ = generator.get_cached_matrix(site_name)
 
                 if not nx_graph or nx_graph.number_of_nodes() == 0:
                     return jsonify({'success': False, 'message': 'No nodes found for this site'}), 404
@@ -7,6 +7,7 @@
     if (!input || !dropdown) return;
 
     let debounceTimer = null;
+    let pendingRequest = null;
     let activeIndex = -1;
     const typeIcons = {
         site: 'fas fa-map-marker-alt text-primary',
@@ -29,8 +30,8 @@
     input.addEventListener('input', function() {
         clearTimeout(debounceTimer);
         const q = input.value.trim();
-        if (q.length < 2) { hideDropdown(); return; }
-        debounceTimer = setTimeout(() => fetchSuggestions(q), 300);
+        if (q.length < 2) { cancelPending(); hideDropdown(); return; }
+        debounceTimer = setTimeout(() => fetchSuggestions(q), 150);
     });
 
     // Close on click outside
@@ -71,14 +72,28 @@
         activeIndex = -1;
     }
 
+    // Only the latest query's response may render: abort superseded requests
+    function cancelPending() {
+        if (pendingRequest) {
+            pendingRequest.abort();
+            pendingRequest = null;
+        }
+    }
+
     function fetchSuggestions(q) {
-        fetch('/api/search/suggest?q=' + encodeURIComponent(q))
+        cancelPending();
+        const controller = new AbortController();
+        pendingRequest = controller;
+        fetch('/api/search/suggest?q=' + encodeURIComponent(q), { signal: controller.signal })
             .then(r => r.json())
             .then(data => {
+                if (pendingRequest === controller) pendingRequest = null;
                 if (!data.length) { hideDropdown(); return; }
                 renderSuggestions(data, q);
             })
-            .catch(() => hideDropdown());
+            .catch(err => {
+                if (err.name !== 'AbortError') hideDropdown();
+            });
     }
 
     function renderSuggestions(items, query) {
@@ -15,16 +15,12 @@ import asyncio
 from datetime import datetime
 from typing import Dict, Any, Optional
 
-from pyarchinit_mini.mcp_server.graphml_parser import GraphMLParser
-from pyarchinit_mini.mcp_server.proxy_generator import ProxyGenerator
 from pyarchinit_mini.mcp_server.blender_client import BlenderClient, BlenderConnectionError
 from pyarchinit_mini.mcp_server.event_stream import get_event_stream
 from pyarchinit_mini.models.extended_matrix import ExtendedMatrix
 from pyarchinit_mini.models.site import Site
 from pyarchinit_mini.models.us import US
-from pyarchinit_mini.harris_matrix.matrix_generator import HarrisMatrixGenerator
 from pyarchinit_mini.services.command_parser import CommandParser
-from pyarchinit_mini.services.mcp_executor import get_executor
 from pyarchinit_mini.graphproj.auto_regen import _trigger_graph_regen
 
 logger = logging.getLogger(__name__)
@@ -107,10 +103,12 @@ def generate_graphml_for_site(db_session, site_name: str) -> Optional[str]:
         logger.info(f"Auto-generating GraphML for site: {site_name}")
 
         # Get matrix generator from current_app
-        matrix_generator = HarrisMatrixGenerator(current_app.db_manager)
+        from pyarchinit_mini.harris_matrix.matrix_generator import HarrisMatrixGenerator
+        from pyarchinit_mini.services.us_service import USService
+        matrix_generator = HarrisMatrixGenerator(current_app.db_manager, USService(current_app.db_manager))
 
         # Generate Harris Matrix graph
-        graph = matrix_generator.generate_matrix(site_name)
+        graph, _, _ = matrix_generator.get_cached_matrix(site_name)
         has_relationships = graph and graph.number_of_edges() > 0
 
         if not graph or graph.number_of_nodes() == 0:
@@ -314,7 +312,9 @@ def generate_3d_model():
             else:
                 graphml_filepath = graphml_record.filepath
 
-            # Load GraphML parser
+            # Load GraphML parser (networkx-based, imported on first build)
+            from pyarchinit_mini.mcp_server.graphml_parser import GraphMLParser
+            from pyarchinit_mini.mcp_server.proxy_generator import ProxyGenerator
             parser = GraphMLParser(db_session)
             if not parser.load_graphml(graphml_filepath):
                 return jsonify({
@@ -473,7 +473,8 @@ def chat_command():
         session_id = data.get('session_id')
         site_id = data.get('site_id')
 
-        # Initialize parser and executor
+        # Initialize parser and executor (the MCP tools load on first command)
+        from pyarchinit_mini.services.mcp_executor import get_executor
         parser = CommandParser()
         database_url = current_app.config.get('DATABASE_URL')
         executor = get_executor(database_url)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark BlenderClient throughput in commands per second.
+
+Starts a local FakeBlenderServer and sends the same create_proxy
+commands one round trip at a time (``send_command``) and pipelined
+(``send_many``). ``--latency`` holds back every response to simulate
+the network hop to a remote Blender.
+
+Usage:
+    python scripts/benchmark_blender_client.py
+    python scripts/benchmark_blender_client.py --commands 5000 --latency 0.002
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from pyarchinit_mini.mcp_server.blender_client import BlenderClient
+from pyarchinit_mini.mcp_server.fake_blender import FakeBlenderServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--commands", type=int, default=2000, help="Commands per run")
+    parser.add_argument("--latency", type=float, nargs="+", default=[0.0, 0.001],
+                        help="Response delays to simulate (seconds)")
+    args = parser.parse_args()
+
+    print(f"{'latency':>9}  {'mode':<12} {'commands/s':>12}")
+    for latency in args.latency:
+        with FakeBlenderServer(latency=latency) as server:
+            with BlenderClient(host=server.host, port=server.port, max_retries=1) as client:
+                commands = [
+                    ("create_proxy", client._proxy_params(f"proxy_{i}", (i, 0.0, 0.0), (1.0, 1.0, 0.3)))
+                    for i in range(args.commands)
+                ]
+
+                # Sequential runs are capped at ~2 s of round trips
+                limit = max(1, int(2 / latency)) if latency else len(commands)
+                sequential = commands[:limit]
+                start = time.perf_counter()
+                for command_type, params in sequential:
+                    client.send_command(command_type, params)
+                rate = len(sequential) / (time.perf_counter() - start)
+                print(f"{latency * 1000:>7.1f}ms  {'sequential':<12} {rate:>12,.0f}")
+
+                start = time.perf_counter()
+                client.send_many(commands)
+                rate = len(commands) / (time.perf_counter() - start)
+                print(f"{latency * 1000:>7.1f}ms  {'pipelined':<12} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
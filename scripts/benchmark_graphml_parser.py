@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark the MCP GraphMLParser on a large site.
+
+Writes a synthetic GraphML (default 5k US nodes, ~3 edges each) and a
+matching SQLite site, then times ``load_graphml`` (which builds the
+US-id index), per-US relationship lookups for every node and the
+whole-site ``get_all_us_with_graphml``.
+
+Usage:
+    python scripts/benchmark_graphml_parser.py
+    python scripts/benchmark_graphml_parser.py --us 10000 --edges 4
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import networkx as nx
+
+from pyarchinit_mini.database.connection import DatabaseConnection
+from pyarchinit_mini.mcp_server.graphml_parser import GraphMLParser, RELATIONSHIP_TYPES
+from pyarchinit_mini.models.site import Site
+from pyarchinit_mini.models.us import US
+
+SITE = "Benchmark Site"
+
+
+def build_graphml(path: str, num_us: int, edges_per_us: int, seed: int = 42):
+    """Write a DAG of num_us 'US N' nodes (edges always point to older US)"""
+    rng = random.Random(seed)
+    graph = nx.DiGraph()
+    for i in range(1, num_us + 1):
+        graph.add_node(f"n{i}", label=f"US {i}")
+    for i in range(2, num_us + 1):
+        for target in rng.sample(range(1, i), min(edges_per_us, i - 1)):
+            graph.add_edge(f"n{i}", f"n{target}", relationship=rng.choice(RELATIONSHIP_TYPES[::2]))
+    nx.write_graphml(graph, path)
+    return graph
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--us", type=int, default=5000, help="Number of US nodes")
+    parser.add_argument("--edges", type=int, default=3, help="Outgoing edges per US")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        graphml_path = os.path.join(tmp, "site.graphml")
+        graph = build_graphml(graphml_path, args.us, args.edges)
+        print(f"GraphML: {graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges")
+
+        conn = DatabaseConnection.sqlite(os.path.join(tmp, "bench.db"))
+        conn.create_tables()
+        with conn.engine.begin() as c:
+            c.execute(Site.__table__.insert(), [{"sito": SITE}])
+            c.execute(US.__table__.insert(),
+                      [{"sito": SITE, "area": "1", "us": str(i), "unita_tipo": "US"}
+                       for i in range(1, args.us + 1)])
+
+        with conn.get_session() as session:
+            graphml_parser = GraphMLParser(session)
+            start = time.perf_counter()
+            graphml_parser.load_graphml(graphml_path)
+            loaded = time.perf_counter()
+            for us_id in range(1, args.us + 1):
+                graphml_parser.get_relationships_for_us(us_id)
+            looked_up = time.perf_counter()
+            records = graphml_parser.get_all_us_with_graphml()
+            done = time.perf_counter()
+
+        print(f"{'load + index':<28} {loaded - start:8.3f} s")
+        print(f"{'relationships, every US':<28} {looked_up - loaded:8.3f} s")
+        print(f"{'get_all_us_with_graphml':<28} {done - looked_up:8.3f} s  ({len(records)} US)")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark Harris Matrix relationship loading.
+
+Builds a synthetic SQLite site (default 10k US / 40k relationships) and
+compares the legacy ``CAST(... AS TEXT)`` join used by
+``HarrisMatrixGenerator._get_relationships`` with the indexed loader
+(``HarrisMatrixGenerator._load_table_relationships``).
+
+Usage:
+    python scripts/benchmark_harris_relationships.py
+    python scripts/benchmark_harris_relationships.py --us 5000 --edges 20000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sqlalchemy import text
+
+from pyarchinit_mini.database.connection import DatabaseConnection
+from pyarchinit_mini.database.manager import DatabaseManager
+from pyarchinit_mini.harris_matrix.matrix_generator import HarrisMatrixGenerator
+from pyarchinit_mini.models.harris_matrix import USRelationships
+from pyarchinit_mini.models.site import Site
+from pyarchinit_mini.models.us import US
+
+SITE = "Benchmark Site"
+
+LEGACY_QUERY = text("""
+    SELECT DISTINCT
+        r.us_from, r.us_to, r.relationship_type,
+        u_to.unita_tipo as target_unita_tipo,
+        u_to.d_interpretativa as target_d_interpretativa,
+        u_to.periodo_iniziale as target_periodo_iniziale,
+        u_to.fase_iniziale as target_fase_iniziale
+    FROM us_relationships_table r
+    INNER JOIN us_table u_from ON r.sito = u_from.sito AND CAST(r.us_from AS TEXT) = CAST(u_from.us AS TEXT)
+    INNER JOIN us_table u_to ON r.sito = u_to.sito AND CAST(r.us_to AS TEXT) = CAST(u_to.us AS TEXT)
+    WHERE r.sito = :site
+""")
+
+
+def populate(conn: DatabaseConnection, num_us: int, num_edges: int, seed: int = 42):
+    """Fill the database with one site, num_us US and num_edges relationships"""
+    rng = random.Random(seed)
+    with conn.engine.begin() as c:
+        c.execute(Site.__table__.insert(), [{"sito": SITE}])
+        c.execute(
+            US.__table__.insert(),
+            [{"sito": SITE, "area": str(i % 10), "us": str(i), "unita_tipo": "US",
+              "d_interpretativa": "strato", "periodo_iniziale": "1", "fase_iniziale": "1"}
+             for i in range(1, num_us + 1)]
+        )
+        edges = set()
+        while len(edges) < num_edges:
+            a = rng.randint(1, num_us - 1)
+            b = rng.randint(a + 1, min(num_us, a + 50))
+            edges.add((a, b))
+        c.execute(
+            USRelationships.__table__.insert(),
+            [{"sito": SITE, "us_from": a, "us_to": b, "relationship_type": "Copre"}
+             for a, b in edges]
+        )
+
+
+def timed(label, func, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"  {label:<40} {best * 1000:10.1f} ms  ({len(result)} rows)")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--us", type=int, default=10000, help="Number of US rows")
+    parser.add_argument("--edges", type=int, default=40000, help="Number of relationships")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best time is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = DatabaseConnection.sqlite(os.path.join(tmp, "bench.db"))
+        conn.create_tables()
+        db_manager = DatabaseManager(conn)
+        generator = HarrisMatrixGenerator(db_manager)
+
+        print(f"Populating synthetic site: {args.us} US, {args.edges} relationships")
+        populate(conn, args.us, args.edges)
+
+        def legacy():
+            with conn.get_session() as session:
+                return session.execute(LEGACY_QUERY, {"site": SITE}).fetchall()
+
+        # The CAST join cannot use any index, so it is timed once only
+        print("Without relationship indexes:")
+        legacy_time = timed("legacy CAST join", legacy, 1)
+        timed("normalized-key loader", lambda: generator._load_table_relationships(SITE), args.repeat)
+
+        db_manager.migrations.migrate_relationship_indexes()
+        print("With relationship indexes:")
+        new_time = timed("normalized-key loader", lambda: generator._load_table_relationships(SITE), args.repeat)
+
+        print(f"Speedup (legacy unindexed / new indexed): {legacy_time / new_time:.1f}x")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark OFFSET vs keyset (cursor) pagination of the US list.
+
+Builds a synthetic SQLite database (default 100k US) and times reading
+pages at increasing depth with ``USService.get_all_us`` (OFFSET/LIMIT)
+and ``USService.get_us_page`` (keyset cursor), plus the cost of the
+page total with and without the count cache.
+
+Usage:
+    python scripts/benchmark_pagination.py
+    python scripts/benchmark_pagination.py --us 20000 --size 100
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from pyarchinit_mini.database.connection import DatabaseConnection
+from pyarchinit_mini.database.manager import DatabaseManager
+from pyarchinit_mini.models.site import Site
+from pyarchinit_mini.models.us import US
+from pyarchinit_mini.services.us_service import USService
+
+
+def populate(conn: DatabaseConnection, num_us: int):
+    with conn.engine.begin() as c:
+        c.execute(Site.__table__.insert(), [{"sito": "Bench"}])
+        c.execute(US.__table__.insert(), [
+            {"sito": "Bench", "area": "1", "us": str(i)} for i in range(1, num_us + 1)
+        ])
+
+
+def timed(func, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--us", type=int, default=100000, help="Number of US")
+    parser.add_argument("--size", type=int, default=50, help="Page size")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = DatabaseConnection.sqlite(os.path.join(tmp, "bench.db"))
+        conn.create_tables()
+        print(f"Populating: {args.us} US")
+        populate(conn, args.us)
+        db_manager = DatabaseManager(conn)
+        db_manager.migrations.migrate_pagination_indexes()
+        service = USService(db_manager)
+
+        # Walk the whole listing once with cursors, remembering where each page starts
+        last_page = (args.us + args.size - 1) // args.size
+        depths = sorted({1, 10, 100, last_page // 2, last_page})
+        cursors = {1: None}
+        cursor, page = None, 1
+        start = time.perf_counter()
+        while True:
+            result = service.get_us_page(cursor=cursor, size=args.size)
+            if not result.has_more:
+                break
+            cursor, page = result.next_cursor, page + 1
+            if page in depths:
+                cursors[page] = cursor
+        walk = time.perf_counter() - start
+        print(f"Keyset walk of {page} pages: {walk:.2f}s ({walk / page * 1000:.2f} ms/page)")
+
+        print(f"  {'page':>6}  {'OFFSET':>10}  {'keyset':>10}")
+        for depth in depths:
+            offset_ms = timed(lambda: service.get_all_us(page=depth, size=args.size))
+            keyset_ms = timed(lambda: db_manager.get_page(
+                US, cursor=cursors[depth], limit=args.size, order_by='us', with_total=False))
+            print(f"  {depth:>6}  {offset_ms:8.2f}ms  {keyset_ms:8.2f}ms")
+
+        exact_ms = timed(lambda: service.count_us())
+        cached_ms = timed(lambda: service.count_us(max_age=60))
+        print(f"Total: COUNT {exact_ms:.2f} ms, cached {cached_ms:.3f} ms")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
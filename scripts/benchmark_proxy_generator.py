@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark 3D proxy generation against site size.
+
+For each US count, writes a synthetic GraphML plus a matching SQLite
+site and times ``ProxyGenerator.generate_all_proxies`` for grid and
+force-directed positioning: the first build (topology, depth levels and
+layout computed) and a second build of the same GraphML (layout served
+from the cache).
+
+Usage:
+    python scripts/benchmark_proxy_generator.py
+    python scripts/benchmark_proxy_generator.py --sizes 500 1000 2000 4000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from benchmark_graphml_parser import SITE, build_graphml
+
+from pyarchinit_mini.database.connection import DatabaseConnection
+from pyarchinit_mini.mcp_server.graphml_parser import GraphMLParser
+from pyarchinit_mini.mcp_server.proxy_generator import ProxyGenerator, clear_layout_cache
+from pyarchinit_mini.models.site import Site
+from pyarchinit_mini.models.us import US
+
+
+def time_build(conn, graphml_path, us_ids, positioning):
+    """Seconds for one generate_all_proxies call (GraphML load excluded)"""
+    with conn.get_session() as session:
+        parser = GraphMLParser(session)
+        parser.load_graphml(graphml_path)
+        start = time.perf_counter()
+        proxies = ProxyGenerator(parser, positioning=positioning).generate_all_proxies(us_ids, "bench")
+        elapsed = time.perf_counter() - start
+    assert len(proxies) == len(us_ids)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 500, 1000, 2000],
+                        help="US counts to benchmark")
+    parser.add_argument("--edges", type=int, default=3, help="Outgoing edges per US")
+    args = parser.parse_args()
+
+    print(f"{'US':>6}  {'positioning':<15} {'first build':>12} {'cached':>10}")
+    for num_us in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            graphml_path = os.path.join(tmp, "site.graphml")
+            build_graphml(graphml_path, num_us, args.edges)
+            conn = DatabaseConnection.sqlite(os.path.join(tmp, "bench.db"))
+            conn.create_tables()
+            with conn.engine.begin() as c:
+                c.execute(Site.__table__.insert(), [{"sito": SITE}])
+                c.execute(US.__table__.insert(),
+                          [{"sito": SITE, "area": "1", "us": str(i), "unita_tipo": "US"}
+                           for i in range(1, num_us + 1)])
+            us_ids = list(range(1, num_us + 1))
+
+            for positioning in ("grid", "force_directed"):
+                clear_layout_cache()
+                first = time_build(conn, graphml_path, us_ids, positioning)
+                cached = time_build(conn, graphml_path, us_ids, positioning)
+                print(f"{num_us:>6}  {positioning:<15} {first:>10.3f} s {cached:>8.3f} s")
+            conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark concurrent SQLite read/write throughput per connection profile.
+
+Runs writer and reader processes against one database file, as the web
+app, backup scheduler and MCP server do, for each SQLite profile of
+``DatabaseConnection`` ('legacy', 'default', 'performance'). Writers insert
+US rows in small transactions, readers run the kind of per-site queries
+the web interface issues. Reports operations per second and the number of
+"database is locked" errors.
+
+Usage:
+    python scripts/benchmark_sqlite_profile.py
+    python scripts/benchmark_sqlite_profile.py --writers 3 --readers 6 --seconds 10
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from pyarchinit_mini.database.connection import SQLITE_PROFILES, DatabaseConnection
+from pyarchinit_mini.models.site import Site
+from pyarchinit_mini.models.us import US
+
+SITE = "Benchmark Site"
+
+READ_QUERY = text("SELECT area, COUNT(*) FROM us_table WHERE sito = :site GROUP BY area")
+
+INSERT_QUERY = text(
+    "INSERT INTO us_table (sito, area, us, unita_tipo, created_at, updated_at, version_number) "
+    "VALUES (:site, :area, :us, 'US', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 1)"
+)
+
+
+def populate(conn: DatabaseConnection, num_us: int):
+    """Create one site with num_us US"""
+    with conn.engine.begin() as c:
+        c.execute(Site.__table__.insert(), [{"sito": SITE}])
+        c.execute(
+            US.__table__.insert(),
+            [{"sito": SITE, "area": str(i % 10), "us": str(i), "unita_tipo": "US"}
+             for i in range(1, num_us + 1)]
+        )
+
+
+def worker(role, index, db_path, profile, seconds, rows_per_tx, results):
+    """Run reads or writes until the deadline; report (ops, lock errors)"""
+    conn = DatabaseConnection.sqlite(db_path, sqlite_profile=profile)
+    ops = 0
+    locked = 0
+    counter = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        try:
+            if role == "writer":
+                with conn.engine.begin() as c:
+                    rows = []
+                    for _ in range(rows_per_tx):
+                        counter += 1
+                        rows.append({"site": SITE, "area": str(counter % 10),
+                                     "us": f"w{index}-{counter}"})
+                    c.execute(INSERT_QUERY, rows)
+            else:
+                with conn.engine.connect() as c:
+                    c.execute(READ_QUERY, {"site": SITE}).fetchall()
+            ops += 1
+        except OperationalError as e:
+            if "locked" not in str(e):
+                raise
+            locked += 1
+    conn.close()
+    results.put((role, ops, locked))
+
+
+def run_profile(profile, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        conn = DatabaseConnection.sqlite(db_path, sqlite_profile=profile)
+        conn.create_tables()
+        populate(conn, args.us)
+        conn.close()
+
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=worker, args=(role, i, db_path, profile, args.seconds,
+                                                         args.rows_per_tx, results))
+            for role, count in (("writer", args.writers), ("reader", args.readers))
+            for i in range(count)
+        ]
+        for p in processes:
+            p.start()
+        totals = {"writer": [0, 0], "reader": [0, 0]}
+        for _ in processes:
+            role, ops, locked = results.get()
+            totals[role][0] += ops
+            totals[role][1] += locked
+        for p in processes:
+            p.join()
+
+    print(f"  {profile:<12} "
+          f"writes {totals['writer'][0] / args.seconds:9.1f} tx/s  "
+          f"reads {totals['reader'][0] / args.seconds:9.1f} q/s  "
+          f"locked errors {totals['writer'][1] + totals['reader'][1]:5d}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--us", type=int, default=20000, help="Initial number of US rows")
+    parser.add_argument("--writers", type=int, default=2, help="Writer processes")
+    parser.add_argument("--readers", type=int, default=4, help="Reader processes")
+    parser.add_argument("--rows-per-tx", type=int, default=5, help="Rows inserted per write transaction")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Duration per profile")
+    parser.add_argument("--profiles", nargs="+", default=list(SQLITE_PROFILES),
+                        choices=list(SQLITE_PROFILES), help="Profiles to compare")
+    args = parser.parse_args()
+
+    print(f"{args.writers} writers, {args.readers} readers, {args.seconds:g}s per profile, "
+          f"{args.us} initial US")
+    for profile in args.profiles:
+        run_profile(profile, args)
+
+
+if __name__ == "__main__":
+    main()
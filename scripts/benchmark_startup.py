@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark cold start of the web app and the desktop GUI.
+
+Runs each entry point in a fresh interpreter with ``python -X importtime``
+and reports the total import time, the slowest top-level imports and
+which heavy optional libraries (matplotlib, pandas, s3dgraphy, reportlab,
+networkx, the MCP SDK) were loaded. It also times the ``wsgi.py`` start
+(import plus ``create_app()``) against an existing SQLite database.
+
+Usage:
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --repeat 5 --top 15
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+TARGETS = {
+    'web (wsgi)': 'pyarchinit_mini.web_interface.app',
+    'desktop (run_gui)': 'pyarchinit_mini.desktop_gui.gui_app',
+}
+
+HEAVY = ('matplotlib', 'pandas', 's3dgraphy', 'reportlab', 'networkx', 'mcp', 'graphviz')
+
+_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+WSGI_STARTUP = """
+import os, time
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join({tmp!r}, 'startup.db')
+start = time.perf_counter()
+from pyarchinit_mini.web_interface.app import create_app
+imported = time.perf_counter()
+create_app()
+print('startup', imported - start, time.perf_counter() - imported)
+"""
+
+
+def import_profile(module: str):
+    """Cumulative import time (s) of ``module`` and every imported module"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    modules = {}
+    top_level = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            cumulative = int(match.group(2)) / 1e6
+            modules[match.group(4)] = cumulative
+            if len(match.group(3)) == 3:
+                top_level.append((cumulative, match.group(4)))
+    return modules, sorted(top_level, reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per target (best is reported)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest top-level imports to list")
+    args = parser.parse_args()
+
+    for label, module in TARGETS.items():
+        try:
+            runs = [import_profile(module) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            print(f"{label:<20} not importable here: {e}")
+            continue
+        modules, top_level = min(runs, key=lambda run: run[0][module])
+        heavy = [name for name in HEAVY if name in modules]
+        print(f"{label:<20} import {modules[module]:.2f} s   heavy libraries: {', '.join(heavy) or 'none'}")
+        for cumulative, name in top_level[:args.top]:
+            print(f"    {cumulative * 1000:8.1f} ms  {name}")
+
+    # The first start creates and migrates the database; later starts are
+    # what a restarted worker pays
+    with tempfile.TemporaryDirectory() as tmp:
+        timings = []
+        for _ in range(args.repeat + 1):
+            result = subprocess.run(
+                [sys.executable, '-c', WSGI_STARTUP.format(tmp=tmp)],
+                cwd=ROOT, capture_output=True, text=True,
+            )
+            timings += [tuple(map(float, line.split()[1:])) for line in result.stdout.splitlines()
+                        if line.startswith('startup ')]
+    if len(timings) > 1:
+        imported, created = min(timings[1:], key=sum)
+        print(f"{'wsgi startup':<20} {imported + created:.2f} s "
+              f"(import {imported:.2f} s + create_app {created:.2f} s, existing database)")
+    else:
+        print(f"{'wsgi startup':<20} failed: {result.stderr.strip().splitlines()[-1:]}")
+
+
+if __name__ == "__main__":
+    main()
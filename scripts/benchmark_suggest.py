@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark /api/search/suggest latency (p50/p99).
+
+Builds a synthetic SQLite database (default 2k sites, 100k US, 200k
+inventory records) and times random typeahead prefixes answered by the
+in-memory SuggestionService index and by the database search it replaces
+(``UniversalSearchService.search_all`` with the full-text index).
+
+Usage:
+    python scripts/benchmark_suggest.py
+    python scripts/benchmark_suggest.py --us 20000 --materials 50000 --queries 500
+"""
+
+import argparse
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from pyarchinit_mini.database.connection import DatabaseConnection
+from pyarchinit_mini.database.manager import DatabaseManager
+from pyarchinit_mini.database.search_index import ensure_search_index
+from pyarchinit_mini.models.inventario_materiali import InventarioMateriali
+from pyarchinit_mini.models.site import Site
+from pyarchinit_mini.models.us import US
+from pyarchinit_mini.services.search_service import UniversalSearchService
+from pyarchinit_mini.services.suggest_service import SuggestionService
+
+NAMES = ["Volterra", "Populonia", "Vetulonia", "Roselle", "Chiusi", "Cortona", "Tarquinia",
+         "Cerveteri", "Vulci", "Veio", "Fiesole", "Arezzo", "Perugia", "Orvieto"]
+TYPES = ["Ceramica", "Anfora", "Lucerna", "Moneta", "Fibula", "Vetro", "Osso", "Bronzo"]
+
+
+def populate(conn: DatabaseConnection, num_sites: int, num_us: int, num_materials: int, seed: int = 42):
+    rng = random.Random(seed)
+    sites = [f"{rng.choice(NAMES)} {i}" for i in range(num_sites)]
+    with conn.engine.begin() as c:
+        c.execute(Site.__table__.insert(), [{"sito": s, "comune": s.split()[0]} for s in sites])
+        c.execute(US.__table__.insert(), [
+            {"sito": rng.choice(sites), "area": "1", "us": str(i), "d_stratigrafica": "Strato"}
+            for i in range(1, num_us + 1)
+        ])
+        c.execute(InventarioMateriali.__table__.insert(), [
+            {"sito": rng.choice(sites), "numero_inventario": i, "tipo_reperto": rng.choice(TYPES)}
+            for i in range(1, num_materials + 1)
+        ])
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    p50 = statistics.median(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    return p50 * 1000, p99 * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sites", type=int, default=2000, help="Number of sites")
+    parser.add_argument("--us", type=int, default=100000, help="Number of US")
+    parser.add_argument("--materials", type=int, default=200000, help="Number of inventory records")
+    parser.add_argument("--queries", type=int, default=1000, help="Number of suggest queries")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    rng = random.Random(7)
+    queries = []
+    for _ in range(args.queries):
+        word = rng.choice(NAMES + TYPES + [str(rng.randint(1, args.us))])
+        queries.append(word[:rng.randint(2, len(word))])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = DatabaseConnection.sqlite(os.path.join(tmp, "bench.db"))
+        conn.create_tables()
+        print(f"Populating: {args.sites} sites, {args.us} US, {args.materials} inventory records")
+        populate(conn, args.sites, args.us, args.materials)
+        ensure_search_index(conn.engine)
+        db_manager = DatabaseManager(conn)
+
+        suggestions = SuggestionService(db_manager)
+        start = time.perf_counter()
+        suggestions.refresh()
+        stats = suggestions.stats()
+        print(f"Index build: {time.perf_counter() - start:.2f}s, "
+              f"~{stats['bytes'] / (1024 * 1024):.1f} MB, entries {stats['entries']}")
+
+        search = UniversalSearchService(db_manager)
+        for label, func in (("in-memory index", lambda q: suggestions.suggest(q)),
+                            ("database search_all", lambda q: search.search_all(q, limit_per_table=5))):
+            samples = []
+            for q in queries:
+                t = time.perf_counter()
+                func(q)
+                samples.append(time.perf_counter() - t)
+            p50, p99 = percentiles(samples)
+            print(f"  {label:<22} p50 {p50:8.3f} ms   p99 {p99:8.3f} ms")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -31,3 +31,27 @@ def test_collision_id_base_default_and_override(tmp_path):
     f.write_text(json.dumps({"source_dsn_env": "SRC", "target_dsn_env": "TGT", "collision_id_base": 5000}))
     cfg2 = load_config(str(f), env=env)
     assert cfg2.collision_id_base == 5000
+
+def test_apply_batch_size_default_and_override(tmp_path):
+    env = {"SRC": "postgresql://x@h/c", "TGT": "postgresql://x@h/v2"}
+    f = tmp_path / "c.json"
+    f.write_text(json.dumps({"source_dsn_env": "SRC", "target_dsn_env": "TGT"}))
+    assert load_config(str(f), env=env).apply_batch_size == 5_000
+    f.write_text(json.dumps({"source_dsn_env": "SRC", "target_dsn_env": "TGT", "apply_batch_size": 250}))
+    assert load_config(str(f), env=env).apply_batch_size == 250
+
+def test_workers_default_and_override(tmp_path):
+    env = {"SRC": "postgresql://x@h/c", "TGT": "postgresql://x@h/v2"}
+    f = tmp_path / "c.json"
+    f.write_text(json.dumps({"source_dsn_env": "SRC", "target_dsn_env": "TGT"}))
+    assert load_config(str(f), env=env).workers == 4
+    f.write_text(json.dumps({"source_dsn_env": "SRC", "target_dsn_env": "TGT", "workers": 8}))
+    assert load_config(str(f), env=env).workers == 8
+
+def test_change_tracking_is_opt_in(tmp_path):
+    env = {"SRC": "postgresql://x@h/c", "TGT": "postgresql://x@h/v2"}
+    f = tmp_path / "c.json"
+    f.write_text(json.dumps({"source_dsn_env": "SRC", "target_dsn_env": "TGT"}))
+    assert load_config(str(f), env=env).change_tracking is False
+    f.write_text(json.dumps({"source_dsn_env": "SRC", "target_dsn_env": "TGT", "change_tracking": True}))
+    assert load_config(str(f), env=env).change_tracking is True
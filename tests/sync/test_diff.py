@@ -1,4 +1,25 @@
-from pyarchinit_mini.sync.diff import diff_by_hash, diff_by_keyset
+import hashlib
+from pyarchinit_mini.sync.diff import diff_by_hash, diff_by_keyset, diff_by_buckets
+
+def _md5(s):
+    return hashlib.md5(s.encode()).hexdigest()
+
+def _reader(table, fetched):
+    # in-memory twin of engine._bucket_reader over {key: hash}
+    def buckets(depth, parents):
+        out = {}
+        for k, h in table.items():
+            p = _md5(k)[:depth]
+            if parents and p[:depth - 1] not in parents:
+                continue
+            n, s = out.get(p, (0, 0))
+            out[p] = (n + 1, s + int(_md5(f"{k}|{h or ''}")[:15], 16))
+        return out
+    def rows(prefixes):
+        got = {k: h for k, h in table.items() if _md5(k)[:len(prefixes[0])] in prefixes}
+        fetched.append(len(got))
+        return got
+    return buckets, rows
 
 def test_diff_by_hash_detects_all_three():
     src = {(1,): "a", (2,): "b", (3,): "c"}      # 3 new vs target
@@ -16,3 +37,24 @@ def test_diff_by_hash_identical_is_empty():
 def test_diff_by_keyset_has_no_updates():
     d = diff_by_keyset({(1,), (2,)}, {(2,), (3,)})
     assert set(d.inserts) == {(1,)} and set(d.deletes) == {(3,)} and d.updates == []
+
+def test_diff_by_buckets_matches_full_diff_and_fetches_few_rows():
+    src = {str(i): _md5(str(i)) for i in range(20_000)}
+    tgt = dict(src)
+    src["7"] = "changed"; src["new"] = "n"; del src["123"]
+    tgt["456"] = None                                  # mapped row gone on the target
+    fetched = []
+    sb, sr = _reader(src, fetched); tb, tr = _reader(tgt, fetched)
+    d = diff_by_buckets(sb, tb, sr, tr, leaf_size=16)
+    assert d == diff_by_hash(src, tgt)
+    assert (d.inserts, d.updates, d.deletes) == (["new"], ["456", "7"], ["123"])
+    assert sum(fetched) < 200                          # only the mismatching leaf buckets
+
+def test_diff_by_buckets_unchanged_and_empty_target():
+    src = {str(i): "h" for i in range(1000)}
+    fetched = []
+    sb, sr = _reader(src, fetched)
+    assert diff_by_buckets(sb, sb, sr, sr) == diff_by_hash({}, {}) and fetched == []
+    tb, tr = _reader({}, fetched)
+    d = diff_by_buckets(sb, tb, sr, tr, leaf_size=4)
+    assert sorted(d.inserts) == sorted(src) and d.updates == d.deletes == []
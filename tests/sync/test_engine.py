@@ -142,3 +142,65 @@ def test_idempotent_on_v2_char_column(src_conn, tgt_conn, make_table):
     assert r1.inserted == 2
     r2 = sync_table(src_conn, tgt_conn, "wC", _cfg(), dry_run=False)
     assert (r2.inserted, r2.updated, r2.deleted) == (0, 0, 0)   # char padding no longer perpetual-updates
+
+def test_batched_apply_spans_several_batches(src_conn, tgt_conn, make_table):
+    # batch size 2: inserts, updates, deletes and a v2 fill column cross batch boundaries
+    make_table(src_conn, "wB", 'CREATE TABLE public."wB" (id int primary key, sito varchar(20))',
+               rows=[(i, f"S{i}") for i in range(1, 8)])
+    make_table(tgt_conn, "wB", 'CREATE TABLE public."wB" (id int primary key, sito varchar(20), '
+               'entity_uuid text NOT NULL)')
+    cfg = _cfg(); cfg.apply_batch_size = 2
+    r1 = sync_table(src_conn, tgt_conn, "wB", cfg, dry_run=False)
+    assert r1.inserted == 7
+    sc = src_conn.cursor()
+    sc.execute('update public."wB" set sito = sito || %s where id <= 3', ("x",))
+    sc.execute('delete from public."wB" where id >= 6')
+    sc.execute('insert into public."wB" values (8, %s), (9, %s)', ("S8", "S9"))
+    r2 = sync_table(src_conn, tgt_conn, "wB", cfg, dry_run=False)
+    assert (r2.inserted, r2.updated, r2.deleted) == (2, 3, 2)
+    cur = tgt_conn.cursor(); cur.execute('select id, sito, entity_uuid is not null from public."wB" order by id')
+    assert cur.fetchall() == [(1, "S1x", True), (2, "S2x", True), (3, "S3x", True), (4, "S4", True),
+                              (5, "S5", True), (8, "S8", True), (9, "S9", True)]
+    assert sorted(M.load_map(tgt_conn, "wB"), key=int) == ["1", "2", "3", "4", "5", "8", "9"]
+    r3 = sync_table(src_conn, tgt_conn, "wB", cfg, dry_run=False)
+    assert (r3.inserted, r3.updated, r3.deleted) == (0, 0, 0)
+
+def test_bucketed_diff_finds_sparse_changes(src_conn, tgt_conn, make_table):
+    # leaf size 4 over 2000 rows: the diff has to descend several bucket levels
+    ddl = 'CREATE TABLE public."wM" (id int primary key, sito varchar(20))'
+    make_table(src_conn, "wM", ddl, rows=[(i, f"S{i}") for i in range(1, 2001)])
+    make_table(tgt_conn, "wM", ddl)
+    cfg = _cfg(); cfg.diff_leaf_size = 4
+    assert sync_table(src_conn, tgt_conn, "wM", cfg, dry_run=False).inserted == 2000
+    sc = src_conn.cursor()
+    sc.execute('update public."wM" set sito = %s where id in (17, 1500)', ("X",))
+    sc.execute('delete from public."wM" where id = 999')
+    sc.execute('insert into public."wM" values (2001, %s)', ("NEW",))
+    tgt_conn.cursor().execute('delete from public."wM" where id = 42')   # mapped row lost in v2
+    tgt_conn.commit()
+    r = sync_table(src_conn, tgt_conn, "wM", cfg, dry_run=False)
+    assert (r.inserted, r.updated, r.deleted) == (1, 3, 1)
+    cur = tgt_conn.cursor(); cur.execute('select sito from public."wM" where id in (17, 42, 1500) order by id')
+    assert cur.fetchall() == [("X",), ("S42",), ("X",)]
+    r2 = sync_table(src_conn, tgt_conn, "wM", cfg, dry_run=False)
+    assert (r2.inserted, r2.updated, r2.deleted) == (0, 0, 0)
+
+def test_change_tracking_skips_unchanged_and_diffs_delta(src_conn, tgt_conn, make_table):
+    ddl = 'CREATE TABLE public."wT" (id int primary key, sito varchar(20))'
+    make_table(src_conn, "wT", ddl, rows=[(1, "A"), (2, "B"), (3, "C")])
+    make_table(tgt_conn, "wT", ddl)
+    cfg = _cfg(); cfg.change_tracking = True
+    assert sync_table(src_conn, tgt_conn, "wT", cfg, dry_run=False).inserted == 3   # installs triggers
+    assert sync_table(src_conn, tgt_conn, "wT", cfg, dry_run=False).skipped is True
+    sc = src_conn.cursor()
+    sc.execute('update public."wT" set sito = %s where id = 1', ("A2",))   # in-place: count/max unchanged
+    sc.execute('delete from public."wT" where id = 2')
+    sc.execute('insert into public."wT" values (4, %s)', ("D",))
+    r = sync_table(src_conn, tgt_conn, "wT", cfg, dry_run=False)
+    assert (r.inserted, r.updated, r.deleted, r.skipped) == (1, 1, 1, False)
+    cur = tgt_conn.cursor(); cur.execute('select id, sito from public."wT" order by id')
+    assert cur.fetchall() == [(1, "A2"), (3, "C"), (4, "D")]
+    assert sync_table(src_conn, tgt_conn, "wT", cfg, dry_run=False).skipped is True
+    sc.execute('truncate public."wT"')                       # logged as "everything changed"
+    cfg.delete_on_empty_source = True
+    assert sync_table(src_conn, tgt_conn, "wT", cfg, dry_run=False).deleted == 3
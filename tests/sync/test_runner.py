@@ -2,7 +2,7 @@ import os, pytest
 pytestmark = pytest.mark.skipif(
     not (os.getenv("TEST_SYNC_SRC_DSN") and os.getenv("TEST_SYNC_TGT_DSN")),
     reason="needs test DBs")
-from pyarchinit_mini.sync.runner import discover_tables, run
+from pyarchinit_mini.sync.runner import discover_tables, run, table_dependencies
 from pyarchinit_mini.sync.config import Config
 
 def test_discover_excludes_system_and_target_only(src_conn, tgt_conn, make_table):
@@ -21,3 +21,30 @@ def test_run_filtered_apply(src_conn, tgt_conn, make_table):
     results = run(cfg, tables=["w_run"], dry_run=False,
                   _conns=(src_conn, tgt_conn))  # test hook
     assert results[0].inserted == 1
+
+def test_fk_dependencies_and_timing(src_conn, tgt_conn, make_table):
+    for conn in (src_conn, tgt_conn):
+        make_table(conn, "w_parent", 'CREATE TABLE public."w_parent"(id int primary key)')
+        make_table(conn, "w_child", 'CREATE TABLE public."w_child"(id int primary key, '
+                   'parent_id int references public."w_parent"(id))')
+    src_conn.cursor().execute('insert into public."w_parent" values (1)')
+    src_conn.cursor().execute('insert into public."w_child" values (1, 1)')
+    assert table_dependencies(tgt_conn, ["w_child", "w_parent"]) == {"w_child": {"w_parent"}, "w_parent": set()}
+    cfg = Config(source_dsn="x", target_dsn="x")
+    results = run(cfg, tables=["w_child", "w_parent"], dry_run=False, _conns=(src_conn, tgt_conn))
+    assert [(r.table, r.inserted, r.error) for r in results] == [("w_child", 1, None), ("w_parent", 1, None)]
+    assert all(r.seconds > 0 for r in results)
+
+def test_dry_run_commits_no_tracking_tables(src_conn, tgt_conn, make_table):
+    ddl = 'CREATE TABLE public."w_dry"(id int primary key, sito varchar(20))'
+    make_table(src_conn, "w_dry", ddl, rows=[(1, "A")])
+    make_table(tgt_conn, "w_dry", ddl, rows=[])
+    tgt_conn.cursor().execute("DROP TABLE IF EXISTS public.sync_row_map, public.sync_state")
+    tgt_conn.commit()
+    cfg = Config(source_dsn="x", target_dsn="x")
+    results = run(cfg, tables=["w_dry"], dry_run=True, _conns=(src_conn, tgt_conn))
+    assert results[0].inserted == 1
+    tgt_conn.rollback()
+    cur = tgt_conn.cursor()
+    cur.execute("select to_regclass('public.sync_row_map'), to_regclass('public.sync_state')")
+    assert cur.fetchone() == (None, None)
@@ -0,0 +1,35 @@
+import threading, time
+from pyarchinit_mini.sync.runner import run_ordered
+
+def _recorder(durations):
+    lock = threading.Lock()
+    log, active = [], [0, 0]          # (event, table); [current, peak] concurrency
+    def work(name):
+        with lock:
+            log.append(("start", name)); active[0] += 1; active[1] = max(active[1], active[0])
+        time.sleep(durations.get(name, 0.01))
+        with lock:
+            log.append(("end", name)); active[0] -= 1
+        return name.upper()
+    return work, log, active
+
+def test_dependents_wait_for_parents_and_pool_is_bounded():
+    deps = {"us": {"site"}, "inventario": {"site", "us"}, "site": set(), "a": set(), "b": set(), "c": set()}
+    work, log, active = _recorder({"site": 0.05})
+    results = run_ordered(list(deps), deps, workers=3, work=work)
+    assert results == {t: t.upper() for t in deps}
+    assert active[1] == 3
+    pos = {event: i for i, event in enumerate(log)}
+    assert pos[("end", "site")] < pos[("start", "us")] < pos[("end", "us")] < pos[("start", "inventario")]
+
+def test_biggest_ready_table_starts_first():
+    work, log, _ = _recorder({})
+    run_ordered(["a", "big", "c"], {}, workers=1, work=work, priority={"big": 10_000, "a": 5})
+    assert [t for e, t in log if e == "start"] == ["big", "a", "c"]
+
+def test_fk_cycle_is_broken_in_name_order():
+    deps = {"x": {"y"}, "y": {"x"}, "z": {"x"}}
+    work, log, _ = _recorder({})
+    results = run_ordered(["x", "y", "z"], deps, workers=2, work=work)
+    assert set(results) == {"x", "y", "z"}
+    assert [t for e, t in log if e == "start"][0] == "x"
@@ -0,0 +1,101 @@
+"""
+Unit tests for the pipelined BlenderClient protocol against FakeBlenderServer
+"""
+
+import pytest
+
+from pyarchinit_mini.mcp_server.blender_client import (
+    BlenderClient,
+    BlenderCommandError,
+    BlenderConnectionError,
+)
+from pyarchinit_mini.mcp_server.fake_blender import FakeBlenderServer
+
+
+@pytest.fixture
+def server():
+    with FakeBlenderServer() as server:
+        yield server
+
+
+def _client(server, **kwargs):
+    return BlenderClient(host=server.host, port=server.port, timeout=5, max_retries=1, **kwargs)
+
+
+def _proxy(index, visible=True):
+    return {
+        "proxy_id": f"proxy_us_{index}",
+        "blender_properties": {
+            "location": {"x": index, "y": 0.0, "z": 0.0},
+            "rotation": {"x": 0.0, "y": 0.0, "z": 0.0},
+            "scale": {"x": 1.0, "y": 1.0, "z": 0.3},
+            "geometry": "CUBE",
+            "material": {"name": "Roman_Generic", "base_color": [0.8, 0.2, 0.2, 1.0]},
+            "collection": "Site_Stratigraphy",
+        },
+        "visualization": {"visible": visible},
+    }
+
+
+def test_send_command_round_trip(server):
+    with _client(server) as client:
+        assert client.create_proxy("p1", (1.0, 2.0, 3.0), (1.0, 1.0, 1.0))["object_name"] == "Proxy_p1"
+        assert client.get_scene_info()["proxy_count"] == 1
+
+        with pytest.raises(BlenderCommandError, match="not found"):
+            client.set_visibility("missing", False)
+        # The connection is still usable after a command error
+        assert client.set_visibility("p1", False) == {"visible": False}
+
+
+@pytest.mark.parametrize("echo_ids", [True, False])
+def test_send_many_streams_and_keeps_order(echo_ids):
+    with FakeBlenderServer(echo_ids=echo_ids, latency=0.01) as server, _client(server, max_in_flight=8) as client:
+        commands = [("create_proxy", client._proxy_params(f"p{i}", (i, 0, 0), (1, 1, 1))) for i in range(200)]
+        responses = client.send_many(commands)
+
+        assert [response.result["proxy_id"] for response in responses] == [f"p{i}" for i in range(200)]
+        assert len(server.proxies) == 200
+
+
+def test_batch_updates_and_errors(server):
+    with _client(server) as client:
+        summary = client.build_scene([_proxy(1), _proxy(2, visible=False)])
+        assert summary == {"proxy_count": 2, "command_count": 7}
+        assert server.proxies["proxy_us_2"]["visible"] is False
+        assert server.proxies["proxy_us_1"]["collection"] == "Site_Stratigraphy"
+
+        client.apply_materials([
+            {"proxy_id": "proxy_us_1", "material_name": "Medieval", "base_color": (0.4, 0.4, 0.5, 1.0)},
+        ])
+        assert server.proxies["proxy_us_1"]["material"] == "Medieval"
+
+        with pytest.raises(BlenderCommandError, match="1 of 3"):
+            client.set_visibilities({"proxy_us_1": False, "missing": True, "proxy_us_2": True})
+        # Every command of the batch ran, including those after the failure
+        assert server.proxies["proxy_us_2"]["visible"] is True
+
+        responses = client.send_many([("unknown_command", {})], raise_on_error=False)
+        assert responses[0].status == "error"
+
+
+def test_pending_commands_fail_when_connection_closes(server):
+    client = _client(server)
+    client.connect()
+    client.disconnect()
+    with pytest.raises(BlenderConnectionError):
+        client.send_async("get_scene_info", {})
+
+    with FakeBlenderServer(latency=5.0) as slow, _client(slow) as slow_client:
+        future = slow_client.send_async("get_scene_info", {})
+        slow_client.disconnect()
+        with pytest.raises(BlenderConnectionError):
+            future.result(timeout=1)
+
+
+def test_response_with_unknown_id_is_dropped():
+    with FakeBlenderServer(latency=0.5) as slow, _client(slow) as client:
+        future = client.send_async("get_scene_info", {})
+        client._dispatch(b'{"id": 999999, "status": "success", "result": {}}')
+        assert not future.done()
+        assert future.result(timeout=5).result["proxy_count"] == 0
@@ -1,8 +1,11 @@
 """Test bundle creation and validation."""
+import hashlib
 import os
 import tempfile
 import json
+import zipfile
 from pyarchinit_mini.stratigraph.bundle_creator import BundleCreator
+from pyarchinit_mini.stratigraph.chunk_store import ChunkStore
 from pyarchinit_mini.stratigraph.bundle_validator import validate_bundle
 
 
@@ -44,3 +47,97 @@ def test_bundle_creator_no_files_error():
         result = creator.build()
         assert result["success"] is False
         assert "No files" in result["errors"][0]
+
+
+def test_bundle_streams_files_and_stores_media_uncompressed():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_file = os.path.join(tmpdir, "db.sqlite")
+        photo = os.path.join(tmpdir, "photo.jpg")
+        with open(data_file, "wb") as f:
+            f.write(b"\0" * 100_000)
+        with open(photo, "wb") as f:
+            f.write(os.urandom(50_000))
+
+        creator = BundleCreator(output_dir=os.path.join(tmpdir, "output"), site_name="TestSite")
+        creator.add_data_file(data_file)
+        creator.add_media_file(photo)
+        result = creator.build()
+
+        with zipfile.ZipFile(result["bundle_path"]) as zf:
+            assert zf.getinfo("data/db.sqlite").compress_type == zipfile.ZIP_DEFLATED
+            assert zf.getinfo("media/photo.jpg").compress_type == zipfile.ZIP_STORED
+            manifest = json.loads(zf.read("metadata/manifest.json"))
+        sizes = {entry["path"]: entry["size_bytes"] for entry in manifest["files"]}
+        assert sizes == {"data/db.sqlite": 100_000, "media/photo.jpg": 50_000}
+        assert validate_bundle(result["bundle_path"])["valid"] is True
+
+
+def test_delta_bundle_ships_only_unacknowledged_chunks():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_file = os.path.join(tmpdir, "db.sqlite")
+        with open(data_file, "wb") as f:
+            f.write(os.urandom(10 * 1024))
+        store = ChunkStore(os.path.join(tmpdir, "chunks.json"), chunk_size=1024)
+
+        def first_chunk(path):
+            with open(path, "rb") as f:
+                return hashlib.sha256(f.read(1024)).hexdigest()
+
+        def build():
+            creator = BundleCreator(output_dir=os.path.join(tmpdir, "output"),
+                                    site_name="TestSite", chunk_store=store)
+            creator.add_data_file(data_file)
+            result = creator.build()
+            assert validate_bundle(result["bundle_path"])["valid"] is True
+            return result
+
+        first = build()
+        assert (first["chunks_shipped"], first["chunks_reused"]) == (10, 0)
+        # Not acknowledged yet: the next bundle ships everything again
+        assert build()["chunks_shipped"] == 10
+        assert store.acknowledge(os.path.basename(first["bundle_path"]))
+
+        with open(data_file, "r+b") as f:
+            f.seek(3 * 1024 + 10)
+            f.write(b"changed")
+            f.seek(3 * 1024)
+            changed_chunk = hashlib.sha256(f.read(1024)).hexdigest()
+        second = build()
+        assert (second["chunks_shipped"], second["chunks_reused"]) == (1, 9)
+        with zipfile.ZipFile(second["bundle_path"]) as zf:
+            assert [n for n in zf.namelist() if n != "metadata/manifest.json"] == [f"chunks/{changed_chunk}"]
+
+        # Acknowledged chunks survive reloading the store
+        reloaded = ChunkStore(os.path.join(tmpdir, "chunks.json"), chunk_size=1024)
+        assert reloaded.has(first_chunk(data_file)) and not reloaded.has(changed_chunk)
+
+
+def test_delta_bundle_still_validates_uuids():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        uid = "123e4567-e89b-42d3-a456-426614174000"
+        small = os.path.join(tmpdir, "small.jsonld")
+        with open(small, "w") as f:
+            json.dump({"@graph": [{"entity_uuid": uid}, {"entity_uuid": uid}]}, f)
+        large = os.path.join(tmpdir, "large.jsonld")
+        with open(large, "w") as f:
+            json.dump({"@graph": [{"entity_uuid": "not-a-uuid", "pad": "x" * 2048}]}, f)
+        store = ChunkStore(os.path.join(tmpdir, "chunks.json"), chunk_size=1024)
+
+        def build():
+            creator = BundleCreator(output_dir=os.path.join(tmpdir, "output"),
+                                    site_name="TestSite", chunk_store=store)
+            creator.add_data_file(small)
+            creator.add_data_file(large)
+            return creator.build()
+
+        first = build()
+        with zipfile.ZipFile(first["bundle_path"]) as zf:
+            assert "data/small.jsonld" in zf.namelist()      # small files are written whole
+        codes = {e["code"] for e in validate_bundle(first["bundle_path"])["errors"]}
+        # The chunked file is reassembled when all its chunks are in the bundle
+        assert codes == {"UUID_DUPLICATE", "UUID_INVALID_FORMAT"}
+
+        store.acknowledge(os.path.basename(first["bundle_path"]))
+        second = validate_bundle(build()["bundle_path"])
+        assert [e["code"] for e in second["errors"]] == ["UUID_DUPLICATE"]
+        assert "UUID_CHECK_SKIPPED" in {w["code"] for w in second["warnings"]}
@@ -0,0 +1,99 @@
+"""
+Unit tests for the precomputed dashboard aggregates behind AnalyticsService
+"""
+
+from sqlalchemy import text
+
+from pyarchinit_mini.models.inventario_materiali import InventarioMateriali
+from pyarchinit_mini.models.site import Site
+from pyarchinit_mini.models.us import US
+from pyarchinit_mini.services.analytics_service import AnalyticsService
+from pyarchinit_mini.services.dashboard_aggregates import invalidate_dashboard_aggregates
+
+
+def _populate(db_manager):
+    db_manager.create(Site, {"sito": "Volterra", "regione": "Toscana", "provincia": "PI"})
+    db_manager.create(Site, {"sito": "Populonia", "regione": "Toscana", "provincia": "LI"})
+    db_manager.create(Site, {"sito": "Veio", "regione": "Lazio", "provincia": ""})
+    for us, tipo in (("1", "US"), ("2", "US"), ("3", "USM")):
+        db_manager.create(US, {"sito": "Volterra", "area": "1", "us": us, "unita_tipo": tipo,
+                               "periodo_iniziale": "Etrusco"})
+    db_manager.create(InventarioMateriali, {"sito": "Volterra", "numero_inventario": 1, "tipo_reperto": "Anfora"})
+
+
+def _live(service):
+    return {
+        'overview': {k: v for k, v in service.get_overview_stats().items()},
+        'sites_by_region': service.get_sites_by_region(),
+        'sites_by_province': service.get_sites_by_province(),
+        'us_by_type': service.get_us_by_type(),
+        'us_by_site': service.get_us_by_site(),
+        'us_by_period': service.get_us_by_period(),
+        'inventario_by_type': service.get_inventario_by_type(),
+    }
+
+
+def _assert_matches_live(service):
+    data = service.get_complete_dashboard_data()
+    for key, expected in _live(service).items():
+        if key == 'overview':
+            assert {k: data[key][k] for k in expected} == expected
+        else:
+            assert data[key] == expected, key
+
+
+def test_dashboard_matches_live_queries(db_manager):
+    _populate(db_manager)
+    service = AnalyticsService(db_manager)
+
+    data = service.get_complete_dashboard_data()
+    assert data['overview']['total_us'] == 3
+    assert data['overview']['total_regions'] == 2
+    assert data['sites_by_region'] == {"Toscana": 2, "Lazio": 1}
+    assert data['freshness']['reconciled_at'] is not None
+    _assert_matches_live(service)
+
+
+def test_orm_writes_update_aggregates_incrementally(db_manager):
+    _populate(db_manager)
+    service = AnalyticsService(db_manager)
+    reconciled_at = service.get_complete_dashboard_data()['freshness']['reconciled_at']
+
+    us = db_manager.create(US, {"sito": "Populonia", "area": "1", "us": "9", "unita_tipo": "USM"})
+    db_manager.update(US, us.id_us, {"unita_tipo": "US", "periodo_iniziale": "Romano"})
+    site = db_manager.get_by_field(Site, "sito", "Veio")
+    db_manager.update(Site, site.id_sito, {"regione": "Etruria"})
+    db_manager.delete(US, 1)
+
+    data = service.get_complete_dashboard_data()
+    assert data['us_by_type'] == {"US": 2, "USM": 1}
+    assert data['us_by_period'] == {"Etrusco": 2, "Romano": 1}
+    assert data['freshness']['reconciled_at'] == reconciled_at
+    assert data['freshness']['stale'] is False
+    _assert_matches_live(service)
+
+
+def test_raw_writes_are_reconciled(db_manager):
+    _populate(db_manager)
+    service = AnalyticsService(db_manager)
+    service.get_complete_dashboard_data()
+
+    with db_manager.connection.engine.begin() as conn:
+        conn.execute(text("DELETE FROM us_table WHERE unita_tipo = 'USM'"))
+    invalidate_dashboard_aggregates(db_manager.connection.engine)
+    assert service.get_dashboard_totals()['freshness']['stale'] is True
+
+    service.reconcile()
+    totals = service.get_dashboard_totals()
+    assert totals['total_us'] == 2 and totals['freshness']['stale'] is False
+    _assert_matches_live(service)
+
+
+def test_missing_tables_count_as_empty(db_manager):
+    _populate(db_manager)
+    with db_manager.connection.engine.begin() as conn:
+        conn.execute(text("DROP TABLE pottery_table"))
+
+    totals = AnalyticsService(db_manager).get_dashboard_totals()
+    assert totals["total_sites"] == 3 and totals["total_pottery"] == 0
+    assert AnalyticsService(db_manager).get_complete_dashboard_data()["pottery_by_form"] == {}
@@ -0,0 +1,89 @@
+"""
+Unit tests for the materialized list filter facets (FacetService)
+"""
+
+from sqlalchemy import text
+
+from pyarchinit_mini.database import facet_cache
+from pyarchinit_mini.database.facet_cache import STATE_TABLE, ensure_facet_cache
+from pyarchinit_mini.models.inventario_materiali import InventarioMateriali
+from pyarchinit_mini.models.site import Site
+from pyarchinit_mini.models.us import US
+from pyarchinit_mini.services.facet_service import FacetService
+
+
+def _populate(db_manager):
+    db_manager.create(Site, {"sito": "Volterra", "comune": "Volterra"})
+    db_manager.create(Site, {"sito": "Populonia", "comune": "Piombino"})
+    for us, area, anno in (("1", "A", 2019), ("2", "A", 2020), ("3", "B", 2020), ("4", "", None)):
+        db_manager.create(US, {"sito": "Volterra", "area": area, "us": us, "anno_scavo": anno})
+    db_manager.create(InventarioMateriali, {"sito": "Populonia", "numero_inventario": 1, "tipo_reperto": "Anfora"})
+
+
+def _dirty(db_manager, table):
+    with db_manager.connection.engine.connect() as conn:
+        return conn.execute(text(f"SELECT dirty FROM {STATE_TABLE} WHERE source_table = :t"),
+                            {"t": table}).scalar()
+
+
+def test_facets_values_and_counts(db_manager):
+    _populate(db_manager)
+    assert ensure_facet_cache(db_manager.connection.engine) == 3
+    service = FacetService(db_manager)
+
+    facets = service.get_facets("us_table")
+    assert facets["area"] == [("A", 2), ("B", 1)]
+    # Typed back from the cache, empty values left out
+    assert facets["anno_scavo"] == [(2019, 1), (2020, 2)]
+    assert service.values("site_table", "sito") == ["Populonia", "Volterra"]
+    assert service.counts("inventario_materiali_table", "sito") == {"Populonia": 1}
+    assert _dirty(db_manager, "us_table") == 0
+
+
+def test_writes_mark_facets_dirty(db_manager):
+    _populate(db_manager)
+    ensure_facet_cache(db_manager.connection.engine)
+    service = FacetService(db_manager)
+    service.get_facets("us_table")
+    service.get_facets("site_table")
+
+    # Raw SQL writes (e.g. another worker) are caught by the triggers too
+    with db_manager.connection.engine.begin() as conn:
+        conn.execute(text("UPDATE us_table SET area = 'C' WHERE us = '1'"))
+    assert _dirty(db_manager, "us_table") == 1
+    assert _dirty(db_manager, "site_table") == 0
+    assert service.get_facets("us_table")["area"] == [("A", 1), ("B", 1), ("C", 1)]
+
+    # Updates of non-facet columns keep the cache
+    with db_manager.connection.engine.begin() as conn:
+        conn.execute(text("UPDATE us_table SET descrizione = 'x'"))
+    assert _dirty(db_manager, "us_table") == 0
+
+    db_manager.create(Site, {"sito": "Vulci"})
+    assert service.values("site_table", "sito") == ["Populonia", "Volterra", "Vulci"]
+
+
+def test_write_during_refresh_leaves_facets_dirty(db_manager, monkeypatch):
+    _populate(db_manager)
+    ensure_facet_cache(db_manager.connection.engine)
+    compute = facet_cache.compute_facets
+
+    def compute_then_write(conn, table, columns=None):
+        facets = compute(conn, table, columns)
+        with db_manager.connection.engine.begin() as other:
+            other.execute(text("UPDATE us_table SET area = 'C' WHERE us = '1'"))
+        return facets
+
+    monkeypatch.setattr(facet_cache, "compute_facets", compute_then_write)
+    service = FacetService(db_manager)
+    assert service.get_facets("us_table")["area"] == [("A", 2), ("B", 1)]
+    assert _dirty(db_manager, "us_table") == 1
+
+    monkeypatch.setattr(facet_cache, "compute_facets", compute)
+    assert service.get_facets("us_table")["area"] == [("A", 1), ("B", 1), ("C", 1)]
+    assert _dirty(db_manager, "us_table") == 0
+
+
+def test_without_cache_tables_queries_directly(db_manager):
+    _populate(db_manager)
+    assert FacetService(db_manager).values("us_table", "area") == ["A", "B"]
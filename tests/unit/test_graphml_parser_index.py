@@ -0,0 +1,66 @@
+"""
+Unit tests for the US-id / node-id index built by GraphMLParser.load_graphml
+"""
+
+import networkx as nx
+import pytest
+
+from pyarchinit_mini.mcp_server.graphml_parser import GraphMLParser
+from pyarchinit_mini.models.site import Site
+from pyarchinit_mini.models.us import US
+
+
+@pytest.fixture
+def graphml_file(tmp_path):
+    graph = nx.DiGraph()
+    graph.add_node("n0", label="US 1")
+    graph.add_node("n1", label="US 2")
+    graph.add_node("n2", label="US 3")
+    graph.add_node("n3", label="Documento")
+    graph.add_edge("n0", "n1", relationship="covers")
+    graph.add_edge("n2", "n0", relationship="Cuts")
+    graph.add_edge("n1", "n3", relationship="covers")
+    graph.add_edge("n0", "n2", relationship="unknown")
+    path = tmp_path / "site.graphml"
+    nx.write_graphml(graph, path)
+    return str(path)
+
+
+def test_index_maps_us_to_nodes_and_relationships(graphml_file):
+    parser = GraphMLParser(db_session=None)
+    assert parser.load_graphml(graphml_file)
+
+    assert parser._find_node_by_us_id(2) == "n1"
+    assert parser._find_node_by_us_id(99) is None
+    assert parser._us_by_node == {"n0": 1, "n1": 2, "n2": 3}
+
+    relationships = parser.get_relationships_for_us(1)
+    assert relationships["covers"] == [2]
+    assert relationships["cut_by"] == [3]
+    assert parser.get_relationships_for_us(2)["covered_by"] == [1]
+    # Edges to nodes without a US label are not relationships
+    assert parser.get_relationships_for_us(2)["covers"] == []
+    assert not any(parser.get_relationships_for_us(99).values())
+
+    # Results are copies of the index
+    relationships["covers"].append(42)
+    assert parser.get_relationships_for_us(1)["covers"] == [2]
+
+
+def test_all_us_joined_by_us_number(graphml_file, temp_db):
+    with temp_db.get_session() as session:
+        session.add(Site(sito="Scavo"))
+        session.add_all([
+            US(sito="Scavo", area="1", us=str(number), unita_tipo="US") for number in (1, 2, 3)
+        ])
+
+    with temp_db.get_session() as session:
+        parser = GraphMLParser(session)
+        assert parser.load_graphml(graphml_file)
+        data = {item["us_id"]: item for item in parser.get_all_us_with_graphml()}
+
+        assert sorted(data) == [1, 2, 3]
+        assert data[2]["graphml_data"]["id"] == "n1"
+        assert data[1]["relationships"]["covers"] == [2]
+        assert data[3]["chronology"]["period_code"] == "UNK"
+        assert data[1] == parser.get_us_data_with_graphml(1)
@@ -0,0 +1,344 @@
+"""
+Unit tests for HarrisMatrixGenerator relationship loading and graph building
+"""
+
+import networkx as nx
+from sqlalchemy import inspect
+
+from pyarchinit_mini.database.migrations import DatabaseMigrations
+from pyarchinit_mini.harris_matrix.matrix_generator import HarrisMatrixGenerator
+from pyarchinit_mini.models.harris_matrix import USRelationships
+from pyarchinit_mini.models.site import Site
+from pyarchinit_mini.models.us import US
+
+
+def _populate(db_manager, us_rows, relationships, site="Scavo"):
+    db_manager.create(Site, {"sito": site})
+    for area, us_num, unita_tipo in us_rows:
+        db_manager.create(US, {"sito": site, "area": area, "us": str(us_num),
+                               "unita_tipo": unita_tipo,
+                               "periodo_iniziale": "1", "fase_iniziale": "2"})
+    for us_from, us_to, rel_type in relationships:
+        db_manager.create(USRelationships, {"sito": site, "us_from": us_from,
+                                            "us_to": us_to,
+                                            "relationship_type": rel_type})
+
+
+def test_relationship_indexes_created(db_manager):
+    migrations = DatabaseMigrations(db_manager)
+    assert migrations.migrate_relationship_indexes() == 3
+    # Idempotent
+    assert migrations.migrate_relationship_indexes() == 0
+
+    inspector = inspect(db_manager.connection.engine)
+    rel_indexes = {ix["name"]: ix["column_names"]
+                   for ix in inspector.get_indexes("us_relationships_table")}
+    us_indexes = {ix["name"]: ix["column_names"]
+                  for ix in inspector.get_indexes("us_table")}
+    assert rel_indexes["idx_us_relationships_sito_us_from"] == ["sito", "us_from"]
+    assert rel_indexes["idx_us_relationships_sito_us_to"] == ["sito", "us_to"]
+    assert us_indexes["idx_us_table_sito_us"] == ["sito", "us"]
+
+
+def test_table_relationships_join_on_normalized_keys(db_manager):
+    _populate(
+        db_manager,
+        [("A", 1, "US"), ("A", 2, "USM"), ("B", 3, "US")],
+        [(1, 2, "Copre"), (2, 3, "Taglia"), (3, 99, "Copre")],
+    )
+    generator = HarrisMatrixGenerator(db_manager)
+
+    rels = generator._load_table_relationships("Scavo")
+
+    pairs = sorted((r["us_from"], r["us_to"], r["type"]) for r in rels)
+    # US 99 does not exist, so its relationship is dropped like an INNER JOIN
+    assert pairs == [("1", "2", "copre"), ("2", "3", "taglia")]
+    by_pair = {(r["us_from"], r["us_to"]): r for r in rels}
+    assert by_pair[("1", "2")]["target_unita_tipo"] == "USM"
+    assert by_pair[("1", "2")]["target_periodo_code"] == "1-2"
+
+
+def test_table_relationships_area_filter_matches_either_endpoint(db_manager):
+    _populate(
+        db_manager,
+        [("A", 1, "US"), ("A", 2, "US"), ("B", 3, "US"), ("B", 4, "US")],
+        [(1, 2, "copre"), (2, 3, "copre"), (3, 4, "copre")],
+    )
+    generator = HarrisMatrixGenerator(db_manager)
+
+    rels = generator._load_table_relationships("Scavo", area="A")
+
+    assert sorted((r["us_from"], r["us_to"]) for r in rels) == [("1", "2"), ("2", "3")]
+
+
+def test_generate_matrix_streams_all_us_without_cap(db_manager, us_service):
+    num_us = 1500
+    with db_manager.connection.engine.begin() as conn:
+        conn.execute(Site.__table__.insert(), [{"sito": "Grande"}])
+        conn.execute(US.__table__.insert(),
+                     [{"sito": "Grande", "area": "1", "us": str(i)}
+                      for i in range(1, num_us + 1)])
+        conn.execute(USRelationships.__table__.insert(),
+                     [{"sito": "Grande", "us_from": i, "us_to": i + 1,
+                       "relationship_type": "copre"} for i in range(1, num_us)])
+    generator = HarrisMatrixGenerator(db_manager, us_service)
+    generator.stream_batch_size = 200
+
+    graph = generator.generate_matrix("Grande")
+
+    assert graph.number_of_nodes() == num_us
+    assert graph.number_of_edges() == num_us - 1
+    assert graph.has_edge("1499", "1500")
+
+
+def test_iter_us_streams_filtered_rows(us_service, db_manager):
+    _populate(db_manager, [("A", 1, "US"), ("B", 2, "US"), ("A", 3, "US")], [])
+
+    streamed = list(us_service.iter_us(filters={"sito": "Scavo", "area": "A"}, batch_size=1))
+
+    assert [u.us for u in streamed] == ["1", "3"]
+
+
+def test_matrix_levels_use_longest_path():
+    graph = nx.DiGraph([("1", "2"), ("2", "3"), ("1", "3"), ("4", "3")])
+    generator = HarrisMatrixGenerator(None)
+
+    levels = generator.get_matrix_levels(graph)
+
+    assert levels == {0: ["1", "4"], 1: ["2"], 2: ["3"]}
+
+
+def test_matrix_levels_condense_cycles():
+    graph = nx.DiGraph([("1", "2"), ("2", "3"), ("3", "2"), ("3", "4")])
+    generator = HarrisMatrixGenerator(None)
+
+    levels = generator.get_matrix_levels(graph)
+
+    assert levels == {0: ["1"], 1: ["2", "3"], 2: ["4"]}
+
+
+def test_matrix_statistics_computed_for_large_graphs():
+    graph = nx.path_graph([str(i) for i in range(2000)], create_using=nx.DiGraph)
+    graph.add_edge("1999", "1998")
+    generator = HarrisMatrixGenerator(None)
+
+    stats = generator.get_matrix_statistics(graph)
+
+    assert stats["total_us"] == 2000
+    assert stats["levels"] == 1999
+    assert stats["has_cycles"] is True
+    assert stats["cycles"] == [["1998", "1999"]]
+
+
+def test_validate_matrix_breaks_cycles_on_least_certain_edge():
+    graph = nx.DiGraph()
+    graph.add_edge("1", "2", relationship="copre", certainty="certain")
+    graph.add_edge("2", "3", relationship="copre", certainty="certain")
+    graph.add_edge("3", "1", relationship="taglia", certainty="dubbia")
+    graph.add_edge("3", "4", relationship="copre", certainty="certain")
+    generator = HarrisMatrixGenerator(None)
+
+    graph = generator._validate_matrix(graph)
+
+    assert nx.is_directed_acyclic_graph(graph)
+    assert not graph.has_edge("3", "1")
+    assert graph.number_of_edges() == 3
+    report = graph.graph["cycle_report"]
+    assert report[0]["nodes"] == ["1", "2", "3"]
+    assert report[0]["feedback_arcs"][0]["certainty"] == "dubbia"
+
+
+def test_validate_matrix_handles_large_dense_cycles():
+    # A dense cyclic graph where simple_cycles enumeration would explode
+    graph = nx.DiGraph()
+    nodes = [str(i) for i in range(600)]
+    for i, node in enumerate(nodes):
+        for step in (1, 2, 3):
+            graph.add_edge(node, nodes[(i + step) % len(nodes)], certainty="certain")
+    generator = HarrisMatrixGenerator(None)
+
+    graph = generator._validate_matrix(graph)
+
+    assert nx.is_directed_acyclic_graph(graph)
+    # Cutting the ring once removes the 1 + 2 + 3 edges that span the cut
+    assert graph.number_of_edges() == 1800 - 6
+
+
+def test_stratigraphic_validator_reports_one_cycle_per_component():
+    from pyarchinit_mini.utils.stratigraphic_validator import StratigraphicValidator
+
+    validator = StratigraphicValidator()
+    for us_num in (1, 2, 3, 4, 5):
+        validator.add_unit(us_num, {})
+    validator.add_relationship(1, 2, "copre")
+    validator.add_relationship(2, 1, "copre")
+    validator.add_relationship(3, 4, "taglia")
+    validator.add_relationship(4, 5, "taglia")
+    validator.add_relationship(5, 3, "taglia")
+
+    errors = validator.validate_sequence()
+
+    assert len(errors) == 2
+    assert all(error.startswith("Temporal paradox (cycle):") for error in errors)
+    assert [len(c["feedback_arcs"]) for c in validator.cycle_report] == [1, 1]
+
+
+def test_transitive_reduction_only_reduces_stratigraphic_edges():
+    from pyarchinit_mini.harris_matrix.transitive_reduction import TransitiveReductionEngine
+
+    graph = nx.DiGraph()
+    graph.add_edge("1", "2", relationship="copre")
+    graph.add_edge("2", "3", relationship="taglia")
+    graph.add_edge("1", "3", relationship="copre")       # implied by 1 → 2 → 3
+    graph.add_edge("1", "4", relationship="si appoggia")
+    graph.add_edge("4", "3", relationship="copre")
+    graph.add_edge("1", "5", relationship=">")
+    graph.add_edge("5", "3", relationship="riempie")
+    graph.add_edge("2", "5", relationship=">>")
+
+    removed = TransitiveReductionEngine().reduce(graph)
+
+    assert removed == 1
+    assert not graph.has_edge("1", "3")
+    # Symbolic and "si appoggia" edges are neither removed nor used as paths
+    assert graph.has_edge("1", "4") and graph.has_edge("1", "5")
+    assert graph.has_edge("4", "3") and graph.has_edge("5", "3")
+
+
+def test_transitive_reduction_matches_networkx_across_chunks():
+    from pyarchinit_mini.harris_matrix.transitive_reduction import TransitiveReductionEngine
+
+    graph = nx.gn_graph(400, seed=7).reverse()
+    graph.add_edges_from((u, w) for u, v in list(graph.edges()) for w in list(graph.successors(v)))
+    expected = set(nx.transitive_reduction(graph).edges())
+
+    TransitiveReductionEngine(chunk_size=37).reduce(graph)
+
+    assert set(graph.edges()) == expected
+
+
+def test_generate_matrix_applies_selective_reduction(db_manager, us_service):
+    _populate(
+        db_manager,
+        [("A", 1, "US"), ("A", 2, "US"), ("A", 3, "US"), ("A", 4, "US")],
+        [(1, 2, "Copre"), (2, 3, "Copre"), (1, 3, "Copre"),
+         (1, 4, "Si appoggia a"), (4, 3, "Copre")],
+    )
+    generator = HarrisMatrixGenerator(db_manager, us_service)
+
+    graph = generator.generate_matrix("Scavo")
+
+    assert not graph.has_edge("1", "3")
+    assert graph.has_edge("1", "4")
+    assert graph.number_of_edges() == 4
+
+
+def test_matrix_cache_lru_eviction_and_counters():
+    from pyarchinit_mini.harris_matrix.matrix_cache import MatrixCache, MatrixCacheEntry
+
+    cache = MatrixCache(max_entries=2)
+    entry = MatrixCacheEntry(graph=nx.DiGraph(), levels={}, statistics={})
+    cache.put("db", "A", None, entry)
+    cache.put("db", "B", None, entry)
+    assert cache.get("db", "A") is entry       # A becomes most recently used
+    cache.put("db", "C", None, entry)          # evicts B
+
+    assert cache.get("db", "B") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["evictions"] == 1
+
+    # A build that started before an invalidation is not stored
+    generation = cache.generation("db", "A")
+    assert cache.invalidate("db", "A") == 1
+    assert cache.put("db", "A", None, entry, generation) is False
+    assert cache.get("db", "A") is None
+
+
+def test_cached_matrix_invalidated_by_us_and_relationship_writes(db_manager, us_service):
+    from pyarchinit_mini.harris_matrix.matrix_cache import matrix_cache
+    from pyarchinit_mini.services.relationship_sync_service import RelationshipSyncService
+
+    _populate(db_manager, [("A", 1, "US"), ("A", 2, "US")], [(1, 2, "Copre")])
+    generator = HarrisMatrixGenerator(db_manager, us_service)
+    hits = matrix_cache.hits
+
+    graph, levels, stats = generator.get_cached_matrix("Scavo")
+    graph.add_node("scratch")                   # callers get a private copy
+    graph, _, _ = generator.get_cached_matrix("Scavo")
+
+    assert matrix_cache.hits == hits + 1
+    assert "scratch" not in graph
+    assert stats["total_relationships"] == 1 and levels == {0: ["1"], 1: ["2"]}
+
+    us_service.create_us({"sito": "Scavo", "area": "A", "us": "3", "unita_tipo": "US"})
+    graph, _, _ = generator.get_cached_matrix("Scavo")
+    assert "3" in graph
+
+    with db_manager.connection.get_session() as session:
+        RelationshipSyncService(db_manager).create_reciprocal_relationship(
+            "Scavo", 2, 3, "Copre", session=session)
+    graph, _, stats = generator.get_cached_matrix("Scavo")
+    assert graph.has_edge("2", "3")
+    assert stats["total_relationships"] == 2
+
+
+def test_cached_matrix_without_us_service_is_not_shared(db_manager, us_service):
+    _populate(db_manager, [("A", 1, "US"), ("A", 2, "US")], [(1, 2, "Copre")])
+
+    graph, _, _ = HarrisMatrixGenerator(db_manager).get_cached_matrix("Scavo")
+    assert graph.number_of_nodes() == 0
+
+    generator = HarrisMatrixGenerator(db_manager, us_service)
+    graph, levels, stats = generator.get_cached_matrix("Scavo")
+    assert graph.number_of_nodes() == 2
+    levels[0].append("scratch")
+    stats["total_us"] = 0
+    _, levels, stats = generator.get_cached_matrix("Scavo")
+    assert levels[0] == ["1"] and stats["total_us"] == 2
+
+
+def test_relationship_write_invalidates_cache_only_after_commit(db_manager, us_service):
+    from pyarchinit_mini.harris_matrix.matrix_cache import matrix_cache
+    from pyarchinit_mini.services.relationship_sync_service import RelationshipSyncService
+
+    _populate(db_manager, [("A", 1, "US"), ("A", 2, "US"), ("A", 3, "US")], [(1, 2, "Copre")])
+    generator = HarrisMatrixGenerator(db_manager, us_service)
+    service = RelationshipSyncService(db_manager)
+    generator.get_cached_matrix("Scavo")
+
+    session = db_manager.connection.SessionLocal()
+    try:
+        service.create_reciprocal_relationship("Scavo", 2, 3, "Copre", session=session)
+        hits = matrix_cache.hits
+        generator.get_cached_matrix("Scavo")          # not committed yet: still cached
+        assert matrix_cache.hits == hits + 1
+        session.rollback()
+        generator.get_cached_matrix("Scavo")          # rolled back: nothing to invalidate
+        assert matrix_cache.hits == hits + 2
+
+        service.create_reciprocal_relationship("Scavo", 2, 3, "Copre", session=session)
+        session.commit()
+    finally:
+        session.close()
+    graph, _, _ = generator.get_cached_matrix("Scavo")
+    assert matrix_cache.hits == hits + 2
+    assert graph.has_edge("2", "3")
+
+
+def test_feedback_arc_set_budget_still_breaks_every_cycle(monkeypatch):
+    from pyarchinit_mini.harris_matrix import graph_algorithms
+
+    graph = nx.gnm_random_graph(3000, 12000, seed=3, directed=True)
+    component = max(graph_algorithms.cyclic_components(graph), key=len)
+    full = graph_algorithms.feedback_arc_set(graph, component)
+
+    # No re-insertion budget at all: the greedy arcs are kept as they are
+    monkeypatch.setattr(graph_algorithms, "MINIMIZE_WORK_FACTOR", 0)
+    greedy = graph_algorithms.feedback_arc_set(graph, component)
+
+    assert len(full) <= len(greedy)
+    for arcs in (full, greedy):
+        acyclic = graph.subgraph(component).copy()
+        acyclic.remove_edges_from(arcs)
+        assert nx.is_directed_acyclic_graph(acyclic)
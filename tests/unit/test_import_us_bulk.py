@@ -0,0 +1,78 @@
+"""
+Unit tests for the batched ImportExportService.import_us pipeline
+"""
+
+from sqlalchemy import text
+
+from pyarchinit_mini.database.connection import DatabaseConnection
+from pyarchinit_mini.models.site import Site
+from pyarchinit_mini.models.us import US
+from pyarchinit_mini.services.import_export_service import ImportExportService
+
+
+def _source_db(tmp_path, rows):
+    url = f"sqlite:///{tmp_path / 'source.db'}"
+    source = DatabaseConnection(url)
+    source.create_tables()
+    with source.engine.begin() as conn:
+        conn.execute(Site.__table__.insert(), [{"sito": sito} for sito in sorted({r[0] for r in rows})])
+        conn.execute(US.__table__.insert(), [
+            {"sito": sito, "area": "1", "us": us, "rapporti": rapporti}
+            for sito, us, rapporti in rows
+        ])
+    source.close()
+    return url
+
+
+def test_import_us_batches_inserts_updates_and_relationships(tmp_path, db_manager):
+    source_url = _source_db(tmp_path, [
+        ("Scavo", str(i), f"[['Copre', '{i + 1}', '1', 'Scavo']]") for i in range(1, 26)
+    ] + [("Altro", "1", "[]")])
+    db_manager.create(Site, {"sito": "Scavo"})
+    db_manager.create(US, {"sito": "Scavo", "area": "1", "us": "3", "descrizione": "old"})
+    mini_url = db_manager.connection.connection_string
+    with db_manager.connection.engine.begin() as conn:
+        conn.execute(text("INSERT INTO us_relationships_table (sito, us_from, us_to, relationship_type, "
+                          "version_number, created_at, updated_at) VALUES ('Scavo', 1, 2, 'Copre', "
+                          "1, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"))
+
+    service = ImportExportService(mini_url, source_url)
+    stats = service.import_us(sito_filter=["Scavo"], auto_migrate=False, batch_size=10)
+
+    assert stats["imported"] == 24
+    assert stats["updated"] == 1
+    assert stats["skipped"] == 0
+    assert stats["batches"] == 3
+    assert stats["relationships_created"] == 24   # 1 -> 2 already existed
+    assert stats["rows_per_second"] > 0
+
+    with db_manager.connection.engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM us_table WHERE sito = 'Altro'")).scalar() == 0
+        ids = [r[0] for r in conn.execute(text("SELECT id_us FROM us_table"))]
+        assert len(ids) == len(set(ids)) == 25
+        assert conn.execute(text("SELECT COUNT(*) FROM us_relationships_table")).scalar() == 25
+
+    # Re-import is idempotent for relationships
+    again = service.import_us(sito_filter=["Scavo"], auto_migrate=False, batch_size=10)
+    assert again["updated"] == 25 and again["relationships_created"] == 0
+
+
+def test_import_us_isolates_failing_rows(tmp_path, db_manager):
+    source_url = _source_db(tmp_path, [("Scavo", "1", "[]"), ("Scavo", "2", "[]")])
+    db_manager.create(Site, {"sito": "Scavo"})
+    service = ImportExportService(db_manager.connection.connection_string, source_url)
+
+    original = service._map_us_fields_import
+
+    def map_fields(data):
+        mapped = original(data)
+        if data["us"] == "2":
+            mapped["version_number"] = None  # violates NOT NULL
+        return mapped
+
+    service._map_us_fields_import = map_fields
+    stats = service.import_us(auto_migrate=False, batch_size=10)
+
+    assert stats["imported"] == 1
+    assert stats["skipped"] == 1
+    assert len(stats["errors"]) == 1
@@ -0,0 +1,97 @@
+"""
+Unit tests for keyset (cursor) pagination and cached counts
+"""
+
+import pytest
+from sqlalchemy import text
+
+from pyarchinit_mini.database.pagination import decode_cursor, encode_cursor
+from pyarchinit_mini.models.inventario_materiali import InventarioMateriali
+from pyarchinit_mini.models.site import Site
+from pyarchinit_mini.models.us import US
+from pyarchinit_mini.services.inventario_service import InventarioService
+from pyarchinit_mini.services.us_service import USService
+from pyarchinit_mini.utils.exceptions import ValidationError
+
+
+def _populate(db_manager):
+    db_manager.create(Site, {"sito": "Volterra"})
+    db_manager.create(Site, {"sito": "Populonia"})
+    # Duplicate US numbers across sites exercise the primary key tie-break
+    for us in ("1", "2", "3", "10", "11"):
+        for sito in ("Volterra", "Populonia"):
+            db_manager.create(US, {"sito": sito, "area": "1", "us": us})
+
+
+def _walk(fetch):
+    pages, cursor = [], None
+    while True:
+        page = fetch(cursor)
+        pages.append(page)
+        if not page.has_more:
+            return pages
+        cursor = page.next_cursor
+
+
+def test_keyset_pages_match_offset_order(db_manager):
+    _populate(db_manager)
+    service = USService(db_manager)
+
+    pages = _walk(lambda cursor: service.get_us_page(cursor=cursor, size=3))
+    keyset = [(u.us, u.id_us) for page in pages for u in page.items]
+
+    assert [len(p.items) for p in pages] == [3, 3, 3, 1]
+    assert keyset == sorted(keyset)
+    assert len(set(keyset)) == 10
+    assert pages[0].total == 10 and not pages[0].total_estimated
+
+    filtered = _walk(lambda cursor: service.get_us_page(cursor=cursor, size=2, filters={"sito": "Volterra"}))
+    assert [u.us for p in filtered for u in p.items] == ["1", "10", "11", "2", "3"]
+    assert filtered[-1].total == 5
+
+
+def test_descending_and_primary_key_order(db_manager):
+    _populate(db_manager)
+    db_manager.create(InventarioMateriali, {"sito": "Volterra", "numero_inventario": 5})
+    db_manager.create(InventarioMateriali, {"sito": "Volterra", "numero_inventario": 7})
+    db_manager.create(InventarioMateriali, {"sito": "Volterra", "numero_inventario": 6})
+
+    pages = _walk(lambda cursor: db_manager.get_page(InventarioMateriali, cursor=cursor, limit=2,
+                                                     order_by='-numero_inventario'))
+    assert [i.numero_inventario for p in pages for i in p.items] == [7, 6, 5]
+
+    pages = _walk(lambda cursor: db_manager.get_page(US, cursor=cursor, limit=4, with_total=False))
+    ids = [u.id_us for p in pages for u in p.items]
+    assert ids == sorted(ids) and len(ids) == 10
+    assert pages[0].total is None
+
+
+def test_invalid_cursors_are_rejected(db_manager):
+    _populate(db_manager)
+    service = USService(db_manager)
+
+    with pytest.raises(ValidationError):
+        service.get_us_page(cursor="not-a-cursor")
+    # A cursor is bound to the ordering it was issued for
+    with pytest.raises(ValidationError):
+        InventarioService(db_manager).get_inventario_page(cursor=encode_cursor("us", ("1", 1)))
+    with pytest.raises(ValidationError):
+        db_manager.get_page(US, order_by="periodo_iniziale")
+
+    assert decode_cursor(encode_cursor("us", ("Città", 3)), "us") == ["Città", 3]
+
+
+def test_cached_count_follows_orm_writes(db_manager):
+    _populate(db_manager)
+    service = USService(db_manager)
+    assert service.count_us(max_age=60) == 10
+
+    db_manager.create(US, {"sito": "Volterra", "area": "1", "us": "99"})
+    assert service.count_us(max_age=60) == 11
+
+    # Raw SQL writes are only seen once the cached value is older than max_age
+    with db_manager.connection.engine.begin() as conn:
+        conn.execute(text("DELETE FROM us_table WHERE us = '99'"))
+    assert service.count_us(max_age=60) == 11
+    assert service.count_us(max_age=0) == 10
+    assert service.count_us() == 10
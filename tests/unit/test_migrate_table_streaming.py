@@ -0,0 +1,104 @@
+"""
+Unit tests for the chunked, resumable ImportExportService._migrate_table
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from pyarchinit_mini.database.connection import DatabaseConnection
+from pyarchinit_mini.services.import_export_service import ImportExportService
+
+
+def _legacy_source(tmp_path, count):
+    """Legacy-style site_table: extra columns, Italian dates, no sync columns"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'source.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE site_table (id_sito INTEGER PRIMARY KEY, sito TEXT, "
+                          "provincia TEXT, toponimo TEXT, find_check TEXT, created_at TEXT)"))
+        conn.execute(text("INSERT INTO site_table VALUES (:id, :sito, :provincia, 'x', :find_check, :created_at)"), [
+            {"id": i, "sito": f"S{i}", "provincia": "P" * 20, "find_check": "" if i % 2 else "1",
+             "created_at": "05-03-2020"}
+            for i in range(1, count + 1)
+        ])
+    return sessionmaker(bind=engine)
+
+
+def _target(tmp_path, existing=()):
+    url = f"sqlite:///{tmp_path / 'target.db'}"
+    target = DatabaseConnection(url)
+    target.create_tables()
+    with target.engine.begin() as conn:
+        for id_sito, sito in existing:
+            conn.execute(text("INSERT INTO site_table (id_sito, sito, created_at, updated_at, version_number) "
+                              "VALUES (:id, :sito, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 1)"),
+                         {"id": id_sito, "sito": sito})
+    target.close()
+    engine = create_engine(url)
+    return engine, sessionmaker(bind=engine)
+
+
+def _sites(engine):
+    with engine.connect() as conn:
+        return {r[0]: r[1] for r in conn.execute(text("SELECT id_sito, sito FROM site_table"))}
+
+
+def test_migrate_table_streams_chunks_and_coerces(tmp_path):
+    source = _legacy_source(tmp_path, 25)
+    engine, target = _target(tmp_path)
+    progress = []
+
+    copied = ImportExportService._migrate_table(
+        'site_table', source, target, chunk_size=10,
+        progress_callback=lambda *args: progress.append(args)
+    )
+
+    assert copied == 25
+    assert progress == [('site_table', 10, 25), ('site_table', 20, 25), ('site_table', 25, 25)]
+    with engine.connect() as conn:
+        row = conn.execute(text("SELECT provincia, find_check, created_at, version_number "
+                                "FROM site_table WHERE id_sito = 1")).one()
+        assert row.provincia == "P" * 10          # varchar(10) truncation
+        assert row.find_check is None             # '' on an integer column
+        assert str(row.created_at).startswith("2020-03-05")
+        assert row.version_number == 1           # NOT NULL filler
+        # Completed tables leave no checkpoint behind
+        assert conn.execute(text("SELECT COUNT(*) FROM pyarchinit_migration_checkpoints")).scalar() == 0
+
+
+@pytest.mark.parametrize("strategy, expected", [
+    ('skip', {1: "T1", 2: "T2", 3: "S3", 4: "S4"}),
+    ('overwrite', {1: "S1", 2: "S2", 3: "S3", 4: "S4"}),
+    ('renumber', {1: "T1", 2: "T2", 3: "S3", 4: "S4", 5: "S1", 6: "S2"}),
+])
+def test_migrate_table_merge_strategies(tmp_path, strategy, expected):
+    source = _legacy_source(tmp_path, 4)
+    engine, target = _target(tmp_path, existing=[(1, "T1"), (2, "T2")])
+
+    ImportExportService._migrate_table('site_table', source, target, merge_strategy=strategy, chunk_size=3)
+
+    assert _sites(engine) == expected
+
+
+def test_migrate_table_resumes_after_interruption(tmp_path):
+    source = _legacy_source(tmp_path, 25)
+    engine, target = _target(tmp_path)
+
+    def interrupt(table_name, rows_read, total_rows):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        ImportExportService._migrate_table('site_table', source, target, chunk_size=10,
+                                           progress_callback=interrupt)
+    assert len(_sites(engine)) == 10
+
+    progress = []
+    copied = ImportExportService._migrate_table(
+        'site_table', source, target, merge_strategy='overwrite', chunk_size=10,
+        progress_callback=lambda *args: progress.append(args)
+    )
+
+    # Only the rows after the checkpoint are read again
+    assert progress == [('site_table', 20, 25), ('site_table', 25, 25)]
+    assert copied == 25
+    assert sorted(_sites(engine)) == list(range(1, 26))
@@ -0,0 +1,49 @@
+"""
+Unit tests for the per-database key, registry and background refresh
+"""
+
+import threading
+
+from sqlalchemy import create_engine
+
+from pyarchinit_mini.database.per_database import BackgroundRefresh, PerDatabase, database_key
+
+
+def test_database_key_is_shared_by_every_handle(db_manager):
+    connection = db_manager.connection
+    key = database_key(connection.connection_string)
+    assert key is not None
+    assert database_key(connection.engine) == key
+    assert database_key(connection) == key
+    assert database_key(db_manager) == key
+    with connection.engine.connect() as conn:
+        assert database_key(conn) == key
+    assert database_key(object()) is None
+
+
+def test_registry_creates_once_per_database():
+    registry = PerDatabase()
+    assert registry.get("sqlite:///a.db") is None
+    first = registry.get("sqlite:///a.db", dict)
+    assert registry.get(create_engine("sqlite:///a.db"), dict) is first
+    assert registry.get("sqlite:///b.db", dict) is not first
+
+
+def test_background_refresh_runs_one_at_a_time():
+    state = BackgroundRefresh()
+    release = threading.Event()
+    done = threading.Event()
+
+    def refresh():
+        release.wait(5)
+        done.set()
+
+    assert state.refresh_in_background(refresh, "test-refresh") is True
+    assert state.refresh_in_background(refresh, "test-refresh") is False
+    release.set()
+    assert done.wait(5)
+    for _ in range(100):
+        if not state._refreshing:
+            break
+        threading.Event().wait(0.01)
+    assert state._refreshing is False
@@ -0,0 +1,72 @@
+"""
+Unit tests for the per-build site layout of ProxyGenerator
+"""
+
+import networkx as nx
+import pytest
+
+from pyarchinit_mini.mcp_server import proxy_generator
+from pyarchinit_mini.mcp_server.graphml_parser import GraphMLParser
+from pyarchinit_mini.mcp_server.proxy_generator import ProxyGenerator
+from pyarchinit_mini.models.site import Site
+from pyarchinit_mini.models.us import US
+
+US_IDS = [1, 2, 3, 4]
+
+
+@pytest.fixture
+def loaded_parser(tmp_path, temp_db):
+    graph = nx.DiGraph()
+    for us_id in US_IDS:
+        graph.add_node(f"n{us_id}", label=f"US {us_id}")
+    graph.add_edge("n1", "n2", relationship="covers")
+    graph.add_edge("n2", "n3", relationship="covers")
+    graph.add_edge("n1", "n4", relationship="cuts")
+    path = tmp_path / "site.graphml"
+    nx.write_graphml(graph, path)
+
+    with temp_db.get_session() as session:
+        session.add(Site(sito="Scavo"))
+        session.add_all([US(sito="Scavo", area="1", us=str(us_id), unita_tipo="US") for us_id in US_IDS])
+
+    proxy_generator.clear_layout_cache()
+    with temp_db.get_session() as session:
+        parser = GraphMLParser(session)
+        assert parser.load_graphml(str(path))
+        yield parser
+    proxy_generator.clear_layout_cache()
+
+
+def _count_calls(monkeypatch, obj, name):
+    calls = []
+    original = getattr(obj, name)
+    monkeypatch.setattr(obj, name, lambda *args, **kwargs: calls.append(name) or original(*args, **kwargs))
+    return calls
+
+
+@pytest.mark.parametrize("positioning", ["grid", "force_directed"])
+def test_layout_computed_once_and_matches_single_proxies(loaded_parser, monkeypatch, positioning):
+    sorts = _count_calls(monkeypatch, loaded_parser, "get_topological_order")
+    layouts = _count_calls(monkeypatch, nx, "spring_layout")
+    generator = ProxyGenerator(loaded_parser, positioning=positioning)
+
+    proxies = generator.generate_all_proxies(US_IDS + [99], "session")
+    assert [proxy.us_id for proxy in proxies] == US_IDS
+    assert len(sorts) == 1
+    assert len(layouts) == (1 if positioning == "force_directed" else 0)
+
+    for proxy in proxies:
+        assert generator.generate_proxy(proxy.us_id, "session") == proxy
+    # Later builds of the same GraphML reuse the cached layout
+    ProxyGenerator(loaded_parser, positioning=positioning).generate_all_proxies(US_IDS, "other")
+    assert len(sorts) == 1
+
+
+def test_depth_levels_drive_z(loaded_parser):
+    proxies = {proxy.us_id: proxy for proxy in ProxyGenerator(loaded_parser, positioning="grid")
+               .generate_all_proxies(US_IDS, "session")}
+    z = {us_id: proxy.blender_properties["location"]["z"] for us_id, proxy in proxies.items()}
+
+    assert z[1] > z[2] > z[3]
+    assert min(z.values()) == 0.0
+    assert proxies[1].relationships["covers"] == [2]
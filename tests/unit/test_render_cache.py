@@ -0,0 +1,73 @@
+"""
+Unit tests for the on-disk Harris Matrix render cache
+"""
+
+import os
+
+import networkx as nx
+import pytest
+
+from pyarchinit_mini.harris_matrix.render_cache import RenderCache
+
+
+def test_render_cache_renders_once_per_key(tmp_path):
+    cache = RenderCache(tmp_path)
+    calls = []
+
+    def render(path):
+        calls.append(path)
+        with open(path, "wb") as f:
+            f.write(b"png-bytes")
+
+    key = cache.make_key("graphviz", "digraph {}", "period_area", "it")
+    first = cache.get_or_render(key, render)
+    second = cache.get_or_render(key, render)
+
+    assert first == second == tmp_path / f"{key}.png"
+    assert first.read_bytes() == b"png-bytes"
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+    # No temporary files are left behind
+    assert os.listdir(tmp_path) == [f"{key}.png"]
+
+
+def test_render_cache_evicts_least_recently_used(tmp_path):
+    cache = RenderCache(tmp_path, max_bytes=25)
+    keys = [cache.make_key(i) for i in range(3)]
+
+    def render(path):
+        with open(path, "wb") as f:
+            f.write(b"x" * 10)
+
+    for age, key in enumerate(keys[:2]):
+        os.utime(cache.get_or_render(key, render), (age, age))
+    cache.get(keys[0])                 # refresh the oldest entry
+    cache.get_or_render(keys[2], render)
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+
+
+def test_render_cache_rejects_invalid_keys(tmp_path):
+    cache = RenderCache(tmp_path)
+    assert not cache.is_valid_key("../../etc/passwd")
+    with pytest.raises(ValueError):
+        cache.path_for("../secret")
+
+
+def test_matplotlib_render_cached_by_matrix_content(tmp_path):
+    from pyarchinit_mini.harris_matrix.matrix_visualizer import MatrixVisualizer
+
+    cache = RenderCache(tmp_path)
+    visualizer = MatrixVisualizer()
+    graph = nx.DiGraph([("1", "2")])
+    levels = {0: ["1"], 1: ["2"]}
+
+    key = visualizer.render_matplotlib_cached(graph, levels, cache=cache)
+    assert visualizer.render_matplotlib_cached(graph, levels, cache=cache) == key
+    assert cache.get(key).read_bytes().startswith(b"\x89PNG")
+
+    graph.add_edge("2", "3")
+    levels[2] = ["3"]
+    assert visualizer.render_matplotlib_cached(graph, levels, cache=cache) != key
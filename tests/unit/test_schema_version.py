@@ -0,0 +1,105 @@
+"""
+Unit tests for the schema fingerprint that lets migrate_all_tables skip
+unchanged databases
+"""
+
+from sqlalchemy import event, inspect, text
+
+from pyarchinit_mini.database.manager import DatabaseManager
+from pyarchinit_mini.database.schema_version import VERSION_TABLE
+from pyarchinit_mini.models.site import Site
+from pyarchinit_mini.models.us import US
+
+
+def _count_statements(engine):
+    statements = []
+    event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+    return statements
+
+
+def _recorded_runs(engine):
+    with engine.connect() as conn:
+        return conn.execute(text(f"SELECT revision, migrations_applied FROM {VERSION_TABLE} ORDER BY id")).all()
+
+
+def test_unchanged_schema_skips_migrations_in_one_query(temp_db):
+    assert DatabaseManager(temp_db).run_migrations() > 0
+    runs = _recorded_runs(temp_db.engine)
+    assert len(runs) == 1
+
+    statements = _count_statements(temp_db.engine)
+    assert DatabaseManager(temp_db).run_migrations() == 0
+    # One fingerprint query; everything else is the UUID back-fill lookup
+    schema_checks = [s for s in statements if 'WHERE entity_uuid IS NULL' not in s]
+    assert len(schema_checks) == 1
+    assert len(_recorded_runs(temp_db.engine)) == 1
+
+    # Forcing runs every check and records the run
+    DatabaseManager(temp_db).run_migrations(force=True)
+    assert len(_recorded_runs(temp_db.engine)) == 2
+
+
+def test_schema_change_reruns_migrations(temp_db):
+    DatabaseManager(temp_db).run_migrations()
+    with temp_db.engine.begin() as conn:
+        conn.execute(text("DROP INDEX idx_us_table_us_id"))
+
+    DatabaseManager(temp_db).run_migrations()
+    indexes = {ix['name'] for ix in inspect(temp_db.engine).get_indexes('us_table')}
+    assert 'idx_us_table_us_id' in indexes
+    assert len(_recorded_runs(temp_db.engine)) == 2
+
+
+def test_columns_reflected_once_per_run(db_manager):
+    migrations = db_manager.migrations
+    assert migrations.check_column_exists('us_table', 'us')
+
+    statements = _count_statements(db_manager.connection.engine)
+    assert migrations.check_column_exists('us_table', 'sito')
+    assert not migrations.check_column_exists('us_table', 'missing_column')
+    assert not statements
+
+    assert migrations.add_column_if_not_exists('us_table', 'missing_column', 'TEXT')
+    assert migrations.check_column_exists('us_table', 'missing_column')
+
+
+def test_unchanged_schema_still_backfills_uuids(temp_db):
+    manager = DatabaseManager(temp_db)
+    manager.run_migrations()
+    manager.create(Site, {"sito": "Written elsewhere"})
+    with temp_db.engine.begin() as conn:                 # as if another client skipped the UUID
+        conn.execute(text("UPDATE site_table SET entity_uuid = NULL"))
+
+    assert DatabaseManager(temp_db).run_migrations() == 0
+    with temp_db.engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM site_table WHERE entity_uuid IS NULL")).scalar() == 0
+
+
+def test_unchanged_schema_still_aligns_vocab_and_node_uuids(temp_db):
+    manager = DatabaseManager(temp_db)
+    manager.run_migrations()
+    manager.create(Site, {"sito": "Scavo"})
+    manager.create(US, {"sito": "Scavo", "area": "1", "us": "1"})
+    with temp_db.engine.begin() as conn:                 # as if written by an older client
+        conn.execute(text("UPDATE us_table SET unita_tipo = 'USVA', node_uuid = NULL"))
+
+    assert DatabaseManager(temp_db).run_migrations() == 0
+    with temp_db.engine.connect() as conn:
+        row = conn.execute(text("SELECT unita_tipo, node_uuid FROM us_table WHERE us = '1'")).one()
+    assert row[0] == 'USVs' and row[1]
+
+
+def test_failed_step_leaves_schema_version_unrecorded(temp_db, monkeypatch):
+    from pyarchinit_mini.database.migrations import DatabaseMigrations
+
+    def broken(self):
+        self._step_failed("migrate_search_index", RuntimeError("boom"))
+        return 0
+
+    monkeypatch.setattr(DatabaseMigrations, "migrate_search_index", broken)
+    DatabaseManager(temp_db).run_migrations()
+    assert not inspect(temp_db.engine).has_table(VERSION_TABLE)
+
+    monkeypatch.undo()
+    DatabaseManager(temp_db).run_migrations()
+    assert len(_recorded_runs(temp_db.engine)) == 1
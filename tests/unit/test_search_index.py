@@ -0,0 +1,89 @@
+"""
+Unit tests for the full-text search index behind UniversalSearchService
+"""
+
+from sqlalchemy import text
+
+from pyarchinit_mini.database.search_index import (
+    ensure_search_index, fts5_match_expression, search_index_status, tsquery_expression
+)
+from pyarchinit_mini.models.site import Site
+from pyarchinit_mini.models.us import US
+from pyarchinit_mini.services.search_service import UniversalSearchService
+
+
+def _populate(db_manager):
+    db_manager.create(Site, {"sito": "Volterra", "comune": "Volterra", "descrizione": "Acropoli etrusca"})
+    db_manager.create(Site, {"sito": "Populonia", "comune": "Piombino", "descrizione": "Necropoli"})
+    db_manager.create(US, {"sito": "Volterra", "area": "1", "us": "1001", "d_stratigrafica": "Strato di crollo"})
+    db_manager.create(US, {"sito": "Volterra", "area": "1", "us": "1002", "d_stratigrafica": "Città medievale"})
+    db_manager.create(US, {"sito": "Populonia", "area": "2", "us": "2001",
+                           "d_stratigrafica": "Taglio", "descrizione": "crollo crollo parziale"})
+
+
+def test_query_expressions():
+    assert fts5_match_expression("US 10-a") == '"US"* "10"* "a"*'
+    assert tsquery_expression("strato crollo") == "strato:* & crollo:*"
+    assert fts5_match_expression("%'") is None
+
+
+def test_indexed_search_is_ranked_prefix_search(db_manager):
+    _populate(db_manager)
+    engine = db_manager.connection.engine
+    assert ensure_search_index(engine) == 3
+    assert ensure_search_index(engine) == 0          # idempotent
+    assert all(s["fulltext"] for s in search_index_status(engine).values())
+
+    results = UniversalSearchService(db_manager).search_all("crol")
+
+    assert results["stats"]["us"] == 2
+    # The US that mentions "crollo" three times ranks first
+    assert [u["us"] for u in results["us"]] == ["2001", "1001"]
+    # Accents are folded and every token must match
+    assert [u["us"] for u in UniversalSearchService(db_manager).search_all("citta vol")["us"]] == ["1002"]
+    assert UniversalSearchService(db_manager).search_all("100")["stats"]["us"] == 2
+
+
+def test_index_follows_writes(db_manager):
+    _populate(db_manager)
+    ensure_search_index(db_manager.connection.engine)
+    service = UniversalSearchService(db_manager)
+
+    db_manager.create(Site, {"sito": "Vetulonia", "comune": "Castiglione della Pescaia"})
+    assert [s["sito"] for s in service.search_all("castig")["sites"]] == ["Vetulonia"]
+
+    with db_manager.connection.engine.begin() as conn:
+        conn.execute(text("UPDATE site_table SET comune = 'Grosseto' WHERE sito = 'Vetulonia'"))
+    assert service.search_all("castig")["stats"]["sites"] == 0
+    assert service.search_all("grosse")["stats"]["sites"] == 1
+
+    with db_manager.connection.engine.begin() as conn:
+        conn.execute(text("DELETE FROM us_table WHERE us = '1001'"))
+    assert [u["us"] for u in service.search_all("crollo")["us"]] == ["2001"]
+
+
+def test_search_without_index_uses_substring_match(db_manager):
+    _populate(db_manager)
+    results = UniversalSearchService(db_manager).search_all("ropoli")
+
+    # Infix match, as before the index existed
+    assert results["stats"]["sites"] == 2
+
+
+def test_index_missing_triggers_is_rebuilt(db_manager):
+    _populate(db_manager)
+    engine = db_manager.connection.engine
+    service = UniversalSearchService(db_manager)
+    # Status read before the index exists is dropped once it is created
+    assert service._search_index_status()["sites"]["fulltext"] is False
+    ensure_search_index(engine)
+    assert service._search_index_status()["sites"]["fulltext"] is True
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP TRIGGER site_table_fts_ai"))
+    db_manager.create(Site, {"sito": "Vetulonia", "comune": "Castiglione della Pescaia"})
+    assert search_index_status(engine)["sites"]["fulltext"] is False
+
+    assert ensure_search_index(engine) == 1
+    assert search_index_status(engine)["sites"]["fulltext"] is True
+    assert [s["sito"] for s in service.search_all("castig")["sites"]] == ["Vetulonia"]
@@ -0,0 +1,66 @@
+"""
+Unit tests for the SQLite connection profiles of DatabaseConnection
+"""
+
+import sqlite3
+
+import pytest
+
+from sqlalchemy import text
+
+from pyarchinit_mini.database.connection import (
+    SQLITE_PROFILES, DatabaseConnection, copy_sqlite_database, get_sqlite_profile
+)
+
+
+def test_performance_profile_enables_wal(tmp_path):
+    conn = DatabaseConnection.sqlite(str(tmp_path / "perf.db"), sqlite_profile="performance")
+    settings = conn.sqlite_settings()
+    conn.close()
+
+    assert settings["journal_mode"] == "wal"
+    assert settings["synchronous"] == 1          # NORMAL
+    assert settings["temp_store"] == 2           # MEMORY
+    assert settings["busy_timeout"] == 20000
+    assert settings["foreign_keys"] == 1
+
+
+def test_profile_selected_from_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYARCHINIT_SQLITE_PROFILE", "legacy")
+    conn = DatabaseConnection.sqlite(str(tmp_path / "legacy.db"))
+    assert conn.sqlite_pragmas == {}
+    assert conn.sqlite_settings() == {"foreign_keys": 1}
+    conn.close()
+
+    monkeypatch.setenv("PYARCHINIT_SQLITE_PROFILE", "no-such-profile")
+    assert get_sqlite_profile() == SQLITE_PROFILES["default"]
+
+
+def test_in_memory_database_keeps_its_journal():
+    conn = DatabaseConnection("sqlite:///:memory:", sqlite_profile="performance")
+    assert conn.sqlite_settings()["journal_mode"] == "memory"
+    conn.close()
+
+
+def test_copy_sqlite_database_includes_uncheckpointed_wal(tmp_path):
+    src = tmp_path / "wal.db"
+    conn = DatabaseConnection.sqlite(str(src), sqlite_profile="performance")
+    with conn.engine.begin() as c:
+        c.execute(text("CREATE TABLE t (x INTEGER)"))
+        c.execute(text("INSERT INTO t VALUES (1), (2), (3)"))
+
+    # The connection is still open, so the rows may only be in the -wal file
+    dst = tmp_path / "copy.db"
+    copy_sqlite_database(str(src), str(dst))
+    conn.close()
+
+    with sqlite3.connect(dst) as copy:
+        assert copy.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 3
+
+
+def test_copy_sqlite_database_missing_source_raises(tmp_path):
+    src = tmp_path / "missing.db"
+    with pytest.raises(FileNotFoundError):
+        copy_sqlite_database(str(src), str(tmp_path / "copy.db"))
+    assert not src.exists()
+    assert not (tmp_path / "copy.db").exists()
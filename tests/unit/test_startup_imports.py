@@ -0,0 +1,55 @@
+"""
+Import-time checks for the web app and desktop GUI entry points
+
+Each entry point is imported in a fresh interpreter with
+``python -X importtime``; heavy optional libraries must not be loaded
+until a feature that needs them is used (see scripts/benchmark_startup.py
+for timings).
+"""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from pyarchinit_mini.utils.lazy import lazy_instance
+
+ROOT = Path(__file__).resolve().parents[2]
+
+HEAVY = ('matplotlib', 'pandas', 's3dgraphy', 'reportlab', 'networkx', 'mcp')
+
+_LINE = re.compile(r'import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)')
+
+
+def _imported_modules(module):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return {match.group(2): int(match.group(1)) for match in map(_LINE.match, result.stderr.splitlines()) if match}
+
+
+@pytest.mark.parametrize("module", [
+    "pyarchinit_mini.web_interface.app",
+    pytest.param("pyarchinit_mini.desktop_gui.gui_app", id="desktop"),
+])
+def test_entry_point_does_not_import_heavy_libraries(module):
+    if module.startswith("pyarchinit_mini.desktop_gui"):
+        pytest.importorskip("tkinter")
+    modules = _imported_modules(module)
+    assert module in modules
+    loaded = [name for name in HEAVY if name in modules]
+    assert not loaded, f"{module} imports {loaded} at startup"
+
+
+def test_lazy_instance_builds_on_first_use():
+    counter = lazy_instance('collections:Counter', 'abracadabra')
+    assert not counter.is_loaded
+
+    assert counter.most_common(1) == [('a', 5)]
+    assert counter.is_loaded
+    counter.extra = 1
+    assert counter.extra == 1
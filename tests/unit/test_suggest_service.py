@@ -0,0 +1,84 @@
+"""
+Unit tests for the in-memory typeahead index (SuggestionService)
+"""
+
+from sqlalchemy import text
+
+from pyarchinit_mini.models.inventario_materiali import InventarioMateriali
+from pyarchinit_mini.models.site import Site
+from pyarchinit_mini.models.us import US
+from pyarchinit_mini.services.suggest_service import SuggestionService, invalidate_suggestions
+
+
+def _populate(db_manager):
+    db_manager.create(Site, {"sito": "Volterra", "comune": "Volterra"})
+    db_manager.create(Site, {"sito": "Tempio di Vénere", "comune": "Roma"})
+    for us in ("101", "102", "1010", "2001"):
+        db_manager.create(US, {"sito": "Volterra", "area": "1", "us": us, "d_stratigrafica": "Strato"})
+    db_manager.create(InventarioMateriali, {"sito": "Volterra", "numero_inventario": 101, "tipo_reperto": "Anfora"})
+
+
+def _labels(suggestions, kind=None):
+    return [s["label"] for s in suggestions if kind is None or s["type"] == kind]
+
+
+def test_suggest_prefix_matches_all_types(db_manager):
+    _populate(db_manager)
+    service = SuggestionService(db_manager)
+
+    results = service.suggest("10")
+    assert _labels(results, "us") == ["US 101 - Volterra", "US 1010 - Volterra", "US 102 - Volterra"]
+    assert _labels(results, "material") == ["Inv. 101 - Volterra"]
+    assert results[0]["sito"] == "Volterra" and results[0]["us"] == "101"
+
+    # Inner words and accents
+    assert _labels(service.suggest("VENE")) == ["Tempio di Vénere"]
+    assert _labels(service.suggest("us 20")) == ["US 2001 - Volterra"]
+    assert _labels(service.suggest("1", limit_per_type=2)) == [
+        "US 101 - Volterra", "US 1010 - Volterra", "Inv. 101 - Volterra"]
+
+
+def test_suggest_follows_committed_orm_writes(db_manager):
+    _populate(db_manager)
+    service = SuggestionService(db_manager)
+    assert service.suggest("popu") == []
+
+    site = db_manager.create(Site, {"sito": "Populonia", "comune": "Piombino"})
+    assert _labels(service.suggest("popu")) == ["Populonia"]
+
+    db_manager.update(Site, site.id_sito, {"sito": "Pupluna"})
+    assert service.suggest("popu") == []
+    assert _labels(service.suggest("pupl")) == ["Pupluna"]
+
+    db_manager.delete(Site, site.id_sito)
+    assert service.suggest("pupl") == []
+
+    # Rolled back writes never reach the index
+    with db_manager.connection.SessionLocal() as session:
+        session.add(Site(sito="Vetulonia"))
+        session.flush()
+        session.rollback()
+    assert service.suggest("vetu") == []
+
+
+def test_raw_writes_are_picked_up_after_invalidation(db_manager):
+    _populate(db_manager)
+    service = SuggestionService(db_manager)
+    service.suggest("vo")
+
+    with db_manager.connection.engine.begin() as conn:
+        conn.execute(text("INSERT INTO site_table (sito, created_at, updated_at, version_number) "
+                          "VALUES ('Vulci', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 1)"))
+    invalidate_suggestions(db_manager.connection.connection_string)
+    assert service.stats()["stale"] is True
+
+    service.refresh()
+    assert _labels(service.suggest("vul")) == ["Vulci"]
+
+
+def test_memory_ceiling_falls_back_to_database(db_manager):
+    _populate(db_manager)
+    service = SuggestionService(db_manager, max_bytes=2000)
+
+    assert service.suggest("10") is None
+    assert service.stats()["complete"] is False